@@ -0,0 +1,50 @@
+"""
+그래프 레지스트리 마이크로 벤치마크
+
+이 스크립트는 요청마다 그래프를 새로 컴파일하는 경우와 프로세스 전역 레지스트리에서
+컴파일된 그래프를 재사용하는 경우의 요청당 준비 비용을 비교합니다.
+
+사용법:
+    python examples/graph_registry_benchmark.py [그래프 이름] [반복 횟수]
+"""
+import os
+import sys
+import time
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.workflows.graphs.registry import GraphRegistry
+
+
+def measure(func, iterations: int) -> float:
+    """함수를 반복 실행하여 호출당 평균 시간(ms)을 반환합니다."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def main():
+    """예제 실행 메인 함수"""
+    name = sys.argv[1] if len(sys.argv) > 1 else "blog"
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    registry = GraphRegistry()
+    builder = registry._resolve_builder(name)
+
+    # 매 요청 컴파일 (기존 방식)
+    fresh_ms = measure(builder, iterations)
+
+    # 레지스트리 재사용 (첫 호출에서만 컴파일)
+    registry.get(name)
+    cached_ms = measure(lambda: registry.get(name), iterations)
+
+    print(f"그래프: {name} (반복 {iterations}회)")
+    print(f"  매 요청 컴파일: {fresh_ms:.3f} ms/요청")
+    print(f"  레지스트리 재사용: {cached_ms:.5f} ms/요청")
+    print(f"  통계: {registry.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+HTML 파서 백엔드 벤치마크
+
+이 스크립트는 저장된 HTML 픽스처(tests/fixtures/html)를 사용 가능한 파서 백엔드
+(selectolax, lxml, html.parser)로 반복 파싱하여 백엔드별 초당 처리 페이지 수와 최대 RSS를 출력합니다.
+최대 RSS가 서로 섞이지 않도록 백엔드마다 별도 프로세스에서 측정합니다.
+
+사용법:
+    python examples/html_parser_benchmark.py [반복 횟수] [픽스처 디렉토리]
+"""
+import os
+import sys
+import glob
+import time
+import resource
+import multiprocessing
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.core.search.utils.html_parser import available_backends, extract_article
+
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures", "html")
+
+CONTENT_SELECTORS = ['article', '.se-main-container', '.article-body', '.content', 'main']
+META_SELECTORS = {'date': ['.t11', '.date', 'time'], 'press': ['.press', '.source']}
+
+
+def run_backend(backend: str, pages: list, iterations: int, queue) -> None:
+    """한 백엔드로 모든 페이지를 반복 파싱하고 결과를 큐에 넣습니다 (별도 프로세스에서 실행)."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for html in pages:
+            extract_article(html, CONTENT_SELECTORS, META_SELECTORS, backend=backend)
+    elapsed = time.perf_counter() - started
+
+    # Linux는 KB, macOS는 바이트 단위
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+    queue.put((backend, len(pages) * iterations / elapsed, peak_rss_mb))
+
+
+def main():
+    """예제 실행 메인 함수"""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    fixture_dir = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_FIXTURE_DIR
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    if not pages:
+        print(f"HTML 픽스처가 없습니다: {fixture_dir}")
+        return
+
+    print(f"픽스처 {len(pages)}개, 반복 {iterations}회")
+    queue = multiprocessing.Queue()
+    for backend in available_backends():
+        process = multiprocessing.Process(target=run_backend, args=(backend, pages, iterations, queue))
+        process.start()
+        name, pages_per_second, peak_rss_mb = queue.get()
+        process.join()
+        print(f"  {name:<12} {pages_per_second:8.1f} 페이지/초   최대 RSS {peak_rss_mb:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
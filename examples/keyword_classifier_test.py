@@ -37,7 +37,7 @@ def test_keyword_classifier():
     classifier = KeywordClassifier(
         client_id=client_id,
         client_secret=client_secret,
-        save_results=True  # 검색 결과를 파일로 저장
+        save_results=True  # 분류 결과를 output/keyword_classifications.jsonl에 추가
     )
     
     # 테스트할 키워드 목록
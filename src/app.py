@@ -4,18 +4,28 @@ FastAPI 웹 서버
 이 모듈은 블로그 생성 시스템의 REST API 엔드포인트를 제공합니다.
 """
 import os
-from typing import Dict, Any, Optional
-from fastapi import FastAPI, BackgroundTasks, HTTPException
-from fastapi.responses import JSONResponse
+import json
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import uvicorn
-import uuid
 import logging
 from datetime import datetime
 
 from src.workflows.workflow import generate_blog
-from src.common.config.providers import set_config_value
-from src.common.config import Configuration
+from src.common.config.providers import set_config_value, get_chat_model_pool_stats, aclose_chat_model_pools
+from src.common.config import Configuration, JobConfiguration
+from src.common.exceptions import JobQueueFullError, JobQueueUnavailableError
+from src.common.http_client import http_session_manager, close_http_sessions
+from src.common.llm_cache import close_llm_cache
+from src.common.rate_limit import get_rate_limiter_stats
+from src.common.hedging import get_hedger_stats
+from src.core.search.manager import get_search_cache_stats
+from src.core.search.utils.extraction import get_extraction_executor, shutdown_extraction_executor
+from src.jobs import BlogJobQueue, JobEventBroker
 
 # 로깅 설정
 logging.basicConfig(
@@ -24,16 +34,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 작업별 진행 이벤트 브로커 (/blog/{job_id}/events 스트리밍에 사용)
+job_events = JobEventBroker()
+
+# 블로그 생성 작업 큐 (워커 수, 큐 크기, 저장소는 JOB_* 환경 변수로 설정)
+job_queue = BlogJobQueue.from_config(generate_blog, JobConfiguration.from_runnable_config(), events=job_events)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 작업 큐와 본문 추출 워커를 시작하고 종료 시 작업 큐, 추출 워커, HTTP/LLM 연결 풀, LLM 응답 캐시를 정리합니다."""
+    await asyncio.to_thread(get_extraction_executor().warm_up)
+    await job_queue.start()
+    try:
+        yield
+    finally:
+        await job_queue.stop()
+        await asyncio.to_thread(shutdown_extraction_executor)
+        await close_http_sessions()
+        await aclose_chat_model_pools()
+        close_llm_cache()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="블로그 생성 API",
     description="AI 기반 블로그 콘텐츠 자동 생성 시스템",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# 현재 생성중인 블로그 작업 저장소
-blog_jobs = {}
-
 
 class BlogRequest(BaseModel):
     """블로그 생성 요청 모델
@@ -56,82 +86,41 @@ class BlogResponse(BaseModel):
         blog: 생성된 블로그 콘텐츠 (완료된 경우)
     """
     job_id: str = Field(..., description="블로그 생성 작업의 고유 ID")
-    status: str = Field(..., description="처리 상태 (pending, completed, failed)")
+    status: str = Field(..., description="처리 상태 (pending, running, completed, failed)")
     message: str = Field(..., description="상태 메시지")
     blog: Optional[str] = Field(None, description="생성된 블로그 콘텐츠")
 
 
-async def generate_blog_task(job_id: str, topic: str, config: Dict[str, Any] = None):
-    """백그라운드 태스크로 블로그를 생성합니다.
-    
-    Args:
-        job_id: 작업 ID
-        topic: 블로그 주제
-        config: 워크플로우 구성 설정
-    """
-    try:
-        # 블로그 생성 작업 시작
-        logger.info(f"블로그 생성 시작: 작업 ID {job_id}, 주제: '{topic}'")
-        
-        # 블로그 생성 실행
-        blog_content = await generate_blog(topic, config)
-        
-        # 결과 저장
-        blog_jobs[job_id]["status"] = "completed"
-        blog_jobs[job_id]["blog"] = blog_content
-        blog_jobs[job_id]["message"] = "블로그 생성이 완료되었습니다."
-        blog_jobs[job_id]["completed_at"] = datetime.now().isoformat()
-        
-        logger.info(f"블로그 생성 완료: 작업 ID {job_id}")
-        
-    except Exception as e:
-        # 오류 처리
-        error_msg = f"블로그 생성 중 오류 발생: {str(e)}"
-        logger.error(error_msg)
-        blog_jobs[job_id]["status"] = "failed"
-        blog_jobs[job_id]["message"] = error_msg
-        blog_jobs[job_id]["completed_at"] = datetime.now().isoformat()
-
-
 @app.post("/blog", response_model=BlogResponse, status_code=202)
-async def create_blog(request: BlogRequest, background_tasks: BackgroundTasks):
+async def create_blog(request: BlogRequest):
     """블로그 생성 요청을 처리합니다.
     
     Args:
         request: 블로그 생성 요청 객체
-        background_tasks: 백그라운드 작업 관리자
         
     Returns:
         작업 상태 정보가 포함된 응답
+        
+    Raises:
+        HTTPException: 큐가 가득 찬 경우(429) 또는 작업 큐를 사용할 수 없는 경우(503)
     """
-    # 작업 ID 생성
-    job_id = str(uuid.uuid4())
-    
     # API 키 구성 처리
     config = request.config or {}
     
-    # 작업 상태 초기화
-    blog_jobs[job_id] = {
-        "status": "pending",
-        "message": "블로그 생성 작업이 큐에 추가되었습니다.",
-        "created_at": datetime.now().isoformat(),
-        "topic": request.topic,
-    }
-    
-    # 백그라운드 작업 추가
-    background_tasks.add_task(
-        generate_blog_task,
-        job_id=job_id,
-        topic=request.topic,
-        config=config
-    )
+    # 작업 큐에 추가 (큐 용량 초과 시 거절)
+    try:
+        job = job_queue.submit(request.topic, config)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "30"})
+    except JobQueueUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     
     # 응답 반환
     return JSONResponse(
         content={
-            "job_id": job_id,
-            "status": "pending",
-            "message": "블로그 생성 작업이 큐에 추가되었습니다."
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "message": job["message"]
         },
         status_code=202
     )
@@ -150,13 +139,13 @@ async def get_blog_status(job_id: str):
     Raises:
         HTTPException: 작업 ID가 존재하지 않는 경우
     """
+    # 작업 상태 가져오기
+    job = job_queue.get(job_id)
+    
     # 작업 ID 확인
-    if job_id not in blog_jobs:
+    if job is None:
         raise HTTPException(status_code=404, detail=f"작업 ID '{job_id}'를 찾을 수 없습니다.")
     
-    # 작업 상태 가져오기
-    job = blog_jobs[job_id]
-    
     # 응답 구성
     response = {
         "job_id": job_id,
@@ -171,6 +160,83 @@ async def get_blog_status(job_id: str):
     return response
 
 
+async def iter_job_events(job_id: str) -> AsyncIterator[Dict[str, Any]]:
+    """작업의 진행 이벤트를 순서대로 전달합니다.
+    
+    이벤트 기록이 이미 정리된 완료/실패 작업은 저장소의 최종 상태를 단일 이벤트로 전달합니다.
+    
+    Args:
+        job_id: 작업 ID
+        
+    Yields:
+        이벤트 딕셔너리
+    """
+    job = job_queue.get(job_id)
+    if job is not None and job["status"] in ("completed", "failed") and not job_events.has(job_id):
+        if job["status"] == "completed":
+            yield {"event": "done", "status": "completed", "message": job["message"], "blog": job.get("blog")}
+        else:
+            yield {"event": "error", "status": "failed", "message": job["message"]}
+        return
+    
+    async for event in job_events.subscribe(job_id):
+        yield event
+
+
+@app.get("/blog/{job_id}/events")
+async def stream_blog_events(job_id: str):
+    """블로그 생성 진행 상황을 Server-Sent Events로 스트리밍합니다.
+    
+    노드 전환(node_start, node_end), 완료된 섹션(section), 최종 결합 단계의 토큰(token),
+    작업 상태(status)를 순서대로 전달하고 done 또는 error 이벤트로 종료합니다.
+    
+    Args:
+        job_id: 작업 ID
+        
+    Returns:
+        text/event-stream 응답
+        
+    Raises:
+        HTTPException: 작업 ID가 존재하지 않는 경우
+    """
+    if job_queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"작업 ID '{job_id}'를 찾을 수 없습니다.")
+    
+    async def event_source():
+        async for event in iter_job_events(job_id):
+            data = json.dumps(event, ensure_ascii=False)
+            yield f"event: {event['event']}\ndata: {data}\n\n"
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.websocket("/blog/{job_id}/events")
+async def websocket_blog_events(websocket: WebSocket, job_id: str):
+    """블로그 생성 진행 상황을 WebSocket으로 스트리밍합니다.
+    
+    SSE 엔드포인트와 같은 이벤트를 JSON 메시지로 전달한 뒤 연결을 닫습니다.
+    
+    Args:
+        websocket: WebSocket 연결
+        job_id: 작업 ID
+    """
+    if job_queue.get(job_id) is None:
+        await websocket.close(code=4404, reason="job not found")
+        return
+    
+    await websocket.accept()
+    try:
+        async for event in iter_job_events(job_id):
+            await websocket.send_json(event)
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info(f"이벤트 스트림 연결 종료: 작업 ID {job_id}")
+
+
 @app.get("/health")
 async def health_check():
     """서버 상태 확인 엔드포인트입니다.
@@ -178,7 +244,17 @@ async def health_check():
     Returns:
         서버 상태 정보
     """
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "jobs": job_queue.stats(),
+        "llm_pools": get_chat_model_pool_stats(),
+        "http": http_session_manager.stats(),
+        "rate_limits": get_rate_limiter_stats(),
+        "search_cache": get_search_cache_stats(),
+        "hedging": get_hedger_stats(),
+        "extraction": get_extraction_executor().stats()
+    }
 
 
 if __name__ == "__main__":
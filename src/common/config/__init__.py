@@ -6,12 +6,25 @@
 
 from src.common.config.base import BaseConfiguration 
 from src.common.config.blog import BlogConfiguration
-from src.common.config.search import SearchConfiguration
+from src.common.config.search import SearchConfiguration, SearchCacheConfiguration
 from src.common.config.configuration import Configuration
+from src.common.config.jobs import JobConfiguration
+from src.common.config.http import HTTPConfiguration
+from src.common.config.extraction import ExtractionConfiguration
+from src.common.config.webdriver import WebDriverConfiguration
+from src.common.config.keywords import KeywordStoreConfiguration
+from src.common.config.llm_cache import LLMCacheConfiguration
 
 __all__ = [
     'BaseConfiguration',
     'BlogConfiguration',
     'SearchConfiguration',
-    'Configuration'
+    'SearchCacheConfiguration',
+    'Configuration',
+    'JobConfiguration',
+    'HTTPConfiguration',
+    'ExtractionConfiguration',
+    'WebDriverConfiguration',
+    'KeywordStoreConfiguration',
+    'LLMCacheConfiguration'
 ]
\ No newline at end of file
@@ -4,7 +4,7 @@
 이 모듈은 블로그 생성 워크플로우의 구성 설정을 제공합니다.
 """
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from langchain_core.runnables import RunnableConfig
 
@@ -22,9 +22,18 @@ class Configuration:
         writer_model: 콘텐츠 작성에 사용할 모델
         searcher_provider: 검색 엔진 제공자
         searcher_api_key: 검색 API 키
+        searcher_providers: 섹션 검색에 동시에 사용할 검색 엔진 목록 (지정하면 searcher_provider 대신 사용)
+        search_deadline: 여러 검색 엔진을 사용할 때 섹션 검색 제한 시간(초)
         number_of_blog_sections: 생성할 블로그 섹션 수
         number_of_queries: 섹션당 생성할 검색 쿼리 수
         max_search_depth: 섹션당 최대 검색 반복 횟수
+        source_token_budget: 섹션 작성 프롬프트에 넣을 검색 결과 컨텍스트의 최대 토큰 수
+        max_tokens_per_source: 컨텍스트에 넣을 소스 하나의 최대 토큰 수
+        parallel_sections: 연구 섹션을 Send로 동시에 실행할지 여부
+        max_parallel_sections: 동시에 실행할 최대 연구 섹션 수
+        llm_cache: LLM 응답 캐시 사용 여부
+        llm_cache_bypass: 이번 요청에서 캐시를 읽지 않고 새로 호출할지 여부 (결과는 캐시에 저장)
+            (캐시 경로, 크기, 유효 시간은 서버 설정인 LLMCacheConfiguration에서 환경 변수로 지정)
     """
     planner_provider: str = "anthropic"
     planner_model: str = "claude-3-7-sonnet-latest"
@@ -32,9 +41,17 @@ class Configuration:
     writer_model: str = "claude-3-7-sonnet-latest"
     searcher_provider: str = "tavily"
     searcher_api_key: Optional[str] = None
+    searcher_providers: Optional[List[str]] = None
+    search_deadline: float = 20.0
     number_of_blog_sections: int = 5
     number_of_queries: int = 3
     max_search_depth: int = 2
+    source_token_budget: int = 6000
+    max_tokens_per_source: int = 1500
+    parallel_sections: bool = False
+    max_parallel_sections: int = 5
+    llm_cache: bool = False
+    llm_cache_bypass: bool = False
     
     @classmethod
     def from_runnable_config(cls, config: RunnableConfig) -> 'Configuration':
@@ -75,7 +92,15 @@ class Configuration:
             "writer_model": self.writer_model,
             "searcher_provider": self.searcher_provider,
             "searcher_api_key": self.searcher_api_key,
+            "searcher_providers": self.searcher_providers,
+            "search_deadline": self.search_deadline,
             "number_of_blog_sections": self.number_of_blog_sections,
             "number_of_queries": self.number_of_queries,
-            "max_search_depth": self.max_search_depth
+            "max_search_depth": self.max_search_depth,
+            "source_token_budget": self.source_token_budget,
+            "max_tokens_per_source": self.max_tokens_per_source,
+            "parallel_sections": self.parallel_sections,
+            "max_parallel_sections": self.max_parallel_sections,
+            "llm_cache": self.llm_cache,
+            "llm_cache_bypass": self.llm_cache_bypass
         } 
\ No newline at end of file
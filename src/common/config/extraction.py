@@ -0,0 +1,23 @@
+"""웹 페이지 본문 추출 실행기 관련 설정을 정의합니다."""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from .base import BaseConfiguration
+
+StartMethod = Literal["spawn", "forkserver", "fork"]
+
+
+@dataclass(kw_only=True)
+class ExtractionConfiguration(BaseConfiguration):
+    """HTML 파싱/본문 추출 프로세스 풀 설정
+
+    각 값은 같은 이름의 대문자 환경 변수(예: EXTRACTION_WORKERS)로 덮어쓸 수 있습니다.
+    """
+
+    extraction_workers: int = 2  # 추출 워커 프로세스 수 (0이면 이벤트 루프 스레드에서 직접 파싱)
+    extraction_start_method: StartMethod = "spawn"  # 워커 프로세스 시작 방식
+
+    def __post_init__(self) -> None:
+        """환경 변수에서 읽은 문자열 값을 정수로 변환합니다."""
+        self.extraction_workers = int(self.extraction_workers)
@@ -0,0 +1,28 @@
+"""공유 HTTP 클라이언트(aiohttp) 관련 설정을 정의합니다."""
+
+from dataclasses import dataclass
+
+from .base import BaseConfiguration
+
+
+@dataclass(kw_only=True)
+class HTTPConfiguration(BaseConfiguration):
+    """공유 aiohttp ClientSession 설정
+
+    각 값은 같은 이름의 대문자 환경 변수(예: HTTP_LIMIT_PER_HOST)로 덮어쓸 수 있습니다.
+    """
+
+    http_limit: int = 100  # 전체 동시 연결 수
+    http_limit_per_host: int = 10  # 호스트별 동시 연결 수
+    http_dns_ttl: int = 300  # DNS 캐시 유지 시간(초)
+    http_keepalive_timeout: float = 30  # 유휴 keep-alive 연결 유지 시간(초)
+    http_timeout: float = 60  # 요청 전체 타임아웃(초)
+    http_connect_timeout: float = 10  # 연결 타임아웃(초)
+    http_max_page_bytes: int = 2097152  # 웹 페이지 수집 시 내려받을 최대 바이트 수
+
+    def __post_init__(self) -> None:
+        """환경 변수에서 읽은 문자열 값을 숫자로 변환합니다."""
+        for name in ("http_limit", "http_limit_per_host", "http_dns_ttl", "http_max_page_bytes"):
+            setattr(self, name, int(getattr(self, name)))
+        for name in ("http_keepalive_timeout", "http_timeout", "http_connect_timeout"):
+            setattr(self, name, float(getattr(self, name)))
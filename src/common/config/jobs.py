@@ -0,0 +1,30 @@
+"""블로그 생성 작업 큐 관련 설정을 정의합니다."""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from .base import BaseConfiguration
+
+JobStoreType = Literal["memory", "sqlite"]
+
+
+@dataclass(kw_only=True)
+class JobConfiguration(BaseConfiguration):
+    """블로그 생성 작업 큐 설정
+
+    각 값은 같은 이름의 대문자 환경 변수(예: JOB_WORKERS)로 덮어쓸 수 있습니다.
+    """
+
+    job_workers: int = 2  # 동시에 블로그를 생성하는 워커 수
+    job_queue_size: int = 20  # 대기 가능한 최대 작업 수
+    job_store: JobStoreType = "memory"  # 작업 저장소 유형 (memory, sqlite)
+    job_store_path: str = "data/blog_jobs.sqlite3"  # SQLite 저장소 파일 경로
+    job_store_max_jobs: int = 1000  # 메모리 저장소에 보관할 최대 작업 수
+    job_ttl_seconds: int = 3600  # 완료/실패한 작업을 보관하는 시간(초)
+    job_cleanup_interval: int = 60  # 만료 작업 정리 주기(초)
+
+    def __post_init__(self) -> None:
+        """환경 변수에서 읽은 문자열 값을 정수로 변환합니다."""
+        for name in ("job_workers", "job_queue_size", "job_store_max_jobs",
+                     "job_ttl_seconds", "job_cleanup_interval"):
+            setattr(self, name, int(getattr(self, name)))
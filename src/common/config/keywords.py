@@ -0,0 +1,20 @@
+"""네이버 키워드 수집 저장소 관련 설정을 정의합니다."""
+
+from dataclasses import dataclass
+
+from .base import BaseConfiguration
+
+
+@dataclass(kw_only=True)
+class KeywordStoreConfiguration(BaseConfiguration):
+    """연관 키워드 저장소 설정
+
+    각 값은 같은 이름의 대문자 환경 변수(예: KEYWORD_STORE_PATH)로 덮어쓸 수 있습니다.
+    """
+
+    keyword_store_path: str = "data/keywords.sqlite3"  # SQLite 파일 경로 (빈 문자열이면 저장소 사용 안 함)
+    keyword_freshness_seconds: int = 604800  # 이 시간 안에 조회한 시드 키워드는 다시 조회하지 않음(초)
+
+    def __post_init__(self) -> None:
+        """환경 변수에서 읽은 문자열 값을 정수로 변환합니다."""
+        self.keyword_freshness_seconds = int(self.keyword_freshness_seconds)
@@ -0,0 +1,23 @@
+"""LLM 응답 캐시 저장소 관련 설정을 정의합니다."""
+
+from dataclasses import dataclass
+
+from .base import BaseConfiguration
+
+
+@dataclass(kw_only=True)
+class LLMCacheConfiguration(BaseConfiguration):
+    """LLM 응답 캐시 저장소 설정
+
+    서버 쪽 설정이므로 요청의 configurable이 아닌 같은 이름의 대문자 환경 변수(예: LLM_CACHE_PATH)로만
+    덮어쓸 수 있습니다. 요청별로는 Configuration의 llm_cache, llm_cache_bypass만 지정합니다.
+    """
+
+    llm_cache_ttl: int = 86400  # 캐시 항목 유효 시간(초)
+    llm_cache_max_entries: int = 1000  # 메모리 캐시에 보관할 최대 항목 수
+    llm_cache_path: str = "data/llm_cache.sqlite3"  # SQLite 파일 경로 (빈 문자열이면 메모리만 사용)
+
+    def __post_init__(self) -> None:
+        """환경 변수에서 읽은 문자열 값을 정수로 변환합니다."""
+        self.llm_cache_ttl = int(self.llm_cache_ttl)
+        self.llm_cache_max_entries = int(self.llm_cache_max_entries)
@@ -1,10 +1,15 @@
 """
 공급자 관리 유틸리티
 
-이 모듈은 API 키 관리 및 환경 변수 처리를 위한 유틸리티 함수를 제공합니다.
+이 모듈은 API 키 관리 및 환경 변수 처리를 위한 유틸리티 함수와
+공유 HTTP 연결 풀을 사용하는 채팅 모델 팩토리를 제공합니다.
 """
 import os
-from typing import Any, Dict, Optional, Literal
+import json
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Literal, Tuple
 import logging
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
@@ -138,4 +143,243 @@ def set_config_value(key: str, value: str) -> None:
 def clear_config_cache() -> None:
     """구성 캐시를 초기화합니다."""
     _CONFIG_CACHE.clear()
-    logger.debug("구성 캐시 초기화 완료") 
\ No newline at end of file
+    logger.debug("구성 캐시 초기화 완료")
+
+
+# 채팅 모델 캐시 (provider, model, temperature, 구조화 출력 스키마, 추가 옵션) -> 모델
+_MODEL_CACHE: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+_MODEL_CACHE_SIZE = int(os.environ.get("LLM_MODEL_CACHE_SIZE", 32))
+_MODEL_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+
+# 제공자별 공유 HTTP 클라이언트 (동기, 비동기)
+_HTTP_CLIENTS: Dict[str, Tuple[Any, Any]] = {}
+
+# 외부 HTTP 클라이언트를 주입할 수 있는 제공자 (그 외 제공자는 캐시된 모델 인스턴스가 자체 연결 풀을 재사용)
+HTTP_CLIENT_PROVIDERS = ("openai",)
+
+_MODEL_LOCK = threading.Lock()
+
+# 실행 중인 이벤트 루프에서 비동기 클라이언트를 닫는 작업 (완료 전 가비지 컬렉션 방지)
+_CLOSE_TASKS = set()
+
+
+def _get_http_clients(provider: str) -> Tuple[Any, Any]:
+    """제공자별 공유 HTTP 클라이언트(동기, 비동기)를 가져옵니다.
+
+    비동기 클라이언트의 연결은 처음 사용한 이벤트 루프에 묶이므로, 요청을 이벤트 루프별
+    httpx.AsyncClient로 보내는 클라이언트를 반환합니다.
+
+    Args:
+        provider: LLM 제공자 이름
+
+    Returns:
+        (httpx.Client, httpx.AsyncClient) 튜플
+    """
+    if provider not in _HTTP_CLIENTS:
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=int(os.environ.get("LLM_HTTP_MAX_CONNECTIONS", 100)),
+            max_keepalive_connections=int(os.environ.get("LLM_HTTP_MAX_KEEPALIVE", 20)),
+            keepalive_expiry=float(os.environ.get("LLM_HTTP_KEEPALIVE_EXPIRY", 60)),
+        )
+        timeout = httpx.Timeout(float(os.environ.get("LLM_HTTP_TIMEOUT", 600)), connect=10.0)
+        _HTTP_CLIENTS[provider] = (
+            httpx.Client(limits=limits, timeout=timeout),
+            _create_loop_local_async_client(limits=limits, timeout=timeout),
+        )
+        logger.debug(f"LLM HTTP 연결 풀 생성: {provider}")
+    return _HTTP_CLIENTS[provider]
+
+
+def _create_loop_local_async_client(**client_kwargs: Any) -> Any:
+    """이벤트 루프별 연결 풀을 사용하는 httpx.AsyncClient를 생성합니다.
+
+    반환된 클라이언트는 캐시된 모델들이 함께 사용하며, send()를 현재 이벤트 루프의
+    httpx.AsyncClient로 전달합니다. 루프별 클라이언트는 처음 요청할 때 생성되고, 종료된 루프의
+    클라이언트는 목록에서 제거됩니다 (HTTPSessionManager와 같은 방식).
+
+    Args:
+        **client_kwargs: 루프별 httpx.AsyncClient에 전달할 옵션 (limits, timeout 등)
+
+    Returns:
+        httpx.AsyncClient 하위 클래스 인스턴스
+    """
+    import httpx
+
+    class LoopLocalAsyncClient(httpx.AsyncClient):
+        """요청을 현재 이벤트 루프의 httpx.AsyncClient로 보내는 클라이언트"""
+
+        def __init__(self) -> None:
+            super().__init__(**client_kwargs)
+            self._loop_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+            self._loop_lock = threading.Lock()
+
+        def loop_clients(self) -> List[httpx.AsyncClient]:
+            """열려 있는 루프별 클라이언트 목록을 반환합니다."""
+            with self._loop_lock:
+                return [client for client in self._loop_clients.values() if not client.is_closed]
+
+        def _client_for_loop(self) -> httpx.AsyncClient:
+            """현재 이벤트 루프의 클라이언트를 반환합니다. 없으면 생성합니다."""
+            loop = asyncio.get_running_loop()
+            with self._loop_lock:
+                client = self._loop_clients.get(loop)
+                if client is None or client.is_closed:
+                    # 종료된 루프의 클라이언트 정리 (연결이 그 루프에 묶여 있어 닫을 수 없음)
+                    for stale_loop in [stale for stale in self._loop_clients if stale.is_closed()]:
+                        self._loop_clients.pop(stale_loop, None)
+                    client = httpx.AsyncClient(**client_kwargs)
+                    self._loop_clients[loop] = client
+                return client
+
+        async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+            return await self._client_for_loop().send(request, **kwargs)
+
+        async def aclose(self) -> None:
+            """현재 이벤트 루프의 클라이언트를 닫고, 다른 루프의 클라이언트는 목록에서 제거합니다."""
+            try:
+                current = self._loop_clients.get(asyncio.get_running_loop())
+            except RuntimeError:
+                current = None
+            with self._loop_lock:
+                self._loop_clients.clear()
+            if current is not None:
+                await current.aclose()
+            await super().aclose()
+
+    return LoopLocalAsyncClient()
+
+
+def get_chat_model(provider: str,
+                   model: str,
+                   temperature: Optional[float] = None,
+                   structured_output: Optional[Any] = None,
+                   **kwargs: Any) -> Any:
+    """캐시된 채팅 모델을 가져옵니다. 없으면 생성하여 캐시합니다.
+
+    같은 (provider, model, temperature, structured_output, kwargs) 조합은 같은 인스턴스를
+    반환하므로 노드 호출마다 클라이언트와 연결 풀을 새로 만들지 않습니다. 외부 HTTP 클라이언트를
+    지원하는 제공자는 모델 간에도 제공자별 연결 풀을 공유합니다.
+
+    Args:
+        provider: LLM 제공자 이름 (예: "openai", "anthropic")
+        model: 모델 이름
+        temperature: 샘플링 온도 (None이면 모델 기본값)
+        structured_output: with_structured_output에 전달할 스키마 (None이면 일반 채팅 모델)
+        **kwargs: init_chat_model에 전달할 추가 옵션 (예: max_tokens, thinking)
+
+    Returns:
+        채팅 모델 또는 구조화 출력 러너블
+    """
+    options_key = json.dumps(kwargs, sort_keys=True, default=str)
+    key = (provider, model, temperature, structured_output, options_key)
+
+    with _MODEL_LOCK:
+        if key in _MODEL_CACHE:
+            _MODEL_CACHE.move_to_end(key)
+            _MODEL_CACHE_STATS["hits"] += 1
+            return _MODEL_CACHE[key]
+
+        from langchain.chat_models import init_chat_model
+
+        model_kwargs = dict(kwargs)
+        if temperature is not None:
+            model_kwargs["temperature"] = temperature
+        if provider in HTTP_CLIENT_PROVIDERS:
+            http_client, http_async_client = _get_http_clients(provider)
+            model_kwargs.setdefault("http_client", http_client)
+            model_kwargs.setdefault("http_async_client", http_async_client)
+
+        chat_model = init_chat_model(model=model, model_provider=provider, **model_kwargs)
+        if structured_output is not None:
+            chat_model = chat_model.with_structured_output(structured_output)
+
+        _MODEL_CACHE[key] = chat_model
+        _MODEL_CACHE_STATS["misses"] += 1
+        if len(_MODEL_CACHE) > _MODEL_CACHE_SIZE:
+            _MODEL_CACHE.popitem(last=False)
+            _MODEL_CACHE_STATS["evictions"] += 1
+
+        logger.debug(f"채팅 모델 생성: {provider}/{model} (temperature={temperature})")
+        return chat_model
+
+
+def get_chat_model_pool_stats() -> Dict[str, Any]:
+    """채팅 모델 캐시와 공유 HTTP 연결 풀 통계를 반환합니다.
+
+    Returns:
+        캐시된 모델 수, 적중/미스/제거 횟수, 제공자별 연결 풀 상태를 담은 딕셔너리
+    """
+    pools = {}
+    for provider, (http_client, http_async_client) in _HTTP_CLIENTS.items():
+        pools[provider] = {
+            "sync_connections": _count_pool_connections(http_client),
+            "async_connections": sum(_count_pool_connections(client) or 0
+                                     for client in http_async_client.loop_clients()),
+        }
+
+    return {
+        "models": len(_MODEL_CACHE),
+        "max_models": _MODEL_CACHE_SIZE,
+        **_MODEL_CACHE_STATS,
+        "http_pools": pools,
+    }
+
+
+def _count_pool_connections(client: Any) -> Optional[int]:
+    """httpx 클라이언트의 열린 연결 수를 반환합니다 (확인할 수 없으면 None)."""
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    return len(connections) if connections is not None else None
+
+
+def clear_chat_model_cache() -> None:
+    """채팅 모델 캐시를 비우고 공유 HTTP 클라이언트(동기, 비동기)를 닫습니다.
+
+    비동기 클라이언트는 현재 스레드에 실행 중인 이벤트 루프가 있으면 그 루프에서 닫는 작업을
+    예약하고, 없으면 새 이벤트 루프에서 바로 닫습니다. 이벤트 루프 안에서는
+    aclose_chat_model_pools를 await하는 것이 좋습니다.
+    """
+    with _MODEL_LOCK:
+        _MODEL_CACHE.clear()
+        clients = list(_HTTP_CLIENTS.values())
+        _HTTP_CLIENTS.clear()
+    for http_client, http_async_client in clients:
+        http_client.close()
+        _close_async_client(http_async_client)
+    logger.debug("채팅 모델 캐시 초기화 완료")
+
+
+def _close_async_client(http_async_client: Any) -> None:
+    """동기 코드에서 비동기 HTTP 클라이언트를 닫습니다.
+
+    Args:
+        http_async_client: httpx.AsyncClient
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    try:
+        if loop is None:
+            asyncio.run(http_async_client.aclose())
+        else:
+            task = loop.create_task(http_async_client.aclose())
+            _CLOSE_TASKS.add(task)
+            task.add_done_callback(_CLOSE_TASKS.discard)
+    except Exception as e:
+        # 연결이 이미 닫힌 다른 이벤트 루프에 묶여 있는 경우 등
+        logger.warning(f"비동기 HTTP 클라이언트 종료 실패: {str(e)}")
+
+
+async def aclose_chat_model_pools() -> None:
+    """공유 HTTP 연결 풀을 비동기로 닫습니다 (서버 종료 시 사용)."""
+    with _MODEL_LOCK:
+        clients = list(_HTTP_CLIENTS.values())
+        _HTTP_CLIENTS.clear()
+        _MODEL_CACHE.clear()
+    for http_client, http_async_client in clients:
+        http_client.close()
+        await http_async_client.aclose()
@@ -22,3 +22,27 @@ class SearchConfiguration(BaseConfiguration):
     search_api_config: Optional[Dict[str, Any]] = None
     number_of_queries: int = 5  # 반복당 생성할 검색 쿼리 수
     max_search_depth: int = 5  # 최대 반성 + 검색 반복 횟수
+
+
+@dataclass(kw_only=True)
+class SearchCacheConfiguration(BaseConfiguration):
+    """검색 결과 캐시 설정
+
+    각 값은 같은 이름의 대문자 환경 변수(예: SEARCH_CACHE_TTL)로 덮어쓸 수 있습니다.
+    """
+
+    search_cache_enabled: bool = True  # 검색 결과 캐시 사용 여부
+    search_cache_max_entries: int = 2000  # 메모리에 보관할 최대 쿼리 결과 수
+    search_cache_path: str = ""  # SQLite 파일 경로 (기본값은 빈 문자열로 메모리만 사용, 절대 경로 권장)
+    search_cache_ttl: int = 21600  # 일반 웹 검색 결과 유효 시간(초)
+    search_cache_news_ttl: int = 900  # 뉴스 검색 결과 유효 시간(초)
+    search_cache_academic_ttl: int = 604800  # arXiv/PubMed 결과 유효 시간(초)
+    search_cache_stale_ttl: int = 3600  # 만료 후 백그라운드 갱신 중에도 이전 결과를 제공하는 시간(초)
+
+    def __post_init__(self) -> None:
+        """환경 변수에서 읽은 문자열 값을 변환합니다."""
+        if isinstance(self.search_cache_enabled, str):
+            self.search_cache_enabled = self.search_cache_enabled.lower() in ("1", "true", "yes", "on")
+        for name in ("search_cache_max_entries", "search_cache_ttl", "search_cache_news_ttl",
+                     "search_cache_academic_ttl", "search_cache_stale_ttl"):
+            setattr(self, name, int(getattr(self, name)))
@@ -0,0 +1,25 @@
+"""Selenium WebDriver 풀 관련 설정을 정의합니다."""
+
+from dataclasses import dataclass
+
+from .base import BaseConfiguration
+
+
+@dataclass(kw_only=True)
+class WebDriverConfiguration(BaseConfiguration):
+    """헤드리스 Chrome WebDriver 풀 설정
+
+    각 값은 같은 이름의 대문자 환경 변수(예: WEBDRIVER_POOL_SIZE)로 덮어쓸 수 있습니다.
+    """
+
+    webdriver_pool_size: int = 2  # 동시에 실행할 최대 Chrome 프로세스 수
+    webdriver_max_pages: int = 50  # 드라이버를 재시작하기 전까지 로드할 최대 페이지 수
+    webdriver_checkout_timeout: float = 120  # 사용 가능한 드라이버를 기다리는 최대 시간(초)
+    webdriver_ready_timeout: float = 10  # 페이지 로드(document.readyState) 대기 시간(초)
+
+    def __post_init__(self) -> None:
+        """환경 변수에서 읽은 문자열 값을 숫자로 변환합니다."""
+        for name in ("webdriver_pool_size", "webdriver_max_pages"):
+            setattr(self, name, int(getattr(self, name)))
+        for name in ("webdriver_checkout_timeout", "webdriver_ready_timeout"):
+            setattr(self, name, float(getattr(self, name)))
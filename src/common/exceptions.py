@@ -0,0 +1,17 @@
+"""
+공통 예외 모듈
+
+이 모듈은 애플리케이션 전반에서 사용하는 예외 클래스를 정의합니다.
+"""
+
+
+class JobQueueFullError(Exception):
+    """작업 큐가 가득 차 새 작업을 받을 수 없을 때 발생하는 예외"""
+
+
+class JobQueueUnavailableError(Exception):
+    """작업 큐가 시작되지 않았거나 종료 중일 때 발생하는 예외"""
+
+
+class UnsupportedContentTypeError(Exception):
+    """수집 대상 URL이 HTML이 아닌 콘텐츠를 반환할 때 발생하는 예외"""
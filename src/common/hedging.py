@@ -0,0 +1,210 @@
+"""
+요청 헤징(hedged request) 유틸리티
+
+이 모듈은 지연 시간 분포의 꼬리가 긴 외부 API 호출을 위한 헤징 실행기를 제공합니다.
+요청이 관측된 p90 지연 시간 안에 끝나지 않으면 같은 요청을 한 번 더 보내고
+먼저 도착한 응답을 사용합니다. 추가 요청 비율은 예산(budget)으로 제한됩니다.
+
+취소 후에도 작업이 계속 실행되는 요청(스레드 풀에서 실행되는 동기 SDK 호출 등)은 진 요청이
+끝까지 실행되어 API 할당량과 작업자를 소모하므로 헤징하지 않아야 합니다.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Awaitable, Callable, Deque, Optional, TypeVar
+
+from src.common.logging import get_logger
+from src.common.rate_limit import AsyncRateLimiter
+
+# 로거 설정
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """지연 시간 백분위수 기반 요청 헤징 실행기
+
+    최근 요청의 지연 시간을 기록하여 percentile 값을 헤지 지연 시간으로 사용합니다.
+    헤지 요청에 져서 취소된 요청은 취소 시점까지의 시간을 하한값으로 기록하고, 예외로 끝난
+    요청은 지연 시간 표본에 넣지 않고 실패 횟수로 따로 셉니다.
+    표본이 min_samples개보다 적으면 initial_delay를 사용합니다.
+    헤지 요청 수가 전체 요청 수의 budget 비율을 넘으면 더 이상 헤지하지 않습니다.
+    """
+
+    def __init__(self,
+                 name: str = "",
+                 budget: float = 0.1,
+                 percentile: float = 0.9,
+                 min_samples: int = 20,
+                 initial_delay: float = 2.0,
+                 window: int = 200) -> None:
+        """RequestHedger 초기화
+
+        Args:
+            name (str, optional): 로그와 통계에 표시할 이름
+            budget (float, optional): 전체 요청 대비 허용할 헤지 요청 비율. 기본값은 0.1.
+            percentile (float, optional): 헤지 지연 시간으로 사용할 백분위수. 기본값은 0.9.
+            min_samples (int, optional): 백분위수를 사용하기 위한 최소 표본 수. 기본값은 20.
+            initial_delay (float, optional): 표본이 부족할 때 사용할 헤지 지연 시간(초). 기본값은 2.0.
+            window (int, optional): 보관할 최근 지연 시간 표본 수. 기본값은 200.
+        """
+        self.name = name
+        self.budget = budget
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "hedged": 0, "hedge_wins": 0, "budget_denied": 0,
+                       "failures": 0, "cancelled": 0}
+
+    def hedge_delay(self) -> float:
+        """현재 헤지 지연 시간(관측된 백분위수 지연 시간)을 반환합니다.
+
+        Returns:
+            float: 헤지 요청을 보내기 전까지 기다릴 시간(초)
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+
+    def record(self, latency: float) -> None:
+        """완료되었거나 취소된 요청의 지연 시간을 기록합니다.
+
+        Args:
+            latency (float): 지연 시간(초). 취소된 요청은 취소 시점까지의 시간(하한값).
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    def record_failure(self) -> None:
+        """예외로 끝난 요청을 실패로 기록합니다. 실패는 지연 시간 표본에 넣지 않습니다."""
+        with self._lock:
+            self._stats["failures"] += 1
+
+    async def run(self, request: Callable[[], Awaitable[T]], limiter: Optional[AsyncRateLimiter] = None) -> T:
+        """요청을 실행하고, 헤지 지연 시간 안에 끝나지 않으면 중복 요청을 보냅니다.
+
+        먼저 성공한 응답을 반환하고 나머지 요청은 취소합니다. 두 요청이 모두 실패하면
+        마지막 예외를 다시 발생시킵니다.
+
+        Args:
+            request (Callable[[], Awaitable[T]]): 호출할 때마다 새 요청 코루틴을 만드는 함수
+            limiter (Optional[AsyncRateLimiter], optional): 헤지 요청 전에 토큰을 획득할 속도 제한기
+
+        Returns:
+            T: 먼저 성공한 응답
+        """
+        self._stats["requests"] += 1
+        delay = self.hedge_delay()
+        primary = asyncio.ensure_future(self._timed(request))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not self._allow_hedge():
+                return await primary
+
+            if limiter is not None:
+                await limiter.acquire()
+            if primary.done():
+                return await primary
+
+            logger.debug(f"헤지 요청 전송({self.name}): {delay:.2f}초 초과")
+            hedge = asyncio.ensure_future(self._timed(request))
+            pending.add(hedge)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    if task is hedge:
+                        self._stats["hedge_wins"] += 1
+                    return task.result()
+            raise error
+        finally:
+            # 호출이 취소되었거나 다른 요청이 먼저 끝난 경우 남은 요청 취소
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """헤징 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 요청/헤지/헤지 승리/실패/취소 횟수, 헤지 비율, 승리 비율, 현재 헤지 지연 시간
+        """
+        stats = dict(self._stats)
+        stats["hedge_rate"] = stats["hedged"] / stats["requests"] if stats["requests"] else 0.0
+        stats["win_rate"] = stats["hedge_wins"] / stats["hedged"] if stats["hedged"] else 0.0
+        stats["hedge_delay"] = round(self.hedge_delay(), 3)
+        stats["samples"] = len(self._latencies)
+        return stats
+
+    def _allow_hedge(self) -> bool:
+        """예산 안에서 헤지 요청을 보낼 수 있는지 확인하고 예약합니다."""
+        with self._lock:
+            if self._stats["hedged"] + 1 > self.budget * self._stats["requests"]:
+                self._stats["budget_denied"] += 1
+                return False
+            self._stats["hedged"] += 1
+            return True
+
+    async def _timed(self, request: Callable[[], Awaitable[T]]) -> T:
+        """요청을 실행하고 지연 시간 또는 실패를 기록합니다.
+
+        성공한 요청은 지연 시간을, 취소된 요청은 취소 시점까지의 시간을 하한값으로 기록합니다.
+        취소된 느린 요청을 빼면 p90 추정치가 낮아져 헤지 비율이 계속 올라가기 때문입니다.
+        """
+        started = time.monotonic()
+        try:
+            result = await request()
+        except asyncio.CancelledError:
+            with self._lock:
+                self._stats["cancelled"] += 1
+            self.record(time.monotonic() - started)
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        self.record(time.monotonic() - started)
+        return result
+
+
+# 프로세스 전역 헤징 실행기 레지스트리
+_HEDGERS: Dict[str, RequestHedger] = {}
+_HEDGERS_LOCK = threading.Lock()
+
+
+def get_request_hedger(name: str, **options: Any) -> RequestHedger:
+    """이름(검색 엔진)별로 공유되는 헤징 실행기를 가져옵니다.
+
+    지연 시간 표본과 예산은 같은 엔진을 사용하는 모든 검색기가 공유합니다.
+
+    Args:
+        name (str): 실행기 이름 (예: "tavily")
+        **options: 처음 생성할 때 RequestHedger에 전달할 옵션
+
+    Returns:
+        RequestHedger: 공유 헤징 실행기
+    """
+    with _HEDGERS_LOCK:
+        hedger = _HEDGERS.get(name)
+        if hedger is None:
+            hedger = RequestHedger(name=name, **options)
+            _HEDGERS[name] = hedger
+        return hedger
+
+
+def get_hedger_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 공유 헤징 실행기의 통계를 반환합니다.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 실행기 이름별 통계
+    """
+    return {name: hedger.stats() for name, hedger in list(_HEDGERS.items())}
@@ -0,0 +1,153 @@
+"""
+공유 HTTP 클라이언트 관리자
+
+이 모듈은 네이버 API, Tavily, 웹 콘텐츠 수집이 함께 사용하는 프로세스 범위의
+aiohttp ClientSession을 제공합니다. 요청마다 세션을 새로 만들지 않으므로 keep-alive 연결,
+DNS 캐시, TLS 세션이 재사용됩니다. 세션은 이벤트 루프별로 하나씩 생성됩니다.
+"""
+import asyncio
+from typing import Dict, Any, Optional, Tuple
+
+import aiohttp
+
+from src.common.config.http import HTTPConfiguration
+from src.common.exceptions import UnsupportedContentTypeError
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 웹 페이지 수집 시 허용하는 콘텐츠 유형
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+
+class HTTPSessionManager:
+    """이벤트 루프별 공유 aiohttp ClientSession 관리자
+
+    호스트별 연결 수 제한, TTL이 있는 DNS 캐시, keep-alive를 설정한 TCPConnector를 사용합니다.
+    세션은 요청 간 상태를 공유하지 않도록 쿠키를 저장하지 않습니다.
+    """
+
+    def __init__(self, config: Optional[HTTPConfiguration] = None) -> None:
+        """HTTPSessionManager 초기화
+
+        Args:
+            config (Optional[HTTPConfiguration], optional): HTTP 설정. 기본값은 환경 변수에서 로드.
+        """
+        self.config = config or HTTPConfiguration.from_runnable_config()
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프의 공유 세션을 반환합니다. 없으면 생성합니다.
+
+        실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+        Returns:
+            aiohttp.ClientSession: 공유 세션
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is not None and not session.closed:
+            return session
+
+        # 종료된 루프의 세션 정리
+        for stale_loop in [stale for stale in self._sessions if stale.is_closed()]:
+            self._sessions.pop(stale_loop, None)
+
+        connector = aiohttp.TCPConnector(
+            limit=self.config.http_limit,
+            limit_per_host=self.config.http_limit_per_host,
+            ttl_dns_cache=self.config.http_dns_ttl,
+            keepalive_timeout=self.config.http_keepalive_timeout,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.config.http_timeout, connect=self.config.http_connect_timeout)
+        session = aiohttp.ClientSession(connector=connector, timeout=timeout, cookie_jar=aiohttp.DummyCookieJar())
+        self._sessions[loop] = session
+        logger.debug(
+            f"공유 HTTP 세션 생성: 전체 {self.config.http_limit}개, 호스트별 {self.config.http_limit_per_host}개 연결"
+        )
+        return session
+
+    def stats(self) -> Dict[str, Any]:
+        """세션과 연결 풀 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 열린 세션 수와 세션별 유휴 연결 수
+        """
+        sessions = [session for session in self._sessions.values() if not session.closed]
+        return {
+            "sessions": len(sessions),
+            "limit": self.config.http_limit,
+            "limit_per_host": self.config.http_limit_per_host,
+            "idle_connections": [
+                sum(len(conns) for conns in getattr(session.connector, "_conns", {}).values())
+                for session in sessions
+            ],
+        }
+
+    async def close(self) -> None:
+        """현재 이벤트 루프의 세션을 닫고, 종료된 루프의 세션은 목록에서 제거합니다."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+            logger.debug("공유 HTTP 세션 종료")
+
+        for stale_loop in [stale for stale in self._sessions if stale.is_closed()]:
+            self._sessions.pop(stale_loop, None)
+
+
+# 프로세스 전역 세션 관리자
+http_session_manager = HTTPSessionManager()
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """프로세스 전역 공유 aiohttp 세션을 가져옵니다.
+
+    반환된 세션은 여러 호출이 공유하므로 `async with`로 닫지 말고 요청에만 사용해야 합니다.
+
+    Returns:
+        aiohttp.ClientSession: 공유 세션
+    """
+    return http_session_manager.get_session()
+
+
+async def close_http_sessions() -> None:
+    """공유 aiohttp 세션을 닫습니다 (서버 종료 시 사용)."""
+    await http_session_manager.close()
+
+
+async def read_html_body(response: aiohttp.ClientResponse,
+                         max_bytes: Optional[int] = None,
+                         chunk_size: int = 65536) -> Tuple[bytes, bool]:
+    """HTML 응답 본문을 최대 바이트 수까지만 스트리밍으로 읽습니다.
+
+    Content-Type이 HTML이 아니면 본문을 읽기 전에 예외를 발생시킵니다 (헤더가 없으면 HTML로 간주).
+    최대 바이트 수를 넘는 나머지 본문은 내려받지 않습니다.
+
+    Args:
+        response (aiohttp.ClientResponse): 상태 코드를 확인한 응답
+        max_bytes (Optional[int], optional): 읽을 최대 바이트 수. 기본값은 HTTP_MAX_PAGE_BYTES 설정.
+        chunk_size (int, optional): 한 번에 읽을 바이트 수. 기본값은 65536.
+
+    Returns:
+        Tuple[bytes, bool]: (본문 바이트, 최대 바이트 수에서 잘렸는지 여부)
+
+    Raises:
+        UnsupportedContentTypeError: HTML이 아닌 콘텐츠 유형인 경우
+    """
+    if response.headers.get("Content-Type") and response.content_type not in HTML_CONTENT_TYPES:
+        raise UnsupportedContentTypeError(f"HTML이 아닌 콘텐츠 유형: {response.content_type}")
+
+    max_bytes = max_bytes or http_session_manager.config.http_max_page_bytes
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(chunk_size):
+        remaining = max_bytes - size
+        if len(chunk) > remaining:
+            chunks.append(chunk[:remaining])
+            logger.debug(f"응답 본문을 {max_bytes}바이트에서 자릅니다: {response.url}")
+            return b"".join(chunks), True
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks), False
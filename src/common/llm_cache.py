@@ -0,0 +1,279 @@
+"""
+LLM 응답 캐시
+
+이 모듈은 계획/작성/평가 노드의 LLM 호출 결과를 (제공자, 모델, 온도, 메시지, 출력 스키마)의
+해시로 저장하는 2단계 캐시(메모리 LRU + SQLite)를 제공합니다. 같은 주제로 블로그를 다시 생성하거나
+실패 후 재실행하는 경우 동일한 호출이 토큰을 사용하지 않고 캐시에서 응답됩니다.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from pydantic import TypeAdapter
+
+from src.common.config import Configuration, LLMCacheConfiguration
+from src.common.config.providers import get_chat_model
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+
+class LLMResponseCache:
+    """2단계 LLM 응답 캐시
+
+    조회 시 메모리 LRU를 먼저 확인하고, 없으면 SQLite 파일(path가 지정된 경우)을 확인하여
+    메모리로 승격합니다. ttl_seconds가 지난 항목은 무시되고 제거됩니다.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: int = 86400, path: Optional[str] = None) -> None:
+        """LLMResponseCache 초기화
+
+        Args:
+            max_entries (int, optional): 메모리에 보관할 최대 항목 수. 기본값은 1000.
+            ttl_seconds (int, optional): 항목 유효 시간(초). 기본값은 86400.
+            path (Optional[str], optional): SQLite 파일 경로. None이면 메모리만 사용.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 값을 조회합니다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Optional[str]: 직렬화된 응답 또는 None (없거나 만료된 경우)
+        """
+        expires_before = time.time() - self.ttl_seconds
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] >= expires_before:
+                    self._memory.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[1]
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    if row[1] >= expires_before:
+                        self._remember(key, row[1], row[0])
+                        self._stats["disk_hits"] += 1
+                        return row[0]
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """값을 캐시에 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            value (str): 직렬화된 응답
+        """
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, value)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, created_at)
+                )
+                self._conn.commit()
+            self._stats["writes"] += 1
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 제거합니다."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_cache")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 메모리 항목 수와 적중/미스/저장 횟수
+        """
+        return {"entries": len(self._memory), "path": self.path, **self._stats}
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, created_at: float, value: str) -> None:
+        """메모리 LRU에 항목을 넣습니다 (잠금을 잡은 상태에서 호출)."""
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# 프로세스 전역 캐시 (경로, 크기, 유효 시간은 서버 설정에서만 결정)
+_CACHE: Optional[LLMResponseCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_llm_cache(config: Optional[LLMCacheConfiguration] = None) -> LLMResponseCache:
+    """프로세스 전역 LLM 응답 캐시를 가져옵니다. 처음 호출할 때 서버 설정으로 생성됩니다.
+
+    Args:
+        config (Optional[LLMCacheConfiguration], optional): 캐시 설정. 기본값은 환경 변수에서 로드.
+
+    Returns:
+        LLMResponseCache 인스턴스
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            config = config or LLMCacheConfiguration.from_runnable_config()
+            _CACHE = LLMResponseCache(
+                max_entries=config.llm_cache_max_entries,
+                ttl_seconds=config.llm_cache_ttl,
+                path=config.llm_cache_path or None
+            )
+        return _CACHE
+
+
+def close_llm_cache() -> None:
+    """프로세스 전역 LLM 응답 캐시를 닫고 제거합니다."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is not None:
+            _CACHE.close()
+            _CACHE = None
+
+
+def make_cache_key(provider: str,
+                   model: str,
+                   temperature: Optional[float],
+                   messages: Sequence[BaseMessage],
+                   structured_output: Optional[Any] = None,
+                   options: Optional[Dict[str, Any]] = None) -> str:
+    """LLM 호출을 식별하는 캐시 키를 만듭니다.
+
+    Args:
+        provider: LLM 제공자 이름
+        model: 모델 이름
+        temperature: 샘플링 온도
+        messages: 입력 메시지 목록
+        structured_output: 구조화 출력 스키마 (JSON 스키마로 해시에 포함)
+        options: 추가 모델 옵션
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    payload = {
+        "provider": provider,
+        "model": model,
+        "temperature": temperature,
+        "messages": [message_to_dict(message) for message in messages],
+        "schema": TypeAdapter(structured_output).json_schema() if structured_output is not None else None,
+        "options": options or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _serialize(result: Any, structured_output: Optional[Any]) -> str:
+    """LLM 응답을 캐시에 저장할 JSON 문자열로 변환합니다."""
+    if structured_output is not None:
+        return json.dumps(TypeAdapter(structured_output).dump_python(result, mode="json"), ensure_ascii=False)
+    return json.dumps(message_to_dict(result), ensure_ascii=False)
+
+
+def _deserialize(value: str, structured_output: Optional[Any]) -> Any:
+    """캐시된 JSON 문자열을 LLM 응답 객체로 복원합니다."""
+    data = json.loads(value)
+    if structured_output is not None:
+        return TypeAdapter(structured_output).validate_python(data)
+    return messages_from_dict([data])[0]
+
+
+def invoke_chat_model(configurable: Configuration,
+                      provider: str,
+                      model: str,
+                      messages: List[BaseMessage],
+                      temperature: Optional[float] = None,
+                      structured_output: Optional[Any] = None,
+                      **kwargs: Any) -> Any:
+    """채팅 모델을 호출합니다. 구성에서 llm_cache가 켜져 있으면 응답 캐시를 사용합니다.
+
+    llm_cache_bypass가 켜져 있으면 캐시를 읽지 않고 모델을 호출한 뒤 결과로 캐시를 갱신합니다.
+
+    Args:
+        configurable: 워크플로우 구성
+        provider: LLM 제공자 이름
+        model: 모델 이름
+        messages: 입력 메시지 목록
+        temperature: 샘플링 온도 (None이면 모델 기본값)
+        structured_output: with_structured_output 스키마 (None이면 AIMessage 반환)
+        **kwargs: get_chat_model에 전달할 추가 옵션
+
+    Returns:
+        AIMessage 또는 구조화 출력 객체
+    """
+    chat_model = get_chat_model(provider, model, temperature=temperature,
+                                structured_output=structured_output, **kwargs)
+    if not configurable.llm_cache:
+        return chat_model.invoke(messages)
+
+    cache = get_llm_cache()
+    key = make_cache_key(provider, model, temperature, messages, structured_output, kwargs)
+
+    if not configurable.llm_cache_bypass:
+        cached = cache.get(key)
+        if cached is not None:
+            try:
+                result = _deserialize(cached, structured_output)
+                logger.debug(f"LLM 응답 캐시 적중: {provider}/{model}")
+                return result
+            except Exception as e:
+                logger.warning(f"캐시된 LLM 응답을 복원하지 못했습니다: {str(e)}")
+
+    result = chat_model.invoke(messages)
+    try:
+        cache.set(key, _serialize(result, structured_output))
+    except Exception as e:
+        logger.warning(f"LLM 응답을 캐시에 저장하지 못했습니다: {str(e)}")
+    return result
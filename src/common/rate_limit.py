@@ -0,0 +1,260 @@
+"""
+요청 속도 제한 유틸리티
+
+이 모듈은 외부 API 호출을 초당 요청 수(QPS)로 제한하는 토큰 버킷 기반의
+비동기 속도 제한기와 공급자/호스트별 공유 제한기 레지스트리를 제공합니다.
+429(Too Many Requests) 응답을 받으면 허용 속도를 낮추고, 성공하면 점차 원래 속도로 회복합니다.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 공급자별 기본 (QPS, 버스트). RATE_LIMIT_<이름>_QPS, RATE_LIMIT_<이름>_BURST 환경 변수로 덮어쓸 수 있습니다.
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "perplexity": (1.0, 2),
+    "exa": (4.0, 4),
+    "tavily": (5.0, 5),
+    "arxiv": (1 / 3, 1),  # arXiv API 이용 지침: 3초에 1회
+    "pubmed": (3.0, 3),  # NCBI E-utilities: API 키 없이 초당 3회
+    "naver": (10.0, 10),
+    "naver_searchad": (5.0, 5),  # 네이버 검색광고 키워드 도구 API
+    "host": (0.5, 1),  # 웹 페이지 크롤링 시 호스트별 기본값
+}
+
+
+class AsyncRateLimiter:
+    """토큰 버킷 방식의 비동기 속도 제한기
+
+    토큰은 초당 rate개씩 최대 burst개까지 채워지며, acquire()는 토큰이 생길 때까지 기다립니다.
+    토큰을 먼저 예약한 뒤 대기하므로 여러 코루틴(또는 이벤트 루프)이 동시에 호출해도
+    전체 처리량이 rate를 넘지 않습니다.
+
+    penalize()는 429 응답 시 속도를 절반으로 낮추고 잠시 요청을 멈추며,
+    reward()는 성공한 요청마다 원래 속도까지 조금씩 회복합니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None, name: str = "") -> None:
+        """AsyncRateLimiter 초기화
+
+        Args:
+            rate (float): 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst (Optional[int], optional): 한 번에 허용할 최대 요청 수. 기본값은 max(1, int(rate)).
+            name (str, optional): 로그에 표시할 제한기 이름
+        """
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 8 if rate > 0 else 0
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited_seconds": 0.0, "throttled": 0}
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 획득할 때까지 기다립니다.
+
+        Args:
+            tokens (float, optional): 필요한 토큰 수. 기본값은 1.
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """속도 제한 응답(429)을 받았을 때 허용 속도를 낮추고 잠시 요청을 멈춥니다.
+
+        Args:
+            retry_after (Optional[float], optional): 서버가 알려준 재시도 대기 시간(초)
+        """
+        if self.base_rate <= 0:
+            return
+
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+            self._stats["throttled"] += 1
+        logger.warning(f"속도 제한 초과({self.name}): {self.rate:.2f} QPS로 낮추고 {pause:.1f}초 대기합니다.")
+
+    def reward(self) -> None:
+        """성공한 요청 후 허용 속도를 원래 값까지 조금씩 회복합니다."""
+        if self.rate < self.base_rate:
+            with self._lock:
+                self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+    def stats(self) -> Dict[str, Any]:
+        """제한기 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 현재/기본 QPS, 획득 횟수, 누적 대기 시간, 429 횟수
+        """
+        return {"rate": self.rate, "base_rate": self.base_rate, "burst": self.burst, **self._stats}
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 예약하고 사용 가능해질 때까지의 대기 시간을 계산합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+
+            delay = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            self._stats["acquired"] += 1
+            self._stats["waited_seconds"] += delay
+            return delay
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+# 프로세스 전역 제한기 레지스트리 (공급자별)
+_LIMITERS: Dict[str, AsyncRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+# 크롤링한 호스트별 제한기 ("host:<호스트>"). 호스트 수에 제한이 없으므로 최근에 사용한 항목만 보관
+_HOST_LIMITERS: "OrderedDict[str, AsyncRateLimiter]" = OrderedDict()
+MAX_HOST_LIMITERS = int(os.environ.get("RATE_LIMIT_MAX_HOSTS", 1024))
+
+
+def get_rate_limiter(name: str, rate: Optional[float] = None, burst: Optional[int] = None) -> AsyncRateLimiter:
+    """이름(공급자 또는 "host:<호스트>")별로 공유되는 속도 제한기를 가져옵니다.
+
+    처음 요청될 때 RATE_LIMIT_<이름>_QPS / _BURST 환경 변수, DEFAULT_RATE_LIMITS,
+    인자로 받은 값 순서로 설정을 정해 생성합니다. 호스트별 제한기는 최근에 사용한
+    MAX_HOST_LIMITERS개만 보관합니다.
+
+    Args:
+        name (str): 제한기 이름 (예: "perplexity", "host:news.naver.com")
+        rate (Optional[float], optional): 기본 QPS
+        burst (Optional[int], optional): 기본 버스트
+
+    Returns:
+        AsyncRateLimiter: 공유 제한기
+    """
+    kind = name.split(":", 1)[0]
+    registry = _HOST_LIMITERS if kind == "host" else _LIMITERS
+    with _LIMITERS_LOCK:
+        limiter = registry.get(name)
+        if limiter is None:
+            default_rate, default_burst = DEFAULT_RATE_LIMITS.get(kind, (0.0, 1))
+            env_name = kind.upper().replace("-", "_").replace(".", "_")
+            rate = float(os.environ.get(f"RATE_LIMIT_{env_name}_QPS", rate if rate is not None else default_rate))
+            burst = int(os.environ.get(f"RATE_LIMIT_{env_name}_BURST", burst if burst is not None else default_burst))
+            limiter = AsyncRateLimiter(rate, burst, name=name)
+            registry[name] = limiter
+        if registry is _HOST_LIMITERS:
+            # 가장 오래 사용하지 않은 호스트 제한기부터 제거
+            _HOST_LIMITERS.move_to_end(name)
+            while len(_HOST_LIMITERS) > MAX_HOST_LIMITERS:
+                _HOST_LIMITERS.popitem(last=False)
+        return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 공유 제한기의 상태를 반환합니다. 호스트별 제한기는 "host" 항목 하나로 합산합니다.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 제한기 이름별 상태
+    """
+    with _LIMITERS_LOCK:
+        limiters = list(_LIMITERS.items())
+        host_limiters = list(_HOST_LIMITERS.values())
+
+    stats = {name: limiter.stats() for name, limiter in limiters}
+    if host_limiters:
+        host_stats = [limiter.stats() for limiter in host_limiters]
+        stats["host"] = {
+            "limiters": len(host_stats),
+            "max_limiters": MAX_HOST_LIMITERS,
+            "slowed_down": sum(1 for item in host_stats if item["rate"] < item["base_rate"]),
+            "acquired": sum(item["acquired"] for item in host_stats),
+            "waited_seconds": sum(item["waited_seconds"] for item in host_stats),
+            "throttled": sum(item["throttled"] for item in host_stats),
+        }
+    return stats
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """예외가 속도 제한(HTTP 429) 응답으로 인한 것인지 확인합니다.
+
+    Args:
+        error (BaseException): 확인할 예외
+
+    Returns:
+        bool: 429 응답 여부
+    """
+    response = getattr(error, "response", None)
+    for status in (getattr(error, "status", None), getattr(error, "status_code", None),
+                   getattr(response, "status_code", None), getattr(response, "status", None)):
+        if status == 429:
+            return True
+    return "Too Many Requests" in str(error)
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """예외의 응답 헤더에서 Retry-After 값을 읽습니다.
+
+    Args:
+        error (BaseException): 확인할 예외
+
+    Returns:
+        Optional[float]: 재시도 대기 시간(초) 또는 None
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or getattr(error, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def gather_rate_limited(items: Sequence[T],
+                              func: Callable[[T], Awaitable[R]],
+                              limiter: AsyncRateLimiter,
+                              concurrency: int = 5) -> List[Any]:
+    """속도 제한을 지키면서 항목별 비동기 작업을 동시에 실행합니다.
+
+    최대 concurrency개를 동시에 실행하고, 각 작업은 시작 전에 limiter에서 토큰을 획득합니다.
+
+    Args:
+        items (Sequence[T]): 처리할 항목 목록
+        func (Callable[[T], Awaitable[R]]): 항목별 비동기 함수
+        limiter (AsyncRateLimiter): 속도 제한기
+        concurrency (int, optional): 최대 동시 실행 수. 기본값은 5.
+
+    Returns:
+        List[Any]: 입력 순서와 같은 순서의 결과 (실패한 항목은 예외 객체)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            await limiter.acquire()
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
@@ -0,0 +1,210 @@
+"""
+토큰 수 계산 유틸리티
+
+이 모듈은 프롬프트에 넣을 텍스트의 토큰 수를 세고 토큰 경계에서 자르는 토크나이저를 제공합니다.
+기본 토크나이저는 tiktoken 인코딩(TOKENIZER_ENCODING 환경 변수, 기본값 cl100k_base)을 사용하고,
+tiktoken이 없거나 인코딩 파일을 받을 수 없는 환경(오프라인 등)에서는 추정 토크나이저를 사용합니다.
+추정 토크나이저는 연속된 ASCII 문자 최대 4자를 1토큰, 한글 등 그 밖의 문자는 1자를 1토큰으로 나눕니다.
+기본 토크나이저는 set_tokenizer로 교체할 수 있습니다. 머리글, 구분자처럼 같은 짧은 텍스트를 반복해서
+세는 경우가 많으므로 짧은 텍스트의 토큰 수만 토크나이저별 작은 LRU 캐시에 보관합니다. 긴 문서와 토큰
+목록은 메모리를 많이 차지하므로 캐시하지 않습니다.
+"""
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 기본 tiktoken 인코딩 (TOKENIZER_ENCODING 환경 변수로 변경 가능)
+DEFAULT_ENCODING = "cl100k_base"
+
+# 토크나이저별 토큰 수 캐시 크기
+DEFAULT_CACHE_SIZE = 256
+
+# 토큰 수를 캐시할 최대 텍스트 길이(문자)
+COUNT_CACHE_MAX_CHARS = 256
+
+
+class Tokenizer:
+    """토크나이저 기본 클래스
+
+    하위 클래스는 encode와 decode를 구현합니다. COUNT_CACHE_MAX_CHARS 이하 텍스트의 토큰 수는 LRU 캐시에
+    보관됩니다.
+    """
+
+    name = "base"
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Tokenizer 초기화
+
+        Args:
+            cache_size (int, optional): 짧은 텍스트의 토큰 수 LRU 캐시 크기. 기본값은 256.
+        """
+        self._count_cached = lru_cache(maxsize=cache_size)(self._count)
+
+    def encode(self, text: str) -> Tuple:
+        """텍스트를 토큰 튜플로 변환합니다."""
+        raise NotImplementedError
+
+    def decode(self, tokens: Sequence) -> str:
+        """토큰을 텍스트로 변환합니다."""
+        raise NotImplementedError
+
+    def count(self, text: str) -> int:
+        """텍스트의 토큰 수를 계산합니다.
+
+        Args:
+            text (str): 텍스트
+
+        Returns:
+            int: 토큰 수
+        """
+        if not text:
+            return 0
+        if len(text) <= COUNT_CACHE_MAX_CHARS:
+            return self._count_cached(text)
+        return self._count(text)
+
+    def _count(self, text: str) -> int:
+        """캐시를 거치지 않고 토큰 수를 계산합니다."""
+        return len(self.encode(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """텍스트를 토큰 경계에서 max_tokens 토큰 이하로 자릅니다.
+
+        Args:
+            text (str): 텍스트
+            max_tokens (int): 최대 토큰 수
+
+        Returns:
+            str: 잘린 텍스트 (토큰 수가 max_tokens 이하면 원문 그대로)
+        """
+        if max_tokens <= 0:
+            return ""
+        tokens = self.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return self.decode(tokens[:max_tokens])
+
+    def cache_info(self):
+        """토큰 수 캐시 통계(hits, misses, maxsize, currsize)를 반환합니다."""
+        return self._count_cached.cache_info()
+
+
+class TiktokenTokenizer(Tokenizer):
+    """tiktoken 인코딩을 사용하는 토크나이저"""
+
+    def __init__(self, encoding: str = DEFAULT_ENCODING, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """TiktokenTokenizer 초기화
+
+        Args:
+            encoding (str, optional): tiktoken 인코딩 이름. 기본값은 "cl100k_base".
+            cache_size (int, optional): 짧은 텍스트의 토큰 수 LRU 캐시 크기. 기본값은 256.
+
+        Raises:
+            ImportError: tiktoken이 설치되지 않은 경우
+            Exception: 인코딩 파일을 불러올 수 없는 경우
+        """
+        import tiktoken
+
+        super().__init__(cache_size)
+        self.name = f"tiktoken:{encoding}"
+        self._encoding = tiktoken.get_encoding(encoding)
+
+    def encode(self, text: str) -> Tuple[int, ...]:
+        return tuple(self._encoding.encode(text, disallowed_special=()))
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        # 잘린 위치에 남는 불완전한 멀티바이트 문자는 제거
+        return self._encoding.decode(list(tokens)).rstrip("�")
+
+
+class EstimateTokenizer(Tokenizer):
+    """문자 종류별로 토큰을 나누는 추정 토크나이저 (토큰은 원문 조각)"""
+
+    name = "estimate"
+
+    _TOKEN_PATTERN = re.compile(r"[\x00-\x7f]{1,4}|[^\x00-\x7f]", re.DOTALL)
+
+    def encode(self, text: str) -> Tuple[str, ...]:
+        return tuple(self._TOKEN_PATTERN.findall(text))
+
+    def decode(self, tokens: Sequence[str]) -> str:
+        return "".join(tokens)
+
+
+_default_tokenizer: Optional[Tokenizer] = None
+_tokenizer_lock = threading.Lock()
+
+
+def create_tokenizer(encoding: Optional[str] = None) -> Tokenizer:
+    """tiktoken 토크나이저를 만들고, 사용할 수 없으면 추정 토크나이저를 반환합니다.
+
+    Args:
+        encoding (Optional[str], optional): tiktoken 인코딩 이름. None이면 TOKENIZER_ENCODING 또는 DEFAULT_ENCODING.
+
+    Returns:
+        Tokenizer: 토크나이저
+    """
+    encoding = encoding or os.environ.get("TOKENIZER_ENCODING", DEFAULT_ENCODING)
+    try:
+        return TiktokenTokenizer(encoding)
+    except Exception as e:
+        logger.warning(f"tiktoken 인코딩 '{encoding}'을 사용할 수 없어 토큰 수를 추정치로 계산합니다: {e}")
+        return EstimateTokenizer()
+
+
+def get_tokenizer() -> Tokenizer:
+    """기본 토크나이저를 반환합니다. 처음 호출할 때 생성됩니다.
+
+    Returns:
+        Tokenizer: 기본 토크나이저
+    """
+    global _default_tokenizer
+    with _tokenizer_lock:
+        if _default_tokenizer is None:
+            _default_tokenizer = create_tokenizer()
+        return _default_tokenizer
+
+
+def set_tokenizer(tokenizer: Optional[Tokenizer]) -> None:
+    """기본 토크나이저를 교체합니다.
+
+    Args:
+        tokenizer (Optional[Tokenizer]): 새 기본 토크나이저. None이면 다음 호출 때 다시 생성.
+    """
+    global _default_tokenizer
+    with _tokenizer_lock:
+        _default_tokenizer = tokenizer
+
+
+def count_tokens(text: str, tokenizer: Optional[Tokenizer] = None) -> int:
+    """텍스트의 토큰 수를 계산합니다.
+
+    Args:
+        text (str): 텍스트
+        tokenizer (Optional[Tokenizer], optional): 토크나이저. 기본값은 get_tokenizer().
+
+    Returns:
+        int: 토큰 수
+    """
+    return (tokenizer or get_tokenizer()).count(text)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, tokenizer: Optional[Tokenizer] = None) -> str:
+    """텍스트를 토큰 경계에서 max_tokens 토큰 이하로 자릅니다.
+
+    Args:
+        text (str): 텍스트
+        max_tokens (int): 최대 토큰 수
+        tokenizer (Optional[Tokenizer], optional): 토크나이저. 기본값은 get_tokenizer().
+
+    Returns:
+        str: 잘린 텍스트 (토큰 수가 max_tokens 이하면 원문 그대로)
+    """
+    return (tokenizer or get_tokenizer()).truncate(text, max_tokens)
@@ -12,7 +12,11 @@ from src.common.utils.selenium_utils import (
     safe_driver_get,
     extract_text_from_element,
     save_screenshot,
-    close_driver
+    close_driver,
+    wait_for_page_ready,
+    WebDriverPool,
+    get_webdriver_pool,
+    close_webdriver_pools
 )
 
 __all__ = [
@@ -23,5 +27,9 @@ __all__ = [
     'safe_driver_get',
     'extract_text_from_element',
     'save_screenshot',
-    'close_driver'
+    'close_driver',
+    'wait_for_page_ready',
+    'WebDriverPool',
+    'get_webdriver_pool',
+    'close_webdriver_pools'
 ] 
\ No newline at end of file
@@ -6,12 +6,15 @@
 import os
 import sys
 import time
+import atexit
 import random
 import logging
 import zipfile
 import platform
+import threading
 import subprocess
-from typing import Optional, Dict, Any, Union, List, Tuple
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Union, List, Tuple, Callable, Iterator
 from pathlib import Path
 
 import requests
@@ -24,6 +27,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from fake_useragent import UserAgent, FakeUserAgentError
 
+from src.common.config.webdriver import WebDriverConfiguration
 from src.common.logging import get_logger
 
 # 로거 설정
@@ -371,4 +375,243 @@ def close_driver(driver: webdriver.Chrome) -> None:
         driver.quit()
         logger.debug("WebDriver 종료 완료")
     except Exception as e:
-        logger.warning(f"WebDriver 종료 중 오류 발생: {str(e)}") 
\ No newline at end of file
+        logger.warning(f"WebDriver 종료 중 오류 발생: {str(e)}")
+
+def wait_for_page_ready(
+    driver: webdriver.Chrome,
+    timeout: float = 10,
+    condition: Optional[Callable[[webdriver.Chrome], bool]] = None
+) -> bool:
+    """
+    document.readyState가 complete가 되고 추가 조건을 만족할 때까지 대기합니다.
+    
+    Args:
+        driver: Chrome WebDriver 객체
+        timeout: 최대 대기 시간(초)
+        condition: 함께 만족해야 하는 조건 (예: 리디렉션 완료 여부)
+        
+    Returns:
+        bool: 시간 안에 준비되었는지 여부 (시간 초과 시 False, 현재 상태 그대로 사용 가능)
+    """
+    def is_ready(current: webdriver.Chrome) -> bool:
+        if current.execute_script("return document.readyState") != "complete":
+            return False
+        return condition is None or condition(current)
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(is_ready)
+        return True
+    except TimeoutException:
+        logger.debug(f"페이지 준비 대기 시간 초과 ({timeout}초): {driver.current_url}")
+        return False
+
+
+class WebDriverPool:
+    """
+    재사용 가능한 헤드리스 Chrome WebDriver 풀
+    
+    동시에 실행되는 Chrome 프로세스 수를 size개로 제한하고, 사용이 끝난 드라이버를 종료하지 않고
+    다음 요청에 다시 사용합니다. 꺼낼 때 상태를 확인하여 응답하지 않는 드라이버는 새로 만들고,
+    max_pages개 페이지를 로드한 드라이버는 메모리 누수를 막기 위해 재시작합니다.
+    스레드 안전하므로 asyncio.to_thread로 실행되는 작업에서 함께 사용할 수 있습니다.
+    """
+    
+    def __init__(
+        self,
+        driver_factory: Optional[Callable[[], webdriver.Chrome]] = None,
+        size: int = 2,
+        max_pages: int = 50,
+        checkout_timeout: float = 120
+    ) -> None:
+        """
+        WebDriverPool 초기화
+        
+        Args:
+            driver_factory: 새 드라이버를 만드는 함수 (기본값: 헤드리스 setup_chrome_driver)
+            size: 최대 드라이버 수
+            max_pages: 드라이버를 재시작하기 전까지 로드할 최대 페이지 수
+            checkout_timeout: 사용 가능한 드라이버를 기다리는 최대 시간(초)
+        """
+        self.driver_factory = driver_factory or setup_chrome_driver
+        self.size = size
+        self.max_pages = max_pages
+        self.checkout_timeout = checkout_timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: List[webdriver.Chrome] = []
+        self._pages: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {"created": 0, "reused": 0, "recycled": 0, "unhealthy": 0}
+    
+    def checkout(self) -> webdriver.Chrome:
+        """
+        풀에서 드라이버를 꺼냅니다. 대기 중인 드라이버가 없으면 새로 만듭니다.
+        
+        Returns:
+            webdriver.Chrome: 사용할 드라이버 (사용 후 반드시 checkin 호출)
+            
+        Raises:
+            TimeoutError: checkout_timeout 안에 드라이버를 얻지 못한 경우
+            RuntimeError: 풀이 닫힌 경우
+        """
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise TimeoutError(f"{self.checkout_timeout}초 안에 사용 가능한 WebDriver가 없습니다.")
+        try:
+            while True:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("WebDriver 풀이 닫혔습니다.")
+                    driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    break
+                healthy = self._is_healthy(driver)
+                with self._lock:
+                    self._stats["reused" if healthy else "unhealthy"] += 1
+                if healthy:
+                    return driver
+                self._discard(driver)
+            
+            driver = self.driver_factory()
+            with self._lock:
+                self._pages[id(driver)] = 0
+                self._stats["created"] += 1
+                created = self._stats["created"]
+            logger.debug(f"WebDriver 생성 ({created}번째)")
+            return driver
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    def checkin(self, driver: webdriver.Chrome, discard: bool = False) -> None:
+        """
+        사용한 드라이버를 풀에 돌려줍니다.
+        
+        Args:
+            driver: checkout으로 꺼낸 드라이버
+            discard: True이면 재사용하지 않고 종료 (예: 드라이버 오류 발생 시)
+        """
+        try:
+            with self._lock:
+                pages = self._pages.get(id(driver), 0) + 1
+                self._pages[id(driver)] = pages
+                closed = self._closed
+            
+            if discard or closed:
+                self._discard(driver)
+                return
+            if pages >= self.max_pages:
+                with self._lock:
+                    self._stats["recycled"] += 1
+                logger.debug(f"WebDriver 재시작: {pages}페이지 로드")
+                self._discard(driver)
+                return
+            
+            # 다음 요청에 쿠키와 페이지 메모리가 남지 않도록 정리
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception as e:
+                logger.debug(f"WebDriver 정리 실패, 종료합니다: {str(e)}")
+                self._discard(driver)
+                return
+            with self._lock:
+                self._idle.append(driver)
+        finally:
+            self._slots.release()
+    
+    @contextmanager
+    def driver(self) -> Iterator[webdriver.Chrome]:
+        """
+        with 문으로 드라이버를 사용합니다. WebDriver 오류가 발생하면 드라이버를 재사용하지 않습니다.
+        
+        Yields:
+            webdriver.Chrome: 사용할 드라이버
+        """
+        driver = self.checkout()
+        discard = False
+        try:
+            yield driver
+        except WebDriverException:
+            discard = True
+            raise
+        finally:
+            self.checkin(driver, discard=discard)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        풀 상태를 반환합니다.
+        
+        Returns:
+            Dict[str, Any]: 최대/활성/대기 드라이버 수와 생성/재사용/재시작/비정상 횟수
+        """
+        with self._lock:
+            return {"size": self.size, "alive": len(self._pages), "idle": len(self._idle), **self._stats}
+    
+    def close(self) -> None:
+        """대기 중인 모든 드라이버를 종료합니다. 사용 중인 드라이버는 checkin할 때 종료됩니다."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+    
+    def _is_healthy(self, driver: webdriver.Chrome) -> bool:
+        """드라이버가 명령에 응답하는지 확인합니다."""
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+    
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        """드라이버를 종료하고 풀에서 제거합니다."""
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        close_driver(driver)
+
+
+# 이름별 프로세스 전역 WebDriver 풀
+_POOLS: Dict[str, WebDriverPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_webdriver_pool(
+    name: str = "default",
+    driver_factory: Optional[Callable[[], webdriver.Chrome]] = None,
+    config: Optional[WebDriverConfiguration] = None
+) -> WebDriverPool:
+    """
+    이름별로 공유되는 WebDriver 풀을 가져옵니다.
+    
+    Args:
+        name: 풀 이름 (드라이버 옵션이 다른 사용처마다 별도 풀 사용)
+        driver_factory: 처음 생성할 때 사용할 드라이버 생성 함수
+        config: 처음 생성할 때 사용할 설정 (기본값: 환경 변수에서 로드)
+        
+    Returns:
+        WebDriverPool: 공유 WebDriver 풀
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(name)
+        if pool is None:
+            config = config or WebDriverConfiguration.from_runnable_config()
+            pool = WebDriverPool(
+                driver_factory=driver_factory,
+                size=config.webdriver_pool_size,
+                max_pages=config.webdriver_max_pages,
+                checkout_timeout=config.webdriver_checkout_timeout
+            )
+            _POOLS[name] = pool
+        return pool
+
+
+def close_webdriver_pools() -> None:
+    """모든 공유 WebDriver 풀의 드라이버를 종료합니다."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+# 프로세스 종료 시 Chrome 프로세스가 남지 않도록 정리
+atexit.register(close_webdriver_pools)
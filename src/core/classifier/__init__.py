@@ -5,9 +5,11 @@
 """
 
 from src.core.classifier.keyword_classifier import KeywordClassifier, KeywordType, KeywordClassifierConfig
+from src.core.classifier.keyword_matcher import KeywordMatcher
 
 __all__ = [
     'KeywordClassifier',
     'KeywordType',
-    'KeywordClassifierConfig'
+    'KeywordClassifierConfig',
+    'KeywordMatcher'
 ] 
\ No newline at end of file
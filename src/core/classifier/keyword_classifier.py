@@ -5,13 +5,28 @@
 """
 import os
 import json
+import time
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Awaitable, Dict, List, Optional, Any, Sequence, Union
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.core.search.utils import naver_search
+import numpy as np
+
+from src.common.http_client import close_http_sessions
+from src.common.rate_limit import AsyncRateLimiter, get_rate_limiter
+from src.core.classifier.keyword_matcher import (
+    INFO_CONTENT_WORDS,
+    PRODUCT_KEYWORD_WORDS,
+    KeywordMatcher,
+    item_text
+)
+from src.core.search.engines.naver import naver_search, naver_search_async
+from src.core.search.manager.search_cache import SearchResultCache, make_search_cache_key
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -30,6 +45,12 @@ class KeywordClassifierConfig:
     llm_temperature: float = 0
     min_brand_consistency: float = 0.7
     min_valid_items: int = 5
+    max_concurrency: int = 8    # classify_many에서 동시에 분류할 최대 키워드 수
+    naver_qps: float = 10.0     # 네이버 검색 API 초당 최대 요청 수 (0 이하이면 제한 없음)
+    search_cache_ttl: int = 86400  # 네이버 검색 원본 응답 캐시 유효 시간(초)
+    search_cache_path: str = "data/naver_search_cache.sqlite3"  # 네이버 검색 원본 응답 캐시 SQLite 파일 (빈 문자열이면 메모리만 사용)
+    search_cache_max_entries: int = 10000  # 네이버 검색 원본 응답을 메모리에 보관할 최대 항목 수
+    results_path: str = "output/keyword_classifications.jsonl"  # save_results=True일 때 분류 결과를 추가하는 파일
 
 class KeywordClassifier:
     """
@@ -42,20 +63,31 @@ class KeywordClassifier:
                  client_id: Optional[str] = None, 
                  client_secret: Optional[str] = None,
                  save_results: bool = False,
-                 config: Optional[KeywordClassifierConfig] = None):
+                 config: Optional[KeywordClassifierConfig] = None,
+                 cache: Optional[SearchResultCache] = None,
+                 use_cache: bool = True):
         """
         키워드 분류기 초기화
         
         Args:
             client_id: 네이버 API 클라이언트 ID
             client_secret: 네이버 API 클라이언트 시크릿
-            save_results: 검색 결과 저장 여부
+            save_results: 분류 결과를 config.results_path JSONL 파일에 추가할지 여부
             config: 분류기 설정
+            cache: 네이버 검색 원본 응답 캐시 (기본값: config.search_cache_path에 저장하는 분류기 전용 캐시)
+            use_cache: 네이버 검색 원본 응답 캐시 사용 여부
         """
         self.client_id = client_id or os.environ.get("NAVER_CLIENT_ID")
         self.client_secret = client_secret or os.environ.get("NAVER_CLIENT_SECRET")
         self.save_results = save_results
         self.config = config or KeywordClassifierConfig()
+        self.cache = (cache or self._create_search_cache()) if use_cache else None
+        self._search_stats = {"cache_hits": 0, "api_calls": 0}
+        self._results_lock = threading.Lock()
+        
+        # 규칙 기반 분류에 쓰는 단어 목록을 한 번만 컴파일
+        self.info_content_matcher = KeywordMatcher(INFO_CONTENT_WORDS)
+        self.product_keyword_matcher = KeywordMatcher(PRODUCT_KEYWORD_WORDS)
         
         if not self.client_id or not self.client_secret:
             logger.warning("네이버 API 인증 정보가 설정되지 않았습니다.")
@@ -66,6 +98,22 @@ class KeywordClassifier:
         if self.client_secret:
             os.environ["NAVER_CLIENT_SECRET"] = self.client_secret
     
+    def _create_search_cache(self) -> SearchResultCache:
+        """
+        네이버 검색 원본 응답을 저장할 분류기 전용 캐시를 생성합니다.
+        
+        웹 검색 결과를 캐시하는 SearchOrchestrator의 캐시와 분리하여, 큰 키워드 목록을 분류해도
+        웹 검색 결과가 밀려나지 않도록 합니다.
+        
+        Returns:
+            config.search_cache_path에 저장하는 검색 결과 캐시 (경로가 빈 문자열이면 메모리만 사용)
+        """
+        return SearchResultCache(
+            max_entries=self.config.search_cache_max_entries,
+            path=self.config.search_cache_path or None,
+            default_ttl=self.config.search_cache_ttl
+        )
+    
     def classify(self, keyword: str) -> Dict[str, Any]:
         """
         키워드 분류 수행
@@ -86,6 +134,7 @@ class KeywordClassifier:
         
         # 결과 분석
         result = self._analyze_results(keyword, blog_results, shop_results)
+        self._write_results([result])
         
         logger.info(f"키워드 '{keyword}' 분류 완료: {result['type']}")
         return result
@@ -93,6 +142,182 @@ class KeywordClassifier:
     # 기존 코드와의 호환성을 위한 alias
     classify_keyword = classify
     
+    async def aclassify(self, keyword: str, limiter: Optional[AsyncRateLimiter] = None) -> Dict[str, Any]:
+        """
+        키워드 분류를 비동기로 수행합니다. 블로그와 쇼핑 검색을 동시에 실행합니다.
+        
+        Args:
+            keyword: 분류할 키워드
+            limiter: 네이버 API 호출에 적용할 속도 제한기
+            
+        Returns:
+            분류 결과 딕셔너리
+        """
+        blog_results, shop_results = await asyncio.gather(
+            self._search_async(keyword, "blog", limiter),
+            self._search_async(keyword, "shop", limiter)
+        )
+        return self._analyze_results(keyword, blog_results, shop_results)
+    
+    async def aclassify_many(self, 
+                             keywords: List[str], 
+                             concurrency: Optional[int] = None, 
+                             qps: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        여러 키워드를 동시에 분류합니다.
+        
+        최대 concurrency개의 키워드를 동시에 처리하며, 모든 네이버 API 호출은
+        하나의 속도 제한기를 공유하여 초당 qps개를 넘지 않습니다. qps를 지정하지 않으면
+        네이버 검색 엔진과 같은 프로세스 전역 "naver" 제한기를 사용합니다.
+        
+        Args:
+            keywords: 분류할 키워드 목록
+            concurrency: 동시에 분류할 최대 키워드 수 (기본값: config.max_concurrency)
+            qps: 네이버 API 초당 최대 요청 수 (기본값: config.naver_qps)
+            
+        Returns:
+            입력 순서와 같은 순서의 분류 결과 목록
+        """
+        concurrency = concurrency or self.config.max_concurrency
+        if qps is not None:
+            limiter = AsyncRateLimiter(qps)
+        else:
+            limiter = get_rate_limiter("naver", rate=self.config.naver_qps)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        started = time.monotonic()
+        
+        logger.info(f"키워드 {len(keywords)}개 분류 시작 (동시 {concurrency}개)")
+        
+        async def classify_one(keyword: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aclassify(keyword, limiter)
+        
+        results = await asyncio.gather(*(classify_one(keyword) for keyword in keywords))
+        self._write_results(results)
+        
+        logger.info(f"키워드 {len(keywords)}개 분류 완료 ({time.monotonic() - started:.1f}초, "
+                    f"캐시 적중 {self._search_stats['cache_hits']}회, API 호출 {self._search_stats['api_calls']}회)")
+        failed = sum(1 for result in results if "error" in result)
+        if failed:
+            logger.warning(f"검색 오류로 분류하지 못한 키워드: {failed}/{len(keywords)}개")
+        return list(results)
+    
+    async def aclassify_batch(self, 
+                              keywords: List[str], 
+                              concurrency: Optional[int] = None, 
+                              qps: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        키워드 목록을 중복 없이 한 번씩만 분류합니다.
+        
+        같은 키워드는 한 번만 분류하여 결과를 공유하고, 네이버 검색 원본 응답은 캐시에서
+        먼저 찾으므로 이전에 분류한 키워드와 겹치는 목록은 대부분 API를 호출하지 않습니다.
+        
+        Args:
+            keywords: 분류할 키워드 목록 (중복 허용)
+            concurrency: 동시에 분류할 최대 키워드 수 (기본값: config.max_concurrency)
+            qps: 네이버 API 초당 최대 요청 수 (기본값: config.naver_qps)
+            
+        Returns:
+            입력 순서와 같은 순서의 분류 결과 목록 (중복 키워드는 같은 결과)
+        """
+        unique_keywords = list(dict.fromkeys(keyword.strip() for keyword in keywords))
+        results = await self.aclassify_many(unique_keywords, concurrency=concurrency, qps=qps)
+        by_keyword = dict(zip(unique_keywords, results))
+        return [by_keyword[keyword.strip()] for keyword in keywords]
+    
+    def classify_batch(self, 
+                       keywords: List[str], 
+                       concurrency: Optional[int] = None, 
+                       qps: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        키워드 목록을 중복 없이 한 번씩만 분류합니다 (aclassify_batch의 동기 버전).
+        
+        Args:
+            keywords: 분류할 키워드 목록 (중복 허용)
+            concurrency: 동시에 분류할 최대 키워드 수 (기본값: config.max_concurrency)
+            qps: 네이버 API 초당 최대 요청 수 (기본값: config.naver_qps)
+            
+        Returns:
+            입력 순서와 같은 순서의 분류 결과 목록 (중복 키워드는 같은 결과)
+        """
+        return self._run_sync(self.aclassify_batch(keywords, concurrency=concurrency, qps=qps))
+    
+    def classify_many(self, 
+                      keywords: List[str], 
+                      concurrency: Optional[int] = None, 
+                      qps: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        여러 키워드를 동시에 분류합니다 (aclassify_many의 동기 버전).
+        
+        Args:
+            keywords: 분류할 키워드 목록
+            concurrency: 동시에 분류할 최대 키워드 수 (기본값: config.max_concurrency)
+            qps: 네이버 API 초당 최대 요청 수 (기본값: config.naver_qps)
+            
+        Returns:
+            입력 순서와 같은 순서의 분류 결과 목록
+        """
+        return self._run_sync(self.aclassify_many(keywords, concurrency=concurrency, qps=qps))
+    
+    def _run_sync(self, coro: Awaitable[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        새 이벤트 루프에서 코루틴을 실행하고, 그 루프에서 연 공유 HTTP 세션을 닫습니다.
+        
+        이벤트 루프 안에서 호출되면 별도 스레드의 새 이벤트 루프에서 실행합니다.
+        
+        Args:
+            coro: 실행할 분류 코루틴
+            
+        Returns:
+            코루틴의 결과
+        """
+        def run() -> List[Dict[str, Any]]:
+            async def run_and_close() -> List[Dict[str, Any]]:
+                try:
+                    return await coro
+                finally:
+                    # 이 호출을 위해 만든 이벤트 루프의 공유 세션 정리
+                    await close_http_sessions()
+            
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(run_and_close())
+            finally:
+                loop.close()
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(run).result()
+    
+    async def _search_async(self, 
+                            keyword: str, 
+                            search_type: str, 
+                            limiter: Optional[AsyncRateLimiter] = None) -> Dict[str, Any]:
+        """
+        속도 제한을 적용하여 네이버 검색을 비동기로 수행
+        
+        Args:
+            keyword: 검색할 키워드
+            search_type: 검색 유형 ("blog" 또는 "shop")
+            limiter: 속도 제한기 (기본값: 공유 "naver" 제한기)
+            
+        Returns:
+            검색 결과 (재시도 후에도 실패하면 error 키 포함)
+        """
+        cached = self._get_cached_search(keyword, search_type)
+        if cached is not None:
+            return cached
+        try:
+            result = await naver_search_async(keyword=keyword, search_type=search_type, limiter=limiter)
+        except Exception as e:
+            logger.error(f"{search_type} 검색 중 오류 발생: {str(e)}")
+            return {"items": [], "error": str(e)}
+        self._set_cached_search(keyword, search_type, result)
+        return result
+    
     def _search_blog(self, keyword: str) -> Dict[str, Any]:
         """
         블로그 검색 수행
@@ -103,15 +328,16 @@ class KeywordClassifier:
         Returns:
             블로그 검색 결과
         """
+        cached = self._get_cached_search(keyword, "blog")
+        if cached is not None:
+            return cached
         try:
-            return naver_search(
-                keyword=keyword,
-                search_type="blog",
-                save_results=self.save_results
-            )
+            result = naver_search(keyword=keyword, search_type="blog")
         except Exception as e:
             logger.error(f"블로그 검색 중 오류 발생: {str(e)}")
-            return {"items": []}
+            return {"items": [], "error": str(e)}
+        self._set_cached_search(keyword, "blog", result)
+        return result
     
     def _search_shop(self, keyword: str) -> Dict[str, Any]:
         """
@@ -123,15 +349,71 @@ class KeywordClassifier:
         Returns:
             쇼핑 검색 결과
         """
+        cached = self._get_cached_search(keyword, "shop")
+        if cached is not None:
+            return cached
         try:
-            return naver_search(
-                keyword=keyword,
-                search_type="shop",
-                save_results=self.save_results
-            )
+            result = naver_search(keyword=keyword, search_type="shop")
         except Exception as e:
             logger.error(f"쇼핑 검색 중 오류 발생: {str(e)}")
-            return {"items": []}
+            return {"items": [], "error": str(e)}
+        self._set_cached_search(keyword, "shop", result)
+        return result
+    
+    def _get_cached_search(self, keyword: str, search_type: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시에서 유효 시간이 지나지 않은 네이버 검색 원본 응답을 찾습니다.
+        
+        Args:
+            keyword: 검색 키워드
+            search_type: 검색 유형 ("blog" 또는 "shop")
+            
+        Returns:
+            캐시된 검색 결과 또는 None (캐시가 없거나, 없거나 만료된 경우)
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.get(make_search_cache_key(f"naver_{search_type}", keyword), self.config.search_cache_ttl)
+        if entry is None or entry[1]:
+            return None
+        self._search_stats["cache_hits"] += 1
+        return entry[0]
+    
+    def _set_cached_search(self, keyword: str, search_type: str, result: Dict[str, Any]) -> None:
+        """
+        네이버 검색 원본 응답을 캐시에 저장합니다. 오류 응답은 저장하지 않습니다.
+        
+        Args:
+            keyword: 검색 키워드
+            search_type: 검색 유형 ("blog" 또는 "shop")
+            result: 검색 결과
+        """
+        self._search_stats["api_calls"] += 1
+        if self.cache is None or result.get("error"):
+            return
+        self.cache.set(make_search_cache_key(f"naver_{search_type}", keyword), result, engine=f"naver_{search_type}")
+    
+    def _write_results(self, results: List[Dict[str, Any]]) -> None:
+        """
+        save_results가 켜져 있으면 분류 결과를 config.results_path JSONL 파일에 한 줄씩 추가합니다.
+        
+        검색 오류로 분류하지 못한 결과는 추가하지 않습니다.
+        
+        Args:
+            results: 분류 결과 목록
+        """
+        results = [result for result in results if "error" not in result]
+        if not self.save_results or not results:
+            return
+        try:
+            directory = os.path.dirname(self.config.results_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            lines = "".join(json.dumps(result, ensure_ascii=False, default=str) + "\n" for result in results)
+            with self._results_lock, open(self.config.results_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError as e:
+            logger.error(f"분류 결과 저장 중 오류 발생: {str(e)}")
     
     def _analyze_results(self, 
                          keyword: str, 
@@ -146,8 +428,24 @@ class KeywordClassifier:
             shop_results: 쇼핑 검색 결과
             
         Returns:
-            분석 결과 딕셔너리
+            분석 결과 딕셔너리 (검색이 실패하면 error 키가 있는 UNKNOWN 결과)
         """
+        # 검색이 실패한 경우 결과가 없는 것으로 보고 분류하지 않음
+        errors = {search_type: results["error"]
+                  for search_type, results in (("blog", blog_results), ("shop", shop_results))
+                  if results.get("error")}
+        if errors:
+            error = ", ".join(f"{search_type}: {message}" for search_type, message in errors.items())
+            logger.warning(f"키워드 '{keyword}' 분류 실패 (검색 오류 - {error})")
+            return {
+                "keyword": keyword,
+                "type": KeywordType.UNKNOWN,
+                "confidence": 0.0,
+                "analysis": "분류 실패 (검색 오류)",
+                "error": error,
+                "timestamp": datetime.now().isoformat()
+            }
+        
         blog_count = len(blog_results.get("items", []))
         shop_count = len(shop_results.get("items", []))
         
@@ -294,37 +592,37 @@ class KeywordClassifier:
         Returns:
             정보성 콘텐츠 여부
         """
-        # 정보성 콘텐츠를 나타내는 키워드
-        info_keywords = [
-            "방법", "효과", "증상", "원인", "차이", "종류", 
-            "특징", "장점", "단점", "비교", "추천", "리뷰",
-            "사용법", "활용", "예방", "관리", "치료", "개선",
-            "해결", "대처", "팁", "노하우", "가이드", "설명"
-        ]
-        
-        # 블로그 제목과 설명에서 정보성 키워드 찾기
-        info_keyword_count = 0
-        total_items = len(blog_results.get("items", []))
-        
-        if total_items == 0:
+        items = blog_results.get("items", [])
+        if not items:
             return False
         
-        for item in blog_results.get("items", []):
-            title = item.get("title", "")
-            description = item.get("description", "")
-            
-            # HTML 태그 제거
-            title = title.replace("<b>", "").replace("</b>", "")
-            description = description.replace("<b>", "").replace("</b>", "")
-            
-            # 정보성 키워드 확인
-            for keyword in info_keywords:
-                if keyword in title or keyword in description:
-                    info_keyword_count += 1
-                    break
+        # 항목마다 제목과 설명을 한 번에 검사 (정보성 단어 목록은 하나의 정규식으로 컴파일됨)
+        info_item_count = sum(1 for item in items if self.info_content_matcher.search(item_text(item)))
         
         # 50% 이상의 결과가 정보성 키워드를 포함하면 정보성 콘텐츠로 판단
-        return info_keyword_count / total_items >= 0.5
+        return info_item_count / len(items) >= 0.5
+    
+    def informational_ratios(self, blog_results_list: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """
+        여러 블로그 검색 결과의 정보성 항목 비율을 한꺼번에 계산합니다.
+        
+        모든 결과의 제목/설명을 하나의 배열로 모아 한 번에 검사하므로 많은 키워드를
+        규칙 기반으로 분류할 때 사용합니다.
+        
+        Args:
+            blog_results_list: 키워드별 블로그 검색 결과 목록
+            
+        Returns:
+            결과별 정보성 항목 비율 (항목이 없으면 0.0), _is_informational_content는 비율 0.5 이상
+        """
+        item_lists = [blog_results.get("items", []) for blog_results in blog_results_list]
+        sizes = np.fromiter((len(items) for items in item_lists), dtype=np.int64, count=len(item_lists))
+        texts = [item_text(item) for items in item_lists for item in items]
+        
+        matched = self.info_content_matcher.contains_many(texts)
+        owners = np.repeat(np.arange(len(item_lists)), sizes)
+        counts = np.bincount(owners, weights=matched, minlength=len(item_lists))
+        return np.divide(counts, sizes, out=np.zeros(len(item_lists)), where=sizes > 0)
     
     def llm_classify_product_or_info(self, keyword: str) -> str:
         """
@@ -336,25 +634,23 @@ class KeywordClassifier:
         Returns:
             '상품' 또는 '정보성'
         """
-        # 상품성 키워드로 판단할 단어들
-        product_keywords = ['구매', '할인', '세일', '쇼핑', '제품', '상품', '가격', 
-                           '구입', '주문', '도서', '의류', '가구', '책상', '의자']
-        
-        # 정보성 키워드로 판단할 단어들
-        info_keywords = ['방법', '정보', '리뷰', '후기', '평가', '비교', '분석', '증상', 
-                        '치료', '질환', '효능', '효과', '예방', '건강', '운동', '다이어트']
-        
-        # 키워드 내에 상품성/정보성 관련 단어가 있는지 확인
-        for word in product_keywords:
-            if word in keyword:
-                return "상품"
-        
-        for word in info_keywords:
-            if word in keyword:
-                return "정보성"
-        
-        # 기본값은 정보성
+        # 상품성 단어가 있으면 상품, 정보성 단어가 있거나 둘 다 없으면 정보성 (기본값)
+        if self.product_keyword_matcher.search(keyword):
+            return "상품"
         return "정보성"
+    
+    def classify_product_or_info_many(self, keywords: Sequence[str]) -> List[str]:
+        """
+        llm_classify_product_or_info를 여러 키워드에 한꺼번에 적용합니다.
+        
+        Args:
+            keywords: 분류할 키워드 목록
+            
+        Returns:
+            키워드별 '상품' 또는 '정보성' (입력 순서와 같음)
+        """
+        is_product = self.product_keyword_matcher.contains_many(keywords)
+        return np.where(is_product, "상품", "정보성").tolist()
 
 # 테스트 코드
 if __name__ == "__main__":
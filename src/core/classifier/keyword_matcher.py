@@ -0,0 +1,126 @@
+"""
+키워드 규칙 매처 모듈
+
+이 모듈은 정보성/상품성 판단에 쓰는 단어 목록을 하나의 정규식 대안(alternation)으로 컴파일한
+매처를 제공합니다. 텍스트마다 단어 수만큼 반복하지 않고 한 번의 검색으로 일치 여부와 일치 횟수를
+구하며, 대량의 제목/설명은 pandas 문자열 연산으로 한꺼번에 처리합니다.
+"""
+import re
+from typing import Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+# 블로그 검색 결과가 정보성 콘텐츠임을 나타내는 단어
+INFO_CONTENT_WORDS = (
+    "방법", "효과", "증상", "원인", "차이", "종류",
+    "특징", "장점", "단점", "비교", "추천", "리뷰",
+    "사용법", "활용", "예방", "관리", "치료", "개선",
+    "해결", "대처", "팁", "노하우", "가이드", "설명"
+)
+
+# 키워드 자체로 상품성을 판단하는 단어 (일치하지 않으면 정보성으로 분류)
+PRODUCT_KEYWORD_WORDS = (
+    "구매", "할인", "세일", "쇼핑", "제품", "상품", "가격",
+    "구입", "주문", "도서", "의류", "가구", "책상", "의자"
+)
+
+# 네이버 검색 결과의 강조 태그
+HIGHLIGHT_TAG_PATTERN = re.compile(r"</?b>")
+
+
+class KeywordMatcher:
+    """
+    여러 단어를 하나의 정규식으로 컴파일한 다중 패턴 매처
+
+    긴 단어를 먼저 시도하므로 겹치는 단어가 있어도 가장 긴 단어로 한 번만 셉니다.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        """
+        키워드 매처 초기화
+
+        Args:
+            words: 찾을 단어 목록 (중복과 빈 문자열은 제외)
+        """
+        self.words = tuple(dict.fromkeys(word for word in words if word))
+        alternation = "|".join(re.escape(word) for word in sorted(self.words, key=len, reverse=True))
+        # 단어가 없으면 어떤 텍스트와도 일치하지 않는 패턴 사용
+        self.pattern = re.compile(alternation or r"(?!)")
+
+    def search(self, text: str) -> bool:
+        """
+        텍스트에 단어가 하나라도 있는지 확인합니다.
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            일치 여부
+        """
+        return self.pattern.search(text) is not None
+
+    def count(self, text: str) -> int:
+        """
+        텍스트에서 단어가 나타난 횟수를 셉니다 (겹치지 않는 일치 기준).
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            일치 횟수
+        """
+        return sum(1 for _ in self.pattern.finditer(text))
+
+    def matches(self, text: str) -> List[str]:
+        """
+        텍스트에서 찾은 단어를 나타난 순서대로 반환합니다.
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            일치한 단어 목록
+        """
+        return self.pattern.findall(text)
+
+    def contains_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        여러 텍스트의 일치 여부를 한꺼번에 계산합니다.
+
+        Args:
+            texts: 검사할 텍스트 목록 (None은 빈 문자열로 처리)
+
+        Returns:
+            텍스트별 일치 여부 (bool 배열)
+        """
+        series = pd.Series(texts, dtype=object).fillna("")
+        return series.str.contains(self.pattern, regex=True).to_numpy(dtype=bool)
+
+    def count_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        여러 텍스트의 일치 횟수를 한꺼번에 계산합니다.
+
+        Args:
+            texts: 검사할 텍스트 목록 (None은 빈 문자열로 처리)
+
+        Returns:
+            텍스트별 일치 횟수 (int 배열)
+        """
+        series = pd.Series(texts, dtype=object).fillna("")
+        return series.str.count(self.pattern.pattern).to_numpy(dtype=np.int64)
+
+
+def item_text(item: dict) -> str:
+    """
+    검색 결과 항목의 제목과 설명을 강조 태그를 제거하여 하나의 텍스트로 합칩니다.
+
+    줄바꿈으로 구분하므로 제목 끝과 설명 앞이 이어져 단어가 잘못 일치하지 않습니다.
+
+    Args:
+        item: 네이버 검색 결과 항목
+
+    Returns:
+        "제목\\n설명" 텍스트
+    """
+    return HIGHLIGHT_TAG_PATTERN.sub("", f"{item.get('title', '')}\n{item.get('description', '')}")
@@ -13,6 +13,7 @@ from langchain_community.retrievers import ArxivRetriever
 from langchain_community.utilities.pubmed import PubMedAPIWrapper
 
 from src.common.logging import get_logger
+from src.common.rate_limit import get_rate_limiter, gather_rate_limited, is_rate_limit_error, get_retry_after
 
 # 로거 설정
 logger = get_logger(__name__)
@@ -26,17 +27,21 @@ class ArxivSearcher:
     def __init__(self, 
                  load_max_docs: int = 5, 
                  get_full_documents: bool = True, 
-                 load_all_available_meta: bool = True) -> None:
+                 load_all_available_meta: bool = True,
+                 max_concurrency: int = 1) -> None:
         """ArxivSearcher 초기화
         
         Args:
             load_max_docs (int, optional): 검색당 최대 문서 개수. 기본값은 5.
             get_full_documents (bool, optional): 전체 문서 내용 가져오기 여부. 기본값은 True.
             load_all_available_meta (bool, optional): 모든 메타데이터 로드 여부. 기본값은 True.
+            max_concurrency (int, optional): search_all의 최대 동시 요청 수. 기본값은 1.
         """
         self.load_max_docs = load_max_docs
         self.get_full_documents = get_full_documents
         self.load_all_available_meta = load_all_available_meta
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = get_rate_limiter("arxiv")
     
     async def search(self, query: str) -> List[Dict[str, Any]]:
         """arXiv에서 검색을 수행합니다.
@@ -138,10 +143,13 @@ class ArxivSearcher:
                 }
                 results.append(result)
             
+            self.rate_limiter.reward()
             logger.info(f"arXiv 검색 완료: '{query}', {len(results)}개 결과 발견")
             return results
             
         except Exception as e:
+            if is_rate_limit_error(e):
+                self.rate_limiter.penalize(get_retry_after(e))
             logger.error(f"arXiv 검색 중 오류 발생: {str(e)}")
             return []
     
@@ -154,25 +162,22 @@ class ArxivSearcher:
         Returns:
             List[Dict[str, Any]]: 검색 결과 목록
         """
-        all_results = []
+        # 공유 속도 제한기(arxiv) 한도 안에서 쿼리를 동시에 실행
+        results = await gather_rate_limited(queries, self.search, self.rate_limiter, self.max_concurrency)
         
-        for i, query in enumerate(queries):
-            # API 속도 제한 준수 (3초 간격)
-            if i > 0:
-                await asyncio.sleep(3.0)
-            
-            try:
-                results = await self.search(query)
+        all_results = []
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(result)}")
                 all_results.append({
                     'query': query,
-                    'results': results
+                    'results': [],
+                    'error': str(result)
                 })
-            except Exception as e:
-                logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(e)}")
+            else:
                 all_results.append({
                     'query': query,
-                    'results': [],
-                    'error': str(e)
+                    'results': result
                 })
         
         return all_results
@@ -188,7 +193,8 @@ class PubMedSearcher:
                  top_k_results: int = 5,
                  doc_content_chars_max: int = 1000000,
                  email: Optional[str] = None,
-                 api_key: Optional[str] = None) -> None:
+                 api_key: Optional[str] = None,
+                 max_concurrency: int = 3) -> None:
         """PubMedSearcher 초기화
         
         Args:
@@ -196,11 +202,16 @@ class PubMedSearcher:
             doc_content_chars_max (int, optional): 최대 문서 내용 길이. 기본값은 1000000.
             email (str, optional): PubMed API 사용을 위한 이메일. NCBI에 필요함.
             api_key (str, optional): PubMed API 키. 높은 요청 한도 제공.
+            max_concurrency (int, optional): search_all의 최대 동시 요청 수. 기본값은 3.
         """
         self.top_k_results = top_k_results
         self.doc_content_chars_max = doc_content_chars_max
         self.email = email or os.getenv("PUBMED_EMAIL", "your_email@example.com")
         self.api_key = api_key or os.getenv("PUBMED_API_KEY", "")
+        self.max_concurrency = max_concurrency
+        # NCBI는 API 키가 있으면 초당 10회까지 허용
+        self.rate_limiter = get_rate_limiter("pubmed", rate=10.0 if self.api_key else None,
+                                             burst=10 if self.api_key else None)
     
     async def search(self, query: str) -> List[Dict[str, Any]]:
         """PubMed에서 검색을 수행합니다.
@@ -271,10 +282,13 @@ class PubMedSearcher:
                 }
                 results.append(result)
             
+            self.rate_limiter.reward()
             logger.info(f"PubMed 검색 완료: '{query}', {len(results)}개 결과 발견")
             return results
             
         except Exception as e:
+            if is_rate_limit_error(e):
+                self.rate_limiter.penalize(get_retry_after(e))
             logger.error(f"PubMed 검색 중 오류 발생: {str(e)}")
             return []
     
@@ -287,36 +301,22 @@ class PubMedSearcher:
         Returns:
             List[Dict[str, Any]]: 검색 결과 목록
         """
-        all_results = []
-        
-        # 처음에는 작은 딜레이로 시작하고, 필요시 증가
-        delay = 1.0
+        # 공유 속도 제한기(pubmed) 한도 안에서 쿼리를 동시에 실행
+        results = await gather_rate_limited(queries, self.search, self.rate_limiter, self.max_concurrency)
         
-        for i, query in enumerate(queries):
-            # 첫 요청이 아닌 경우 딜레이 추가
-            if i > 0:
-                await asyncio.sleep(delay)
-            
-            try:
-                results = await self.search(query)
+        all_results = []
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(result)}")
                 all_results.append({
                     'query': query,
-                    'results': results
+                    'results': [],
+                    'error': str(result)
                 })
-                
-                # 결과가 있다면 딜레이 약간 감소 (최소 0.5초)
-                if results:
-                    delay = max(0.5, delay * 0.9)
-                    
-            except Exception as e:
-                logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(e)}")
+            else:
                 all_results.append({
                     'query': query,
-                    'results': [],
-                    'error': str(e)
+                    'results': result
                 })
-                
-                # 오류 발생시 딜레이 증가 (최대 5초)
-                delay = min(5.0, delay * 1.5)
         
         return all_results
@@ -6,12 +6,17 @@ Google News RSS를 활용한 뉴스 데이터 수집 엔진
 """
 
 import asyncio
+import base64
+import binascii
 import random
 import time
 import re
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from urllib.parse import urlparse
 import json
+import threading
 
 import requests
 import feedparser
@@ -22,11 +27,224 @@ from fake_useragent import UserAgent
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
+from src.common.config.webdriver import WebDriverConfiguration
+from src.common.http_client import get_http_session, read_html_body
 from src.common.logging import get_logger
+from src.common.rate_limit import get_rate_limiter
+from src.common.utils.selenium_utils import get_webdriver_pool, wait_for_page_ready
+from src.core.search.utils.extraction import decode_html
+from src.core.search.utils.html_parser import make_soup, normalize_whitespace
 
 # 로거 설정
 logger = get_logger(__name__)
 
+# 본문에서 제거할 광고/저작권/구독 안내 문구 (여러 정규식을 한 번의 패스로 처리)
+_BOILERPLATE_PATTERN = re.compile(
+    r'광고|AD|Advertisement|Sponsored'
+    r'|copyright|ⓒ|\(c\)|\©'
+    r'|구독하기|뉴스레터|뉴스스탠드'
+    r'|톡톡톡|기사제보|오류신고'
+    r'|더보기|관련기사|추천기사'
+)
+
+# HTTP 수집 결과를 본문으로 인정하는 최소 길이 (이보다 짧으면 Selenium으로 재시도)
+MIN_HTTP_CONTENT_LENGTH = 200
+
+# 본문 추출 실패 시 _extract_content_by_tags가 반환하는 안내 문구
+_EXTRACTION_FAILURE_TEXTS = {
+    "내용을 추출할 수 없습니다.",
+    "원본 기사를 보려면 링크 방문이 필요합니다. 구글 뉴스는 미리보기만 제공합니다."
+}
+
+# 자바스크립트 렌더링이 필요한 페이지 안내 문구
+_JS_REQUIRED_PATTERN = re.compile(
+    r'enable javascript|javascript is (?:disabled|required)|자바스크립트를 (?:활성화|사용)',
+    re.IGNORECASE
+)
+
+
+# Google News 기사 링크 (https://news.google.com/rss/articles/<기사 ID>?...)
+_GOOGLE_NEWS_ARTICLE_PATTERN = re.compile(r'^/(?:rss/)?articles/([A-Za-z0-9_-]+)')
+
+# 기사 ID 안의 원문 URL
+_ENCODED_URL_PATTERN = re.compile(rb'https?://[\x21-\x7e]+')
+
+
+def _is_google_news(url: str) -> bool:
+    """Google News 도메인의 URL인지 확인합니다."""
+    return "news.google.com" in urlparse(url).netloc
+
+
+def _needs_javascript(html: str, final_url: str) -> bool:
+    """HTTP 응답만으로는 기사를 볼 수 없는 페이지인지 확인합니다.
+
+    Google News 링크가 원문으로 리디렉션되지 않았거나, 페이지가 자바스크립트 활성화를 요구하는 경우입니다.
+    """
+    return _is_google_news(final_url) or bool(_JS_REQUIRED_PATTERN.search(html[:20000]))
+
+
+def decode_google_news_url(url: str) -> Optional[str]:
+    """Google News 기사 링크에 인코딩된 원문 URL을 꺼냅니다.
+
+    기사 ID는 원문 URL을 담은 protobuf 메시지를 base64url로 인코딩한 값입니다. 원문 URL 대신
+    서버 조회용 토큰만 담긴 새 형식의 ID는 디코딩할 수 없습니다.
+
+    Args:
+        url (str): Google News 기사 링크
+
+    Returns:
+        Optional[str]: 원문 URL (Google News 기사 링크가 아니거나 디코딩할 수 없으면 None)
+    """
+    parts = urlparse(url)
+    if "news.google.com" not in parts.netloc:
+        return None
+    match = _GOOGLE_NEWS_ARTICLE_PATTERN.match(parts.path)
+    if match is None:
+        return None
+    article_id = match.group(1)
+    try:
+        data = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (binascii.Error, ValueError):
+        return None
+
+    # 필드 태그(0x22) 뒤의 길이(varint)만큼 읽고, 실패하면 URL 형태의 바이트를 찾음
+    start = data.find(b"\x22")
+    if start >= 0:
+        length, shift, position = 0, 0, start + 1
+        while position < len(data):
+            byte = data[position]
+            length |= (byte & 0x7f) << shift
+            position += 1
+            shift += 7
+            if not byte & 0x80:
+                break
+        encoded = data[position:position + length]
+        if encoded.startswith((b"http://", b"https://")) and len(encoded) == length:
+            return encoded.decode("ascii", errors="ignore") or None
+    found = _ENCODED_URL_PATTERN.search(data)
+    return found.group(0).decode("ascii") if found else None
+
+
+def _publisher_domain(url: str, publisher_url: Optional[str] = None) -> str:
+    """수집 단계를 기록할 언론사 도메인을 반환합니다.
+
+    URL이 아직 Google News 링크이면 RSS 항목의 언론사 URL(source href) 도메인을 사용합니다.
+
+    Args:
+        url (str): 기사 URL
+        publisher_url (Optional[str], optional): RSS 항목의 언론사 URL
+
+    Returns:
+        str: 도메인 (netloc)
+    """
+    if _is_google_news(url) and publisher_url:
+        return urlparse(publisher_url).netloc or urlparse(url).netloc
+    return urlparse(url).netloc
+
+
+class DomainTierMemory:
+    """도메인별 수집 단계(http, selenium) 기록
+
+    HTTP 수집이 연속으로 max_failures번 실패한 도메인은 retry_interval 동안 바로 Selenium을 사용하고,
+    그 이후에는 HTTP 수집을 다시 시도합니다. 최근에 기록한 max_domains개 도메인만 보관합니다.
+    """
+
+    def __init__(self, max_failures: int = 2, retry_interval: float = 3600, max_domains: int = 1000) -> None:
+        """DomainTierMemory 초기화
+
+        Args:
+            max_failures (int, optional): Selenium으로 전환하기 전 허용할 연속 HTTP 실패 횟수. 기본값은 2.
+            retry_interval (float, optional): HTTP 수집을 다시 시도하기까지의 시간(초). 기본값은 3600.
+            max_domains (int, optional): 기록을 보관할 최대 도메인 수. 기본값은 1000.
+        """
+        self.max_failures = max_failures
+        self.retry_interval = retry_interval
+        self.max_domains = max_domains
+        self._domains: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def preferred_tier(self, domain: str) -> str:
+        """도메인에서 먼저 시도할 수집 단계를 반환합니다.
+
+        Args:
+            domain (str): 도메인 (netloc)
+
+        Returns:
+            str: "http" 또는 "selenium"
+        """
+        with self._lock:
+            entry = self._domains.get(domain)
+            if entry is None or entry["http_failures"] < self.max_failures:
+                return "http"
+            if time.monotonic() - entry["last_http_attempt"] >= self.retry_interval:
+                return "http"
+            return "selenium"
+
+    def record(self, domain: str, tier: str, success: bool) -> None:
+        """수집 결과를 기록합니다.
+
+        Args:
+            domain (str): 도메인 (netloc)
+            tier (str): 사용한 수집 단계 ("http" 또는 "selenium")
+            success (bool): 본문 수집 성공 여부
+        """
+        with self._lock:
+            entry = self._domains.setdefault(domain, {
+                "http_failures": 0, "last_http_attempt": 0.0, "http": 0, "selenium": 0
+            })
+            if tier == "http":
+                entry["last_http_attempt"] = time.monotonic()
+                entry["http_failures"] = 0 if success else entry["http_failures"] + 1
+            if success:
+                entry[tier] += 1
+            # 가장 오래 기록하지 않은 도메인부터 제거
+            self._domains.move_to_end(domain)
+            while len(self._domains) > self.max_domains:
+                self._domains.popitem(last=False)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """도메인별 선호 단계와 단계별 성공 횟수를 반환합니다.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 도메인별 통계
+        """
+        with self._lock:
+            domains = {domain: dict(entry) for domain, entry in self._domains.items()}
+        return {
+            domain: {
+                "tier": self.preferred_tier(domain),
+                "http_successes": entry["http"],
+                "selenium_successes": entry["selenium"],
+                "http_failures": entry["http_failures"]
+            }
+            for domain, entry in domains.items()
+        }
+
+
+# 프로세스 전역 도메인별 수집 단계 기록
+_DOMAIN_TIERS = DomainTierMemory()
+
+
+def _create_news_driver() -> webdriver.Chrome:
+    """Google News 원문 수집용 헤드리스 Chrome 드라이버를 만듭니다.
+
+    최신 셀레니움에서는 Selenium Manager가 자동으로 크롬드라이버를 관리합니다.
+    """
+    options = Options()
+    # 최신 headless 모드 사용 (Chrome 109 이상 권장)
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--incognito")
+    options.add_argument("--disable-infobars")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(30)
+    return driver
+
+
 class GoogleNews:
     """Google News RSS를 이용한 뉴스 수집기
 
@@ -34,11 +252,21 @@ class GoogleNews:
     각 뉴스 기사의 원문 링크에 접속하여 상세 내용을 크롤링합니다.
     """
     
-    def __init__(self) -> None:
-        """GoogleNews 초기화"""
+    def __init__(self, tier_memory: Optional[DomainTierMemory] = None) -> None:
+        """GoogleNews 초기화
+        
+        Args:
+            tier_memory (Optional[DomainTierMemory], optional): 도메인별 수집 단계 기록. 기본값은 프로세스 전역 기록.
+        """
         # fake-useragent를 사용한 UserAgent 초기화
         self.user_agent = UserAgent()
         
+        # 도메인별로 성공한 수집 단계(http, selenium) 기록
+        self.tier_memory = tier_memory or _DOMAIN_TIERS
+        
+        # 공유 WebDriver 풀 설정 (페이지 준비 대기 시간)
+        self.webdriver_config = WebDriverConfiguration.from_runnable_config()
+        
         # 뉴스 사이트별 컨텐츠 셀렉터 매핑
         self.site_specific_selectors = {
             'news.naver.com': ['#newsct', '#dic_area', '#articeBody', '.end_body'],
@@ -85,6 +313,7 @@ class GoogleNews:
                     'url': entry.link,
                     'published': entry.published,
                     'source': entry.source.title if hasattr(entry, 'source') else None,
+                    'source_url': entry.source.get('href') if hasattr(entry, 'source') else None,
                 }
                 if include_content and hasattr(entry, 'summary'):
                     item['content'] = entry.summary
@@ -267,40 +496,48 @@ class GoogleNews:
         
     def _fetch_with_selenium(self, url: str, ua: Optional[UserAgent] = None, max_content_length: int = 1000000) -> Tuple[str, str, Dict[str, Any]]:
         """
-        Selenium을 사용하여 헤드리스 모드에서 페이지를 로드한 후, 최종 URL 및 본문 내용을 추출합니다.
-        Selenium Manager가 자동으로 크롬드라이버를 관리합니다.
+        공유 WebDriver 풀의 헤드리스 브라우저로 페이지를 로드한 후, 최종 URL 및 본문 내용을 추출합니다.
+        Google News 링크는 자바스크립트로 원문에 리디렉션되므로 리디렉션과 페이지 로드 완료를 기다립니다.
         """
         ua = ua or self.user_agent
-        ua_string = ua.random
-
-        options = Options()
-        # 최신 headless 모드 사용 (Chrome 109 이상 권장)
-        options.add_argument("--headless=new")
-        options.add_argument(f"user-agent={ua_string}")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--incognito")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        
-        # 최신 셀레니움에서는 Selenium Manager가 자동으로 크롬드라이버를 관리합니다.
-        driver = webdriver.Chrome(options=options)
+        pool = get_webdriver_pool("google_news", _create_news_driver)
+        
         try:
-            driver.get(url)
-            # 페이지 로딩을 위한 충분한 대기시간 적용
-            time.sleep(random.uniform(2, 4))
-            final_url = driver.current_url
-            html = driver.page_source
+            with pool.driver() as driver:
+                # 드라이버는 재사용되므로 페이지마다 User-Agent 변경
+                try:
+                    driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": ua.random})
+                except Exception as e:
+                    logger.debug(f"User-Agent 변경 실패: {str(e)}")
+                driver.get(url)
+                wait_for_page_ready(
+                    driver,
+                    timeout=self.webdriver_config.webdriver_ready_timeout,
+                    condition=lambda current: "news.google.com" not in current.current_url
+                )
+                final_url = driver.current_url
+                html = driver.page_source
             logger.info(f"Selenium으로 페이지 로드 완료: {url} -> {final_url}")
         except Exception as e:
             logger.error(f"Selenium fetch error: {url}, {str(e)}")
-            driver.quit()
             return "", f"Error: {str(e)}", {}
-        driver.quit()
         
-        # 이후 BeautifulSoup을 이용하여 HTML 파싱 및 본문 추출 로직 진행
-        soup = BeautifulSoup(html, 'html.parser')
+        text, metadata = self._extract_from_html(html, final_url, max_content_length)
+        metadata['final_url'] = final_url
+        return "", text, metadata
+    
+    def _extract_from_html(self, html: str, final_url: str, max_content_length: int = 1000000) -> Tuple[str, Dict[str, Any]]:
+        """HTML에서 제목과 본문을 추출합니다 (HTTP/Selenium 단계 공통).
+        
+        Args:
+            html (str): 페이지 HTML
+            final_url (str): 리디렉션 후 최종 URL (사이트별 셀렉터 선택에 사용)
+            max_content_length (int, optional): 최대 콘텐츠 길이. 기본값은 1000000자.
+            
+        Returns:
+            Tuple[str, Dict[str, Any]]: (정제된 본문, 메타데이터)
+        """
+        soup = make_soup(html)
         for tag in soup(['script', 'style', 'iframe', 'ins', 'header', 'footer', 'nav', 'aside']):
             tag.extract()
         
@@ -308,7 +545,6 @@ class GoogleNews:
         title_tag = soup.find('title')
         title = title_tag.get_text().strip() if title_tag else "제목 없음"
         metadata['title'] = title
-        # 추가 메타데이터 및 본문 추출 로직은 기존과 동일하게 진행...
         
         # 사이트별 셀렉터 사용 등 본문 추출 로직
         main_content = None
@@ -330,33 +566,123 @@ class GoogleNews:
             text = self._extract_content_by_tags(soup, final_url)
         
         # 텍스트 정제
-        text = '\n'.join([line.strip() for line in text.split('\n') if line.strip()])
-        text = re.sub(r'\s+', ' ', text)
-        for pattern in [r'광고|AD|Advertisement|Sponsored',
-                        r'copyright|ⓒ|\(c\)|\©',
-                        r'구독하기|뉴스레터|뉴스스탠드',
-                        r'톡톡톡|기사제보|오류신고',
-                        r'더보기|관련기사|추천기사']:
-            text = re.sub(pattern, '', text)
+        text = _BOILERPLATE_PATTERN.sub('', normalize_whitespace(text))
         if len(text) > max_content_length:
             text = text[:max_content_length] + "... [잘림]"
         
+        return text, metadata
+    
+    async def _resolve_url(self, url: str) -> str:
+        """HTTP 리디렉션을 따라가 최종 URL을 확인합니다 (본문은 내려받지 않음).
+        
+        Args:
+            url (str): 뉴스 링크
+            
+        Returns:
+            str: 최종 URL (확인하지 못하면 원래 URL)
+        """
+        try:
+            session = get_http_session()
+            async with session.head(url, headers={'User-Agent': self._get_random_user_agent()},
+                                    allow_redirects=True) as response:
+                return str(response.url)
+        except Exception as e:
+            logger.debug(f"리디렉션 확인 실패: {url}, {str(e)}")
+            return url
+    
+    async def _fetch_with_http(self, url: str, ua: UserAgent, max_content_length: int = 1000000) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        """브라우저 없이 HTTP 요청만으로 기사를 가져옵니다.
+        
+        Args:
+            url (str): 리디렉션을 확인한 기사 URL
+            ua (UserAgent): UserAgent 객체
+            max_content_length (int, optional): 최대 콘텐츠 길이. 기본값은 1000000자.
+            
+        Returns:
+            Optional[Tuple[str, str, Dict[str, Any]]]: (HTML 내용, 추출된 텍스트, 추가 메타데이터).
+                본문을 얻지 못했거나 자바스크립트 렌더링이 필요한 페이지이면 None.
+        """
+        headers = {
+            'User-Agent': ua.random,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
+        }
+        host_limiter = get_rate_limiter(f"host:{urlparse(url).netloc}")
+        await host_limiter.acquire()
+        try:
+            session = get_http_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    if response.status == 429:
+                        retry_after = response.headers.get('Retry-After', '')
+                        host_limiter.penalize(float(retry_after) if retry_after.isdigit() else None)
+                    logger.debug(f"HTTP 수집 실패: {url}, 상태 코드: {response.status}")
+                    return None
+                raw, _ = await read_html_body(response)
+                final_url = str(response.url)
+                charset = response.charset
+        except Exception as e:
+            logger.debug(f"HTTP 수집 실패: {url}, {str(e)}")
+            return None
+        
+        html = decode_html(raw, charset)
+        if _needs_javascript(html, final_url):
+            logger.debug(f"자바스크립트 렌더링이 필요한 페이지: {final_url}")
+            return None
+        
+        # 파싱은 이벤트 루프를 막지 않도록 스레드에서 실행
+        text, metadata = await asyncio.to_thread(self._extract_from_html, html, final_url, max_content_length)
+        if len(text) < MIN_HTTP_CONTENT_LENGTH or text in _EXTRACTION_FAILURE_TEXTS:
+            logger.debug(f"HTTP 수집 본문 부족({len(text)}자): {final_url}")
+            return None
+        metadata['final_url'] = final_url
         return "", text, metadata
-
     
-    async def fetch_content(self, url: str, user_agent: Optional[UserAgent] = None, max_content_length: int = 1000000) -> Tuple[str, str, Dict[str, Any]]:
-        """주어진 URL에서 Selenium을 사용하여 웹 페이지 내용을 가져옵니다.
+    async def fetch_content(self, url: str, user_agent: Optional[UserAgent] = None, max_content_length: int = 1000000,
+                            publisher_url: Optional[str] = None) -> Tuple[str, str, Dict[str, Any]]:
+        """주어진 URL에서 웹 페이지 내용을 가져옵니다.
+        
+        Google News 링크는 먼저 기사 ID에서 원문 URL을 디코딩하고, 디코딩할 수 없으면 리디렉션을 확인합니다.
+        원문 URL을 얻으면 일반 HTTP 요청으로 본문을 추출하고, 본문이 비어 있거나 자바스크립트 렌더링이
+        필요한 경우(원문 URL을 얻지 못한 경우 포함)에만 Selenium WebDriver 풀을 사용합니다.
+        언론사 도메인별로 성공한 단계를 기억하여 HTTP 수집이 계속 실패하는 도메인은 바로 Selenium을 사용합니다.
+        Selenium으로 수집한 경우 리디렉션된 최종 URL의 도메인에 기록합니다.
         
         Args:
             url (str): 크롤링할 URL
             user_agent (UserAgent, optional): UserAgent 객체. 기본값은 None.
             max_content_length (int, optional): 최대 콘텐츠 길이. 기본값은 1000000자.
+            publisher_url (Optional[str], optional): RSS 항목의 언론사 URL. 원문 URL을 알 수 없을 때 도메인으로 사용.
             
         Returns:
-            Tuple[str, str, Dict[str, Any]]: (HTML 내용, 추출된 텍스트, 추가 메타데이터)
+            Tuple[str, str, Dict[str, Any]]: (HTML 내용, 추출된 텍스트, 추가 메타데이터).
+                메타데이터의 fetch_tier에 사용한 단계(http, selenium)가 기록됩니다.
         """
         ua = user_agent or self.user_agent
-        html, text, metadata = await asyncio.to_thread(self._fetch_with_selenium, url, ua, max_content_length)
+        
+        article_url = decode_google_news_url(url) or url
+        domain = _publisher_domain(article_url, publisher_url)
+        
+        if self.tier_memory.preferred_tier(domain) == "http":
+            if _is_google_news(article_url):
+                article_url = await self._resolve_url(article_url)
+                domain = _publisher_domain(article_url, publisher_url)
+            
+            # 원문 URL을 얻지 못한 Google News 링크는 HTTP로 수집할 수 없으므로 바로 Selenium 사용
+            if not _is_google_news(article_url) and self.tier_memory.preferred_tier(domain) == "http":
+                result = await self._fetch_with_http(article_url, ua, max_content_length)
+                self.tier_memory.record(domain, "http", result is not None)
+                if result is not None:
+                    result[2]['fetch_tier'] = "http"
+                    return result
+                logger.info(f"HTTP 수집 실패, Selenium으로 재시도: {article_url}")
+        
+        html, text, metadata = await asyncio.to_thread(self._fetch_with_selenium, article_url, ua, max_content_length)
+        final_url = metadata.get('final_url', '')
+        if final_url and not _is_google_news(final_url):
+            domain = urlparse(final_url).netloc
+        self.tier_memory.record(domain, "selenium", not text.startswith("Error:"))
+        metadata['fetch_tier'] = "selenium"
         return html, text, metadata
     
     async def process_news_content(self, item: Dict[str, Any]) -> Dict[str, Any]:
@@ -371,7 +697,7 @@ class GoogleNews:
         url = item['url']
         original_url = url  # 원본 URL 저장
         try:
-            html, content, metadata = await self.fetch_content(url)
+            html, content, metadata = await self.fetch_content(url, publisher_url=item.get('source_url'))
             original_content_found = bool(content and not content.startswith("Error:"))
             result = {
                 'title': item['title'],
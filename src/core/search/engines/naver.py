@@ -12,7 +12,7 @@ import time
 import re
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 import os
 import json
 import time
@@ -29,6 +29,10 @@ from dotenv import load_dotenv
 from fake_useragent import UserAgent
 
 from src.common.logging import get_logger
+from src.common.http_client import get_http_session, read_html_body
+from src.common.exceptions import UnsupportedContentTypeError
+from src.common.rate_limit import AsyncRateLimiter, get_rate_limiter
+from src.core.search.utils.extraction import get_extraction_executor, extract_naver_source_content
 
 # 비동기 작업을 Jupyter Notebook에서 실행하기 위한 설정
 nest_asyncio.apply()
@@ -36,6 +40,13 @@ nest_asyncio.apply()
 # 로거 설정
 logger = get_logger(__name__)
 
+# 네이버 검색 API 유형별 URL
+NAVER_SEARCH_API_URLS = {
+    "blog": "https://openapi.naver.com/v1/search/blog",
+    "shop": "https://openapi.naver.com/v1/search/shop",
+    "kin": "https://openapi.naver.com/v1/search/kin"
+}
+
 
 def naver_search(keyword: str, search_type: Literal["blog", "shop", "kin"] = "blog", save_results: bool = False) -> Dict[str, Any]:
     """
@@ -58,11 +69,7 @@ def naver_search(keyword: str, search_type: Literal["blog", "shop", "kin"] = "bl
         return {"items": [], "error": "API 키가 설정되지 않았습니다."}
     
     # 검색 유형에 따른 URL 설정
-    api_urls = {
-        "blog": "https://openapi.naver.com/v1/search/blog",
-        "shop": "https://openapi.naver.com/v1/search/shop",
-        "kin": "https://openapi.naver.com/v1/search/kin"
-    }
+    api_urls = NAVER_SEARCH_API_URLS
     
     if search_type not in api_urls:
         logger.error(f"지원되지 않는 검색 유형: {search_type}")
@@ -114,6 +121,89 @@ def naver_search(keyword: str, search_type: Literal["blog", "shop", "kin"] = "bl
     except Exception as e:
         logger.error(f"검색 중 오류 발생: {str(e)}")
         return {"items": [], "error": str(e)} 
+
+
+async def naver_search_async(keyword: str,
+                             search_type: Literal["blog", "shop", "kin"] = "blog",
+                             save_results: bool = False,
+                             limiter: Optional[AsyncRateLimiter] = None,
+                             max_retries: int = 3,
+                             backoff: float = 1.0) -> Dict[str, Any]:
+    """
+    naver_search의 비동기 버전으로, 공유 aiohttp 세션을 사용하여 검색을 수행합니다.
+    
+    여러 키워드를 동시에 검색할 때 사용합니다. 요청마다 속도 제한기에서 토큰을 획득하며,
+    429 응답을 받으면 제한기의 허용 속도를 낮추고 429 응답이나 일시적인 오류는
+    지터가 적용된 지수 백오프로 재시도합니다.
+    
+    Args:
+        keyword: 검색할 키워드
+        search_type: 검색 유형 ("blog", "shop", "kin" 중 하나)
+        save_results: 검색 결과를 파일로 저장할지 여부
+        limiter: 요청 전에 토큰을 획득할 속도 제한기 (기본값: 공유 "naver" 제한기)
+        max_retries: 최대 재시도 횟수
+        backoff: 첫 재시도의 최대 대기 시간(초), 재시도마다 두 배로 증가
+        
+    Returns:
+        검색 결과를 포함하는 사전 (naver_search와 같은 형식, 실패 시 error 키 포함)
+    """
+    client_id = os.getenv("NAVER_CLIENT_ID", "")
+    client_secret = os.getenv("NAVER_CLIENT_SECRET", "")
+    
+    if not client_id or not client_secret:
+        logger.error("NAVER_CLIENT_ID 또는 NAVER_CLIENT_SECRET이 설정되지 않았습니다.")
+        return {"items": [], "error": "API 키가 설정되지 않았습니다."}
+    
+    if search_type not in NAVER_SEARCH_API_URLS:
+        logger.error(f"지원되지 않는 검색 유형: {search_type}")
+        return {"items": [], "error": f"지원되지 않는 검색 유형: {search_type}"}
+    
+    limiter = limiter or get_rate_limiter("naver")
+    params = {"query": keyword, "display": 20, "start": 1, "sort": "sim"}
+    headers = {"X-Naver-Client-Id": client_id, "X-Naver-Client-Secret": client_secret}
+    
+    last_error = {"items": [], "error": "API 요청 실패"}
+    for attempt in range(max_retries + 1):
+        if attempt:
+            # 지터를 적용한 지수 백오프 (동시에 재시도가 몰리지 않도록)
+            await asyncio.sleep(random.uniform(0, backoff * 2 ** (attempt - 1)))
+        await limiter.acquire()
+        
+        try:
+            session = get_http_session()
+            async with session.get(NAVER_SEARCH_API_URLS[search_type], params=params, headers=headers) as response:
+                if response.status == 200:
+                    limiter.reward()
+                    result = await response.json(content_type=None)
+                    result["crawled_at"] = datetime.now().isoformat()
+                    
+                    if save_results:
+                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                        filename = f"naver_search_results_{timestamp}.json"
+                        with open(filename, "w", encoding="utf-8") as f:
+                            json.dump(result, f, ensure_ascii=False, indent=2)
+                        logger.info(f"검색 결과가 {filename}에 저장되었습니다.")
+                    
+                    return result
+                
+                last_error = {"items": [], "error": f"API 요청 오류: {response.status}"}
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After", "")
+                    limiter.penalize(float(retry_after) if retry_after.isdigit() else None)
+                elif response.status < 500:
+                    logger.error(f"API 요청 오류: {response.status}")
+                    return last_error
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_error = {"items": [], "error": f"API 요청 실패: {str(e)}"}
+        except Exception as e:
+            logger.error(f"검색 중 오류 발생: {str(e)}")
+            return {"items": [], "error": str(e)}
+        
+        if attempt < max_retries:
+            logger.warning(f"네이버 {search_type} 검색 재시도 ({attempt + 1}/{max_retries}): {last_error['error']}")
+    
+    logger.error(f"네이버 {search_type} 검색 실패 (최대 재시도 횟수 초과): {keyword}")
+    return last_error
     
     
 class NaverCrawler:
@@ -205,23 +295,24 @@ class NaverCrawler:
         """
         url = f"https://openapi.naver.com/v1/search/news.json?query={quote(query)}&display={display}&start={start}&sort={sort}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    result = await response.json()
+        await get_rate_limiter("naver").acquire()
+        session = get_http_session()
+        async with session.get(url, headers=self.headers) as response:
+            if response.status == 200:
+                result = await response.json()
                     
-                    # 결과 내의 HTML 태그 제거
-                    for item in result.get('items', []):
-                        if 'title' in item:
-                            item['title'] = self._clean_html_tags(item['title'])
-                        if 'description' in item:
-                            item['description'] = self._clean_html_tags(item['description'])
+                # 결과 내의 HTML 태그 제거
+                for item in result.get('items', []):
+                    if 'title' in item:
+                        item['title'] = self._clean_html_tags(item['title'])
+                    if 'description' in item:
+                        item['description'] = self._clean_html_tags(item['description'])
                     
-                    return result
-                else:
-                    response_text = await response.text()
-                    logger.error(f"뉴스 검색 API 호출 실패: {response.status}, {response_text}")
-                    raise Exception(f"뉴스 검색 API 호출 실패: {response.status}, {response_text}")
+                return result
+            else:
+                response_text = await response.text()
+                logger.error(f"뉴스 검색 API 호출 실패: {response.status}, {response_text}")
+                raise Exception(f"뉴스 검색 API 호출 실패: {response.status}, {response_text}")
     
     async def search_encyc(self, query: str, display: int = 10, start: int = 1) -> Dict[str, Any]:
         """네이버 백과사전 검색 API를 사용하여 백과사전 항목을 검색합니다.
@@ -236,23 +327,24 @@ class NaverCrawler:
         """
         url = f"https://openapi.naver.com/v1/search/encyc.json?query={quote(query)}&display={display}&start={start}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    result = await response.json()
+        await get_rate_limiter("naver").acquire()
+        session = get_http_session()
+        async with session.get(url, headers=self.headers) as response:
+            if response.status == 200:
+                result = await response.json()
                     
-                    # 결과 내의 HTML 태그 제거
-                    for item in result.get('items', []):
-                        if 'title' in item:
-                            item['title'] = self._clean_html_tags(item['title'])
-                        if 'description' in item:
-                            item['description'] = self._clean_html_tags(item['description'])
+                # 결과 내의 HTML 태그 제거
+                for item in result.get('items', []):
+                    if 'title' in item:
+                        item['title'] = self._clean_html_tags(item['title'])
+                    if 'description' in item:
+                        item['description'] = self._clean_html_tags(item['description'])
                     
-                    return result
-                else:
-                    response_text = await response.text()
-                    logger.error(f"백과사전 검색 API 호출 실패: {response.status}, {response_text}")
-                    raise Exception(f"백과사전 검색 API 호출 실패: {response.status}, {response_text}")
+                return result
+            else:
+                response_text = await response.text()
+                logger.error(f"백과사전 검색 API 호출 실패: {response.status}, {response_text}")
+                raise Exception(f"백과사전 검색 API 호출 실패: {response.status}, {response_text}")
     
     async def search_kin(self, query: str, display: int = 10, start: int = 1, sort: str = "sim") -> Dict[str, Any]:
         """네이버 지식인 검색 API를 사용하여 지식인 질문을 검색합니다.
@@ -268,31 +360,34 @@ class NaverCrawler:
         """
         url = f"https://openapi.naver.com/v1/search/kin.json?query={quote(query)}&display={display}&start={start}&sort={sort}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    result = await response.json()
+        await get_rate_limiter("naver").acquire()
+        session = get_http_session()
+        async with session.get(url, headers=self.headers) as response:
+            if response.status == 200:
+                result = await response.json()
                     
-                    # 결과 내의 HTML 태그 제거
-                    for item in result.get('items', []):
-                        if 'title' in item:
-                            item['title'] = self._clean_html_tags(item['title'])
-                        if 'description' in item:
-                            item['description'] = self._clean_html_tags(item['description'])
+                # 결과 내의 HTML 태그 제거
+                for item in result.get('items', []):
+                    if 'title' in item:
+                        item['title'] = self._clean_html_tags(item['title'])
+                    if 'description' in item:
+                        item['description'] = self._clean_html_tags(item['description'])
                     
-                    return result
-                else:
-                    response_text = await response.text()
-                    logger.error(f"지식인 검색 API 호출 실패: {response.status}, {response_text}")
-                    raise Exception(f"지식인 검색 API 호출 실패: {response.status}, {response_text}")
+                return result
+            else:
+                response_text = await response.text()
+                logger.error(f"지식인 검색 API 호출 실패: {response.status}, {response_text}")
+                raise Exception(f"지식인 검색 API 호출 실패: {response.status}, {response_text}")
     
-    async def fetch_content(self, url: str, source_type: str = None, max_content_length: int = 1000000) -> Tuple[str, str, Dict[str, Any]]:
+    async def fetch_content(self, url: str, source_type: str = None, max_content_length: int = 1000000,
+                            max_bytes: Optional[int] = None) -> Tuple[str, str, Dict[str, Any]]:
         """주어진 URL에서 웹 페이지 내용을 가져옵니다.
         
         Args:
             url (str): 크롤링할 URL
             source_type (str, optional): 소스 유형(news, encyc, kin). 기본값은 None.
             max_content_length (int, optional): 최대 콘텐츠 길이. 기본값은 1000000자.
+            max_bytes (Optional[int], optional): 내려받을 최대 바이트 수. 기본값은 HTTP_MAX_PAGE_BYTES 설정.
             
         Returns:
             Tuple[str, str, Dict[str, Any]]: (HTML 내용, 추출된 텍스트 내용, 추가 메타데이터)
@@ -305,101 +400,43 @@ class NaverCrawler:
         headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
         headers['Accept-Language'] = 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3'
         
-        # 랜덤 딜레이 증가 (1-5초)
-        await self._async_random_delay(1.0, 5.0)
+        # 호스트별 공유 속도 제한 (같은 호스트에 요청이 몰리지 않도록)
+        host_limiter = get_rate_limiter(f"host:{urlparse(url).netloc}")
+        await host_limiter.acquire()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, cookies=cookies) as response:
-                    if response.status == 200:
-                        # 인코딩 문제 해결: 여러 인코딩 시도
-                        try:
-                            # 먼저 응답 헤더에서 charset 확인
-                            content_type = response.headers.get('Content-Type', '')
-                            charset = None
-                            if 'charset=' in content_type:
-                                charset = content_type.split('charset=')[-1].strip()
-                            
-                            # charset이 지정되어 있으면 해당 인코딩 사용
-                            if charset:
-                                html = await response.text(encoding=charset, errors='replace')
-                            else:
-                                # UTF-8 시도
-                                try:
-                                    html = await response.text(encoding='utf-8', errors='strict')
-                                except UnicodeDecodeError:
-                                    # UTF-8 실패시 EUC-KR 시도
-                                    try:
-                                        html = await response.text(encoding='euc-kr', errors='replace')
-                                    except UnicodeDecodeError:
-                                        # 마지막으로 CP949 시도
-                                        html = await response.text(encoding='cp949', errors='replace')
-                        except Exception as e:
-                            logger.warning(f"인코딩 감지 실패: {str(e)}, 기본 인코딩으로 대체합니다.")
-                            # 어떤 인코딩도 실패하면 바이너리로 읽고 디코딩 대신 errors='replace' 사용
-                            binary = await response.read()
-                            html = binary.decode('utf-8', errors='replace')
-                        
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # 불필요한 요소 제거
-                        for script in soup(['script', 'style', 'iframe', 'ins']):
-                            script.extract()
-                        
-                        # 뉴스 본문 추출 시도
-                        main_content = None
-                        
-                        # 주요 뉴스 컨텐츠 영역 탐색
-                        for selector in ['article', '.article-body', '.article_body', '.news-content', '.story-body', '.content-article']:
-                            content = soup.select_one(selector)
-                            if content:
-                                main_content = content
-                                break
-                        
-                        # 발행일, 작성자 추출 시도
-                        pub_date = None
-                        date_selectors = ['.t11', '.report_date', '.article_date', '.date', '.time']
-                        for selector in date_selectors:
-                            date_elem = soup.select_one(selector)
-                            if date_elem:
-                                pub_date = date_elem.get_text().strip()
-                                break
-                        
-                        # 언론사 추출
-                        press = None
-                        press_selectors = ['.press', '.source', '.publisher', '.article_by']
-                        for selector in press_selectors:
-                            press_elem = soup.select_one(selector)
-                            if press_elem:
-                                press = press_elem.get_text().strip()
-                                break
-                        
-                        # 텍스트 추출
-                        if main_content:
-                            text = main_content.get_text(separator='\n').strip()
-                        else:
-                            # 본문 영역을 찾지 못한 경우 일반적인 방법으로 텍스트 추출
-                            text = soup.get_text(separator='\n').strip()
-                        
-                        # 정제
-                        text = '\n'.join([line.strip() for line in text.split('\n') if line.strip()])
-                        text = re.sub(r'\s+', ' ', text)
+            session = get_http_session()
+            async with session.get(url, headers=headers, cookies=cookies) as response:
+                if response.status == 200:
+                    # 본문은 최대 바이트 수까지만 스트리밍으로 읽고,
+                    # 디코딩, 파싱, 본문/발행일/언론사 추출은 추출 프로세스 풀에서 실행 (이벤트 루프 차단 방지)
+                    raw, _ = await read_html_body(response, max_bytes)
+                    extracted = await get_extraction_executor().extract(raw, 'article', response.charset)
+                    text = extracted['text']
+                    pub_date = extracted['date']
+                    press = extracted['press']
                         
-                        # 텍스트 길이 제한 (토큰 제한 방지)
-                        if len(text) > max_content_length:
-                            text = text[:max_content_length] + "... [잘림]"
+                    # 텍스트 길이 제한 (토큰 제한 방지)
+                    if len(text) > max_content_length:
+                        text = text[:max_content_length] + "... [잘림]"
                         
-                        metadata = {
-                            'date': pub_date,
-                            'press': press,
-                            'crawled_at': datetime.now().isoformat()
-                        }
+                    metadata = {
+                        'date': pub_date,
+                        'press': press,
+                        'crawled_at': datetime.now().isoformat()
+                    }
                         
-                        # HTML은 빈 문자열로 반환 (토큰 절약)
-                        return "", text, metadata
-                    else:
-                        logger.warning(f"콘텐츠 가져오기 실패: {url}, 상태 코드: {response.status}")
-                        return "", f"Error: Status code {response.status}", {}
+                    # HTML은 빈 문자열로 반환 (토큰 절약)
+                    return "", text, metadata
+                else:
+                    if response.status == 429:
+                        retry_after = response.headers.get('Retry-After', '')
+                        host_limiter.penalize(float(retry_after) if retry_after.isdigit() else None)
+                    logger.warning(f"콘텐츠 가져오기 실패: {url}, 상태 코드: {response.status}")
+                    return "", f"Error: Status code {response.status}", {}
+        except UnsupportedContentTypeError as e:
+            logger.info(f"콘텐츠 가져오기 건너뜀: {url}, {str(e)}")
+            return "", f"Error: {str(e)}", {}
         except Exception as e:
             logger.error(f"콘텐츠 가져오기 중 예외 발생: {url}, {str(e)}")
             return "", f"Error: {str(e)}", {}
@@ -407,6 +444,9 @@ class NaverCrawler:
     def _extract_content_by_source(self, soup: BeautifulSoup, source_type: str) -> Dict[str, Any]:
         """소스 유형에 따라 특화된 콘텐츠 추출 로직을 적용합니다.
         
+        추출 로직은 추출 프로세스 풀에서도 사용할 수 있도록
+        src.core.search.utils.extraction.extract_naver_source_content에 있습니다.
+        
         Args:
             soup (BeautifulSoup): 파싱할 HTML 콘텐츠의 BeautifulSoup 객체
             source_type (str): 소스 유형(news, encyc, kin)
@@ -414,159 +454,7 @@ class NaverCrawler:
         Returns:
             Dict[str, Any]: 추출된 텍스트와 메타데이터
         """
-        result = {'text': ''}
-        
-        if not source_type:
-            # 일반적인 텍스트 추출
-            text = soup.get_text(separator='\n').strip()
-            # 여러 줄 공백 제거
-            text = '\n'.join([line.strip() for line in text.split('\n') if line.strip()])
-            # 연속된 공백 제거
-            text = re.sub(r'\s+', ' ', text)
-            result['text'] = text
-            return result
-        
-        if source_type == 'news':
-            # 뉴스 특화 파싱
-            # 주요 뉴스 컨텐츠 영역 탐색
-            main_content = None
-            
-            # 네이버 뉴스 구조
-            if soup.select_one('#dic_area'):
-                main_content = soup.select_one('#dic_area')
-            # 다른 뉴스 사이트의 일반적인 구조
-            elif soup.select_one('article'):
-                main_content = soup.select_one('article')
-            elif soup.select_one('.news_body'):
-                main_content = soup.select_one('.news_body')
-            elif soup.select_one('.article_body'):
-                main_content = soup.select_one('.article_body')
-            elif soup.select_one('.article-body'):
-                main_content = soup.select_one('.article-body')
-            
-            # 발행일, 작성자, 언론사 추출 시도
-            pub_date = None
-            date_selectors = ['.t11', '.report_date', '.article_date', '.date', '.time']
-            for selector in date_selectors:
-                date_elem = soup.select_one(selector)
-                if date_elem:
-                    pub_date = date_elem.get_text().strip()
-                    break
-            
-            result['date'] = pub_date
-            
-            # 언론사 추출
-            press = None
-            press_selectors = ['.press', '.source', '.publisher', '.article_by']
-            for selector in press_selectors:
-                press_elem = soup.select_one(selector)
-                if press_elem:
-                    press = press_elem.get_text().strip()
-                    break
-            
-            result['press'] = press
-            
-            # 텍스트 추출
-            if main_content:
-                # 불필요한 요소 제거
-                for elem in main_content.select('.reporter_area, .byline, .copyright'):
-                    if elem:
-                        elem.extract()
-                
-                text = main_content.get_text(separator='\n').strip()
-                # 정제
-                text = '\n'.join([line.strip() for line in text.split('\n') if line.strip()])
-                text = re.sub(r'\s+', ' ', text)
-                result['text'] = text
-            else:
-                # 본문 영역을 찾지 못한 경우 일반적인 방법으로 텍스트 추출
-                text = soup.get_text(separator='\n').strip()
-                text = '\n'.join([line.strip() for line in text.split('\n') if line.strip()])
-                text = re.sub(r'\s+', ' ', text)
-                result['text'] = text
-        
-        elif source_type == 'encyc':
-            # 백과사전 특화 파싱
-            # 네이버 백과사전 구조
-            main_content = None
-            
-            if soup.select_one('.summary_area'):
-                summary = soup.select_one('.summary_area').get_text().strip()
-                result['summary'] = summary
-            
-            if soup.select_one('#content'):
-                main_content = soup.select_one('#content')
-            elif soup.select_one('.article'):
-                main_content = soup.select_one('.article')
-            
-            if main_content:
-                # 불필요한 요소 제거
-                for elem in main_content.select('.manager_area, .button_area, .related_area'):
-                    if elem:
-                        elem.extract()
-                
-                text = main_content.get_text(separator='\n').strip()
-                # 정제
-                text = '\n'.join([line.strip() for line in text.split('\n') if line.strip()])
-                text = re.sub(r'\s+', ' ', text)
-                result['text'] = text
-            else:
-                # 본문 영역을 찾지 못한 경우 일반적인 방법으로 텍스트 추출
-                text = soup.get_text(separator='\n').strip()
-                text = '\n'.join([line.strip() for line in text.split('\n') if line.strip()])
-                text = re.sub(r'\s+', ' ', text)
-                result['text'] = text
-            
-            # 카테고리 추출
-            categories = []
-            for cat in soup.select('.location a'):
-                categories.append(cat.get_text().strip())
-            
-            if categories:
-                result['categories'] = categories
-        
-        elif source_type == 'kin':
-            # 지식인 특화 파싱
-            # 질문 영역
-            question = None
-            if soup.select_one('.c-heading__title'):
-                question = soup.select_one('.c-heading__title').get_text().strip()
-            elif soup.select_one('.title'):
-                question = soup.select_one('.title').get_text().strip()
-            
-            result['question'] = question
-            
-            # 질문 내용
-            question_content = None
-            if soup.select_one('.c-heading__content'):
-                question_content = soup.select_one('.c-heading__content').get_text().strip()
-            elif soup.select_one('.c-heading__detail'):
-                question_content = soup.select_one('.c-heading__detail').get_text().strip()
-            
-            result['question_content'] = question_content
-            
-            # 답변 추출
-            answers = []
-            for answer in soup.select('.answer-content__item'):
-                answer_text = answer.get_text().strip()
-                answers.append(answer_text)
-            
-            result['answers'] = answers
-            
-            # 텍스트 조합
-            text_parts = []
-            if question:
-                text_parts.append(f"질문: {question}")
-            if question_content:
-                text_parts.append(f"질문 내용: {question_content}")
-            if answers:
-                for i, answer in enumerate(answers, 1):
-                    text_parts.append(f"답변 {i}: {answer}")
-            
-            text = '\n\n'.join(text_parts)
-            result['text'] = text
-        
-        return result
+        return extract_naver_source_content(soup, source_type)
     
     async def process_news_content(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """뉴스 검색 결과 아이템을 처리하고 상세 내용을 추가합니다.
@@ -9,14 +9,17 @@ import re
 import json
 import time
 import asyncio
+import importlib.util
 import pandas as pd
-from typing import Dict, List, Any, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable, Sequence
 from datetime import datetime
 import urllib.parse
 
 from selenium.webdriver.common.by import By
 from bs4 import BeautifulSoup
 
+from src.common.http_client import close_http_sessions
 from src.common.logging import get_logger
 from src.common.utils.selenium_utils import (
     setup_chrome_driver, 
@@ -26,14 +29,84 @@ from src.common.utils.selenium_utils import (
     close_driver
 )
 from src.core.search.utils.naver_api_utils import (
-    get_relkeyword,
     collect_related_keywords,
-    get_naver_searchad_header
+    get_naver_searchad_header,
+    RelatedKeywordExpander
 )
+from src.core.search.utils.keyword_store import KeywordStore, create_keyword_store
 
 # 로거 설정
 logger = get_logger(__name__)
 
+# 키워드 도구 API 응답 필드와 DataFrame 컬럼명
+RELKEYWORD_COLUMNS = {
+    "relKeyword": "연관키워드",
+    "monthlyPcQcCnt": "월간검색수_PC",
+    "monthlyMobileQcCnt": "월간검색수_모바일",
+    "monthlyAvePcClkCnt": "월평균클릭수_PC",
+    "monthlyAveMobileClkCnt": "월평균클릭수_모바일",
+    "monthlyAvePcCtr": "월평균클릭률_PC",
+    "monthlyAveMobileCtr": "월평균클릭률_모바일",
+    "compIdx": "경쟁정도",
+    "plAvgDepth": "월평균노출광고수",
+}
+
+# 후처리 후 컬럼별 dtype
+KEYWORD_COUNT_COLUMNS = ("월간검색수_PC", "월간검색수_모바일")  # "< 10"은 10으로 변환 후 int32
+KEYWORD_FLOAT_COLUMNS = ("월평균클릭수_PC", "월평균클릭수_모바일", "월평균클릭률_PC", "월평균클릭률_모바일", "월평균노출광고수")
+COMPETITION_LEVELS = ("낮음", "중간", "높음")
+
+# store 인자를 생략했음을 나타내는 값 (None은 저장소를 사용하지 않음)
+_DEFAULT_STORE = object()
+
+
+def normalize_keyword_frame(df: pd.DataFrame, dropna: bool = False) -> pd.DataFrame:
+    """
+    연관 키워드 DataFrame을 고정 dtype으로 변환하고 연관키워드를 인덱스로 설정합니다.
+    
+    검색수는 int32("< 10"은 10), 클릭수/클릭률/노출광고수는 float32, 경쟁정도는 순서형 범주로
+    변환하며, 같은 연관 키워드는 처음 행만 남깁니다.
+    
+    Args:
+        df: _keyword_rows_to_df 형식의 연관 키워드 DataFrame
+        dropna: 값이 없는 행을 제거할지 여부. 기본값은 False.
+        
+    Returns:
+        pd.DataFrame: 연관키워드 인덱스의 DataFrame
+    """
+    if df.empty:
+        return df
+    
+    df = df.drop_duplicates(subset="연관키워드")
+    columns = {"연관키워드": df["연관키워드"]}
+    for col in KEYWORD_COUNT_COLUMNS:
+        columns[col] = pd.to_numeric(df[col].replace("< 10", 10), errors="coerce").fillna(0).astype("int32")
+    for col in KEYWORD_FLOAT_COLUMNS:
+        columns[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
+    competition = df["경쟁정도"].where(df["경쟁정도"].isin(COMPETITION_LEVELS))
+    columns["경쟁정도"] = pd.Categorical(competition, categories=COMPETITION_LEVELS, ordered=True)
+    
+    typed = pd.DataFrame(columns)[list(RELKEYWORD_COLUMNS.values())]
+    if dropna:
+        typed = typed.dropna()
+    return typed.set_index("연관키워드")
+
+
+def load_keyword_frame(path: str) -> pd.DataFrame:
+    """
+    save_to_parquet 또는 save_to_excel로 저장한 연관 키워드 파일을 고정 dtype으로 읽습니다.
+    
+    Args:
+        path: .parquet 또는 .xlsx 파일 경로
+        
+    Returns:
+        pd.DataFrame: 연관키워드 인덱스의 DataFrame
+    """
+    if path.endswith(".parquet"):
+        # Parquet은 dtype을 그대로 보존하므로 변환 없이 반환
+        return pd.read_parquet(path)
+    return normalize_keyword_frame(pd.read_excel(path))
+
 class NaverKeywordCollector:
     """네이버 키워드 수집기 클래스
     
@@ -43,7 +116,11 @@ class NaverKeywordCollector:
     def __init__(self, api_key: Optional[str] = None, 
                  secret_key: Optional[str] = None, 
                  customer_id: Optional[str] = None,
-                 headless: bool = True) -> None:
+                 headless: bool = True,
+                 qps: Optional[float] = None,
+                 hint_batch_size: int = 1,
+                 concurrency: int = 4,
+                 store: Union[KeywordStore, None, object] = _DEFAULT_STORE) -> None:
         """
         NaverKeywordCollector 초기화
         
@@ -52,6 +129,10 @@ class NaverKeywordCollector:
             secret_key: 네이버 검색광고 시크릿 키. 기본값은 None으로, 환경 변수에서 로드.
             customer_id: 네이버 검색광고 고객 ID. 기본값은 None으로, 환경 변수에서 로드.
             headless: 헤드리스 모드 사용 여부. 기본값은 True.
+            qps: 연관 키워드 조회 초당 최대 요청 수. 기본값은 None으로, RATE_LIMIT_NAVER_SEARCHAD_QPS(기본 5).
+            hint_batch_size: 연관 키워드 조회 한 번에 묶을 시드 키워드 수(1~5). 기본값은 1.
+            concurrency: 연관 키워드 조회 최대 동시 요청 수. 기본값은 4.
+            store: 연관 키워드 저장소. None이면 저장소를 사용하지 않음. 생략하면 KEYWORD_STORE_PATH 설정으로 생성(빈 값이면 사용 안 함).
         """
         # API 키 초기화
         self.api_key = api_key or os.getenv("NAVER_API_KEY", "")
@@ -69,6 +150,13 @@ class NaverKeywordCollector:
         # 헤드리스 모드 설정
         self.headless = headless
         
+        # 연관 키워드 확장기 (공유 HTTP 세션, 속도 제한, 429 재시도)
+        self.expander = RelatedKeywordExpander(qps=qps, batch_size=hint_batch_size, concurrency=concurrency)
+        
+        # 연관 키워드 저장소 (시드 키워드별 결과 즉시 저장, run_id로 재개)
+        self.store: Optional[KeywordStore] = create_keyword_store() if store is _DEFAULT_STORE else store
+        self.last_run_id: Optional[str] = None
+        
         # 드라이버 초기화는 필요할 때만 수행
         self._driver = None
     
@@ -92,29 +180,24 @@ class NaverKeywordCollector:
         """객체 소멸 시 드라이버를 종료합니다."""
         self.close()
     
-    def collect_info_keywords_from_category(self, url: str, pages: int = 1) -> pd.DataFrame:
+    def collect_category_keywords(self, url: str, pages: int = 1) -> List[str]:
         """
-        특정 URL(카테고리 페이지)에서 정보성 키워드를 수집합니다.
+        특정 URL(카테고리 페이지)의 글 제목을 시드 키워드로 수집합니다.
         
         Args:
             url: 수집할 카테고리 URL
             pages: 수집할 페이지 수. 기본값은 1.
             
         Returns:
-            pd.DataFrame: 수집된 키워드 DataFrame
+            List[str]: 중복을 제거한 시드 키워드 목록
         """
-        logger.info(f"정보성 키워드 수집 시작: {url}, {pages}페이지")
         keywords = []
         
         try:
-            # URL이 유효한지 확인
-            if not url.startswith(("http://", "https://")):
-                raise ValueError(f"유효하지 않은 URL: {url}")
-            
             # 셀레니움으로 페이지 접근
             if not safe_driver_get(self.driver, url):
                 logger.error(f"URL 접근 실패: {url}")
-                return pd.DataFrame()
+                return []
             
             # 대괄호 제거 및 전처리 함수
             def clean_keyword(text: str) -> str:
@@ -175,59 +258,54 @@ class NaverKeywordCollector:
                     continue
             
             # 중복 제거 및 빈 문자열 제거
-            keywords = list(set([keyword for keyword in keywords if keyword]))
+            keywords = list(dict.fromkeys(keyword for keyword in keywords if keyword))
+            
+            return keywords
+        
+        except Exception as e:
+            logger.error(f"카테고리 키워드 수집 중 오류 발생: {str(e)}")
+            return []
+    
+    def collect_info_keywords_from_category(self, url: str, pages: int = 1, run_id: Optional[str] = None) -> pd.DataFrame:
+        """
+        특정 URL(카테고리 페이지)에서 정보성 키워드를 수집합니다.
+        
+        키워드 저장소를 사용하면 시드 키워드마다 결과가 바로 저장되며, 중간에 실패한 실행은
+        같은 run_id로 다시 호출하여 남은 시드 키워드부터 이어서 진행할 수 있습니다.
+        
+        Args:
+            url: 수집할 카테고리 URL
+            pages: 수집할 페이지 수. 기본값은 1.
+            run_id: 이어서 진행할 실행 ID. 기본값은 None으로, 새 실행을 시작.
+            
+        Returns:
+            pd.DataFrame: 수집된 키워드 DataFrame
+        """
+        logger.info(f"정보성 키워드 수집 시작: {url}, {pages}페이지")
+        
+        try:
+            # URL이 유효한지 확인
+            if not url.startswith(("http://", "https://")):
+                raise ValueError(f"유효하지 않은 URL: {url}")
+            
+            # 이전 실행을 이어서 진행하는 경우 저장된 시드 키워드를 사용하고, 아니면 페이지에서 수집
+            keywords = self._stored_run_seeds(run_id) or self.collect_category_keywords(url, pages)
             
             if not keywords:
                 logger.warning(f"수집된 키워드가 없습니다. URL: {url}")
                 return pd.DataFrame()
             
-            # 각 키워드별로 연관 키워드 수집
+            # 각 키워드별로 연관 키워드 수집 (동시 요청, 속도 제한)
             logger.info(f"총 {len(keywords)}개 키워드의 연관 키워드 수집 시작")
+            run_id = self._start_run(keywords, run_id, "info", url)
+            df_keywords = self.expand_related_keywords(keywords, run_id=run_id)
             
-            dfs = []
-            for idx, keyword in enumerate(keywords):
-                try:
-                    # 연관 키워드 수집
-                    df_keyword = self._collect_related_keywords_as_df(keyword)
-                    if df_keyword is not None and not df_keyword.empty:
-                        dfs.append(df_keyword)
-                        logger.info(f"[{idx+1}/{len(keywords)}] 키워드 '{keyword}' 처리 완료")
-                    else:
-                        logger.warning(f"[{idx+1}/{len(keywords)}] 키워드 '{keyword}'의 연관 키워드 없음")
-                    
-                    # API 호출 제한 방지를 위한 딜레이
-                    if idx < len(keywords) - 1:
-                        random_delay(1.5, 3.0)
-                        
-                except Exception as e:
-                    logger.error(f"키워드 '{keyword}' 수집 실패: {str(e)}")
-                    random_delay(3.0, 5.0)  # 오류 발생 시 더 긴 딜레이
-                    continue
-            
-            if not dfs:
+            if df_keywords.empty:
                 logger.warning("연관 키워드 데이터 없음")
                 return pd.DataFrame()
             
-            # 모든 키워드 데이터 병합
-            df_keywords = pd.concat(dfs, axis=0)
-            
-            # 중복 제거
-            df_keywords = df_keywords.drop_duplicates()
-            
-            # "< 10" 값을 "10"으로 변환
-            df_keywords = df_keywords.replace("< 10", "10")
-            
-            # 숫자 컬럼 변환
-            for col in ["월간검색수_PC", "월간검색수_모바일"]:
-                if col in df_keywords.columns:
-                    df_keywords[col] = pd.to_numeric(df_keywords[col], errors='coerce').fillna(0).astype(int)
-            
-            # NaN 값 제거
-            df_keywords = df_keywords.dropna()
-            
-            # 인덱스 설정
-            if '연관키워드' in df_keywords.columns:
-                df_keywords = df_keywords.set_index("연관키워드")
+            # 중복 제거, "< 10" 변환, dtype 고정, NaN 행 제거, 인덱스 설정
+            df_keywords = normalize_keyword_frame(df_keywords, dropna=True)
             
             # 결과 저장
             logger.info(f"정보성 키워드 수집 완료: 총 {len(df_keywords)}개 키워드")
@@ -238,75 +316,150 @@ class NaverKeywordCollector:
             logger.error(f"정보성 키워드 수집 중 오류 발생: {str(e)}")
             return pd.DataFrame()
     
-    def _collect_related_keywords_as_df(self, keyword: str) -> pd.DataFrame:
+    @staticmethod
+    def _clean_seed_keyword(keyword: str) -> str:
+        """시드 키워드에서 대괄호와 그 내용을 제거합니다."""
+        return re.sub(r'\s*\[.*?\]\s*', '', keyword).strip()
+    
+    @staticmethod
+    def _keyword_rows_to_df(rows: List[Dict[str, Any]]) -> pd.DataFrame:
         """
-        네이버 키워드도구 API를 이용하여 연관키워드를 DataFrame으로 반환합니다.
+        키워드 도구 API의 keywordList를 한글 컬럼명의 DataFrame으로 변환합니다.
         
         Args:
-            keyword: 검색할 키워드
+            rows: 키워드 도구 API 응답의 keywordList 항목들
             
         Returns:
             pd.DataFrame: 연관 키워드 DataFrame
         """
-        try:
-            # 키워드 전처리
-            keyword = re.sub(r'\s*\[.*?\]\s*', '', keyword).strip()
-            if not keyword:
-                return pd.DataFrame()
-            
-            # API 응답 가져오기
-            result = get_relkeyword(keyword)
-            
-            if "error" in result:
-                logger.error(f"연관 키워드 조회 실패: {result.get('error')}")
-                return pd.DataFrame()
+        df = pd.DataFrame(rows)
+        if df.empty:
+            return df
+        
+        # 컬럼명 변경 및 필요한 컬럼만 선택
+        return df.rename(columns=RELKEYWORD_COLUMNS)[list(RELKEYWORD_COLUMNS.values())]
+    
+    def _start_run(self, keywords: Sequence[str], run_id: Optional[str], kind: str, label: str) -> Optional[str]:
+        """
+        키워드 저장소에 수집 실행을 시작(또는 재개)하고 실행 ID를 반환합니다.
+        
+        Args:
+            keywords: 시드 키워드 목록
+            run_id: 이어서 진행할 실행 ID (None이면 새로 생성)
+            kind: 실행 유형 ("info" 또는 "product")
+            label: 실행 설명 (카테고리 URL 또는 카테고리명)
             
-            if "keywordList" not in result:
-                logger.warning(f"키워드 '{keyword}'에 대한 연관 키워드가 없습니다.")
-                return pd.DataFrame()
+        Returns:
+            Optional[str]: 실행 ID (저장소를 사용하지 않으면 None)
+        """
+        if self.store is None:
+            return None
+        seeds = [seed for seed in map(self._clean_seed_keyword, keywords) if seed]
+        run_id = self.store.start_run(seeds, run_id, kind=kind, label=label)
+        logger.info(f"키워드 수집 실행 ID: {run_id} (중단된 경우 run_id='{run_id}'로 이어서 진행)")
+        return run_id
+    
+    def _stored_run_seeds(self, run_id: Optional[str]) -> List[str]:
+        """
+        키워드 저장소에 기록된 실행의 시드 키워드를 반환합니다.
+        
+        Args:
+            run_id: 실행 ID
             
-            # DataFrame으로 변환
-            df = pd.DataFrame(result["keywordList"])
-            if df.empty:
-                return df
-            
-            # 컬럼명 변경
-            df.rename(
-                {
-                    "compIdx": "경쟁정도",
-                    "monthlyAveMobileClkCnt": "월평균클릭수_모바일",
-                    "monthlyAveMobileCtr": "월평균클릭률_모바일",
-                    "monthlyAvePcClkCnt": "월평균클릭수_PC",
-                    "monthlyAvePcCtr": "월평균클릭률_PC",
-                    "monthlyMobileQcCnt": "월간검색수_모바일",
-                    "monthlyPcQcCnt": "월간검색수_PC",
-                    "plAvgDepth": "월평균노출광고수",
-                    "relKeyword": "연관키워드",
-                },
-                axis=1,
-                inplace=True,
-            )
+        Returns:
+            List[str]: 시드 키워드 목록 (실행이 없거나 저장소를 사용하지 않으면 빈 리스트)
+        """
+        if not run_id or self.store is None:
+            return []
+        seeds = self.store.run_seeds(run_id)
+        if seeds:
+            logger.info(f"실행 {run_id}을(를) 이어서 진행합니다: {self.store.get_run(run_id)['seeds']}")
+        else:
+            logger.warning(f"저장된 실행 {run_id}이(가) 없어 새로 수집합니다.")
+        return seeds
+    
+    async def aexpand_related_keywords(self,
+                                       keywords: Sequence[str],
+                                       on_progress: Optional[Callable[[int, int], None]] = None,
+                                       run_id: Optional[str] = None) -> pd.DataFrame:
+        """
+        여러 시드 키워드의 연관 키워드를 동시에 조회하여 하나의 DataFrame으로 반환합니다.
+        
+        키워드 저장소를 사용하면 요청이 끝날 때마다 결과를 저장하고, 이 실행에서 이미 완료했거나
+        freshness 기간 안에 조회한 시드 키워드는 API를 호출하지 않고 저장된 결과를 사용합니다.
+        
+        Args:
+            keywords: 시드 키워드 목록
+            on_progress: 요청이 끝날 때마다 (완료한 요청 수, 전체 요청 수)로 호출되는 콜백
+            run_id: 키워드 저장소의 실행 ID. 기본값은 None으로, 새 실행을 시작.
             
-            # 필요한 컬럼만 선택
-            df = df[
-                [
-                    "연관키워드",
-                    "월간검색수_PC",
-                    "월간검색수_모바일",
-                    "월평균클릭수_PC",
-                    "월평균클릭수_모바일",
-                    "월평균클릭률_PC",
-                    "월평균클릭률_모바일",
-                    "경쟁정도",
-                    "월평균노출광고수",
-                ]
-            ]
+        Returns:
+            pd.DataFrame: 모든 시드 키워드의 연관 키워드 DataFrame (저장소를 사용하지 않으면 중복 포함)
+        """
+        seeds = [seed for seed in map(self._clean_seed_keyword, keywords) if seed]
+        if self.store is None:
+            results = await self.expander.expand(seeds, on_progress=on_progress)
+            rows = [row for result in results for row in result.get("keywordList", [])]
+        else:
+            run_id = self.store.start_run(seeds, run_id)
+            self.last_run_id = run_id
+            pending = self.store.pending_seeds(run_id)
+            logger.info(f"실행 {run_id}: 시드 키워드 {len(seeds)}개 중 {len(seeds) - len(pending)}개는 저장된 결과 사용")
+            
+            def save(result: Dict[str, Any]) -> None:
+                # 요청이 끝날 때마다 바로 기록하여 중단되어도 결과가 남도록 함
+                if "error" in result:
+                    self.store.mark_failed(run_id, result["hints"])
+                else:
+                    self.store.save_results(run_id, result["hints"], result.get("keywordList", []))
+            
+            results = await self.expander.expand(pending, on_progress=on_progress, on_result=save)
+            status = self.store.finish_run(run_id)
+            logger.info(f"실행 {run_id} 종료: {status}")
+            rows = self.store.run_keywords(run_id)
+        
+        failed = sum(1 for result in results if "error" in result)
+        if failed:
+            logger.warning(f"연관 키워드 조회 실패 요청: {failed}/{len(results)}개")
+        return self._keyword_rows_to_df(rows)
+    
+    def expand_related_keywords(self,
+                                keywords: Sequence[str],
+                                on_progress: Optional[Callable[[int, int], None]] = None,
+                                run_id: Optional[str] = None) -> pd.DataFrame:
+        """
+        aexpand_related_keywords의 동기 버전입니다.
+        
+        이벤트 루프 안에서 호출되면 별도 스레드의 새 이벤트 루프에서 실행합니다.
+        
+        Args:
+            keywords: 시드 키워드 목록
+            on_progress: 요청이 끝날 때마다 (완료한 요청 수, 전체 요청 수)로 호출되는 콜백
+            run_id: 키워드 저장소의 실행 ID. 기본값은 None으로, 새 실행을 시작.
             
-            return df
+        Returns:
+            pd.DataFrame: 모든 시드 키워드의 연관 키워드 DataFrame
+        """
+        def run() -> pd.DataFrame:
+            async def expand_and_close() -> pd.DataFrame:
+                try:
+                    return await self.aexpand_related_keywords(keywords, on_progress, run_id)
+                finally:
+                    # 이 호출을 위해 만든 이벤트 루프의 공유 세션 정리
+                    await close_http_sessions()
             
-        except Exception as e:
-            logger.error(f"키워드 '{keyword}' 연관키워드 수집 중 오류: {str(e)}")
-            return pd.DataFrame()
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(expand_and_close())
+            finally:
+                loop.close()
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(run).result()
     
     def collect_datalab_keywords(self, pages: int = 25) -> Tuple[List[str], str]:
         """
@@ -402,69 +555,42 @@ class NaverKeywordCollector:
             logger.error(f"데이터랩 키워드 수집 중 오류 발생: {str(e)}")
             return [], filename
     
-    def collect_product_keywords(self, pages: int = 25) -> Tuple[pd.DataFrame, str]:
+    def collect_product_keywords(self, pages: int = 25, run_id: Optional[str] = None) -> Tuple[pd.DataFrame, str]:
         """
         데이터랩에서 상품 키워드를 수집하고, 각 키워드의 연관 키워드를 가져옵니다.
         
         Args:
             pages: 데이터랩에서 수집할 페이지 수. 기본값은 25.
+            run_id: 이어서 진행할 실행 ID. 기본값은 None으로, 새 실행을 시작.
             
         Returns:
             Tuple[pd.DataFrame, str]: (연관 키워드 DataFrame, 파일명)
         """
         try:
-            # 데이터랩에서 키워드 수집
-            logger.info("데이터랩 키워드 수집 시작...")
-            keywords, filename = self.collect_datalab_keywords(pages)
+            # 이전 실행을 이어서 진행하는 경우 저장된 시드 키워드와 카테고리명을 사용
+            keywords = self._stored_run_seeds(run_id)
+            if keywords:
+                filename = self.store.get_run(run_id)["label"]
+            else:
+                # 데이터랩에서 키워드 수집
+                logger.info("데이터랩 키워드 수집 시작...")
+                keywords, filename = self.collect_datalab_keywords(pages)
             
             if not keywords:
                 logger.warning("데이터랩에서 수집된 키워드가 없습니다.")
                 return pd.DataFrame(), ""
             
-            # 연관 키워드 수집
+            # 연관 키워드 수집 (동시 요청, 속도 제한)
             logger.info(f"총 {len(keywords)}개 키워드의 연관 키워드 수집 시작")
+            run_id = self._start_run(keywords, run_id, "product", filename)
+            df_combined = self.expand_related_keywords(keywords, run_id=run_id)
             
-            dfs = []
-            for idx, keyword in enumerate(keywords):
-                try:
-                    # 연관 키워드 수집
-                    df_keyword = self._collect_related_keywords_as_df(keyword)
-                    if df_keyword is not None and not df_keyword.empty:
-                        dfs.append(df_keyword)
-                        logger.info(f"[{idx+1}/{len(keywords)}] 키워드 '{keyword}' 처리 완료")
-                    else:
-                        logger.warning(f"[{idx+1}/{len(keywords)}] 키워드 '{keyword}'의 연관 키워드 없음")
-                    
-                    # API 호출 제한 방지를 위한 딜레이
-                    if idx < len(keywords) - 1:
-                        random_delay(1.5, 3.0)
-                        
-                except Exception as e:
-                    logger.error(f"키워드 '{keyword}' 수집 실패: {str(e)}")
-                    random_delay(3.0, 5.0)  # 오류 발생 시 더 긴 딜레이
-                    continue
-            
-            if not dfs:
+            if df_combined.empty:
                 logger.warning("연관 키워드 데이터 없음")
                 return pd.DataFrame(), filename
             
-            # 모든 키워드 데이터 병합
-            df_combined = pd.concat(dfs, axis=0)
-            
-            # 중복 제거
-            df_combined = df_combined.drop_duplicates()
-            
-            # "< 10" 값을 "10"으로 변환
-            df_combined = df_combined.replace("< 10", "10")
-            
-            # 숫자 컬럼 변환
-            for col in ["월간검색수_PC", "월간검색수_모바일"]:
-                if col in df_combined.columns:
-                    df_combined[col] = pd.to_numeric(df_combined[col], errors='coerce').fillna(0).astype(int)
-            
-            # 인덱스 설정
-            if '연관키워드' in df_combined.columns:
-                df_combined = df_combined.set_index("연관키워드")
+            # 중복 제거, "< 10" 변환, dtype 고정, 인덱스 설정
+            df_combined = normalize_keyword_frame(df_combined)
             
             # 결과 저장
             logger.info(f"상품 키워드 수집 완료: 총 {len(df_combined)}개 키워드")
@@ -505,6 +631,27 @@ class NaverKeywordCollector:
         except Exception:
             return datetime.now().strftime("%Y%m%d")
     
+    def _output_filename(self, prefix: str, category_id: str, extension: str) -> str:
+        """
+        저장할 파일명을 생성합니다.
+        
+        Args:
+            prefix: 파일명 접두사
+            category_id: 카테고리 ID (비어 있으면 오늘 날짜)
+            extension: 파일 확장자 (예: "xlsx", "parquet")
+            
+        Returns:
+            str: 파일명
+        """
+        today = datetime.now().strftime("%Y%m%d")
+        
+        if not category_id:
+            category_id = today
+        
+        if prefix:
+            return f"{prefix}_{category_id}_{today}.{extension}"
+        return f"keywords_{category_id}_{today}.{extension}"
+    
     def save_to_excel(self, df: pd.DataFrame, prefix: str = "", category_id: str = "") -> str:
         """
         DataFrame을 엑셀 파일로 저장합니다.
@@ -523,15 +670,7 @@ class NaverKeywordCollector:
         
         try:
             # 파일명 생성
-            today = datetime.now().strftime("%Y%m%d")
-            
-            if not category_id:
-                category_id = today
-            
-            if prefix:
-                filename = f"{prefix}_{category_id}_{today}.xlsx"
-            else:
-                filename = f"keywords_{category_id}_{today}.xlsx"
+            filename = self._output_filename(prefix, category_id, "xlsx")
             
             # 파일 저장
             df.to_excel(filename)
@@ -543,14 +682,49 @@ class NaverKeywordCollector:
             logger.error(f"파일 저장 중 오류 발생: {str(e)}")
             return ""
     
-    async def collect_keywords_async(self, url: str = None, pages: int = 1, keyword_type: str = "info") -> Tuple[pd.DataFrame, str]:
+    def save_to_parquet(self, df: pd.DataFrame, prefix: str = "", category_id: str = "") -> str:
+        """
+        DataFrame을 dtype을 보존하는 Parquet 파일로 저장합니다.
+        
+        pyarrow 또는 fastparquet이 설치되어 있지 않으면 저장하지 않습니다.
+        
+        Args:
+            df: 저장할 DataFrame
+            prefix: 파일명 접두사
+            category_id: 카테고리 ID
+            
+        Returns:
+            str: 저장된 파일 경로 (저장하지 않은 경우 빈 문자열)
+        """
+        if df.empty:
+            logger.warning("저장할 데이터가 없습니다.")
+            return ""
+        
+        if not any(importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet")):
+            logger.warning("pyarrow 또는 fastparquet이 설치되어 있지 않아 Parquet 파일을 저장하지 않습니다.")
+            return ""
+        
+        try:
+            filename = self._output_filename(prefix, category_id, "parquet")
+            df.to_parquet(filename)
+            logger.info(f"데이터 저장 완료: {filename}")
+            
+            return filename
+        
+        except Exception as e:
+            logger.error(f"Parquet 파일 저장 중 오류 발생: {str(e)}")
+            return ""
+    
+    async def collect_keywords_async(self, url: str = None, pages: int = 1, keyword_type: str = "info",
+                                     run_id: Optional[str] = None) -> Tuple[pd.DataFrame, str]:
         """
-        키워드를 비동기적으로 수집합니다.
+        키워드를 비동기적으로 수집합니다. 결과는 엑셀 파일과 함께 Parquet 파일로도 저장합니다.
         
         Args:
             url: 정보성 키워드 수집 시 사용할 URL
             pages: 수집할 페이지 수
             keyword_type: 키워드 유형 ('info' 또는 'product')
+            run_id: 이어서 진행할 실행 ID. 기본값은 None으로, 새 실행을 시작.
             
         Returns:
             Tuple[pd.DataFrame, str]: (수집된 키워드 DataFrame, 파일명)
@@ -561,13 +735,16 @@ class NaverKeywordCollector:
                 return pd.DataFrame(), ""
             
             category_id = self.extract_category_id(url)
-            df = self.collect_info_keywords_from_category(url, pages)
+            # 동기 수집기(Selenium)는 이벤트 루프를 막지 않도록 스레드에서 실행
+            df = await asyncio.to_thread(self.collect_info_keywords_from_category, url, pages, run_id)
             filename = self.save_to_excel(df, "정보성키워드", category_id)
+            self.save_to_parquet(df, "정보성키워드", category_id)
             return df, filename
         
         elif keyword_type == "product":
-            df, category_name = self.collect_product_keywords(pages)
+            df, category_name = await asyncio.to_thread(self.collect_product_keywords, pages, run_id)
             filename = self.save_to_excel(df, f"{category_name}_상품키워드")
+            self.save_to_parquet(df, f"{category_name}_상품키워드")
             return df, filename
         
         else:
@@ -6,33 +6,91 @@
 
 import asyncio
 import os
-import requests
+import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from exa_py import Exa
 from tavily import AsyncTavilyClient
 
+from src.common.hedging import RequestHedger, get_request_hedger
+from src.common.http_client import get_http_session
 from src.common.logging import get_logger
+from src.common.rate_limit import get_rate_limiter, gather_rate_limited, is_rate_limit_error, get_retry_after
 
 # 로거 설정
 logger = get_logger(__name__)
 
+PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
+
+# 429 응답 후 쿼리를 다시 보낼 최대 횟수
+RATE_LIMIT_RETRIES = 2
+
+# Exa SDK는 동기 방식이므로 전용 스레드 풀에서 실행 (기본 실행기를 다른 작업과 나눠 쓰지 않도록 크기 제한)
+_exa_executor = ThreadPoolExecutor(max_workers=int(os.getenv("EXA_MAX_WORKERS", "4")), thread_name_prefix="exa")
+
+
+async def _send_request(request, hedger: Optional[RequestHedger] = None, limiter=None,
+                        max_retries: int = RATE_LIMIT_RETRIES, backoff: float = 1.0):
+    """API 요청을 실행합니다. 헤징 실행기가 있으면 헤지 요청과 함께 실행합니다.
+
+    429 응답을 받으면 속도 제한기의 허용 속도를 낮추고, 지터를 적용한 백오프 후 제한기에서
+    토큰을 다시 획득하여 최대 max_retries번 재시도합니다.
+
+    Args:
+        request: 호출할 때마다 새 요청 코루틴을 만드는 함수
+        hedger (Optional[RequestHedger], optional): 엔진별 헤징 실행기
+        limiter (optional): 헤지 요청과 재시도 전에 토큰을 획득할 속도 제한기
+        max_retries (int, optional): 429 응답 후 최대 재시도 횟수. 기본값은 RATE_LIMIT_RETRIES.
+        backoff (float, optional): 첫 재시도의 최대 대기 시간(초), 재시도마다 두 배로 증가. 기본값은 1.0.
+
+    Returns:
+        API 응답
+
+    Raises:
+        Exception: 429가 아닌 오류이거나 재시도 횟수를 넘은 경우 마지막 예외
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            if hedger is None:
+                return await request()
+            return await hedger.run(request, limiter)
+        except Exception as e:
+            if limiter is None or not is_rate_limit_error(e):
+                raise
+            limiter.penalize(get_retry_after(e))
+            if attempt >= max_retries:
+                raise
+            logger.warning(f"속도 제한 초과로 재시도합니다 ({attempt + 1}/{max_retries}): {str(e)}")
+        # 지터를 적용한 지수 백오프 후 제한기 토큰을 다시 획득 (동시에 재시도가 몰리지 않도록)
+        await asyncio.sleep(random.uniform(0, backoff * 2 ** attempt))
+        await limiter.acquire()
+
 class PerplexitySearcher:
     """Perplexity API를 활용한 웹 검색기
 
     이 클래스는 Perplexity API를 통해 웹 검색을 수행합니다.
     """
     
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(self, api_key: Optional[str] = None, model: str = "sonar-pro", max_concurrency: int = 3,
+                 hedge: bool = False) -> None:
         """PerplexitySearcher 초기화
         
         Args:
             api_key (Optional[str], optional): Perplexity API 키. 기본값은 환경변수에서 로드.
+            model (str, optional): 사용할 Perplexity 모델. 기본값은 "sonar-pro".
+            max_concurrency (int, optional): search_all의 최대 동시 요청 수. 기본값은 3.
+            hedge (bool, optional): p90 지연 시간을 넘은 요청을 한 번 더 보낼지 여부. 기본값은 False.
         """
         self.api_key = api_key or os.getenv("PERPLEXITY_API_KEY")
         if not self.api_key:
             raise ValueError("PERPLEXITY_API_KEY가 필요합니다.")
+        
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = get_rate_limiter("perplexity")
+        self.hedger = get_request_hedger("perplexity") if hedge else None
     
     async def search(self, query: str) -> List[Dict[str, Any]]:
         """Perplexity API를 사용하여 검색을 수행합니다.
@@ -51,7 +109,7 @@ class PerplexitySearcher:
             }
             
             payload = {
-                "model": "sonar-pro",
+                "model": self.model,
                 "messages": [
                     {
                         "role": "system",
@@ -64,15 +122,16 @@ class PerplexitySearcher:
                 ]
             }
             
-            response = requests.post(
-                "https://api.perplexity.ai/chat/completions",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
+            # 공유 aiohttp 세션으로 요청 (이벤트 루프를 막지 않음)
+            async def request():
+                session = get_http_session()
+                async with session.post(PERPLEXITY_API_URL, headers=headers, json=payload) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            
+            data = await _send_request(request, self.hedger, self.rate_limiter)
             
             # 응답 파싱
-            data = response.json()
             content = data["choices"][0]["message"]["content"]
             citations = data.get("citations", ["https://perplexity.ai"])
             
@@ -89,7 +148,7 @@ class PerplexitySearcher:
                 "score": 1.0,
                 "source_type": "perplexity",
                 "metadata": {
-                    "model": "sonar-pro",
+                    "model": self.model,
                     "query": query,
                     "crawled_at": current_time
                 }
@@ -110,6 +169,7 @@ class PerplexitySearcher:
                     }
                 })
             
+            self.rate_limiter.reward()
             logger.info(f"Perplexity 검색 완료: '{query}', {len(results)}개 결과 발견")
             return results
             
@@ -126,25 +186,22 @@ class PerplexitySearcher:
         Returns:
             List[Dict[str, Any]]: 검색 결과 목록
         """
-        all_results = []
+        # 공유 속도 제한기(perplexity) 한도 안에서 쿼리를 동시에 실행
+        results = await gather_rate_limited(queries, self.search, self.rate_limiter, self.max_concurrency)
         
-        for i, query in enumerate(queries):
-            # API 속도 제한 준수 (1초 간격)
-            if i > 0:
-                await asyncio.sleep(1.0)
-            
-            try:
-                results = await self.search(query)
+        all_results = []
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(result)}")
                 all_results.append({
                     'query': query,
-                    'results': results
+                    'results': [],
+                    'error': str(result)
                 })
-            except Exception as e:
-                logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(e)}")
+            else:
                 all_results.append({
                     'query': query,
-                    'results': [],
-                    'error': str(e)
+                    'results': result
                 })
         
         return all_results
@@ -162,8 +219,11 @@ class ExaSearcher:
                  num_results: int = 5,
                  include_domains: Optional[List[str]] = None,
                  exclude_domains: Optional[List[str]] = None,
-                 subpages: Optional[int] = None) -> None:
+                 subpages: Optional[int] = None,
+                 max_concurrency: int = 4) -> None:
         """ExaSearcher 초기화
+
+        Exa SDK 호출은 스레드 풀에서 실행되어 취소해도 멈추지 않으므로 요청 헤징을 지원하지 않습니다.
         
         Args:
             api_key (Optional[str], optional): Exa API 키. 기본값은 환경변수에서 로드.
@@ -172,6 +232,7 @@ class ExaSearcher:
             include_domains (Optional[List[str]], optional): 포함할 도메인 목록.
             exclude_domains (Optional[List[str]], optional): 제외할 도메인 목록.
             subpages (Optional[int], optional): 결과당 가져올 하위 페이지 수.
+            max_concurrency (int, optional): search_all의 최대 동시 요청 수. 기본값은 4.
         """
         self.api_key = api_key or os.getenv("EXA_API_KEY")
         if not self.api_key:
@@ -186,6 +247,8 @@ class ExaSearcher:
         self.include_domains = include_domains
         self.exclude_domains = exclude_domains
         self.subpages = subpages
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = get_rate_limiter("exa")
         
         # Exa 클라이언트 초기화
         self.exa = Exa(api_key=self.api_key)
@@ -201,7 +264,7 @@ class ExaSearcher:
         """
         try:
             # 비동기 컨텍스트에서 동기 함수 실행
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             
             # 검색 함수 정의
             def exa_search_fn():
@@ -223,8 +286,10 @@ class ExaSearcher:
                     
                 return self.exa.search_and_contents(query, **kwargs)
             
-            # 쓰레드 풀에서 동기 검색 실행
-            response = await loop.run_in_executor(None, exa_search_fn)
+            # 크기가 제한된 전용 스레드 풀에서 동기 검색 실행
+            response = await _send_request(
+                lambda: loop.run_in_executor(_exa_executor, exa_search_fn), limiter=self.rate_limiter
+            )
             
             # 결과 형식화
             formatted_results = []
@@ -328,6 +393,7 @@ class ExaSearcher:
                             }
                         })
             
+            self.rate_limiter.reward()
             logger.info(f"Exa 검색 완료: '{query}', {len(formatted_results)}개 결과 발견")
             return formatted_results
             
@@ -344,31 +410,23 @@ class ExaSearcher:
         Returns:
             List[Dict[str, Any]]: 검색 결과 목록
         """
-        all_results = []
+        # 공유 속도 제한기(exa) 한도 안에서 쿼리를 동시에 실행
+        results = await gather_rate_limited(queries, self.search, self.rate_limiter, self.max_concurrency)
         
-        for i, query in enumerate(queries):
-            # API 속도 제한 준수 (0.25초 간격)
-            if i > 0:
-                await asyncio.sleep(0.25)
-            
-            try:
-                results = await self.search(query)
+        all_results = []
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(result)}")
                 all_results.append({
                     'query': query,
-                    'results': results
+                    'results': [],
+                    'error': str(result)
                 })
-            except Exception as e:
-                logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(e)}")
+            else:
                 all_results.append({
                     'query': query,
-                    'results': [],
-                    'error': str(e)
+                    'results': result
                 })
-                
-                # 429 에러시 추가 딜레이 적용
-                if "429" in str(e):
-                    logger.warning("속도 제한 초과. 추가 딜레이 적용...")
-                    await asyncio.sleep(1.0)
         
         return all_results
 
@@ -383,7 +441,9 @@ class TavilySearcher:
                  api_key: Optional[str] = None,
                  max_results: int = 5,
                  include_raw_content: bool = True,
-                 topic: str = "general") -> None:
+                 topic: str = "general",
+                 max_concurrency: int = 5,
+                 hedge: bool = False) -> None:
         """TavilySearcher 초기화
         
         Args:
@@ -391,11 +451,16 @@ class TavilySearcher:
             max_results (int, optional): 최대 결과 수. 기본값은 5.
             include_raw_content (bool, optional): 원본 콘텐츠 포함 여부. 기본값은 True.
             topic (str, optional): 검색 주제. 기본값은 "general".
+            max_concurrency (int, optional): search_all의 최대 동시 요청 수. 기본값은 5.
+            hedge (bool, optional): p90 지연 시간을 넘은 요청을 한 번 더 보낼지 여부. 기본값은 False.
         """
         self.api_key = api_key
         self.max_results = max_results
         self.include_raw_content = include_raw_content
         self.topic = topic
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = get_rate_limiter("tavily")
+        self.hedger = get_request_hedger("tavily") if hedge else None
         
         # AsyncTavilyClient 초기화 (API 키는 환경변수에서 자동으로 로드됨)
         self.client = AsyncTavilyClient(api_key=self.api_key)
@@ -410,11 +475,15 @@ class TavilySearcher:
             List[Dict[str, Any]]: 검색 결과 목록
         """
         try:
-            response = await self.client.search(
-                query,
-                max_results=self.max_results,
-                include_raw_content=self.include_raw_content,
-                topic=self.topic
+            response = await _send_request(
+                lambda: self.client.search(
+                    query,
+                    max_results=self.max_results,
+                    include_raw_content=self.include_raw_content,
+                    topic=self.topic
+                ),
+                self.hedger,
+                self.rate_limiter
             )
             
             # 응답 포맷 변환
@@ -439,6 +508,7 @@ class TavilySearcher:
                 }
                 formatted_results.append(formatted_result)
             
+            self.rate_limiter.reward()
             logger.info(f"Tavily 검색 완료: '{query}', {len(formatted_results)}개 결과 발견")
             return formatted_results
             
@@ -455,15 +525,11 @@ class TavilySearcher:
         Returns:
             List[Dict[str, Any]]: 검색 결과 목록
         """
-        search_tasks = []
-        for query in queries:
-            search_tasks.append(self.search(query))
-        
-        # 모든 검색 동시 실행
-        results = await asyncio.gather(*search_tasks, return_exceptions=True)
+        # 공유 속도 제한기(tavily) 한도 안에서 쿼리를 동시에 실행
+        results = await gather_rate_limited(queries, self.search, self.rate_limiter, self.max_concurrency)
         
         all_results = []
-        for i, (query, result) in enumerate(zip(queries, results)):
+        for query, result in zip(queries, results):
             if isinstance(result, Exception):
                 logger.error(f"검색 쿼리 '{query}' 처리 중 오류 발생: {str(result)}")
                 all_results.append({
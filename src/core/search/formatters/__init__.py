@@ -4,10 +4,14 @@
 이 패키지는 검색 결과와 섹션을 다양한 형식으로 변환하는 클래스들을 제공합니다.
 """
 
-from src.core.search.formatters.source_formatter import SourceFormatter
+from src.core.search.formatters.source_formatter import SourceFormatter, FormattedSources
 from src.core.search.formatters.section_formatter import SectionFormatter
+from src.core.search.formatters.context_builder import SourceContextBuilder, SourceContext
 
 __all__ = [
     'SourceFormatter',
+    'FormattedSources',
     'SectionFormatter',
+    'SourceContextBuilder',
+    'SourceContext',
 ] 
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+토큰 예산 기반 소스 컨텍스트 빌더
+
+이 모듈은 섹션 작성 프롬프트에 넣을 검색 결과 컨텍스트를 만듭니다. 검색 결과를 정규화한 URL과
+내용 해시로 중복 제거하고 점수 순으로 정렬한 뒤, 실제 토크나이저로 토큰 수를 세어 섹션당 토큰 예산
+안에 들어가는 만큼만 간결한 텍스트 형식으로 담습니다. 예산 경계에 걸린 소스는 토큰 단위로 잘립니다.
+"""
+import re
+import hashlib
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from src.common.tokens import Tokenizer, count_tokens, get_tokenizer
+
+# URL 정규화 시 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "dclid", "msclkid", "igshid", "ref", "ref_src", "spm"})
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+# 소스 사이 구분자
+SOURCE_SEPARATOR = "\n\n"
+
+# 잘린 소스 끝에 붙이는 표시
+TRUNCATION_MARK = " ...[잘림]"
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_url(url: str) -> str:
+    """중복 판단용으로 URL을 정규화합니다.
+
+    스킴과 호스트를 소문자로 바꾸고, "www." 접두사, 기본 포트, 프래그먼트, 추적용 쿼리 파라미터,
+    경로 끝의 "/"를 제거하며 남은 쿼리 파라미터는 이름순으로 정렬합니다.
+
+    Args:
+        url (str): URL
+
+    Returns:
+        str: 정규화된 URL (빈 값이면 빈 문자열)
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").removeprefix("www.")
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in TRACKING_PARAMS and not name.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ))
+    return urlunsplit((scheme, host, parts.path.rstrip("/"), query, ""))
+
+
+def content_hash(text: str) -> str:
+    """공백과 대소문자 차이를 무시한 내용 해시를 계산합니다.
+
+    Args:
+        text (str): 소스 내용
+
+    Returns:
+        str: SHA-1 해시 (16진수)
+    """
+    normalized = _WHITESPACE_PATTERN.sub(" ", text or "").strip().casefold()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SourceContext:
+    """컨텍스트 빌드 결과
+
+    Attributes:
+        text: 프롬프트에 넣을 컨텍스트 문자열
+        tokens: 컨텍스트의 토큰 수
+        sources: 컨텍스트에 포함된 소스 (점수 순)
+        duplicates: 중복으로 제외된 결과 수
+        dropped: 예산을 넘어 제외된 소스 수
+        truncated: 토큰 단위로 잘린 소스 수
+    """
+    text: str
+    tokens: int
+    sources: List[Dict[str, Any]] = field(default_factory=list)
+    duplicates: int = 0
+    dropped: int = 0
+    truncated: int = 0
+
+
+class SourceContextBuilder:
+    """검색 결과를 토큰 예산 안의 컨텍스트 문자열로 만드는 빌더"""
+
+    def __init__(self, token_budget: int = 6000, max_tokens_per_source: int = 1500,
+                 min_source_tokens: int = 50, include_raw_content: bool = True,
+                 tokenizer: Optional[Tokenizer] = None) -> None:
+        """SourceContextBuilder 초기화
+
+        Args:
+            token_budget (int, optional): 컨텍스트 전체 최대 토큰 수. 기본값은 6000.
+            max_tokens_per_source (int, optional): 소스 하나의 최대 토큰 수. 기본값은 1500.
+            min_source_tokens (int, optional): 남은 예산이 이보다 작으면 더 이상 소스를 담지 않음. 기본값은 50.
+            include_raw_content (bool, optional): raw_content가 있으면 본문으로 포함할지 여부. 기본값은 True.
+            tokenizer (Optional[Tokenizer], optional): 토크나이저. 기본값은 src.common.tokens의 기본 토크나이저.
+        """
+        self.token_budget = token_budget
+        self.max_tokens_per_source = max_tokens_per_source
+        self.min_source_tokens = min_source_tokens
+        self.include_raw_content = include_raw_content
+        self.tokenizer = tokenizer
+
+    def deduplicate(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """결과를 점수 순으로 정렬하고 정규화한 URL과 내용 해시로 중복을 제거합니다.
+
+        같은 URL이나 같은 내용의 결과가 여러 개면 점수가 가장 높은 결과만 남습니다.
+
+        Args:
+            results (List[Dict[str, Any]]): 검색 결과 목록
+
+        Returns:
+            List[Dict[str, Any]]: 점수 내림차순의 중복 없는 결과 목록
+        """
+        ranked = sorted(results, key=lambda result: float(result.get("score") or 0), reverse=True)
+        seen_urls, seen_hashes = set(), set()
+        unique = []
+        for result in ranked:
+            url = normalize_url(result.get("url", ""))
+            body = self._body(result)
+            digest = content_hash(body) if body.strip() else None
+            if (url and url in seen_urls) or (digest and digest in seen_hashes):
+                continue
+            if url:
+                seen_urls.add(url)
+            if digest:
+                seen_hashes.add(digest)
+            unique.append(result)
+        return unique
+
+    def build(self, results: List[Dict[str, Any]]) -> SourceContext:
+        """검색 결과로 토큰 예산 안의 컨텍스트를 만듭니다.
+
+        Args:
+            results (List[Dict[str, Any]]): 검색 결과 목록 (title, url, content, score, raw_content 필드)
+
+        Returns:
+            SourceContext: 컨텍스트 문자열과 포함/제외 통계
+        """
+        unique = self.deduplicate(results)
+        context = SourceContext(text="", tokens=0, duplicates=len(results) - len(unique))
+        tokenizer = self.tokenizer or get_tokenizer()
+        separator_tokens = count_tokens(SOURCE_SEPARATOR, tokenizer)
+
+        blocks = []
+        used = 0
+        for position, source in enumerate(unique):
+            remaining = self.token_budget - used - (separator_tokens if blocks else 0)
+            header = self._header(len(blocks) + 1, source)
+            header_tokens = count_tokens(header, tokenizer)
+            body_budget = min(self.max_tokens_per_source, remaining) - header_tokens
+            if body_budget < self.min_source_tokens:
+                context.dropped = len(unique) - position
+                break
+
+            # 긴 원본 본문을 한 번만 토큰화하여 길이 비교와 자르기에 함께 사용
+            body = self._body(source)
+            body_tokens = tokenizer.encode(body)
+            if len(body_tokens) > body_budget:
+                keep = max(0, body_budget - count_tokens(TRUNCATION_MARK, tokenizer))
+                body = tokenizer.decode(body_tokens[:keep]).rstrip() + TRUNCATION_MARK
+                context.truncated += 1
+
+            block = header + body
+            used += count_tokens(block, tokenizer) + (separator_tokens if blocks else 0)
+            blocks.append(block)
+            context.sources.append(source)
+
+        context.text = SOURCE_SEPARATOR.join(blocks)
+        context.tokens = count_tokens(context.text, tokenizer)
+        return context
+
+    @staticmethod
+    def _header(index: int, source: Dict[str, Any]) -> str:
+        """소스 번호, 제목, URL 머리글을 만듭니다."""
+        return f"[{index}] {source.get('title') or '제목 없음'}\nURL: {source.get('url', '')}\n"
+
+    def _body(self, source: Dict[str, Any]) -> str:
+        """소스의 요약 내용과 (설정된 경우) 원본 본문을 합칩니다."""
+        content = (source.get("content") or "").strip()
+        raw_content = (source.get("raw_content") or "").strip() if self.include_raw_content else ""
+        if raw_content and raw_content != content:
+            return f"{content}\n{raw_content}" if content else raw_content
+        return content
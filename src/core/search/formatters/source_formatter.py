@@ -3,8 +3,32 @@
 
 이 모듈은 다양한 검색 소스의 결과를 가공하고 형식화하는 기능을 제공합니다.
 """
+import io
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Union
 
+from src.common.logging import get_logger
+from src.common.tokens import Tokenizer, get_tokenizer
+
+# 로거 설정
+logger = get_logger(__name__)
+
+
+@dataclass
+class FormattedSources:
+    """형식화된 소스 문자열과 토큰 수
+    
+    Attributes:
+        text: 형식화된 소스 문자열
+        tokens: text의 토큰 수
+        sources: 포함된 소스 수 (URL 중복 제거 후)
+        truncated: raw_content가 토큰 제한으로 잘린 소스 수
+    """
+    text: str
+    tokens: int
+    sources: int = 0
+    truncated: int = 0
+
 
 class SourceFormatter:
     """검색 결과를 형식화하는 유틸리티 클래스
@@ -16,10 +40,11 @@ class SourceFormatter:
     @classmethod
     def deduplicate_and_format_sources(cls, search_response: List[Dict[str, Any]], 
                                       max_tokens_per_source: int = 4000, 
-                                      include_raw_content: bool = True) -> str:
+                                      include_raw_content: bool = True,
+                                      tokenizer: Optional[Tokenizer] = None) -> str:
         """
         검색 응답 리스트를 가져와 읽기 쉬운 문자열로 형식화합니다.
-        원본 콘텐츠(raw_content)를 약 max_tokens_per_source 토큰으로 제한합니다.
+        원본 콘텐츠(raw_content)를 max_tokens_per_source 토큰으로 제한합니다.
      
         Args:
             search_response: 검색 응답 딕셔너리 리스트, 각 응답은 다음을 포함합니다:
@@ -32,40 +57,65 @@ class SourceFormatter:
                     - raw_content: str|None
             max_tokens_per_source: 소스당 최대 토큰 수
             include_raw_content: 원본 콘텐츠 포함 여부
+            tokenizer: 토큰 수 계산과 자르기에 사용할 토크나이저 (기본값은 get_tokenizer())
                 
         Returns:
             str: 중복이 제거된 소스가 포함된 형식화된 문자열
         """
-        # 모든 결과 수집
-        sources_list = []
-        for response in search_response:
-            sources_list.extend(response['results'])
+        return cls.format_sources(search_response, max_tokens_per_source, include_raw_content, tokenizer).text
+    
+    @classmethod
+    def format_sources(cls, search_response: List[Dict[str, Any]],
+                       max_tokens_per_source: int = 4000,
+                       include_raw_content: bool = True,
+                       tokenizer: Optional[Tokenizer] = None) -> FormattedSources:
+        """
+        deduplicate_and_format_sources와 같은 형식으로 소스를 형식화하고 최종 토큰 수를 함께 반환합니다.
+        
+        출력은 StringIO에 한 번에 기록하고, raw_content는 토크나이저의 토큰 경계에서 자릅니다.
+        
+        Args:
+            search_response: 검색 응답 딕셔너리 리스트 (deduplicate_and_format_sources 참고)
+            max_tokens_per_source: 소스당 최대 토큰 수
+            include_raw_content: 원본 콘텐츠 포함 여부
+            tokenizer: 토큰 수 계산과 자르기에 사용할 토크나이저 (기본값은 get_tokenizer())
+            
+        Returns:
+            FormattedSources: 형식화된 문자열, 토큰 수, 소스 수, 잘린 소스 수
+        """
+        tokenizer = tokenizer or get_tokenizer()
         
         # URL 기준으로 중복 제거
-        unique_sources = {source['url']: source for source in sources_list}
-
+        unique_sources = {
+            source['url']: source for response in search_response for source in response['results']
+        }
+        
         # 출력 형식화
-        formatted_text = "소스 콘텐츠:\n"
-        for i, source in enumerate(unique_sources.values(), 1):
-            formatted_text += f"{'='*80}\n"  # 명확한 섹션 구분자
-            formatted_text += f"소스: {source['title']}\n"
-            formatted_text += f"{'-'*80}\n"  # 하위 섹션 구분자
-            formatted_text += f"URL: {source['url']}\n===\n"
-            formatted_text += f"소스의 가장 관련성 높은 내용: {source['content']}\n===\n"
+        separator = '=' * 80  # 명확한 섹션 구분자
+        sub_separator = '-' * 80  # 하위 섹션 구분자
+        truncated = 0
+        buffer = io.StringIO()
+        buffer.write("소스 콘텐츠:\n")
+        for source in unique_sources.values():
+            buffer.write(f"{separator}\n소스: {source['title']}\n{sub_separator}\n")
+            buffer.write(f"URL: {source['url']}\n===\n")
+            buffer.write(f"소스의 가장 관련성 높은 내용: {source['content']}\n===\n")
             if include_raw_content:
-                # 토큰당 약 4자로 대략 추정
-                char_limit = max_tokens_per_source * 4
                 # None인 raw_content 처리
                 raw_content = source.get('raw_content', '')
                 if raw_content is None:
                     raw_content = ''
-                    print(f"경고: {source['url']} 소스에 raw_content가 없습니다")
-                if len(raw_content) > char_limit:
-                    raw_content = raw_content[:char_limit] + "... [잘림]"
-                formatted_text += f"{max_tokens_per_source} 토큰으로 제한된 전체 소스 내용: {raw_content}\n\n"
-            formatted_text += f"{'='*80}\n\n"  # 섹션 종료 구분자
-                    
-        return formatted_text.strip()
+                    logger.warning(f"{source['url']} 소스에 raw_content가 없습니다")
+                clipped = tokenizer.truncate(raw_content, max_tokens_per_source)
+                if clipped != raw_content:
+                    raw_content = clipped + "... [잘림]"
+                    truncated += 1
+                buffer.write(f"{max_tokens_per_source} 토큰으로 제한된 전체 소스 내용: {raw_content}\n\n")
+            buffer.write(f"{separator}\n\n")  # 섹션 종료 구분자
+        
+        text = buffer.getvalue().strip()
+        return FormattedSources(text=text, tokens=tokenizer.count(text),
+                                sources=len(unique_sources), truncated=truncated)
     
     @classmethod
     def merge_search_results(cls, results_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -100,6 +150,30 @@ class SourceFormatter:
         
         return list(unique_results.values())
     
+    @classmethod
+    def normalize_scores(cls, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """한 검색 엔진의 결과 점수를 0~1 범위로 정규화합니다.
+        
+        엔진마다 점수 척도가 다르므로(Tavily 관련도, Exa 유사도, 학술 검색 순위 점수 등)
+        병합하기 전에 엔진별 최소-최대 정규화를 적용합니다. 원래 점수는 'engine_score'에 보존됩니다.
+        
+        Args:
+            results: 한 검색 엔진의 결과 목록
+            
+        Returns:
+            List[Dict[str, Any]]: 점수가 정규화된 결과 목록 (입력은 변경하지 않음)
+        """
+        scores = [float(result.get('score') or 0) for result in results]
+        if not scores:
+            return []
+        
+        low, high = min(scores), max(scores)
+        span = high - low
+        return [
+            {**result, 'engine_score': result.get('score'), 'score': (score - low) / span if span else 1.0}
+            for result, score in zip(results, scores)
+        ]
+    
     @classmethod
     def extract_key_information(cls, search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """검색 결과에서 핵심 정보를 추출합니다.
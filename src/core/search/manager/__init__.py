@@ -6,8 +6,12 @@
 
 from src.core.search.manager.orchestrator import SearchOrchestrator
 from src.core.search.manager.content_fetcher import ContentFetcher
+from src.core.search.manager.search_cache import SearchResultCache, get_search_cache, get_search_cache_stats
 
 __all__ = [
     'SearchOrchestrator',
     'ContentFetcher',
+    'SearchResultCache',
+    'get_search_cache',
+    'get_search_cache_stats',
 ] 
\ No newline at end of file
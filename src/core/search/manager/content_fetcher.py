@@ -4,11 +4,12 @@
 이 모듈은 검색 결과의 URL에서 웹 페이지 내용을 추출하는 기능을 제공합니다.
 """
 import asyncio
-import aiohttp
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
 
 from src.common.logging import get_logger
+from src.common.http_client import get_http_session, read_html_body
+from src.common.exceptions import UnsupportedContentTypeError
+from src.core.search.utils.extraction import get_extraction_executor
 
 # 로거 설정
 logger = get_logger(__name__)
@@ -20,12 +21,14 @@ class ContentFetcher:
     이 클래스는 검색 결과의 URL에서 웹 페이지 내용을 비동기적으로 추출하는 메서드를 제공합니다.
     """
     
-    def __init__(self, user_agent: Optional[str] = None):
+    def __init__(self, user_agent: Optional[str] = None, max_bytes: Optional[int] = None):
         """ContentFetcher 초기화
         
         Args:
             user_agent (Optional[str]): 요청에 사용할 User-Agent 헤더. 기본값은 None.
+            max_bytes (Optional[int]): 페이지당 내려받을 최대 바이트 수. 기본값은 HTTP_MAX_PAGE_BYTES 설정.
         """
+        self.max_bytes = max_bytes
         self.user_agent = user_agent or (
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
             '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -81,197 +84,55 @@ class ContentFetcher:
         try:
             headers = {'User-Agent': self.user_agent}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        return {'url': url, 'title': item.get('title', ''), 'content': '', 'error': f'상태 코드: {response.status}'}
+            session = get_http_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    return {'url': url, 'title': item.get('title', ''), 'content': '', 'error': f'상태 코드: {response.status}'}
                     
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # 결과 저장 딕셔너리
-                    content = {
-                        'url': url,
-                        'title': item.get('title', '').replace('<b>', '').replace('</b>', ''),
-                        'description': item.get('description', '').replace('<b>', '').replace('</b>', ''),
-                        'content': '',
-                        'error': None
-                    }
-                    
-                    # 네이버 지식IN의 경우
-                    if 'kin.naver.com' in url:
-                        content.update(self._extract_naver_kin_content(soup))
-                    
-                    # 네이버 뉴스의 경우
-                    elif 'news.naver.com' in url:
-                        content.update(self._extract_naver_news_content(soup))
-                    
-                    # 네이버 블로그의 경우
-                    elif 'blog.naver.com' in url:
-                        content.update(self._extract_naver_blog_content(soup))
-                    
-                    # 네이버 용어사전의 경우
-                    elif 'terms.naver.com' in url:
-                        content.update(self._extract_naver_terms_content(soup))
-                    
-                    # 기타 일반 웹페이지의 경우
-                    else:
-                        content.update(self._extract_general_content(soup))
-                    
-                    # 내용이 없으면 에러 메시지 추가
-                    if not content['content']:
-                        content['error'] = '내용을 추출할 수 없습니다. 페이지 구조가 변경되었거나 접근이 제한된 페이지일 수 있습니다.'
-                    
-                    return content
-        
+                # 본문은 최대 바이트 수까지만 스트리밍으로 읽고, 디코딩/파싱은 추출 프로세스 풀에서 실행
+                raw, _ = await read_html_body(response, self.max_bytes)
+                charset = response.charset
+                
+            # 결과 저장 딕셔너리
+            content = {
+                'url': url,
+                'title': item.get('title', '').replace('<b>', '').replace('</b>', ''),
+                'description': item.get('description', '').replace('<b>', '').replace('</b>', ''),
+                'content': '',
+                'error': None
+            }
+            content.update(await get_extraction_executor().extract(raw, self._source_type(url), charset))
+                
+            # 내용이 없으면 에러 메시지 추가
+            if not content['content']:
+                content['error'] = '내용을 추출할 수 없습니다. 페이지 구조가 변경되었거나 접근이 제한된 페이지일 수 있습니다.'
+                
+            return content
+        
+        except UnsupportedContentTypeError as e:
+            return {'url': url, 'title': item.get('title', ''), 'content': '', 'error': str(e)}
         except Exception as e:
             return {'url': url, 'title': item.get('title', ''), 'content': '', 'error': f'오류: {str(e)}'}
     
-    def _extract_naver_kin_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """네이버 지식인 페이지에서 콘텐츠를 추출합니다.
-        
-        Args:
-            soup (BeautifulSoup): 파싱할 HTML 콘텐츠의 BeautifulSoup 객체
-            
-        Returns:
-            Dict[str, Any]: 추출된 콘텐츠
-        """
-        content = {}
-        
-        title_element = soup.select_one('.title')
-        question_element = soup.select_one('.c-heading__content')
-        answer_element = soup.select_one('.se-main-container')
-        
-        # 답변자 정보와 채택 여부 확인
-        is_adopted = False
-        answerer_grade = None
-        
-        # 채택 답변 확인
-        adoption_element = soup.select_one('.badge__adoption')
-        if adoption_element:
-            is_adopted = True
-        
-        # 답변자 등급 확인
-        # 등급은 일반적으로 프로필 이미지 옆이나 닉네임 근처에 표시됨
-        answerer_info = soup.select_one('.c-userinfo__author') or soup.select_one('.answer-author')
-        if answerer_info:
-            grade_element = answerer_info.select_one('.grade') or answerer_info.select_one('.badge')
-            if grade_element:
-                answerer_grade = grade_element.get_text(strip=True)
-            
-            # 답변자 이름도 추출
-            name_element = answerer_info.select_one('.c-userinfo__author-name') or answerer_info
-            if name_element:
-                content['answerer_name'] = name_element.get_text(strip=True)
-        
-        # 채택 여부와 등급 정보 저장
-        content['is_adopted'] = is_adopted
-        content['answerer_grade'] = answerer_grade
-        
-        if title_element:
-            content['title'] = title_element.get_text(strip=True)
-        
-        if question_element:
-            content['question'] = question_element.get_text(strip=True)
-        
-        if answer_element:
-            content['answer'] = answer_element.get_text(strip=True)
-            content['content'] = content['answer']
-        
-        return content
-    
-    def _extract_naver_news_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """네이버 뉴스 페이지에서 콘텐츠를 추출합니다.
-        
-        Args:
-            soup (BeautifulSoup): 파싱할 HTML 콘텐츠의 BeautifulSoup 객체
-            
-        Returns:
-            Dict[str, Any]: 추출된 콘텐츠
-        """
-        content = {}
-        
-        title_element = soup.select_one('#title_area') or soup.select_one('.media_end_head_headline')
-        content_element = soup.select_one('#newsct_article') or soup.select_one('#dic_area')
-        
-        if title_element:
-            content['title'] = title_element.get_text(strip=True)
-        
-        if content_element:
-            content['content'] = content_element.get_text(strip=True)
-        
-        return content
-    
-    def _extract_naver_blog_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """네이버 블로그 페이지에서 콘텐츠를 추출합니다.
-        
-        Args:
-            soup (BeautifulSoup): 파싱할 HTML 콘텐츠의 BeautifulSoup 객체
-            
-        Returns:
-            Dict[str, Any]: 추출된 콘텐츠
-        """
-        content = {}
-        
-        title_element = soup.select_one('.se-title-text')
-        content_element = soup.select_one('.se-main-container')
-        
-        if title_element:
-            content['title'] = title_element.get_text(strip=True)
-        
-        if content_element:
-            content['content'] = content_element.get_text(strip=True)
-        
-        return content
-    
-    def _extract_naver_terms_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """네이버 용어사전 페이지에서 콘텐츠를 추출합니다.
+    @staticmethod
+    def _source_type(url: str) -> str:
+        """URL에 맞는 추출 소스 유형을 반환합니다.
         
         Args:
-            soup (BeautifulSoup): 파싱할 HTML 콘텐츠의 BeautifulSoup 객체
+            url (str): 페이지 URL
             
         Returns:
-            Dict[str, Any]: 추출된 콘텐츠
+            str: 소스 유형 (naver_kin, naver_news, naver_blog, naver_terms, web)
         """
-        content = {}
-        
-        title_element = soup.select_one('.headword') or soup.select_one('.word_title')
-        content_element = soup.select_one('#size_ct') or soup.select_one('.detail_area')
-        
-        if title_element:
-            content['title'] = title_element.get_text(strip=True)
-        
-        if content_element:
-            content['content'] = content_element.get_text(strip=True)
-        
-        return content
-    
-    def _extract_general_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """일반 웹페이지에서 콘텐츠를 추출합니다.
-        
-        Args:
-            soup (BeautifulSoup): 파싱할 HTML 콘텐츠의 BeautifulSoup 객체
-            
-        Returns:
-            Dict[str, Any]: 추출된 콘텐츠
-        """
-        content = {}
-        
-        title_element = soup.select_one('title') or soup.select_one('h1')
-        content_element = soup.select_one('article') or soup.select_one('.content') or soup.select_one('#content')
-        
-        if title_element:
-            content['title'] = title_element.get_text(strip=True)
-        
-        if content_element:
-            content['content'] = content_element.get_text(strip=True)
-        else:
-            # 본문 요소를 찾지 못한 경우 body 전체 텍스트 추출
-            body = soup.select_one('body')
-            if body:
-                content['content'] = body.get_text(strip=True)
-        
-        return content
+        if 'kin.naver.com' in url:
+            return 'naver_kin'
+        if 'news.naver.com' in url:
+            return 'naver_news'
+        if 'blog.naver.com' in url:
+            return 'naver_blog'
+        if 'terms.naver.com' in url:
+            return 'naver_terms'
+        return 'web'
     
     def fetch_contents_from_search_results_sync(self, search_results: Dict[str, Any], 
                                               max_items: int = 5) -> List[Dict[str, str]]:
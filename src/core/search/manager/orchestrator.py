@@ -10,11 +10,15 @@ from typing import List, Dict, Any, Optional, Union
 from langsmith import traceable
 
 from src.core.search.formatters.source_formatter import SourceFormatter
+from src.core.search.manager.search_cache import SearchResultCache, get_search_cache, make_search_cache_key
 from src.common.logging import get_logger
 
 # 로거 설정
 logger = get_logger(__name__)
 
+# 실행 중인 백그라운드 캐시 갱신 작업 (가비지 컬렉션 방지)
+_background_refreshes = set()
+
 
 class SearchOrchestrator:
     """검색 엔진 오케스트레이션을 위한 클래스
@@ -31,17 +35,22 @@ class SearchOrchestrator:
     # 검색 API별 허용 매개변수 정의
     SEARCH_API_PARAMS = {
         "exa": ["max_characters", "num_results", "include_domains", "exclude_domains", "subpages"],
-        "tavily": ["max_results", "include_raw_content", "topic"],
-        "perplexity": ["model"],
+        "tavily": ["max_results", "include_raw_content", "topic", "hedge"],
+        "perplexity": ["model", "hedge"],
         "arxiv": ["load_max_docs", "get_full_documents", "load_all_available_meta"],
         "pubmed": ["top_k_results", "email", "api_key", "doc_content_chars_max"],
         "linkup": ["depth"],
         "data_crawler": ["display", "include_google", "max_content_length", "max_results"],
     }
     
-    def __init__(self):
-        """SearchOrchestrator 초기화"""
-        pass
+    def __init__(self, cache: Optional[SearchResultCache] = None, use_cache: bool = True):
+        """SearchOrchestrator 초기화
+        
+        Args:
+            cache: 검색 결과 캐시. 기본값은 SearchCacheConfiguration에 따른 프로세스 전역 캐시.
+            use_cache: 검색 결과 캐시 사용 여부
+        """
+        self.cache = (cache or get_search_cache()) if use_cache else None
     
     @staticmethod
     def get_search_params(search_api: str, search_api_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -96,129 +105,294 @@ class SearchOrchestrator:
         
         logger.info(f"검색 엔진 '{search_api}' 실행 중: 쿼리 {len(query_list)}개")
         
-        # 검색 엔진별 실행 로직
-        search_results = None
+        searcher = self._create_searcher(search_api, params_to_pass)
+        search_results = await self._search_engine(search_api, searcher, query_list, params_to_pass)
+        
+        # 결과 형식화
+        if format_results and search_results:
+            return self._format_results(search_results, max_tokens_per_source, include_raw_content)
+        
+        return search_results
+    
+    @traceable
+    async def select_and_execute_multi_search(self, search_apis: List[str], query_list: List[str],
+                                              params_by_api: Optional[Dict[str, Dict[str, Any]]] = None,
+                                              deadline: Optional[float] = 20.0,
+                                              format_results: bool = True,
+                                              max_tokens_per_source: int = 4000,
+                                              include_raw_content: bool = True) -> Union[str, List[Dict[str, Any]]]:
+        """여러 검색 엔진에 같은 쿼리 목록을 동시에 실행하고 결과를 병합합니다.
+        
+        (엔진, 쿼리)마다 별도 작업으로 실행하며, deadline이 지나면 아직 끝나지 않은 작업은 취소하고
+        그때까지 도착한 결과만 사용합니다. 따라서 느린 엔진(예: 쿼리당 3초인 arXiv)이 전체를 지연시키지 않습니다.
+        점수는 엔진별로 0~1 범위로 정규화한 뒤 쿼리별로 병합하고 URL 중복을 제거합니다.
+        
+        Args:
+            search_apis: 사용할 검색 API 이름 목록
+            query_list: 실행할 검색 쿼리 목록
+            params_by_api: 검색 API별 매개변수 (get_search_params로 필터링됨)
+            deadline: 전체 검색 제한 시간(초). None이면 모든 엔진을 기다림
+            format_results: 결과를 형식화된 문자열로 반환할지 여부
+            max_tokens_per_source: 소스당 최대 토큰 수 (format_results가 True인 경우에만 사용)
+            include_raw_content: 원본 콘텐츠를 포함할지 여부 (format_results가 True인 경우에만 사용)
+            
+        Returns:
+            형식화된 문자열 또는 쿼리별 병합된 검색 결과 목록
+            
+        Raises:
+            ValueError: 지원되지 않는 검색 API가 지정된 경우
+        """
+        params_by_api = params_by_api or {}
+        unsupported = [api for api in search_apis if api not in self.SUPPORTED_ENGINES]
+        if unsupported:
+            raise ValueError(f"지원되지 않는 검색 API: {', '.join(unsupported)}")
+        
+        logger.info(f"검색 엔진 {len(search_apis)}개 동시 실행 중: {', '.join(search_apis)}, 쿼리 {len(query_list)}개")
         
+        tasks = {}
+        for search_api in search_apis:
+            params = self.get_search_params(search_api, params_by_api.get(search_api))
+            try:
+                searcher = self._create_searcher(search_api, params)
+            except Exception as e:
+                logger.warning(f"검색 엔진 '{search_api}'을(를) 사용할 수 없습니다: {str(e)}")
+                continue
+            for query in query_list:
+                task = asyncio.ensure_future(self._search_engine(search_api, searcher, [query], params))
+                tasks[task] = (search_api, query)
+        
+        done, pending = await asyncio.wait(tasks, timeout=deadline) if tasks else (set(), set())
+        for task in pending:
+            task.cancel()
+        if pending:
+            late = sorted({tasks[task][0] for task in pending})
+            logger.warning(f"제한 시간 {deadline}초 초과: {len(pending)}개 검색 취소 ({', '.join(late)})")
+        
+        # 엔진별로 도착한 결과 수집
+        results_by_api: Dict[str, List[Dict[str, Any]]] = {}
+        for task in done:
+            search_api, query = tasks[task]
+            if task.exception() is not None:
+                logger.error(f"검색 엔진 '{search_api}' 쿼리 '{query}' 처리 중 오류 발생: {str(task.exception())}")
+                continue
+            for item in task.result():
+                results_by_api.setdefault(search_api, []).extend(
+                    {**result, '_query': query} for result in item.get('results', [])
+                )
+        
+        # 엔진별 점수 정규화 후 쿼리별 병합
+        results_by_query: Dict[str, List[Dict[str, Any]]] = {query: [] for query in query_list}
+        for results in results_by_api.values():
+            for result in SourceFormatter.normalize_scores(results):
+                results_by_query[result.pop('_query')].append(result)
+        
+        search_results = []
+        for query in query_list:
+            merged = SourceFormatter.merge_search_results([results_by_query[query]])
+            merged.sort(key=lambda result: result.get('score', 0), reverse=True)
+            search_results.append({'query': query, 'results': merged})
+        
+        if format_results:
+            return self._format_results(search_results, max_tokens_per_source, include_raw_content)
+        
+        return search_results
+    
+    @staticmethod
+    def _format_results(search_results: List[Dict[str, Any]], max_tokens_per_source: int,
+                        include_raw_content: bool) -> str:
+        """검색 결과를 형식화하고 최종 토큰 수를 기록합니다.
+        
+        Args:
+            search_results: 쿼리별 검색 응답 목록
+            max_tokens_per_source: 소스당 최대 토큰 수
+            include_raw_content: 원본 콘텐츠 포함 여부
+            
+        Returns:
+            str: 형식화된 소스 문자열
+        """
+        formatted = SourceFormatter.format_sources(
+            search_results,
+            max_tokens_per_source=max_tokens_per_source,
+            include_raw_content=include_raw_content
+        )
+        logger.info(f"소스 {formatted.sources}개를 {formatted.tokens} 토큰으로 형식화했습니다 "
+                    f"(잘림 {formatted.truncated}개).")
+        return formatted.text
+    
+    async def _search_engine(self, search_api: str, searcher, query_list: List[str],
+                             params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """캐시가 있으면 캐시를 거쳐, 없으면 바로 검색 엔진을 실행합니다.
+        
+        Args:
+            search_api: 검색 API 이름
+            searcher: 검색 엔진 인스턴스
+            query_list: 쿼리 목록
+            params: 검색 매개변수
+            
+        Returns:
+            List[Dict[str, Any]]: 검색 결과 목록
+        """
+        if self.cache is None:
+            return await self._execute_search_all(searcher, query_list)
+        return await self._execute_cached_search(search_api, searcher, query_list, params)
+    
+    @staticmethod
+    def _create_searcher(search_api: str, params: Dict[str, Any]):
+        """검색 엔진 인스턴스를 생성합니다.
+        
+        모든 엔진은 비동기 search_all을 제공하므로 같은 경로로 실행합니다.
+        매개변수는 검색기 생성자에 전달하고, search_all에는 쿼리만 전달합니다.
+        
+        Args:
+            search_api: 검색 API 이름
+            params: 검색 매개변수
+            
+        Returns:
+            검색 엔진 인스턴스
+        """
         if search_api == "tavily":
-            # 현재 모듈에서 직접 import하여 사용
             from src.core.search.engines.web_engines import TavilySearcher
-            searcher = TavilySearcher(api_key=os.getenv("TAVILY_API_KEY"))
-            search_results = await self._execute_search_all(searcher, query_list, params_to_pass)
+            return TavilySearcher(api_key=os.getenv("TAVILY_API_KEY"), **params)
             
         elif search_api == "perplexity":
             from src.core.search.engines.web_engines import PerplexitySearcher
-            searcher = PerplexitySearcher(api_key=os.getenv("PERPLEXITY_API_KEY"))
-            search_results = self._execute_search_all_sync(searcher, query_list, params_to_pass)
+            return PerplexitySearcher(api_key=os.getenv("PERPLEXITY_API_KEY"), **params)
             
         elif search_api == "exa":
             from src.core.search.engines.web_engines import ExaSearcher
-            searcher = ExaSearcher(api_key=os.getenv("EXA_API_KEY"))
-            search_results = await self._execute_search_all(searcher, query_list, params_to_pass)
+            return ExaSearcher(api_key=os.getenv("EXA_API_KEY"), **params)
             
         elif search_api == "arxiv":
             from src.core.search.engines.academic import ArxivSearcher
-            searcher = ArxivSearcher()
-            search_results = await self._execute_search_all(searcher, query_list, params_to_pass)
+            return ArxivSearcher(**params)
             
         elif search_api == "pubmed":
             from src.core.search.engines.academic import PubMedSearcher
-            searcher = PubMedSearcher(email=params_to_pass.get("email"), api_key=params_to_pass.get("api_key"))
-            search_results = await self._execute_search_all(searcher, query_list, params_to_pass)
+            return PubMedSearcher(**params)
             
         elif search_api == "linkup":
             # LinkupSearcher는 현재 구현되어 있지 않으므로 예외 발생
             raise NotImplementedError("LinkupSearcher는 아직 구현되지 않았습니다.")
             
-        elif search_api == "data_crawler":
-            # DataCrawlerSearcher는 현재 구현되어 있지 않으므로 예외 발생
-            raise NotImplementedError("DataCrawlerSearcher는 아직 구현되지 않았습니다.")
-        
-        # 결과 형식화
-        if format_results and search_results:
-            return SourceFormatter.deduplicate_and_format_sources(
-                search_results, 
-                max_tokens_per_source=max_tokens_per_source,
-                include_raw_content=include_raw_content
-            )
-        
-        return search_results
+        # DataCrawlerSearcher는 현재 구현되어 있지 않으므로 예외 발생
+        raise NotImplementedError("DataCrawlerSearcher는 아직 구현되지 않았습니다.")
     
-    async def _execute_search_all(self, searcher, query_list: List[str], params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """비동기 검색 엔진의 search_all 메서드를 실행합니다.
+    async def _execute_cached_search(self, search_api: str, searcher, query_list: List[str],
+                                     params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """검색 결과 캐시를 거쳐 검색을 실행합니다.
+        
+        캐시에 없는 쿼리만 검색 엔진에 요청하고, 만료된(stale) 결과는 바로 반환한 뒤
+        백그라운드에서 갱신합니다.
         
         Args:
+            search_api: 검색 API 이름
             searcher: 검색 엔진 인스턴스
             query_list: 쿼리 목록
-            params: 검색 매개변수
+            params: 검색 매개변수 (캐시 키에 포함)
             
         Returns:
-            List[Dict[str, Any]]: 검색 결과 목록
+            List[Dict[str, Any]]: 쿼리 순서와 같은 순서의 검색 결과 목록
+        """
+        ttl = self.cache.ttl_for(search_api, params)
+        keys = [make_search_cache_key(search_api, query, params) for query in query_list]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(query_list)
+        missing: List[int] = []
+        stale: List[int] = []
+        
+        for i, (query, key) in enumerate(zip(query_list, keys)):
+            entry = self.cache.get(key, ttl)
+            if entry is None:
+                missing.append(i)
+                continue
+            value, is_stale = entry
+            results[i] = {**value, 'query': query}
+            if is_stale:
+                stale.append(i)
+        
+        logger.info(f"검색 캐시: 적중 {len(query_list) - len(missing)}개, 미스 {len(missing)}개, 만료 {len(stale)}개")
+        
+        if missing:
+            fetched = await self._execute_search_all(searcher, [query_list[i] for i in missing])
+            for i, item in zip(missing, fetched):
+                results[i] = item
+                self._store(search_api, keys[i], item)
+        
+        refresh = [i for i in stale if self.cache.begin_refresh(keys[i])]
+        if refresh:
+            task = asyncio.ensure_future(self._revalidate(
+                search_api, searcher, [query_list[i] for i in refresh], [keys[i] for i in refresh]
+            ))
+            _background_refreshes.add(task)
+            task.add_done_callback(_background_refreshes.discard)
+        
+        return results
+    
+    async def _revalidate(self, search_api: str, searcher, query_list: List[str], keys: List[str]) -> None:
+        """만료된 캐시 항목을 백그라운드에서 다시 검색하여 갱신합니다.
+        
+        Args:
+            search_api: 검색 API 이름
+            searcher: 검색 엔진 인스턴스
+            query_list: 갱신할 쿼리 목록
+            keys: 쿼리별 캐시 키
         """
         try:
-            # 검색 엔진에 따라 search_all 또는 다른 메서드 호출
-            if hasattr(searcher, 'search_all'):
-                return await searcher.search_all(query_list, **params)
-            else:
-                # 검색 엔진에 search_all이 없는 경우 개별 검색 실행
-                results = []
-                for query in query_list:
-                    # search 메서드가 딕셔너리를 반환하는지 또는 리스트를 반환하는지에 따라 다르게 처리
-                    result = await searcher.search(query, **params)
-                    
-                    # search 메서드가 딕셔너리를 반환하는 경우
-                    if isinstance(result, dict):
-                        results.append(result)
-                    # search 메서드가 리스트를 반환하는 경우
-                    elif isinstance(result, list):
-                        # 각 결과를 query 키와 함께 딕셔너리로 변환
-                        results.append({
-                            'query': query,
-                            'results': result
-                        })
-                        
-                return results
+            fetched = await self._execute_search_all(searcher, query_list)
+            for key, item in zip(keys, fetched):
+                self._store(search_api, key, item)
         except Exception as e:
-            logger.error(f"검색 실행 중 오류 발생: {str(e)}")
-            # 오류가 발생한 경우 빈 결과와 오류 메시지 반환
-            return [{
-                'query': query,
-                'results': [],
-                'error': str(e)
-            } for query in query_list]
+            logger.warning(f"검색 캐시 갱신 실패 ({search_api}): {str(e)}")
+        finally:
+            for key in keys:
+                self.cache.end_refresh(key)
     
-    def _execute_search_all_sync(self, searcher, query_list: List[str], params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """동기 검색 엔진의 search_all 메서드를 실행합니다.
+    def _store(self, search_api: str, key: str, item: Dict[str, Any]) -> None:
+        """성공한 검색 결과를 캐시에 저장합니다 (오류나 빈 결과는 저장하지 않음).
+        
+        Args:
+            search_api: 검색 API 이름
+            key: 캐시 키
+            item: {'query', 'results'} 형식의 검색 결과
+        """
+        if item.get('error') or not item.get('results'):
+            return
+        try:
+            self.cache.set(key, item, engine=search_api)
+        except Exception as e:
+            logger.warning(f"검색 결과를 캐시에 저장하지 못했습니다: {str(e)}")
+    
+    async def _execute_search_all(self, searcher, query_list: List[str]) -> List[Dict[str, Any]]:
+        """검색 엔진의 비동기 search_all 메서드를 실행합니다.
+        
+        search_all이 없는 검색 엔진은 쿼리별 search를 동시에 실행합니다.
         
         Args:
             searcher: 검색 엔진 인스턴스
             query_list: 쿼리 목록
-            params: 검색 매개변수
             
         Returns:
             List[Dict[str, Any]]: 검색 결과 목록
         """
         try:
-            # 검색 엔진에 따라 search_all 또는 다른 메서드 호출
             if hasattr(searcher, 'search_all'):
-                return searcher.search_all(query_list, **params)
-            else:
-                # 검색 엔진에 search_all이 없는 경우 개별 검색 실행
-                results = []
-                for query in query_list:
-                    result = searcher.search(query, **params)
+                return await searcher.search_all(query_list)
+            
+            # 검색 엔진에 search_all이 없는 경우 개별 검색을 동시에 실행
+            results = []
+            search_results = await asyncio.gather(*(searcher.search(query) for query in query_list))
+            for query, result in zip(query_list, search_results):
+                # search 메서드가 딕셔너리를 반환하는 경우
+                if isinstance(result, dict):
+                    results.append(result)
+                # search 메서드가 리스트를 반환하는 경우
+                elif isinstance(result, list):
+                    # 각 결과를 query 키와 함께 딕셔너리로 변환
+                    results.append({
+                        'query': query,
+                        'results': result
+                    })
                     
-                    # search 메서드가 딕셔너리를 반환하는 경우
-                    if isinstance(result, dict):
-                        results.append(result)
-                    # search 메서드가 리스트를 반환하는 경우
-                    elif isinstance(result, list):
-                        # 각 결과를 query 키와 함께 딕셔너리로 변환
-                        results.append({
-                            'query': query,
-                            'results': result
-                        })
-                        
-                return results
+            return results
         except Exception as e:
             logger.error(f"검색 실행 중 오류 발생: {str(e)}")
             # 오류가 발생한 경우 빈 결과와 오류 메시지 반환
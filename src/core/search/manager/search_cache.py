@@ -0,0 +1,298 @@
+"""
+검색 결과 캐시
+
+이 모듈은 (검색 엔진, 정규화된 쿼리, 검색 매개변수) 단위로 검색 결과를 저장하는
+2단계 캐시(메모리 LRU + SQLite)를 제공합니다. 관련 주제의 블로그를 여러 개 생성할 때
+반복되는 계획 쿼리가 유료 검색 API를 다시 호출하지 않도록 합니다.
+
+유효 시간은 엔진별로 다르며(뉴스는 짧게, 학술 검색은 길게), 만료된 항목도 stale_ttl 동안은
+이전 결과를 바로 반환하면서 백그라운드에서 갱신합니다(stale-while-revalidate).
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Set, Tuple
+
+from src.common.config import SearchCacheConfiguration
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 유효 시간이 긴 학술 검색 엔진
+ACADEMIC_ENGINES = {"arxiv", "pubmed"}
+
+# 결과에 영향을 주지 않아 캐시 키에서 제외하는 매개변수
+TRANSPORT_PARAMS = {"hedge"}
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키에 사용할 수 있도록 쿼리를 정규화합니다 (공백 정리, 대소문자 통일).
+
+    Args:
+        query (str): 검색 쿼리
+
+    Returns:
+        str: 정규화된 쿼리
+    """
+    return " ".join(query.split()).casefold()
+
+
+def make_search_cache_key(engine: str, query: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """검색 호출을 식별하는 캐시 키를 만듭니다.
+
+    Args:
+        engine (str): 검색 엔진 이름
+        query (str): 검색 쿼리
+        params (Optional[Dict[str, Any]], optional): get_search_params로 필터링된 검색 매개변수
+
+    Returns:
+        str: SHA-256 해시 문자열
+    """
+    params = {key: value for key, value in (params or {}).items() if key not in TRANSPORT_PARAMS}
+    payload = {"engine": engine, "query": normalize_query(query), "params": params}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """2단계 검색 결과 캐시
+
+    조회 시 메모리 LRU를 먼저 확인하고, 없으면 SQLite 파일(path가 지정된 경우)을 확인하여
+    메모리로 승격합니다. 유효 시간은 조회할 때 엔진별로 전달받습니다.
+    """
+
+    def __init__(self,
+                 max_entries: int = 2000,
+                 path: Optional[str] = None,
+                 default_ttl: int = 21600,
+                 news_ttl: int = 900,
+                 academic_ttl: int = 604800,
+                 stale_ttl: int = 3600) -> None:
+        """SearchResultCache 초기화
+
+        Args:
+            max_entries (int, optional): 메모리에 보관할 최대 항목 수. 기본값은 2000.
+            path (Optional[str], optional): SQLite 파일 경로. None이면 메모리만 사용.
+            default_ttl (int, optional): 일반 웹 검색 유효 시간(초). 기본값은 21600.
+            news_ttl (int, optional): 뉴스 검색 유효 시간(초). 기본값은 900.
+            academic_ttl (int, optional): arXiv/PubMed 유효 시간(초). 기본값은 604800.
+            stale_ttl (int, optional): 만료 후 이전 결과를 제공하는 시간(초). 기본값은 3600.
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.default_ttl = default_ttl
+        self.news_ttl = news_ttl
+        self.academic_ttl = academic_ttl
+        self.stale_ttl = stale_ttl
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "stale_hits": 0, "misses": 0, "writes": 0, "refreshes": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    engine TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+
+    def ttl_for(self, engine: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """검색 엔진과 매개변수에 맞는 유효 시간을 반환합니다.
+
+        Args:
+            engine (str): 검색 엔진 이름
+            params (Optional[Dict[str, Any]], optional): 검색 매개변수
+
+        Returns:
+            int: 유효 시간(초)
+        """
+        if engine in ACADEMIC_ENGINES:
+            return self.academic_ttl
+        if (params or {}).get("topic") == "news":
+            return self.news_ttl
+        return self.default_ttl
+
+    def get(self, key: str, ttl: int) -> Optional[Tuple[Any, bool]]:
+        """캐시된 값을 조회합니다.
+
+        Args:
+            key (str): 캐시 키
+            ttl (int): 항목 유효 시간(초)
+
+        Returns:
+            Optional[Tuple[Any, bool]]: (값, 만료 여부) 또는 None (없거나 stale_ttl까지 지난 경우)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            from_disk = False
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM search_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[1], json.loads(row[0]))
+                    from_disk = True
+
+            if entry is None or now - entry[0] > ttl + self.stale_ttl:
+                if entry is not None:
+                    self._forget(key)
+                self._stats["misses"] += 1
+                return None
+
+            if from_disk:
+                self._remember(key, entry[0], entry[1])
+            else:
+                self._memory.move_to_end(key)
+
+            stale = now - entry[0] > ttl
+            if stale:
+                self._stats["stale_hits"] += 1
+            elif from_disk:
+                self._stats["disk_hits"] += 1
+            else:
+                self._stats["hits"] += 1
+            return entry[1], stale
+
+    def set(self, key: str, value: Any, engine: str = "") -> None:
+        """값을 캐시에 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            value (Any): JSON으로 직렬화 가능한 검색 결과
+            engine (str, optional): 검색 엔진 이름 (SQLite에 함께 기록)
+        """
+        created_at = time.time()
+        encoded = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._remember(key, created_at, json.loads(encoded))
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, engine, value, created_at) VALUES (?, ?, ?, ?)",
+                    (key, engine, encoded, created_at)
+                )
+                self._conn.commit()
+            self._stats["writes"] += 1
+
+    def begin_refresh(self, key: str) -> bool:
+        """백그라운드 갱신을 시작해도 되는지 확인하고 갱신 중으로 표시합니다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            bool: 이미 다른 갱신이 진행 중이면 False
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._stats["refreshes"] += 1
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        """백그라운드 갱신 완료를 표시합니다.
+
+        Args:
+            key (str): 캐시 키
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 제거합니다."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM search_cache")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 메모리 항목 수, 적중/만료 적중/미스/저장/갱신 횟수
+        """
+        return {"entries": len(self._memory), "path": self.path, **self._stats}
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, created_at: float, value: Any) -> None:
+        """메모리 LRU에 항목을 넣습니다 (잠금을 잡은 상태에서 호출)."""
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        """메모리와 SQLite에서 항목을 제거합니다 (잠금을 잡은 상태에서 호출)."""
+        self._memory.pop(key, None)
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+
+# SQLite 경로별 프로세스 전역 캐시 (None은 메모리 전용)
+_CACHES: Dict[Optional[str], SearchResultCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_search_cache(config: Optional[SearchCacheConfiguration] = None) -> Optional[SearchResultCache]:
+    """설정에 맞는 프로세스 전역 검색 결과 캐시를 가져옵니다.
+
+    Args:
+        config (Optional[SearchCacheConfiguration], optional): 캐시 설정. 기본값은 환경 변수에서 로드.
+
+    Returns:
+        Optional[SearchResultCache]: 검색 결과 캐시 (캐시가 꺼져 있으면 None)
+    """
+    config = config or SearchCacheConfiguration.from_runnable_config()
+    if not config.search_cache_enabled:
+        return None
+
+    path = config.search_cache_path or None
+    with _CACHES_LOCK:
+        cache = _CACHES.get(path)
+        if cache is None:
+            cache = SearchResultCache(
+                max_entries=config.search_cache_max_entries,
+                path=path,
+                default_ttl=config.search_cache_ttl,
+                news_ttl=config.search_cache_news_ttl,
+                academic_ttl=config.search_cache_academic_ttl,
+                stale_ttl=config.search_cache_stale_ttl
+            )
+            _CACHES[path] = cache
+        return cache
+
+
+def get_search_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """생성된 모든 검색 결과 캐시의 통계를 반환합니다.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 캐시 경로("memory"는 메모리 전용)별 통계
+    """
+    return {path or "memory": cache.stats() for path, cache in list(_CACHES.items())}
@@ -7,11 +7,40 @@
 from src.core.search.utils.naver_api_utils import (
     get_relkeyword,
     get_keyword_trend,
-    collect_related_keywords
+    collect_related_keywords,
+    aget_relkeywords,
+    RelatedKeywordExpander
+)
+from src.core.search.utils.keyword_store import KeywordStore, create_keyword_store
+from src.core.search.utils.html_parser import (
+    available_backends,
+    get_parser_backend,
+    make_soup,
+    extract_article,
+    normalize_whitespace
+)
+from src.core.search.utils.extraction import (
+    ExtractionExecutor,
+    extract_content,
+    get_extraction_executor,
+    shutdown_extraction_executor
 )
 
 __all__ = [
     'get_relkeyword',
     'get_keyword_trend',
-    'collect_related_keywords'
+    'collect_related_keywords',
+    'aget_relkeywords',
+    'RelatedKeywordExpander',
+    'KeywordStore',
+    'create_keyword_store',
+    'available_backends',
+    'get_parser_backend',
+    'make_soup',
+    'extract_article',
+    'normalize_whitespace',
+    'ExtractionExecutor',
+    'extract_content',
+    'get_extraction_executor',
+    'shutdown_extraction_executor'
 ] 
\ No newline at end of file
@@ -0,0 +1,457 @@
+"""
+웹 페이지 본문 추출 실행기
+
+이 모듈은 HTML 파싱과 텍스트 추출(CPU 작업)을 이벤트 루프 밖의 프로세스 풀에서 실행합니다.
+비동기 수집기는 응답 바이트와 소스 유형만 넘기고, 워커 프로세스가 디코딩, 파싱, 추출을 수행하여
+결과 딕셔너리를 반환합니다. 큰 페이지를 파싱하는 동안에도 다른 요청과 API 서버의 응답이 지연되지 않습니다.
+
+소스 유형:
+    - article: 뉴스/일반 기사 본문, 발행일, 언론사 (NaverCrawler.fetch_content)
+    - news, encyc, kin: 네이버 뉴스/백과사전/지식iN 특화 추출 (NaverCrawler._extract_content_by_source)
+    - naver_kin, naver_news, naver_blog, naver_terms, web: URL 유형별 추출 (ContentFetcher)
+"""
+import re
+import codecs
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Callable, Optional
+
+from bs4 import BeautifulSoup
+
+from src.common.config.extraction import ExtractionConfiguration
+from src.common.logging import get_logger
+from src.core.search.utils.html_parser import extract_article, make_soup, normalize_whitespace
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 바이트 순서 표시(BOM)와 인코딩
+BOM_ENCODINGS = ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'))
+
+# <meta charset="..."> 또는 <meta http-equiv="Content-Type" content="...; charset=..."> 탐지
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9._:-]+)', re.IGNORECASE)
+META_SNIFF_BYTES = 4096
+
+# 기사 본문 추출에 사용하는 선택자
+ARTICLE_CONTENT_SELECTORS = ['article', '.article-body', '.article_body', '.news-content', '.story-body', '.content-article']
+ARTICLE_META_SELECTORS = {
+    'date': ['.t11', '.report_date', '.article_date', '.date', '.time'],
+    'press': ['.press', '.source', '.publisher', '.article_by'],
+}
+
+
+def sniff_charset(raw: bytes, header_charset: Optional[str] = None) -> Optional[str]:
+    """BOM, Content-Type 헤더, meta 태그 순서로 문서 인코딩을 확인합니다.
+
+    Args:
+        raw (bytes): 응답 본문
+        header_charset (Optional[str], optional): Content-Type 헤더의 charset
+
+    Returns:
+        Optional[str]: 확인된 인코딩 이름 (알 수 없으면 None)
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if raw.startswith(bom):
+            return encoding
+
+    candidates = [header_charset]
+    match = META_CHARSET_PATTERN.search(raw[:META_SNIFF_BYTES])
+    if match:
+        candidates.append(match.group(1).decode('ascii', errors='ignore'))
+
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            encoding = codecs.lookup(candidate).name
+        except LookupError:
+            logger.warning(f"알 수 없는 charset '{candidate}'을(를) 무시합니다.")
+            continue
+        # EUC-KR 문서는 CP949 확장 문자를 포함하는 경우가 많음
+        return 'cp949' if encoding == 'euc_kr' else encoding
+    return None
+
+
+def decode_html(raw: bytes, charset: Optional[str] = None) -> str:
+    """응답 바이트를 문자열로 한 번만 디코딩합니다.
+
+    sniff_charset으로 인코딩을 확인하고, 인코딩 선언이 전혀 없는 문서만 UTF-8을 시도한 뒤
+    실패하면 CP949(EUC-KR 상위 호환)로 디코딩합니다. 최대 바이트 수에서 잘린 본문은 마지막
+    문자가 중간에 끊길 수 있으므로, UTF-8은 끝의 불완전한 바이트 시퀀스를 버리고 디코딩합니다.
+
+    Args:
+        raw (bytes): 응답 본문
+        charset (Optional[str], optional): Content-Type 헤더의 charset
+
+    Returns:
+        str: 디코딩된 HTML
+    """
+    encoding = sniff_charset(raw, charset)
+    if encoding:
+        return raw.decode(encoding, errors='replace')
+    try:
+        return codecs.getincrementaldecoder('utf-8')().decode(raw, final=False)
+    except UnicodeDecodeError:
+        return raw.decode('cp949', errors='replace')
+
+
+def extract_article_content(html: str) -> Dict[str, Any]:
+    """기사 본문, 발행일, 언론사를 추출합니다.
+
+    Args:
+        html (str): HTML 문자열
+
+    Returns:
+        Dict[str, Any]: text, date, press
+    """
+    text, metadata = extract_article(html, ARTICLE_CONTENT_SELECTORS, ARTICLE_META_SELECTORS)
+    return {'text': normalize_whitespace(text), **metadata}
+
+
+def extract_naver_source_content(soup: BeautifulSoup, source_type: Optional[str]) -> Dict[str, Any]:
+    """네이버 소스 유형(news, encyc, kin)에 특화된 추출 로직을 적용합니다.
+
+    Args:
+        soup (BeautifulSoup): 파싱된 문서
+        source_type (Optional[str]): 소스 유형. None이면 문서 전체 텍스트를 추출합니다.
+
+    Returns:
+        Dict[str, Any]: 추출된 텍스트와 메타데이터
+    """
+    result = {'text': ''}
+
+    if not source_type:
+        result['text'] = normalize_whitespace(soup.get_text(separator='\n'))
+        return result
+
+    if source_type == 'news':
+        # 네이버 뉴스 구조, 다른 뉴스 사이트의 일반적인 구조 순서로 본문 탐색
+        main_content = None
+        for selector in ('#dic_area', 'article', '.news_body', '.article_body', '.article-body'):
+            main_content = soup.select_one(selector)
+            if main_content is not None:
+                break
+
+        # 발행일, 언론사 추출
+        result['date'] = _first_text(soup, ['.t11', '.report_date', '.article_date', '.date', '.time'])
+        result['press'] = _first_text(soup, ['.press', '.source', '.publisher', '.article_by'])
+
+        if main_content is not None:
+            # 불필요한 요소 제거
+            for elem in main_content.select('.reporter_area, .byline, .copyright'):
+                elem.extract()
+            result['text'] = normalize_whitespace(main_content.get_text(separator='\n'))
+        else:
+            result['text'] = normalize_whitespace(soup.get_text(separator='\n'))
+
+    elif source_type == 'encyc':
+        summary = soup.select_one('.summary_area')
+        if summary is not None:
+            result['summary'] = summary.get_text().strip()
+
+        main_content = soup.select_one('#content') or soup.select_one('.article')
+        if main_content is not None:
+            # 불필요한 요소 제거
+            for elem in main_content.select('.manager_area, .button_area, .related_area'):
+                elem.extract()
+            result['text'] = normalize_whitespace(main_content.get_text(separator='\n'))
+        else:
+            result['text'] = normalize_whitespace(soup.get_text(separator='\n'))
+
+        # 카테고리 추출
+        categories = [cat.get_text().strip() for cat in soup.select('.location a')]
+        if categories:
+            result['categories'] = categories
+
+    elif source_type == 'kin':
+        question = _first_text(soup, ['.c-heading__title', '.title'])
+        question_content = _first_text(soup, ['.c-heading__content', '.c-heading__detail'])
+        answers = [answer.get_text().strip() for answer in soup.select('.answer-content__item')]
+        result['question'] = question
+        result['question_content'] = question_content
+        result['answers'] = answers
+
+        # 텍스트 조합
+        text_parts = []
+        if question:
+            text_parts.append(f"질문: {question}")
+        if question_content:
+            text_parts.append(f"질문 내용: {question_content}")
+        for i, answer in enumerate(answers, 1):
+            text_parts.append(f"답변 {i}: {answer}")
+        result['text'] = '\n\n'.join(text_parts)
+
+    return result
+
+
+def extract_naver_kin_page(soup: BeautifulSoup) -> Dict[str, Any]:
+    """네이버 지식iN 페이지에서 질문, 채택 답변, 답변자 정보를 추출합니다.
+
+    Args:
+        soup (BeautifulSoup): 파싱된 문서
+
+    Returns:
+        Dict[str, Any]: 추출된 콘텐츠
+    """
+    content = {}
+
+    # 채택 답변 확인
+    content['is_adopted'] = soup.select_one('.badge__adoption') is not None
+    content['answerer_grade'] = None
+
+    # 답변자 등급과 이름 (등급은 일반적으로 프로필 이미지 옆이나 닉네임 근처에 표시됨)
+    answerer_info = soup.select_one('.c-userinfo__author') or soup.select_one('.answer-author')
+    if answerer_info:
+        grade_element = answerer_info.select_one('.grade') or answerer_info.select_one('.badge')
+        if grade_element:
+            content['answerer_grade'] = grade_element.get_text(strip=True)
+        name_element = answerer_info.select_one('.c-userinfo__author-name') or answerer_info
+        content['answerer_name'] = name_element.get_text(strip=True)
+
+    title_element = soup.select_one('.title')
+    question_element = soup.select_one('.c-heading__content')
+    answer_element = soup.select_one('.se-main-container')
+    if title_element:
+        content['title'] = title_element.get_text(strip=True)
+    if question_element:
+        content['question'] = question_element.get_text(strip=True)
+    if answer_element:
+        content['answer'] = answer_element.get_text(strip=True)
+        content['content'] = content['answer']
+    return content
+
+
+def extract_naver_news_page(soup: BeautifulSoup) -> Dict[str, Any]:
+    """네이버 뉴스 페이지에서 제목과 본문을 추출합니다."""
+    return _title_and_content(
+        soup.select_one('#title_area') or soup.select_one('.media_end_head_headline'),
+        soup.select_one('#newsct_article') or soup.select_one('#dic_area')
+    )
+
+
+def extract_naver_blog_page(soup: BeautifulSoup) -> Dict[str, Any]:
+    """네이버 블로그 페이지에서 제목과 본문을 추출합니다."""
+    return _title_and_content(soup.select_one('.se-title-text'), soup.select_one('.se-main-container'))
+
+
+def extract_naver_terms_page(soup: BeautifulSoup) -> Dict[str, Any]:
+    """네이버 용어사전 페이지에서 제목과 본문을 추출합니다."""
+    return _title_and_content(
+        soup.select_one('.headword') or soup.select_one('.word_title'),
+        soup.select_one('#size_ct') or soup.select_one('.detail_area')
+    )
+
+
+def extract_web_page(soup: BeautifulSoup) -> Dict[str, Any]:
+    """일반 웹 페이지에서 제목과 본문(없으면 body 전체)을 추출합니다."""
+    content_element = soup.select_one('article') or soup.select_one('.content') or soup.select_one('#content')
+    return _title_and_content(
+        soup.select_one('title') or soup.select_one('h1'),
+        content_element or soup.select_one('body')
+    )
+
+
+# 소스 유형별 BeautifulSoup 추출 함수
+SOUP_EXTRACTORS: Dict[str, Callable[[BeautifulSoup], Dict[str, Any]]] = {
+    'news': lambda soup: extract_naver_source_content(soup, 'news'),
+    'encyc': lambda soup: extract_naver_source_content(soup, 'encyc'),
+    'kin': lambda soup: extract_naver_source_content(soup, 'kin'),
+    'naver_kin': extract_naver_kin_page,
+    'naver_news': extract_naver_news_page,
+    'naver_blog': extract_naver_blog_page,
+    'naver_terms': extract_naver_terms_page,
+    'web': extract_web_page,
+}
+
+
+def extract_content(raw: bytes, source_type: str, charset: Optional[str] = None) -> Dict[str, Any]:
+    """응답 바이트를 디코딩하고 소스 유형에 맞게 본문을 추출합니다 (워커 프로세스에서 실행).
+
+    Args:
+        raw (bytes): 응답 본문
+        source_type (str): 소스 유형 (article, news, encyc, kin, naver_kin, naver_news, naver_blog, naver_terms, web)
+        charset (Optional[str], optional): Content-Type 헤더의 charset
+
+    Returns:
+        Dict[str, Any]: 추출된 텍스트와 메타데이터
+
+    Raises:
+        ValueError: 알 수 없는 소스 유형인 경우
+    """
+    html = decode_html(raw, charset)
+    if source_type == 'article':
+        return extract_article_content(html)
+    extractor = SOUP_EXTRACTORS.get(source_type)
+    if extractor is None:
+        raise ValueError(f"알 수 없는 소스 유형: {source_type}")
+    return extractor(make_soup(html))
+
+
+def _first_text(soup: BeautifulSoup, selectors) -> Optional[str]:
+    """선택자를 순서대로 시도하여 처음 일치하는 요소의 텍스트를 반환합니다."""
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element is not None:
+            return element.get_text().strip()
+    return None
+
+
+def _title_and_content(title_element, content_element) -> Dict[str, Any]:
+    """제목/본문 요소에서 텍스트를 꺼냅니다."""
+    content = {}
+    if title_element:
+        content['title'] = title_element.get_text(strip=True)
+    if content_element:
+        content['content'] = content_element.get_text(strip=True)
+    return content
+
+
+def _warm_up() -> None:
+    """워커 프로세스를 시작할 때 파서를 미리 로드합니다."""
+    extract_content(b"<html><body><article>warm-up</article></body></html>", 'article')
+    extract_content(b"<html><body>warm-up</body></html>", 'web')
+
+
+def _ping() -> int:
+    """워커 프로세스 생성을 강제하기 위한 빈 작업입니다."""
+    return multiprocessing.current_process().pid
+
+
+class ExtractionExecutor:
+    """HTML 파싱/본문 추출 프로세스 풀
+
+    워커 프로세스는 시작할 때 파서를 미리 로드하며(warm_up), workers가 0이면 프로세스 풀 없이
+    호출한 스레드에서 바로 추출합니다. 워커가 비정상 종료(메모리 부족, 파서 segfault 등)하여 풀이
+    깨지면 해당 요청은 실패하고, 다음 요청에서 새 풀을 만듭니다.
+    """
+
+    def __init__(self, workers: int = 2, start_method: str = "spawn") -> None:
+        """ExtractionExecutor 초기화
+
+        Args:
+            workers (int, optional): 워커 프로세스 수. 0이면 프로세스 풀을 사용하지 않습니다. 기본값은 2.
+            start_method (str, optional): 워커 프로세스 시작 방식. 기본값은 "spawn".
+        """
+        self.workers = workers
+        self.start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {"tasks": 0, "bytes": 0, "errors": 0, "pool_restarts": 0}
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """프로세스 풀을 반환합니다. 없으면 생성합니다."""
+        if self.workers <= 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_warm_up
+                )
+                logger.info(f"본문 추출 프로세스 풀 생성: 워커 {self.workers}개 ({self.start_method})")
+            return self._pool
+
+    def warm_up(self) -> None:
+        """모든 워커 프로세스를 미리 시작하고 파서를 로드합니다 (첫 요청 지연 방지)."""
+        pool = self._get_pool()
+        if pool is None:
+            return
+        futures = [pool.submit(_ping) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    async def extract(self, raw: bytes, source_type: str, charset: Optional[str] = None) -> Dict[str, Any]:
+        """응답 바이트에서 본문을 추출합니다. 파싱은 워커 프로세스에서 실행됩니다.
+
+        Args:
+            raw (bytes): 응답 본문
+            source_type (str): 소스 유형
+            charset (Optional[str], optional): Content-Type 헤더의 charset
+
+        Returns:
+            Dict[str, Any]: 추출된 텍스트와 메타데이터
+        """
+        self._stats["tasks"] += 1
+        self._stats["bytes"] += len(raw)
+        pool = self._get_pool()
+        try:
+            if pool is None:
+                return extract_content(raw, source_type, charset)
+            return await asyncio.get_running_loop().run_in_executor(pool, extract_content, raw, source_type, charset)
+        except BrokenProcessPool:
+            self._stats["errors"] += 1
+            self._discard_pool(pool)
+            raise
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """깨진 프로세스 풀을 종료하고 버립니다. 다음 호출에서 새 풀이 만들어집니다.
+
+        Args:
+            pool (ProcessPoolExecutor): 깨진 프로세스 풀
+        """
+        with self._lock:
+            if self._pool is not pool:
+                # 다른 요청이 이미 풀을 교체함
+                return
+            self._pool = None
+            self._stats["pool_restarts"] += 1
+        logger.warning("본문 추출 워커 프로세스가 비정상 종료되어 프로세스 풀을 다시 만듭니다.")
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """실행기 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 워커 수, 시작 여부, 처리한 작업 수/바이트/오류 수, 풀 재생성 횟수
+        """
+        return {"workers": self.workers, "started": self._pool is not None, **self._stats}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """프로세스 풀을 종료합니다.
+
+        Args:
+            wait (bool, optional): 실행 중인 작업이 끝날 때까지 기다릴지 여부. 기본값은 True.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+            logger.info("본문 추출 프로세스 풀 종료")
+
+
+# 프로세스 전역 추출 실행기
+_executor: Optional[ExtractionExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_extraction_executor(config: Optional[ExtractionConfiguration] = None) -> ExtractionExecutor:
+    """프로세스 전역 본문 추출 실행기를 가져옵니다.
+
+    Args:
+        config (Optional[ExtractionConfiguration], optional): 처음 생성할 때 사용할 설정. 기본값은 환경 변수에서 로드.
+
+    Returns:
+        ExtractionExecutor: 공유 추출 실행기
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            config = config or ExtractionConfiguration.from_runnable_config()
+            _executor = ExtractionExecutor(config.extraction_workers, config.extraction_start_method)
+        return _executor
+
+
+def shutdown_extraction_executor() -> None:
+    """공유 본문 추출 실행기를 종료합니다 (서버 종료 시 사용)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
@@ -0,0 +1,156 @@
+"""
+HTML 파서 백엔드
+
+이 모듈은 웹 페이지 본문 추출에 사용할 HTML 파서를 선택합니다. selectolax 또는 lxml이
+설치되어 있으면 이를 사용하고, 없으면 표준 라이브러리 html.parser로 대체합니다.
+HTML_PARSER 환경 변수("auto", "selectolax", "lxml", "html.parser")로 백엔드를 고정할 수 있습니다.
+"""
+import os
+import importlib.util
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 빠른 순서대로 나열한 백엔드 (html.parser는 항상 사용 가능)
+PARSER_BACKENDS = ("selectolax", "lxml", "html.parser")
+
+# 본문 추출 전에 제거하는 태그
+DEFAULT_REMOVE_TAGS = ("script", "style", "iframe", "ins")
+
+
+@lru_cache(maxsize=None)
+def available_backends() -> Tuple[str, ...]:
+    """현재 환경에서 사용할 수 있는 파서 백엔드를 반환합니다.
+
+    Returns:
+        Tuple[str, ...]: 빠른 순서대로 정렬된 백엔드 이름
+    """
+    return tuple(
+        backend for backend in PARSER_BACKENDS
+        if backend == "html.parser" or importlib.util.find_spec(backend) is not None
+    )
+
+
+def get_parser_backend(backend: Optional[str] = None) -> str:
+    """사용할 파서 백엔드를 결정합니다.
+
+    Args:
+        backend (Optional[str], optional): 원하는 백엔드. None이면 HTML_PARSER 환경 변수, 기본값은 "auto".
+
+    Returns:
+        str: 사용할 수 있는 백엔드 이름 (요청한 백엔드가 없으면 가장 빠른 사용 가능한 백엔드)
+    """
+    backend = backend or os.getenv("HTML_PARSER", "auto")
+    backends = available_backends()
+    if backend in backends:
+        return backend
+    if backend != "auto":
+        logger.warning(f"HTML 파서 '{backend}'을(를) 사용할 수 없어 '{backends[0]}'을(를) 사용합니다.")
+    return backends[0]
+
+
+def make_soup(html: str, backend: Optional[str] = None) -> BeautifulSoup:
+    """가장 빠른 BeautifulSoup 트리 빌더로 HTML을 파싱합니다.
+
+    selectolax는 BeautifulSoup 트리 빌더가 아니므로 BeautifulSoup 객체가 필요한 경우에는
+    lxml(설치된 경우) 또는 html.parser를 사용합니다.
+
+    Args:
+        html (str): HTML 문자열
+        backend (Optional[str], optional): 원하는 백엔드
+
+    Returns:
+        BeautifulSoup: 파싱된 문서
+    """
+    backend = get_parser_backend(backend)
+    if backend == "selectolax":
+        backend = "lxml" if "lxml" in available_backends() else "html.parser"
+    return BeautifulSoup(html, backend)
+
+
+def normalize_whitespace(text: str) -> str:
+    """줄 단위 공백 제거와 연속 공백 압축을 한 번에 수행합니다.
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 모든 공백 구간이 공백 한 칸으로 바뀐 텍스트
+    """
+    return " ".join(text.split())
+
+
+def extract_article(html: str,
+                    content_selectors: Sequence[str],
+                    meta_selectors: Optional[Dict[str, Sequence[str]]] = None,
+                    remove_tags: Sequence[str] = DEFAULT_REMOVE_TAGS,
+                    backend: Optional[str] = None) -> Tuple[str, Dict[str, Optional[str]]]:
+    """HTML에서 본문 텍스트와 메타데이터를 추출합니다.
+
+    remove_tags를 제거한 뒤 content_selectors 중 처음 일치하는 요소의 텍스트를 본문으로 사용하고,
+    일치하는 요소가 없으면 문서 전체 텍스트를 사용합니다.
+
+    Args:
+        html (str): HTML 문자열
+        content_selectors (Sequence[str]): 본문 영역 CSS 선택자 (우선순위 순)
+        meta_selectors (Optional[Dict[str, Sequence[str]]], optional): 메타데이터 이름별 CSS 선택자
+        remove_tags (Sequence[str], optional): 제거할 태그 이름
+        backend (Optional[str], optional): 사용할 파서 백엔드
+
+    Returns:
+        Tuple[str, Dict[str, Optional[str]]]: (줄바꿈으로 구분된 본문 텍스트, 메타데이터)
+    """
+    meta_selectors = meta_selectors or {}
+    if get_parser_backend(backend) == "selectolax":
+        return _extract_with_selectolax(html, content_selectors, meta_selectors, remove_tags)
+
+    soup = make_soup(html, backend)
+    for element in soup(list(remove_tags)):
+        element.extract()
+
+    main_content = _first_match(soup.select_one, content_selectors)
+    root = main_content if main_content is not None else soup
+    text = root.get_text(separator="\n").strip()
+
+    metadata = {}
+    for name, selectors in meta_selectors.items():
+        element = _first_match(soup.select_one, selectors)
+        metadata[name] = element.get_text().strip() if element is not None else None
+    return text, metadata
+
+
+def _extract_with_selectolax(html: str,
+                             content_selectors: Sequence[str],
+                             meta_selectors: Dict[str, Sequence[str]],
+                             remove_tags: Sequence[str]) -> Tuple[str, Dict[str, Optional[str]]]:
+    """selectolax(Lexbor)로 본문과 메타데이터를 추출합니다."""
+    from selectolax.parser import HTMLParser
+
+    tree = HTMLParser(html)
+    tree.strip_tags(list(remove_tags))
+
+    main_content = _first_match(tree.css_first, content_selectors)
+    root = main_content if main_content is not None else (tree.body if tree.body is not None else tree.root)
+    text = root.text(separator="\n").strip() if root is not None else ""
+
+    metadata = {}
+    for name, selectors in meta_selectors.items():
+        element = _first_match(tree.css_first, selectors)
+        metadata[name] = element.text().strip() if element is not None else None
+    return text, metadata
+
+
+def _first_match(select, selectors: Sequence[str]):
+    """선택자를 순서대로 시도하여 처음 일치하는 요소를 반환합니다."""
+    for selector in selectors:
+        element = select(selector)
+        if element is not None:
+            return element
+    return None
+
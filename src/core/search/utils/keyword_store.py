@@ -0,0 +1,295 @@
+"""
+연관 키워드 저장소
+
+이 모듈은 네이버 키워드 수집 결과를 SQLite 파일에 바로바로 기록하는 저장소를 제공합니다.
+연관 키워드는 키워드별로 조회 시각과 함께 저장되며, 수집 실행(run)은 시드 키워드별 진행 상태를
+기록하므로 중간에 실패한 실행을 run_id로 이어서 진행할 수 있습니다. freshness_seconds 안에
+이미 조회한 시드 키워드는 API를 다시 호출하지 않고 저장된 결과를 사용합니다.
+"""
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional, Sequence
+
+from src.common.config.keywords import KeywordStoreConfiguration
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 시드 키워드 진행 상태
+SEED_PENDING = "pending"
+SEED_DONE = "done"
+SEED_FAILED = "failed"
+
+
+class KeywordStore:
+    """SQLite 연관 키워드 저장소
+
+    테이블 구성:
+        keywords: 연관 키워드별 API 응답 행과 조회 시각
+        keyword_seeds: 시드 키워드별 마지막 조회 시각
+        keyword_seed_links: 시드 키워드와 그 연관 키워드의 연결
+        keyword_runs / keyword_run_seeds: 수집 실행과 실행별 시드 키워드 진행 상태
+    """
+
+    def __init__(self, path: str = "data/keywords.sqlite3", freshness_seconds: int = 604800) -> None:
+        """KeywordStore 초기화
+
+        Args:
+            path (str, optional): SQLite 파일 경로. 기본값은 "data/keywords.sqlite3".
+            freshness_seconds (int, optional): 시드 키워드 조회 결과를 재사용하는 시간(초). 기본값은 604800.
+        """
+        self.path = path
+        self.freshness_seconds = freshness_seconds
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS keywords (
+                keyword TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS keyword_seeds (
+                seed TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS keyword_seed_links (
+                seed TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                PRIMARY KEY (seed, keyword)
+            );
+            CREATE TABLE IF NOT EXISTS keyword_runs (
+                run_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                label TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                finished_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS keyword_run_seeds (
+                run_id TEXT NOT NULL,
+                seed TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (run_id, seed)
+            );
+            """
+        )
+        self._conn.commit()
+
+    def start_run(self, seeds: Sequence[str], run_id: Optional[str] = None, kind: str = "", label: str = "") -> str:
+        """수집 실행을 시작하거나, 이미 있는 run_id면 이어서 진행합니다.
+
+        이어서 진행하는 경우 기존 시드 키워드의 진행 상태는 유지되고 새 시드 키워드만 추가됩니다.
+
+        Args:
+            seeds (Sequence[str]): 시드 키워드 목록
+            run_id (Optional[str], optional): 실행 ID. None이면 새로 생성.
+            kind (str, optional): 실행 유형 (예: "info", "product")
+            label (str, optional): 실행 설명 (예: 카테고리 URL, 카테고리명)
+
+        Returns:
+            str: 실행 ID
+        """
+        run_id = run_id or uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO keyword_runs (run_id, kind, label, status, created_at) VALUES (?, ?, ?, 'running', ?)",
+                (run_id, kind, label, now)
+            )
+            self._conn.execute("UPDATE keyword_runs SET status = 'running', finished_at = NULL WHERE run_id = ?", (run_id,))
+            offset = self._conn.execute(
+                "SELECT COUNT(*) FROM keyword_run_seeds WHERE run_id = ?", (run_id,)
+            ).fetchone()[0]
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO keyword_run_seeds (run_id, seed, position, status, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, seed, offset + i, SEED_PENDING, now) for i, seed in enumerate(dict.fromkeys(seeds))]
+            )
+            self._conn.commit()
+        return run_id
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """실행 정보와 시드 키워드 진행 현황을 조회합니다.
+
+        Args:
+            run_id (str): 실행 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 실행 정보 또는 None (없는 경우)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id, kind, label, status, created_at, finished_at FROM keyword_runs WHERE run_id = ?",
+                (run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            counts = dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM keyword_run_seeds WHERE run_id = ? GROUP BY status", (run_id,)
+            ).fetchall())
+        run = dict(zip(("run_id", "kind", "label", "status", "created_at", "finished_at"), row))
+        run["seeds"] = {status: counts.get(status, 0) for status in (SEED_PENDING, SEED_DONE, SEED_FAILED)}
+        return run
+
+    def run_seeds(self, run_id: str) -> List[str]:
+        """실행에 등록된 시드 키워드를 등록 순서대로 반환합니다.
+
+        Args:
+            run_id (str): 실행 ID
+
+        Returns:
+            List[str]: 시드 키워드 목록
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seed FROM keyword_run_seeds WHERE run_id = ? ORDER BY position", (run_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def pending_seeds(self, run_id: str) -> List[str]:
+        """실행에서 아직 조회해야 하는 시드 키워드를 반환합니다.
+
+        다른 실행에서 freshness_seconds 안에 조회한 시드 키워드는 완료로 처리하고 제외합니다.
+
+        Args:
+            run_id (str): 실행 ID
+
+        Returns:
+            List[str]: 조회가 필요한 시드 키워드 목록
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"""
+                UPDATE keyword_run_seeds SET status = '{SEED_DONE}', updated_at = ?
+                WHERE run_id = ? AND status != '{SEED_DONE}'
+                  AND seed IN (SELECT seed FROM keyword_seeds WHERE fetched_at >= ?)
+                """,
+                (now, run_id, now - self.freshness_seconds)
+            )
+            self._conn.commit()
+            rows = self._conn.execute(
+                f"SELECT seed FROM keyword_run_seeds WHERE run_id = ? AND status != '{SEED_DONE}' ORDER BY position",
+                (run_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def save_results(self, run_id: str, seeds: Sequence[str], rows: Sequence[Dict[str, Any]]) -> None:
+        """시드 키워드의 조회 결과를 저장하고 완료로 표시합니다.
+
+        Args:
+            run_id (str): 실행 ID
+            seeds (Sequence[str]): 한 요청으로 함께 조회한 시드 키워드
+            rows (Sequence[Dict[str, Any]]): 키워드 도구 API 응답의 keywordList 항목들
+        """
+        now = time.time()
+        keywords = [row["relKeyword"] for row in rows if row.get("relKeyword")]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO keywords (keyword, data, fetched_at) VALUES (?, ?, ?)",
+                [(row["relKeyword"], json.dumps(row, ensure_ascii=False), now) for row in rows if row.get("relKeyword")]
+            )
+            self._conn.executemany("DELETE FROM keyword_seed_links WHERE seed = ?", [(seed,) for seed in seeds])
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO keyword_seed_links (seed, keyword) VALUES (?, ?)",
+                [(seed, keyword) for seed in seeds for keyword in keywords]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO keyword_seeds (seed, fetched_at) VALUES (?, ?)", [(seed, now) for seed in seeds]
+            )
+            self._set_seed_status(run_id, seeds, SEED_DONE, now)
+            self._conn.commit()
+
+    def mark_failed(self, run_id: str, seeds: Sequence[str]) -> None:
+        """조회에 실패한 시드 키워드를 표시합니다. 실패한 시드 키워드는 이어서 진행할 때 다시 조회합니다.
+
+        Args:
+            run_id (str): 실행 ID
+            seeds (Sequence[str]): 실패한 시드 키워드
+        """
+        with self._lock:
+            self._set_seed_status(run_id, seeds, SEED_FAILED, time.time())
+            self._conn.commit()
+
+    def finish_run(self, run_id: str) -> str:
+        """실행을 종료합니다. 실패한 시드 키워드가 남아 있으면 상태는 "partial"이 됩니다.
+
+        Args:
+            run_id (str): 실행 ID
+
+        Returns:
+            str: 실행 상태 ("completed" 또는 "partial")
+        """
+        with self._lock:
+            remaining = self._conn.execute(
+                f"SELECT COUNT(*) FROM keyword_run_seeds WHERE run_id = ? AND status != '{SEED_DONE}'", (run_id,)
+            ).fetchone()[0]
+            status = "partial" if remaining else "completed"
+            self._conn.execute(
+                "UPDATE keyword_runs SET status = ?, finished_at = ? WHERE run_id = ?", (status, time.time(), run_id)
+            )
+            self._conn.commit()
+        return status
+
+    def run_keywords(self, run_id: str) -> List[Dict[str, Any]]:
+        """실행의 완료된 시드 키워드에 연결된 연관 키워드 행을 반환합니다.
+
+        Args:
+            run_id (str): 실행 ID
+
+        Returns:
+            List[Dict[str, Any]]: 키워드 도구 API 응답 형식의 행 (연관 키워드별 1개)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT k.data FROM keywords k
+                WHERE k.keyword IN (
+                    SELECT l.keyword FROM keyword_run_seeds s
+                    JOIN keyword_seed_links l ON l.seed = s.seed
+                    WHERE s.run_id = ? AND s.status = '{SEED_DONE}'
+                )
+                ORDER BY k.keyword
+                """,
+                (run_id,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+    def _set_seed_status(self, run_id: str, seeds: Sequence[str], status: str, now: float) -> None:
+        """실행의 시드 키워드 상태를 변경합니다. (잠금 보유 상태에서 호출)"""
+        self._conn.executemany(
+            "UPDATE keyword_run_seeds SET status = ?, updated_at = ? WHERE run_id = ? AND seed = ?",
+            [(status, now, run_id, seed) for seed in seeds]
+        )
+
+
+def create_keyword_store(config: Optional[KeywordStoreConfiguration] = None) -> Optional[KeywordStore]:
+    """설정에 맞는 연관 키워드 저장소를 생성합니다.
+
+    Args:
+        config (Optional[KeywordStoreConfiguration], optional): 저장소 설정. 기본값은 환경 변수에서 로드.
+
+    Returns:
+        Optional[KeywordStore]: 연관 키워드 저장소 또는 None (경로가 비어 있는 경우)
+    """
+    config = config or KeywordStoreConfiguration.from_runnable_config()
+    if not config.keyword_store_path:
+        return None
+    return KeywordStore(config.keyword_store_path, config.keyword_freshness_seconds)
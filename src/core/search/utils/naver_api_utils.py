@@ -8,20 +8,32 @@ import re
 import json
 import time
 import random
+import asyncio
 import requests
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable, Sequence
 from datetime import datetime
 import hashlib
 import hmac
 import base64
 from urllib.parse import quote
 
+import aiohttp
+
+from src.common.http_client import get_http_session
 from src.common.logging import get_logger
+from src.common.rate_limit import AsyncRateLimiter, get_rate_limiter
 
 # 로거 설정
 logger = get_logger(__name__)
 
+# 네이버 검색광고 키워드 도구 API
+NAVER_SEARCHAD_BASE_URL = "https://api.naver.com"
+KEYWORDSTOOL_PATH = "/keywordstool"
+
+# 키워드 도구 API가 한 번의 요청에 허용하는 최대 hintKeywords 수
+MAX_HINT_KEYWORDS = 5
+
 def get_naver_api_keys() -> Tuple[str, str]:
     """
     환경 변수에서 네이버 API 키를 가져옵니다.
@@ -164,6 +176,138 @@ def get_relkeyword(keyword: str, search_count: int = 10) -> Dict[str, Any]:
         logger.error(f"네이버 키워드 도구 조회 중 예외 발생: {str(e)}")
         return {"error": "예외 발생", "message": str(e)}
 
+async def aget_relkeywords(hint_keywords: Sequence[str],
+                           limiter: Optional[AsyncRateLimiter] = None,
+                           max_retries: int = 3,
+                           backoff: float = 1.0) -> Dict[str, Any]:
+    """
+    네이버 검색광고 키워드 도구 API로 여러 힌트 키워드의 연관 키워드를 비동기로 조회합니다.
+    
+    공유 HTTP 세션을 사용하며, 429 응답이나 일시적인 오류는 지터가 적용된 지수 백오프로 재시도합니다.
+    
+    Args:
+        hint_keywords: 힌트 키워드 목록 (최대 5개, 쉼표는 제거됨)
+        limiter: 요청 전에 토큰을 획득할 속도 제한기 (기본값: 공유 "naver_searchad" 제한기)
+        max_retries: 최대 재시도 횟수
+        backoff: 첫 재시도의 최대 대기 시간(초), 재시도마다 두 배로 증가
+        
+    Returns:
+        Dict[str, Any]: 연관 키워드 정보 (실패 시 error, message 키 포함)
+    """
+    if not hint_keywords or len(hint_keywords) > MAX_HINT_KEYWORDS:
+        return {"error": "잘못된 요청", "message": f"힌트 키워드는 1~{MAX_HINT_KEYWORDS}개여야 합니다."}
+    
+    limiter = limiter or get_rate_limiter("naver_searchad")
+    params = {
+        "hintKeywords": ",".join(keyword.replace(",", " ").strip() for keyword in hint_keywords),
+        "showDetail": 1
+    }
+    
+    last_error = {"error": "API 요청 실패", "message": ""}
+    for attempt in range(max_retries + 1):
+        if attempt:
+            # 지터를 적용한 지수 백오프 (동시에 재시도가 몰리지 않도록)
+            await asyncio.sleep(random.uniform(0, backoff * 2 ** (attempt - 1)))
+        await limiter.acquire()
+        
+        # 서명에 타임스탬프가 포함되므로 요청마다 헤더를 새로 생성
+        headers = get_naver_searchad_header(method="GET", path=KEYWORDSTOOL_PATH, query=params)
+        try:
+            session = get_http_session()
+            async with session.get(NAVER_SEARCHAD_BASE_URL + KEYWORDSTOOL_PATH, headers=headers, params=params) as response:
+                if response.status == 200:
+                    limiter.reward()
+                    return await response.json(content_type=None)
+                
+                text = await response.text()
+                last_error = {"error": f"API 오류: {response.status}", "message": text}
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After", "")
+                    limiter.penalize(float(retry_after) if retry_after.isdigit() else None)
+                elif response.status < 500:
+                    logger.error(f"네이버 키워드 도구 API 오류: {response.status} - {text}")
+                    return last_error
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_error = {"error": "API 요청 실패", "message": str(e)}
+        
+        if attempt < max_retries:
+            logger.warning(f"네이버 키워드 도구 API 재시도 ({attempt + 1}/{max_retries}): {last_error['error']}")
+    
+    logger.error(f"네이버 키워드 도구 API 요청 실패 (최대 재시도 횟수 초과): {params['hintKeywords']}")
+    return last_error
+
+
+class RelatedKeywordExpander:
+    """
+    여러 시드 키워드의 연관 키워드를 동시에 조회하는 확장기
+    
+    시드 키워드를 batch_size개(최대 5개)씩 묶어 하나의 요청으로 조회하고, 최대 concurrency개의
+    요청을 동시에 보내며, 모든 요청은 하나의 속도 제한기(QPS)를 공유합니다.
+    """
+    
+    def __init__(self,
+                 qps: Optional[float] = None,
+                 batch_size: int = 1,
+                 concurrency: int = 4,
+                 max_retries: int = 3) -> None:
+        """
+        RelatedKeywordExpander 초기화
+        
+        Args:
+            qps: 초당 최대 요청 수 (기본값: 공유 "naver_searchad" 제한기, RATE_LIMIT_NAVER_SEARCHAD_QPS)
+            batch_size: 한 요청에 묶을 시드 키워드 수 (1~5)
+            concurrency: 동시에 보낼 최대 요청 수
+            max_retries: 요청별 최대 재시도 횟수
+        """
+        self.limiter = AsyncRateLimiter(qps, name="naver_searchad") if qps is not None else get_rate_limiter("naver_searchad")
+        self.batch_size = min(MAX_HINT_KEYWORDS, max(1, batch_size))
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+    
+    async def expand(self,
+                     keywords: Sequence[str],
+                     on_progress: Optional[Callable[[int, int], None]] = None,
+                     on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        시드 키워드의 연관 키워드를 조회합니다.
+        
+        Args:
+            keywords: 시드 키워드 목록 (중복과 빈 문자열은 제외)
+            on_progress: 요청이 끝날 때마다 (완료한 요청 수, 전체 요청 수)로 호출되는 콜백
+            on_result: 요청이 끝날 때마다 해당 요청의 결과로 호출되는 콜백 (중간 결과 저장용)
+            
+        Returns:
+            List[Dict[str, Any]]: 요청별 결과 ({"hints", "keywordList"} 또는 {"hints", "error", "message"})
+        """
+        seeds = list(dict.fromkeys(keyword.strip() for keyword in keywords if keyword and keyword.strip()))
+        batches = [seeds[i:i + self.batch_size] for i in range(0, len(seeds), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        done = 0
+        started = time.monotonic()
+        
+        logger.info(f"연관 키워드 조회 시작: 시드 {len(seeds)}개, 요청 {len(batches)}개 (동시 {self.concurrency}개)")
+        
+        async def run(batch: List[str]) -> Dict[str, Any]:
+            nonlocal done
+            async with semaphore:
+                result = await aget_relkeywords(batch, self.limiter, self.max_retries)
+            done += 1
+            if "error" in result:
+                logger.warning(f"[{done}/{len(batches)}] 연관 키워드 조회 실패 {batch}: {result.get('error')}")
+            else:
+                logger.info(f"[{done}/{len(batches)}] 연관 키워드 {len(result.get('keywordList', []))}개 조회: {', '.join(batch)}")
+            result = {"hints": batch, **result}
+            if on_result is not None:
+                on_result(result)
+            if on_progress is not None:
+                on_progress(done, len(batches))
+            return result
+        
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+        logger.info(f"연관 키워드 조회 완료: 요청 {len(batches)}개 ({time.monotonic() - started:.1f}초)")
+        return list(results)
+
+
 def get_keyword_trend(keyword: str, time_unit: str = "month", device: str = "all", ages: List[str] = ["1", "2"]) -> Dict[str, Any]:
     """
     네이버 검색광고 키워드 도구 API를 사용하여 키워드 트렌드를 조회합니다.
@@ -0,0 +1,18 @@
+"""
+블로그 생성 작업 관리 모듈
+
+이 패키지는 블로그 생성 작업을 위한 제한된 작업 큐, 작업 저장소, 진행 이벤트 브로커를 제공합니다.
+"""
+
+from src.jobs.store import JobStore, MemoryJobStore, SQLiteJobStore, create_job_store
+from src.jobs.events import JobEventBroker
+from src.jobs.queue import BlogJobQueue
+
+__all__ = [
+    'JobStore',
+    'MemoryJobStore',
+    'SQLiteJobStore',
+    'create_job_store',
+    'JobEventBroker',
+    'BlogJobQueue',
+]
@@ -0,0 +1,122 @@
+"""
+블로그 생성 작업 이벤트 브로커
+
+이 모듈은 작업별 진행 이벤트(노드 전환, 완료된 섹션, 토큰 등)를 구독자에게 전달하는
+메모리 기반 브로커를 제공합니다. 늦게 연결한 구독자도 지금까지의 이벤트를 다시 받습니다.
+토큰 이벤트는 수가 많아 기록을 밀어내므로 연결된 구독자에게만 전달하고 다시 보내지 않습니다
+(최종 본문은 done 이벤트에 포함됩니다).
+"""
+import asyncio
+from collections import deque
+from typing import Dict, Any, AsyncIterator, Set, Deque
+
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 스트림을 종료하는 이벤트 유형
+TERMINAL_EVENTS = ("done", "error")
+
+# 기록하지 않고 연결된 구독자에게만 전달하는 이벤트 유형
+LIVE_ONLY_EVENTS = ("token",)
+
+
+class _JobChannel:
+    """작업 하나의 이벤트 기록과 구독자 목록"""
+
+    def __init__(self, max_history: int) -> None:
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.closed = False
+
+
+class JobEventBroker:
+    """작업별 진행 이벤트 브로커
+
+    publish()로 기록된 이벤트는 subscribe()로 연결된 모든 구독자에게 전달됩니다.
+    LIVE_ONLY_EVENTS 유형은 기록하지 않으므로 늦게 연결한 구독자는 받지 못합니다.
+    종료 이벤트(done, error) 이후 retention_seconds가 지나면 작업 채널이 제거됩니다.
+    """
+
+    def __init__(self, max_history: int = 5000, retention_seconds: float = 300) -> None:
+        """JobEventBroker 초기화
+
+        Args:
+            max_history (int, optional): 작업당 보관할 최대 이벤트 수 (토큰 이벤트 제외). 기본값은 5000.
+            retention_seconds (float, optional): 종료 후 채널 보관 시간(초). 기본값은 300.
+        """
+        self.max_history = max_history
+        self.retention_seconds = retention_seconds
+        self._channels: Dict[str, _JobChannel] = {}
+
+    def has(self, job_id: str) -> bool:
+        """작업 채널이 존재하는지 확인합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            bool: 채널 존재 여부
+        """
+        return job_id in self._channels
+
+    def open(self, job_id: str) -> None:
+        """작업 채널을 생성합니다. 이미 있으면 그대로 둡니다.
+
+        Args:
+            job_id (str): 작업 ID
+        """
+        if job_id not in self._channels:
+            self._channels[job_id] = _JobChannel(self.max_history)
+
+    def publish(self, job_id: str, event: Dict[str, Any]) -> None:
+        """이벤트를 기록하고 구독자에게 전달합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            event (Dict[str, Any]): "event" 키로 유형을 나타내는 이벤트 딕셔너리
+        """
+        self.open(job_id)
+        channel = self._channels[job_id]
+        if channel.closed:
+            return
+
+        if event.get("event") not in LIVE_ONLY_EVENTS:
+            channel.history.append(event)
+        for queue in channel.subscribers:
+            queue.put_nowait(event)
+
+        if event.get("event") in TERMINAL_EVENTS:
+            channel.closed = True
+            asyncio.get_running_loop().call_later(self.retention_seconds, self._channels.pop, job_id, None)
+
+    async def subscribe(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """작업 이벤트를 처음부터 순서대로 전달합니다.
+
+        지금까지 기록된 이벤트를 먼저 전달한 뒤, 종료 이벤트가 올 때까지 새 이벤트를 기다립니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Yields:
+            Dict[str, Any]: 이벤트 딕셔너리
+        """
+        self.open(job_id)
+        channel = self._channels[job_id]
+        queue: asyncio.Queue = asyncio.Queue()
+        for event in channel.history:
+            queue.put_nowait(event)
+
+        if channel.closed and queue.empty():
+            return
+
+        channel.subscribers.add(queue)
+        try:
+            while True:
+                event = await queue.get()
+                yield event
+                if event.get("event") in TERMINAL_EVENTS:
+                    break
+        finally:
+            channel.subscribers.discard(queue)
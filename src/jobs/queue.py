@@ -0,0 +1,325 @@
+"""
+블로그 생성 작업 큐
+
+이 모듈은 크기가 제한된 비동기 큐와 고정 개수의 워커로 블로그 생성 작업을 처리하는
+작업 큐를 제공합니다. 큐가 가득 차면 새 작업을 거절하여 동시 실행 수와 메모리 사용량을 제한합니다.
+"""
+import re
+import uuid
+import asyncio
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+
+from src.common.config.jobs import JobConfiguration
+from src.common.exceptions import JobQueueFullError, JobQueueUnavailableError
+from src.common.logging import get_logger
+from src.jobs.events import JobEventBroker
+from src.jobs.store import JobStore, create_job_store
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 작업 처리 함수 유형: (topic, config) -> 블로그 콘텐츠
+# 이벤트 브로커가 설정된 경우 on_event 키워드 인자로 진행 이벤트 콜백이 전달됩니다.
+JobHandler = Callable[..., Awaitable[str]]
+
+# 저장소에 기록하지 않는 비밀 설정 키 (API 키, 비밀번호 등)
+SECRET_KEY_PATTERN = re.compile(r"api_?key|secret|password|passwd|access_token|credential", re.IGNORECASE)
+
+
+def redact_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """구성 설정에서 비밀 키를 제거한 사본을 반환합니다. 중첩된 딕셔너리도 처리합니다.
+
+    Args:
+        config (Dict[str, Any]): 구성 설정
+
+    Returns:
+        Dict[str, Any]: 비밀 키가 제거된 구성 설정
+    """
+    return {
+        key: redact_config(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+        if not SECRET_KEY_PATTERN.search(str(key))
+    }
+
+
+class BlogJobQueue:
+    """블로그 생성 작업 큐
+
+    submit()으로 받은 작업을 저장소에 기록하고 큐에 넣으면, workers개의 워커가
+    큐에서 작업을 꺼내 handler로 블로그를 생성합니다. 만료된 완료 작업은
+    cleanup_interval마다 저장소에서 제거됩니다. events가 설정되면 작업 상태와
+    handler가 보낸 진행 이벤트를 작업별로 발행합니다.
+
+    저장소에는 비밀 키(API 키 등)를 제거한 구성만 기록하고, 원래 구성은 작업이 끝날 때까지
+    메모리에만 보관합니다. 재시작 후 복구된 작업은 비밀 키 없이 서버 기본값(환경 변수)으로 실행됩니다.
+    """
+
+    def __init__(self,
+                 handler: JobHandler,
+                 store: JobStore,
+                 workers: int = 2,
+                 queue_size: int = 20,
+                 cleanup_interval: int = 60,
+                 events: Optional[JobEventBroker] = None) -> None:
+        """BlogJobQueue 초기화
+
+        Args:
+            handler (JobHandler): 블로그를 생성하는 비동기 함수
+            store (JobStore): 작업 저장소
+            workers (int, optional): 워커 수. 기본값은 2.
+            queue_size (int, optional): 대기 가능한 최대 작업 수. 기본값은 20.
+            cleanup_interval (int, optional): 만료 작업 정리 주기(초). 기본값은 60.
+            events (Optional[JobEventBroker], optional): 진행 이벤트 브로커. 기본값은 None.
+        """
+        self.handler = handler
+        self.store = store
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.cleanup_interval = cleanup_interval
+        self.events = events
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._active_jobs = 0
+        self._running = False
+        self._configs: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_config(cls, handler: JobHandler, config: Optional[JobConfiguration] = None,
+                    events: Optional[JobEventBroker] = None) -> "BlogJobQueue":
+        """JobConfiguration으로 작업 큐를 생성합니다.
+
+        Args:
+            handler (JobHandler): 블로그를 생성하는 비동기 함수
+            config (Optional[JobConfiguration], optional): 작업 큐 설정. 기본값은 환경 변수에서 로드.
+            events (Optional[JobEventBroker], optional): 진행 이벤트 브로커. 기본값은 None.
+
+        Returns:
+            BlogJobQueue: 작업 큐 인스턴스
+        """
+        config = config or JobConfiguration.from_runnable_config()
+        store = create_job_store(
+            store_type=config.job_store,
+            path=config.job_store_path,
+            max_jobs=config.job_store_max_jobs,
+            ttl_seconds=config.job_ttl_seconds
+        )
+        return cls(
+            handler=handler,
+            store=store,
+            workers=config.job_workers,
+            queue_size=config.job_queue_size,
+            cleanup_interval=config.job_cleanup_interval,
+            events=events
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """작업 큐가 새 작업을 받을 수 있는 상태인지 여부"""
+        return self._running
+
+    async def start(self) -> None:
+        """워커와 정리 태스크를 시작하고, 이전 실행에서 끝나지 않은 작업을 다시 큐에 넣습니다.
+
+        stop() 후 다시 시작하는 경우 stop()에서 닫은 저장소를 다시 엽니다.
+        """
+        if self._running:
+            return
+
+        self.store.open()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._running = True
+        self._recover_unfinished_jobs()
+
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._cleanup_loop()))
+        logger.info(f"작업 큐 시작: 워커 {self.workers}개, 큐 크기 {self.queue_size}")
+
+    async def stop(self) -> None:
+        """새 작업 접수를 중단하고 워커를 종료합니다.
+
+        실행 중이던 작업은 저장소에 running 상태로 남아, 영구 저장소를 사용하는 경우
+        다음 start()에서 다시 큐에 들어갑니다.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.store.close()
+        logger.info("작업 큐 종료")
+
+    def submit(self, topic: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """블로그 생성 작업을 큐에 추가합니다.
+
+        Args:
+            topic (str): 블로그 주제
+            config (Optional[Dict[str, Any]], optional): 워크플로우 구성 설정
+
+        Returns:
+            Dict[str, Any]: 생성된 작업 정보
+
+        Raises:
+            JobQueueUnavailableError: 작업 큐가 실행 중이 아닌 경우
+            JobQueueFullError: 큐가 가득 찬 경우
+        """
+        if not self._running or self._queue is None:
+            raise JobQueueUnavailableError("작업 큐가 실행 중이 아닙니다.")
+
+        if self._queue.full():
+            raise JobQueueFullError(f"작업 큐가 가득 찼습니다 (최대 {self.queue_size}개). 잠시 후 다시 시도해주세요.")
+
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "status": "pending",
+            "message": "블로그 생성 작업이 큐에 추가되었습니다.",
+            "created_at": datetime.now().isoformat(),
+            "topic": topic,
+            "config": redact_config(config or {}),
+        }
+        self.store.create(job)
+        self._configs[job["job_id"]] = config or {}
+        self._queue.put_nowait(job["job_id"])
+        self._publish(job["job_id"], {"event": "status", "status": "pending", "message": job["message"]})
+
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 정보를 조회합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 정보 또는 None (없는 경우)
+        """
+        return self.store.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """작업 큐 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 실행 여부, 대기/실행 중인 작업 수 등의 통계
+        """
+        return {
+            "running": self._running,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "active": self._active_jobs,
+        }
+
+    def _recover_unfinished_jobs(self) -> None:
+        """저장소에 남아 있는 미완료 작업을 큐에 다시 넣습니다."""
+        for job in self.store.list_unfinished():
+            job_id = job["job_id"]
+            if self._queue.full():
+                self.store.update(
+                    job_id,
+                    status="failed",
+                    message="재시작 후 큐 용량이 부족하여 작업이 취소되었습니다.",
+                    completed_at=datetime.now().isoformat()
+                )
+                continue
+
+            self.store.update(job_id, status="pending", message="재시작 후 작업이 다시 큐에 추가되었습니다.")
+            self._queue.put_nowait(job_id)
+            logger.info(f"미완료 작업 복구: 작업 ID {job_id}")
+
+    async def _worker(self, index: int) -> None:
+        """큐에서 작업을 꺼내 처리하는 워커 루프입니다.
+
+        Args:
+            index (int): 워커 번호
+        """
+        while True:
+            job_id = await self._queue.get()
+            self._active_jobs += 1
+            try:
+                await self._run_job(job_id)
+            finally:
+                self._active_jobs -= 1
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str) -> None:
+        """작업 하나를 실행하고 결과를 저장소에 기록합니다.
+
+        Args:
+            job_id (str): 작업 ID
+        """
+        job = self.store.get(job_id)
+        config = self._configs.pop(job_id, None)
+        if job is None:
+            logger.warning(f"저장소에서 작업을 찾을 수 없습니다: 작업 ID {job_id}")
+            return
+
+        topic = job["topic"]
+        config = config if config is not None else job.get("config") or {}
+        message = "블로그를 생성하고 있습니다."
+        self.store.update(job_id, status="running", message=message)
+        self._publish(job_id, {"event": "status", "status": "running", "message": message})
+
+        try:
+            # 블로그 생성 작업 시작
+            logger.info(f"블로그 생성 시작: 작업 ID {job_id}, 주제: '{topic}'")
+
+            if self.events is None:
+                blog_content = await self.handler(topic, config)
+            else:
+                blog_content = await self.handler(
+                    topic, config,
+                    on_event=lambda event: self._publish(job_id, event)
+                )
+
+            message = "블로그 생성이 완료되었습니다."
+            self.store.update(
+                job_id,
+                status="completed",
+                blog=blog_content,
+                message=message,
+                completed_at=datetime.now().isoformat()
+            )
+            self._publish(job_id, {"event": "done", "status": "completed", "message": message, "blog": blog_content})
+            logger.info(f"블로그 생성 완료: 작업 ID {job_id}")
+
+        except asyncio.CancelledError:
+            # 종료 중 취소된 작업은 running 상태로 남겨 재시작 시 복구되도록 함
+            self._configs[job_id] = config
+            raise
+
+        except Exception as e:
+            # 오류 처리
+            error_msg = f"블로그 생성 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            self.store.update(
+                job_id,
+                status="failed",
+                message=error_msg,
+                completed_at=datetime.now().isoformat()
+            )
+            self._publish(job_id, {"event": "error", "status": "failed", "message": error_msg})
+
+    def _publish(self, job_id: str, event: Dict[str, Any]) -> None:
+        """이벤트 브로커가 설정된 경우 작업 이벤트를 발행합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            event (Dict[str, Any]): 이벤트 딕셔너리
+        """
+        if self.events is not None:
+            self.events.publish(job_id, event)
+
+    async def _cleanup_loop(self) -> None:
+        """만료된 완료 작업을 주기적으로 저장소에서 제거합니다."""
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            try:
+                evicted = self.store.evict_expired()
+                if evicted:
+                    logger.info(f"만료된 작업 {evicted}개를 제거했습니다.")
+            except Exception as e:
+                logger.error(f"만료 작업 정리 중 오류 발생: {str(e)}")
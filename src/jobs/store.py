@@ -0,0 +1,283 @@
+"""
+블로그 생성 작업 저장소
+
+이 모듈은 블로그 생성 작업의 상태를 보관하는 저장소 인터페이스와
+메모리(LRU) 및 SQLite 구현을 제공합니다.
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 완료된 것으로 간주하는 작업 상태
+FINISHED_STATUSES = ("completed", "failed")
+
+
+class JobStore(ABC):
+    """블로그 생성 작업 저장소 인터페이스
+
+    작업은 job_id를 키로 하는 딕셔너리로 저장됩니다. 완료/실패한 작업은
+    ttl_seconds가 지나면 evict_expired()로 제거됩니다.
+    """
+
+    def __init__(self, ttl_seconds: int = 3600) -> None:
+        """JobStore 초기화
+
+        Args:
+            ttl_seconds (int, optional): 완료된 작업 보관 시간(초). 기본값은 3600.
+        """
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    def create(self, job: Dict[str, Any]) -> None:
+        """새 작업을 저장합니다.
+
+        Args:
+            job (Dict[str, Any]): job_id와 status를 포함하는 작업 딕셔너리
+        """
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업을 조회합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 딕셔너리 또는 None (없는 경우)
+        """
+
+    @abstractmethod
+    def update(self, job_id: str, **fields: Any) -> None:
+        """작업의 필드를 갱신합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            **fields: 갱신할 필드
+        """
+
+    @abstractmethod
+    def list_unfinished(self) -> List[Dict[str, Any]]:
+        """완료되지 않은(pending, running) 작업 목록을 반환합니다.
+
+        Returns:
+            List[Dict[str, Any]]: 생성 시간 순으로 정렬된 작업 목록
+        """
+
+    @abstractmethod
+    def evict_expired(self) -> int:
+        """TTL이 지난 완료 작업을 제거합니다.
+
+        Returns:
+            int: 제거된 작업 수
+        """
+
+    def open(self) -> None:
+        """close()로 정리한 저장소 리소스를 다시 준비합니다. 이미 열려 있으면 아무것도 하지 않습니다."""
+
+    def close(self) -> None:
+        """저장소 리소스를 정리합니다."""
+
+    def _is_expired(self, finished_at: Optional[float], now: float) -> bool:
+        """완료 시각 기준으로 작업이 만료되었는지 확인합니다."""
+        return finished_at is not None and now - finished_at >= self.ttl_seconds
+
+
+class MemoryJobStore(JobStore):
+    """프로세스 메모리에 작업을 보관하는 LRU 저장소
+
+    max_jobs를 넘으면 가장 오래 조회되지 않은 완료 작업부터 제거합니다.
+    진행 중인 작업은 큐 크기로 제한되므로 용량 초과로 제거하지 않습니다.
+    """
+
+    def __init__(self, max_jobs: int = 1000, ttl_seconds: int = 3600) -> None:
+        """MemoryJobStore 초기화
+
+        Args:
+            max_jobs (int, optional): 보관할 최대 작업 수. 기본값은 1000.
+            ttl_seconds (int, optional): 완료된 작업 보관 시간(초). 기본값은 3600.
+        """
+        super().__init__(ttl_seconds)
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._finished_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self._jobs[job["job_id"]] = dict(job)
+            self._jobs.move_to_end(job["job_id"])
+            self._enforce_capacity()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            self._jobs.move_to_end(job_id)
+            return dict(job)
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields)
+            if job.get("status") in FINISHED_STATUSES:
+                self._finished_at.setdefault(job_id, time.time())
+
+    def list_unfinished(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            jobs = [dict(job) for job in self._jobs.values() if job.get("status") not in FINISHED_STATUSES]
+        return sorted(jobs, key=lambda job: job.get("created_at", ""))
+
+    def evict_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [job_id for job_id, finished_at in self._finished_at.items()
+                       if self._is_expired(finished_at, now)]
+            for job_id in expired:
+                self._remove(job_id)
+        return len(expired)
+
+    def _enforce_capacity(self) -> None:
+        """용량을 초과하면 오래된 완료 작업부터 제거합니다. (잠금 보유 상태에서 호출)"""
+        if len(self._jobs) <= self.max_jobs:
+            return
+        for job_id in [job_id for job_id in self._jobs if job_id in self._finished_at]:
+            if len(self._jobs) <= self.max_jobs:
+                break
+            self._remove(job_id)
+
+    def _remove(self, job_id: str) -> None:
+        """작업을 제거합니다. (잠금 보유 상태에서 호출)"""
+        self._jobs.pop(job_id, None)
+        self._finished_at.pop(job_id, None)
+
+
+class SQLiteJobStore(JobStore):
+    """SQLite 파일에 작업을 보관하는 저장소
+
+    프로세스가 재시작되어도 작업 상태가 유지됩니다.
+    """
+
+    def __init__(self, path: str = "data/blog_jobs.sqlite3", ttl_seconds: int = 3600) -> None:
+        """SQLiteJobStore 초기화
+
+        Args:
+            path (str, optional): SQLite 파일 경로. 기본값은 "data/blog_jobs.sqlite3".
+            ttl_seconds (int, optional): 완료된 작업 보관 시간(초). 기본값은 3600.
+        """
+        super().__init__(ttl_seconds)
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.open()
+
+    def open(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                return
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    finished_at REAL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_finished_at ON jobs (finished_at)")
+            self._conn.commit()
+
+    def create(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, status, data, created_at, finished_at) VALUES (?, ?, ?, ?, NULL)",
+                (job["job_id"], job.get("status", "pending"), json.dumps(job, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            job = json.loads(row[0])
+            job.update(fields)
+            status = job.get("status", "pending")
+            finished_at = time.time() if status in FINISHED_STATUSES else None
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, data = ?, finished_at = COALESCE(finished_at, ?) WHERE job_id = ?",
+                (status, json.dumps(job, ensure_ascii=False), finished_at, job_id)
+            )
+            self._conn.commit()
+
+    def list_unfinished(self) -> List[Dict[str, Any]]:
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM jobs WHERE status NOT IN ({placeholders}) ORDER BY created_at",
+                FINISHED_STATUSES
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def evict_expired(self) -> int:
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at <= ?", (cutoff,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_job_store(store_type: str = "memory", path: str = "data/blog_jobs.sqlite3",
+                     max_jobs: int = 1000, ttl_seconds: int = 3600) -> JobStore:
+    """설정에 맞는 작업 저장소를 생성합니다.
+
+    Args:
+        store_type (str, optional): 저장소 유형 ("memory" 또는 "sqlite"). 기본값은 "memory".
+        path (str, optional): SQLite 파일 경로. 기본값은 "data/blog_jobs.sqlite3".
+        max_jobs (int, optional): 메모리 저장소의 최대 작업 수. 기본값은 1000.
+        ttl_seconds (int, optional): 완료된 작업 보관 시간(초). 기본값은 3600.
+
+    Returns:
+        JobStore: 작업 저장소 인스턴스
+
+    Raises:
+        ValueError: 지원되지 않는 저장소 유형이 지정된 경우
+    """
+    if store_type == "memory":
+        return MemoryJobStore(max_jobs=max_jobs, ttl_seconds=ttl_seconds)
+    if store_type == "sqlite":
+        return SQLiteJobStore(path=path, ttl_seconds=ttl_seconds)
+    raise ValueError(f"지원되지 않는 작업 저장소 유형: {store_type}")
@@ -21,6 +21,8 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, END
 
+from src.workflows.graphs.registry import get_compiled_graph
+
 # pydantic (Function Calling을 위한 모델)
 try:
     from pydantic import BaseModel, Field
@@ -416,7 +418,7 @@ def convert_markdown_to_html(markdown_text: str, theme: Optional[Theme] = None)
     doc_state = DocumentState(markdown_text, theme)
     initial_state = doc_state.to_dict()
 
-    graph = create_markdown_to_html_graph()
+    graph = get_compiled_graph("markdown_to_html")
     final_state = graph.invoke(initial_state)
 
     return final_state["html_output"]
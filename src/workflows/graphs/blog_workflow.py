@@ -7,8 +7,14 @@ import copy
 from typing import Dict, Any, Tuple, List, TypedDict, Annotated
 from langgraph.graph import END, StateGraph
 
-from src.workflows.graphs.search_workflow import create_search_workflow
-from src.workflows.states.blog_state import BlogState, SectionState, BlogSection
+from src.workflows.graphs.registry import get_compiled_graph
+from src.workflows.graphs.section_research import (
+    _build_section_state,
+    route_research_sections,
+    create_research_section_node,
+    collect_research_sections
+)
+from src.workflows.states.blog_state import BlogState, BlogSection
 from src.workflows.nodes.planners.section_planner import plan_sections
 from src.workflows.nodes.writers.section_writer import write_final_sections
 from src.workflows.nodes.writers.section_combiner import combine_blog_sections
@@ -32,15 +38,7 @@ def set_up_section_state(state: BlogState) -> Dict[str, Any]:
     section = state["research_needed_sections"][0]
     
     # Prepare section state for search workflow
-    section_state = SectionState(
-        topic=state["topic"],
-        section=section,
-        search_queries=[],
-        search_results=[],
-        source_str="",
-        search_iterations=0,
-        completed_sections=[]
-    )
+    section_state = _build_section_state(state["topic"], section)
     
     # Return section state dictionary
     return {"section_state": section_state}
@@ -132,15 +130,15 @@ def create_blog_workflow() -> StateGraph:
     
     워크플로우는 다음과 같은 단계로 구성됩니다:
     1. 블로그 섹션 계획 수립
-    2. 각 섹션에 대한 정보 검색 및 작성
+    2. 각 섹션에 대한 정보 검색 및 작성 (parallel_sections 구성 시 Send로 동시 실행)
     3. 연구가 필요하지 않은 섹션 작성 (결론 등)
     4. 모든 섹션을 결합하여 최종 블로그 생성
     
     Returns:
         블로그 생성 워크플로우 그래프
     """
-    # Create the search workflow
-    search_workflow = create_search_workflow()
+    # Reuse the process-wide compiled search workflow
+    search_workflow = get_compiled_graph("search")
     
     # Create the main workflow
     workflow = StateGraph(BlogState)
@@ -150,6 +148,8 @@ def create_blog_workflow() -> StateGraph:
     workflow.add_node("set_up_section_state", set_up_section_state)
     workflow.add_node("search_section", search_workflow)
     workflow.add_node("update_blog_state", update_blog_state)
+    workflow.add_node("research_section", create_research_section_node(search_workflow))
+    workflow.add_node("collect_research_sections", collect_research_sections)
     workflow.add_node("get_remaining_non_research_sections", get_remaining_non_research_sections)
     workflow.add_node("write_final_sections", write_final_sections)
     workflow.add_node("combine_blog_sections", combine_blog_sections)
@@ -157,8 +157,11 @@ def create_blog_workflow() -> StateGraph:
     # Set entry point
     workflow.set_entry_point("plan_sections")
     
-    # Define main research and writing loop
-    workflow.add_edge("plan_sections", "set_up_section_state")
+    # Define main research and writing loop (serial loop or parallel fan-out)
+    research_routes = ["set_up_section_state", "research_section", "get_remaining_non_research_sections"]
+    workflow.add_conditional_edges("plan_sections", route_research_sections, research_routes)
+    workflow.add_edge("research_section", "collect_research_sections")
+    workflow.add_conditional_edges("collect_research_sections", route_research_sections, research_routes)
     workflow.add_edge("set_up_section_state", "search_section")
     workflow.add_edge("search_section", "update_blog_state")
     
@@ -0,0 +1,166 @@
+"""
+컴파일된 그래프 레지스트리
+
+이 모듈은 블로그, 검색, 마크다운 변환 그래프를 프로세스당 한 번만 컴파일하여
+여러 요청이 공유할 수 있도록 하는 레지스트리를 제공합니다.
+컴파일된 LangGraph 그래프는 실행 상태를 갖지 않으므로 동시 요청 간에 안전하게 재사용할 수 있습니다.
+"""
+import importlib
+import threading
+import time
+from typing import Dict, Any, Callable, Hashable, Optional, Tuple
+
+from src.common.logging import get_logger
+
+# 로거 설정
+logger = get_logger(__name__)
+
+# 그래프 이름 -> "모듈:빌더 함수" (순환 임포트를 피하기 위해 처음 사용할 때 임포트)
+GRAPH_BUILDERS: Dict[str, str] = {
+    "blog": "src.workflows.graphs.blog_workflow:create_blog_workflow",
+    "search": "src.workflows.graphs.search_workflow:create_search_workflow",
+    "markdown_to_html": "src.markdown_to_html_converter:create_markdown_to_html_graph",
+}
+
+GraphKey = Tuple[str, Tuple[Tuple[str, Hashable], ...]]
+
+
+class GraphRegistry:
+    """컴파일된 그래프 레지스트리
+
+    그래프 이름과 빌더 옵션을 키로 컴파일된 그래프를 보관합니다. 처음 요청될 때
+    빌더를 호출하여 컴파일하며, 동시에 같은 그래프를 요청해도 한 번만 컴파일됩니다.
+    """
+
+    def __init__(self, builders: Optional[Dict[str, str]] = None) -> None:
+        """GraphRegistry 초기화
+
+        Args:
+            builders (Optional[Dict[str, str]], optional): 그래프 이름과 "모듈:함수" 경로. 기본값은 GRAPH_BUILDERS.
+        """
+        self._builders: Dict[str, Any] = dict(builders if builders is not None else GRAPH_BUILDERS)
+        self._graphs: Dict[GraphKey, Any] = {}
+        self._build_seconds: Dict[GraphKey, float] = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def register(self, name: str, builder: Callable[..., Any]) -> None:
+        """그래프 빌더를 등록합니다. 같은 이름으로 캐시된 그래프는 제거됩니다.
+
+        Args:
+            name (str): 그래프 이름
+            builder (Callable[..., Any]): 컴파일된 그래프를 반환하는 함수
+        """
+        with self._lock:
+            self._builders[name] = builder
+            self._evict(name)
+
+    def get(self, name: str, **options: Hashable) -> Any:
+        """컴파일된 그래프를 반환합니다. 없으면 빌드하여 캐시합니다.
+
+        Args:
+            name (str): 그래프 이름
+            **options: 빌더에 전달할 구성 옵션 (해시 가능한 값, 캐시 키에 포함)
+
+        Returns:
+            Any: 컴파일된 그래프
+
+        Raises:
+            KeyError: 등록되지 않은 그래프 이름인 경우
+        """
+        key: GraphKey = (name, tuple(sorted(options.items())))
+
+        graph = self._graphs.get(key)
+        if graph is not None:
+            self._hits += 1
+            return graph
+
+        with self._lock:
+            # 잠금을 기다리는 동안 다른 스레드가 빌드했을 수 있음
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._hits += 1
+                return graph
+
+            builder = self._resolve_builder(name)
+            started = time.perf_counter()
+            graph = builder(**options)
+            elapsed = time.perf_counter() - started
+
+            self._graphs[key] = graph
+            self._build_seconds[key] = elapsed
+            self._misses += 1
+            logger.info(f"그래프 컴파일 완료: {name}{dict(options) if options else ''} ({elapsed * 1000:.1f}ms)")
+            return graph
+
+    def clear(self, name: Optional[str] = None) -> None:
+        """캐시된 그래프를 제거합니다.
+
+        Args:
+            name (Optional[str], optional): 제거할 그래프 이름. None이면 전체 제거.
+        """
+        with self._lock:
+            if name is None:
+                self._graphs.clear()
+                self._build_seconds.clear()
+            else:
+                self._evict(name)
+
+    def stats(self) -> Dict[str, Any]:
+        """레지스트리 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 캐시된 그래프 수, 적중/미스 횟수, 그래프별 컴파일 시간(ms)
+        """
+        return {
+            "graphs": len(self._graphs),
+            "hits": self._hits,
+            "misses": self._misses,
+            "build_ms": {
+                name + (f"{dict(options)}" if options else ""): round(seconds * 1000, 2)
+                for (name, options), seconds in self._build_seconds.items()
+            },
+        }
+
+    def _resolve_builder(self, name: str) -> Callable[..., Any]:
+        """그래프 빌더 함수를 찾습니다. 경로 문자열이면 임포트합니다.
+
+        Args:
+            name (str): 그래프 이름
+
+        Returns:
+            Callable[..., Any]: 빌더 함수
+        """
+        if name not in self._builders:
+            raise KeyError(f"등록되지 않은 그래프입니다: {name}")
+
+        builder = self._builders[name]
+        if isinstance(builder, str):
+            module_name, func_name = builder.split(":")
+            builder = getattr(importlib.import_module(module_name), func_name)
+            self._builders[name] = builder
+        return builder
+
+    def _evict(self, name: str) -> None:
+        """이름이 같은 캐시 항목을 모두 제거합니다 (잠금을 잡은 상태에서 호출)."""
+        for key in [key for key in self._graphs if key[0] == name]:
+            self._graphs.pop(key, None)
+            self._build_seconds.pop(key, None)
+
+
+# 프로세스 전역 레지스트리
+graph_registry = GraphRegistry()
+
+
+def get_compiled_graph(name: str, **options: Hashable) -> Any:
+    """프로세스 전역 레지스트리에서 컴파일된 그래프를 가져옵니다.
+
+    Args:
+        name (str): 그래프 이름 ("blog", "search", "markdown_to_html")
+        **options: 빌더에 전달할 구성 옵션
+
+    Returns:
+        Any: 컴파일된 그래프
+    """
+    return graph_registry.get(name, **options)
@@ -0,0 +1,121 @@
+"""
+연구 섹션 병렬 실행 노드
+
+이 모듈은 블로그 워크플로우의 연구 섹션을 LangGraph Send로 동시에 실행하는 라우터와 노드를 제공합니다.
+남은 연구 섹션을 max_parallel_sections개씩 웨이브로 나누어 검색 워크플로우에 보내고, 완료된 섹션은
+research_results에 누적한 뒤 계획 순서대로 병합합니다.
+"""
+import logging
+from typing import Dict, Any, List, Union, Callable, Awaitable
+from langchain_core.runnables import RunnableConfig
+from langgraph.types import Send
+
+from src.workflows.states.blog_state import BlogState, SectionState, BlogSection
+from src.common.config import Configuration
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def _build_section_state(topic: str, section: BlogSection) -> SectionState:
+    """검색 워크플로우에 전달할 초기 섹션 상태를 만듭니다.
+    
+    Args:
+        topic: 블로그 주제
+        section: 연구할 섹션
+        
+    Returns:
+        초기화된 섹션 상태
+    """
+    return SectionState(
+        topic=topic,
+        section=section,
+        search_queries=[],
+        search_results=[],
+        source_str="",
+        search_iterations=0,
+        completed_sections=[]
+    )
+
+
+def route_research_sections(state: BlogState, config: RunnableConfig) -> Union[str, List[Send]]:
+    """연구가 필요한 섹션을 다음 노드로 라우팅합니다.
+    
+    이 함수는:
+    1. 병렬 모드가 꺼져 있으면 기존 순차 루프(set_up_section_state)로 보냅니다
+    2. 병렬 모드에서는 남은 연구 섹션 중 최대 max_parallel_sections개를 Send로 동시에 실행합니다
+    3. 남은 연구 섹션이 없으면 연구가 필요 없는 섹션 처리로 넘어갑니다
+    
+    Args:
+        state: 현재 블로그 상태
+        config: 병렬 실행 구성
+        
+    Returns:
+        다음 노드 이름 또는 Send 목록
+    """
+    configurable = Configuration.from_runnable_config(config)
+    pending_sections = state["research_needed_sections"]
+    
+    if not pending_sections:
+        return "get_remaining_non_research_sections"
+    
+    if not configurable.parallel_sections:
+        return "set_up_section_state"
+    
+    # Fan out one wave of sections, bounded by max_parallel_sections
+    wave_size = max(1, configurable.max_parallel_sections)
+    wave = pending_sections[:wave_size]
+    logger.info(f"연구 섹션 {len(wave)}개를 병렬로 실행합니다 (남은 섹션: {len(pending_sections)}개)")
+    
+    return [Send("research_section", _build_section_state(state["topic"], section)) for section in wave]
+
+
+def create_research_section_node(search_workflow) -> Callable[[SectionState, RunnableConfig], Awaitable[Dict[str, Any]]]:
+    """Send로 전달된 섹션 하나를 검색 워크플로우로 처리하는 노드를 만듭니다.
+    
+    Args:
+        search_workflow: 컴파일된 검색 워크플로우
+        
+    Returns:
+        완료된 섹션을 research_results에 기록하는 비동기 노드 함수
+    """
+    async def research_section(state: SectionState, config: RunnableConfig) -> Dict[str, Any]:
+        section = state["section"]
+        result = await search_workflow.ainvoke(state, config=config)
+        completed_sections = result.get("completed_sections") or []
+        
+        # Keep the wave loop moving even if the subgraph produced nothing
+        if not completed_sections:
+            logger.warning(f"'{section.name}' 섹션이 완료되지 않았습니다. 현재 내용으로 진행합니다.")
+            completed_sections = [result.get("section", section)]
+        
+        return {"research_results": completed_sections}
+    
+    return research_section
+
+
+def collect_research_sections(state: BlogState) -> Dict[str, Any]:
+    """병렬로 완료된 연구 섹션을 계획 순서대로 병합합니다.
+    
+    이 함수는:
+    1. 지금까지 누적된 research_results를 섹션 이름으로 정리합니다
+    2. 계획된 섹션 순서(state["sections"])대로 정렬하여 completed_sections를 갱신합니다
+    3. 완료된 섹션을 연구가 필요한 섹션 목록에서 제거합니다
+    
+    Args:
+        state: 현재 블로그 상태
+        
+    Returns:
+        업데이트된 블로그 상태
+    """
+    plan_order = {section.name: index for index, section in enumerate(state["sections"])}
+    finished = {section.name: section for section in state["research_results"]}
+    
+    # Merge back in plan order regardless of which branch finished first
+    completed_sections = sorted(finished.values(), key=lambda section: plan_order.get(section.name, len(plan_order)))
+    remaining_sections = [section for section in state["research_needed_sections"] if section.name not in finished]
+    
+    return {
+        "completed_sections": completed_sections,
+        "research_needed_sections": remaining_sections
+    }
@@ -3,7 +3,6 @@
 
 이 모듈은 블로그 주제를 기반으로 섹션 구조를 계획하는 노드를 제공합니다.
 """
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 
@@ -11,7 +10,7 @@ from src.workflows.states.blog_state import blogState, Sections, Queries
 from src.prompts import blog_planner_query_writer_instructions, blog_planner_instructions
 from src.configuration import Configuration
 from src.core.search.manager import SearchOrchestrator
-from src.common.config.providers import get_config_value, get_search_params
+from src.common.config.providers import get_config_value, get_search_params, get_chat_model
 
 
 async def generate_blog_plan(state: blogState, config: RunnableConfig):
@@ -50,8 +49,7 @@ async def generate_blog_plan(state: blogState, config: RunnableConfig):
     # Set writer model (model used for query writing)
     writer_provider = get_config_value(configurable.writer_provider)
     writer_model_name = get_config_value(configurable.writer_model)
-    writer_model = init_chat_model(model=writer_model_name, model_provider=writer_provider, temperature=0) 
-    structured_llm = writer_model.with_structured_output(Queries)
+    structured_llm = get_chat_model(writer_provider, writer_model_name, temperature=0, structured_output=Queries)
 
     # Format system instructions
     system_instructions_query = blog_planner_query_writer_instructions.format(topic=topic, blog_organization=blog_structure, number_of_queries=number_of_queries)
@@ -82,18 +80,18 @@ async def generate_blog_plan(state: blogState, config: RunnableConfig):
     if planner_model == "claude-3-7-sonnet-latest":
 
         # Allocate a thinking budget for claude-3-7-sonnet-latest as the planner model
-        planner_llm = init_chat_model(model=planner_model, 
-                                      model_provider=planner_provider, 
-                                      max_tokens=20_000, 
-                                      thinking={"type": "enabled", "budget_tokens": 16_000})
+        structured_llm = get_chat_model(planner_provider, 
+                                        planner_model, 
+                                        structured_output=Sections,
+                                        max_tokens=20_000, 
+                                        thinking={"type": "enabled", "budget_tokens": 16_000})
 
     else:
 
         # With other models, we can use with_structured_output
-        planner_llm = init_chat_model(model=planner_model, model_provider=planner_provider)
+        structured_llm = get_chat_model(planner_provider, planner_model, structured_output=Sections)
     
     # Generate the blog sections
-    structured_llm = planner_llm.with_structured_output(Sections)
     blog_sections = structured_llm.invoke([SystemMessage(content=system_instructions_sections),
                                              HumanMessage(content=planner_message)])
 
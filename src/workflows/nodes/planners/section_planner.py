@@ -4,7 +4,6 @@
 이 모듈은 블로그 주제에 대한 섹션 계획을 생성하는 노드를 제공합니다.
 """
 from typing import List
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 
@@ -12,6 +11,7 @@ from src.workflows.states.blog_state import BlogSection, BlogState
 from src.prompts import section_planner_instructions
 from src.common.config import Configuration
 from src.common.config.providers import get_config_value
+from src.common.llm_cache import invoke_chat_model
 
 
 def plan_sections(state: BlogState, config: RunnableConfig) -> dict:
@@ -41,11 +41,13 @@ def plan_sections(state: BlogState, config: RunnableConfig) -> dict:
     # Generate section plan using planner model
     planner_provider = get_config_value(configurable.planner_provider)
     planner_model_name = get_config_value(configurable.planner_model)
-    planner_model = init_chat_model(model=planner_model_name, model_provider=planner_provider, temperature=0).with_structured_output(List[BlogSection])
     
     # Get section plan and convert to correct type
-    section_plan = planner_model.invoke([SystemMessage(content=system_instructions),
-                                       HumanMessage(content=f"Plan sections for a blog post about '{topic}'.")])
+    section_plan = invoke_chat_model(configurable, planner_provider, planner_model_name,
+                                     [SystemMessage(content=system_instructions),
+                                      HumanMessage(content=f"Plan sections for a blog post about '{topic}'.")],
+                                     temperature=0,
+                                     structured_output=List[BlogSection])
     
     # Return the updated state
     return {"sections": section_plan, "research_needed_sections": section_plan} 
\ No newline at end of file
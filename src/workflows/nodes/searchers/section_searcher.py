@@ -8,15 +8,16 @@ import json
 import asyncio
 import logging
 from typing import List, Dict, Any, Optional
-import aiohttp
 from datetime import datetime
 
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 
 from src.common.config import Configuration
 from src.common.config.providers import get_config_value
+from src.common.llm_cache import invoke_chat_model
+from src.common.http_client import get_http_session
+from src.core.search.manager import SearchOrchestrator
 from src.workflows.states.blog_state import SectionState
 from src.prompts import search_query_generator_instructions
 
@@ -62,14 +63,13 @@ def generate_queries(state: SectionState, config: RunnableConfig) -> Dict[str, A
     # Generate queries using planner model
     planner_provider = get_config_value(configurable.planner_provider)
     planner_model_name = get_config_value(configurable.planner_model)
-    planner_model = init_chat_model(model=planner_model_name, model_provider=planner_provider, temperature=0)
     
     logger.info(f"'{section.name}' 섹션에 대한 검색 쿼리 생성 중...")
     
-    query_response = planner_model.invoke([
+    query_response = invoke_chat_model(configurable, planner_provider, planner_model_name, [
         SystemMessage(content=system_instructions),
         HumanMessage(content=f"'{section.name}' 섹션을 위한 검색 쿼리를 생성해주세요.")
-    ])
+    ], temperature=0)
     
     # Parse queries from the response
     queries = []
@@ -109,19 +109,59 @@ async def _search_tavily(query: str, api_key: str) -> Dict[str, Any]:
         "max_results": 5
     }
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "https://api.tavily.com/search",
-            headers=headers,
-            json=data
-        ) as response:
-            if response.status == 200:
-                result = await response.json()
-                return result
-            else:
-                error_text = await response.text()
-                logger.error(f"Tavily 검색 오류: {error_text}")
-                return {"results": []}
+    session = get_http_session()
+    async with session.post(
+        "https://api.tavily.com/search",
+        headers=headers,
+        json=data
+    ) as response:
+        if response.status == 200:
+            result = await response.json()
+            return result
+        else:
+            error_text = await response.text()
+            logger.error(f"Tavily 검색 오류: {error_text}")
+            return {"results": []}
+
+
+async def _search_multi_engine(search_queries: List[str], configurable: Configuration) -> List[Dict[str, Any]]:
+    """여러 검색 엔진에 쿼리를 동시에 실행하고 병합된 결과를 섹션 검색 결과 형식으로 반환합니다.
+    
+    Args:
+        search_queries: 검색 쿼리 목록
+        configurable: 워크플로우 구성 (searcher_providers, search_deadline)
+        
+    Returns:
+        검색 결과 목록
+    """
+    providers = configurable.searcher_providers
+    if isinstance(providers, str):
+        providers = [provider.strip() for provider in providers.split(",") if provider.strip()]
+    logger.info(f"{len(search_queries)}개의 쿼리로 {', '.join(providers)} 검색을 수행합니다...")
+    
+    orchestrator = SearchOrchestrator()
+    responses = await orchestrator.select_and_execute_multi_search(
+        providers,
+        search_queries,
+        deadline=float(configurable.search_deadline),
+        format_results=False
+    )
+    
+    all_results = []
+    for response in responses:
+        for item in response["results"]:
+            all_results.append({
+                "title": item.get("title", ""),
+                "url": item.get("url", ""),
+                "content": item.get("content", ""),
+                "score": item.get("score", 0),
+                "source_type": item.get("source_type", ""),
+                "query": response["query"],
+                "metadata": item.get("metadata") or {"crawled_at": datetime.now().isoformat()}
+            })
+    
+    logger.info(f"총 {len(all_results)}개의 검색 결과를 찾았습니다.")
+    return all_results
 
 
 async def search_web(state: SectionState, config: RunnableConfig) -> Dict[str, Any]:
@@ -148,6 +188,10 @@ async def search_web(state: SectionState, config: RunnableConfig) -> Dict[str, A
         logger.warning("검색 쿼리가 없습니다.")
         return {"search_results": []}
     
+    # Fan out to several engines with a deadline when configured
+    if configurable.searcher_providers:
+        return {"search_results": await _search_multi_engine(search_queries, configurable)}
+    
     # Get API key for search
     search_provider = get_config_value(configurable.searcher_provider)
     search_api_key = get_config_value(configurable.searcher_api_key)
@@ -3,12 +3,12 @@
 
 이 모듈은 작성된 섹션들을 묶어 최종 블로그 포스트를 생성하는 노드를 제공합니다.
 """
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 
 from src.common.config import Configuration
 from src.common.config.providers import get_config_value
+from src.common.llm_cache import invoke_chat_model
 from src.workflows.states.blog_state import BlogState
 from src.prompts import combine_sections_instructions
 
@@ -48,10 +48,10 @@ def combine_blog_sections(state: BlogState, config: RunnableConfig) -> dict:
     # Generate final blog post
     writer_provider = get_config_value(configurable.writer_provider)
     writer_model_name = get_config_value(configurable.writer_model)
-    writer_model = init_chat_model(model=writer_model_name, model_provider=writer_provider, temperature=0) 
-    
-    blog_post = writer_model.invoke([SystemMessage(content=system_instructions),
-                                    HumanMessage(content=f"Combine these sections into a cohesive blog post about {topic}.")])
+    blog_post = invoke_chat_model(configurable, writer_provider, writer_model_name,
+                                  [SystemMessage(content=system_instructions),
+                                   HumanMessage(content=f"Combine these sections into a cohesive blog post about {topic}.")],
+                                  temperature=0)
     
     # Return the combined blog post
     return {"blog_post": blog_post.content} 
\ No newline at end of file
@@ -5,7 +5,6 @@
 """
 from typing import Literal
 
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.constants import END
@@ -15,6 +14,7 @@ from src.workflows.states.blog_state import SectionState, Feedback
 from src.prompts import section_writer_instructions, section_writer_inputs, section_grader_instructions, final_section_writer_instructions
 from src.common.config import Configuration
 from src.common.config.providers import get_config_value
+from src.common.llm_cache import invoke_chat_model
 
 
 def write_section(state: SectionState, config: RunnableConfig) -> Command[Literal[END, "search_web"]]:
@@ -53,9 +53,10 @@ def write_section(state: SectionState, config: RunnableConfig) -> Command[Litera
     # Generate section  
     writer_provider = get_config_value(configurable.writer_provider)
     writer_model_name = get_config_value(configurable.writer_model)
-    writer_model = init_chat_model(model=writer_model_name, model_provider=writer_provider, temperature=0) 
-    section_content = writer_model.invoke([SystemMessage(content=section_writer_instructions),
-                                           HumanMessage(content=section_writer_inputs_formatted)])
+    section_content = invoke_chat_model(configurable, writer_provider, writer_model_name,
+                                        [SystemMessage(content=section_writer_instructions),
+                                         HumanMessage(content=section_writer_inputs_formatted)],
+                                        temperature=0)
     
     # Write content to the section object  
     section.content = section_content.content
@@ -75,16 +76,15 @@ def write_section(state: SectionState, config: RunnableConfig) -> Command[Litera
     planner_model = get_config_value(configurable.planner_model)
     if planner_model == "claude-3-7-sonnet-latest":
         # Allocate a thinking budget for claude-3-7-sonnet-latest as the planner model
-        reflection_model = init_chat_model(model=planner_model, 
-                                           model_provider=planner_provider, 
-                                           max_tokens=20_000, 
-                                           thinking={"type": "enabled", "budget_tokens": 16_000}).with_structured_output(Feedback)
+        reflection_options = {"max_tokens": 20_000, "thinking": {"type": "enabled", "budget_tokens": 16_000}}
     else:
-        reflection_model = init_chat_model(model=planner_model, 
-                                           model_provider=planner_provider).with_structured_output(Feedback)
+        reflection_options = {}
     # Generate feedback
-    feedback = reflection_model.invoke([SystemMessage(content=section_grader_instructions_formatted),
-                                        HumanMessage(content=section_grader_message)])
+    feedback = invoke_chat_model(configurable, planner_provider, planner_model,
+                                 [SystemMessage(content=section_grader_instructions_formatted),
+                                  HumanMessage(content=section_grader_message)],
+                                 structured_output=Feedback,
+                                 **reflection_options)
 
     # If the section is passing or the max search depth is reached, publish the section to completed sections 
     if feedback.grade == "pass" or state["search_iterations"] >= configurable.max_search_depth:
@@ -129,9 +129,10 @@ def write_final_sections(state: SectionState, config: RunnableConfig):
     # Generate section  
     writer_provider = get_config_value(configurable.writer_provider)
     writer_model_name = get_config_value(configurable.writer_model)
-    writer_model = init_chat_model(model=writer_model_name, model_provider=writer_provider, temperature=0) 
-    section_content = writer_model.invoke([SystemMessage(content=system_instructions),
-                                           HumanMessage(content="Generate a blog section based on the provided sources.")])
+    section_content = invoke_chat_model(configurable, writer_provider, writer_model_name,
+                                        [SystemMessage(content=system_instructions),
+                                         HumanMessage(content="Generate a blog section based on the provided sources.")],
+                                        temperature=0)
     
     # Write content to section 
     section.content = section_content.content
@@ -3,7 +3,8 @@
 
 이 모듈은 블로그 생성 워크플로우의 상태를 표현하는 클래스를 제공합니다.
 """
-from typing import List, Dict, Any, Optional, TypedDict, Union
+import operator
+from typing import Annotated, List, Dict, Any, Optional, TypedDict, Union
 from dataclasses import dataclass, field
 from pydantic import BaseModel
 
@@ -52,12 +53,14 @@ class BlogState(TypedDict):
         sections: 계획된 모든 섹션 목록
         research_needed_sections: 연구가 필요한 섹션 목록
         completed_sections: 작성 완료된 섹션 목록
+        research_results: 병렬(Send) 연구 분기에서 완료된 섹션 목록 (누적)
         blog_post: 최종 블로그 콘텐츠
     """
     topic: str
     sections: List[BlogSection]
     research_needed_sections: List[BlogSection]
     completed_sections: List[BlogSection]
+    research_results: Annotated[List[BlogSection], operator.add]
     blog_post: str
 
 
@@ -4,47 +4,159 @@
 이 모듈은 블로그 생성 시스템의 주요 워크플로우 인터페이스를 제공합니다.
 """
 import asyncio
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, Callable, Optional, Set
 
 from langchain_core.runnables import RunnableConfig
+from langgraph.types import Command
 
-from src.workflows.graphs.blog_workflow import create_blog_workflow
-from src.workflows.states.blog_state import BlogState
+from src.workflows.graphs.registry import get_compiled_graph
+from src.workflows.states.blog_state import BlogState, BlogSection
 from src.common.config import Configuration
 
+# 토큰 단위로 스트리밍하는 노드 (최종 결합 단계)
+TOKEN_STREAM_NODES = {"combine_blog_sections"}
 
-async def generate_blog(topic: str, config: Dict[str, Any] = None) -> str:
+# 완료된 섹션을 담고 있는 상태 키
+SECTION_STATE_KEYS = ("completed_sections", "research_results")
+
+
+def _create_initial_state(topic: str) -> BlogState:
+    """주제에 대한 초기 블로그 상태를 생성합니다.
+
+    Args:
+        topic: 블로그 주제
+
+    Returns:
+        초기 블로그 상태
+    """
+    return BlogState(
+        topic=topic,
+        sections=[],
+        research_needed_sections=[],
+        completed_sections=[],
+        research_results=[],
+        blog_post=""
+    )
+
+
+def _chunk_text(chunk: Any) -> str:
+    """채팅 모델 스트림 청크에서 텍스트를 추출합니다.
+
+    Args:
+        chunk: AIMessageChunk 등 content 속성을 가진 청크
+
+    Returns:
+        청크의 텍스트 (콘텐츠 블록 목록인 경우 텍스트 블록만 결합)
+    """
+    content = getattr(chunk, "content", "")
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+async def generate_blog(topic: str, config: Dict[str, Any] = None,
+                        on_event: Optional[Callable[[Dict[str, Any]], None]] = None) -> str:
     """블로그 주제에 대한 완전한 블로그 포스트를 생성합니다.
-    
+
     이 함수는:
-    1. 블로그 워크플로우를 생성합니다
+    1. 컴파일된 블로그 워크플로우를 가져옵니다 (프로세스당 한 번 컴파일)
     2. 주제에 대한 초기 블로그 상태를 설정합니다
     3. 워크플로우를 실행하여 블로그를 생성합니다
-    
+
     Args:
         topic: 블로그 주제
         config: 워크플로우 구성 옵션
-        
+        on_event: 진행 이벤트를 받을 콜백 (지정하면 stream_blog로 실행)
+
     Returns:
         생성된 블로그 콘텐츠
     """
-    # Create blog workflow
-    workflow = create_blog_workflow()
-    
+    if on_event is not None:
+        blog_post = ""
+        async for event in stream_blog(topic, config):
+            if event["event"] == "result":
+                blog_post = event["blog"]
+            else:
+                on_event(event)
+        return blog_post
+
+    # Get the compiled blog workflow (built once per process)
+    workflow = get_compiled_graph("blog")
+
     # Set up initial state
-    initial_state = BlogState(
-        topic=topic,
-        sections=[],
-        research_needed_sections=[],
-        completed_sections=[],
-        blog_post=""
-    )
-    
+    initial_state = _create_initial_state(topic)
+
     # Prepare config
     runnable_config = RunnableConfig(configurable=config or {})
-    
+
     # Run the workflow asynchronously
     final_state = await workflow.ainvoke(initial_state, config=runnable_config)
-    
+
     # Return the blog post from the final state
-    return final_state["blog_post"] 
\ No newline at end of file
+    return final_state["blog_post"]
+
+
+async def stream_blog(topic: str, config: Dict[str, Any] = None) -> AsyncIterator[Dict[str, Any]]:
+    """블로그 생성 진행 상황을 이벤트로 스트리밍합니다.
+
+    LangGraph astream_events를 기반으로 다음 이벤트를 순서대로 전달합니다:
+    - node_start / node_end: 워크플로우 노드 전환
+    - section: 새로 완료된 BlogSection
+    - token: 최종 결합 단계에서 생성되는 토큰 조각
+    - result: 최종 블로그 콘텐츠 (마지막 이벤트)
+
+    Args:
+        topic: 블로그 주제
+        config: 워크플로우 구성 옵션
+
+    Yields:
+        "event" 키로 유형을 나타내는 이벤트 딕셔너리
+    """
+    workflow = get_compiled_graph("blog")
+    initial_state = _create_initial_state(topic)
+    runnable_config = RunnableConfig(configurable=config or {})
+
+    emitted_sections: Set[str] = set()
+    blog_post = ""
+
+    async for event in workflow.astream_events(initial_state, config=runnable_config, version="v2"):
+        kind = event["event"]
+        name = event.get("name", "")
+        node = event.get("metadata", {}).get("langgraph_node")
+
+        # Final state of the top-level graph
+        if kind == "on_chain_end" and not event.get("parent_ids"):
+            output = event["data"].get("output") or {}
+            if isinstance(output, dict):
+                blog_post = output.get("blog_post", blog_post)
+            continue
+
+        if kind == "on_chat_model_stream" and node in TOKEN_STREAM_NODES:
+            text = _chunk_text(event["data"].get("chunk"))
+            if text:
+                yield {"event": "token", "node": node, "content": text}
+            continue
+
+        # Only report the node runnables themselves, not their inner chains
+        if name != node:
+            continue
+
+        if kind == "on_chain_start":
+            yield {"event": "node_start", "node": node}
+
+        elif kind == "on_chain_end":
+            yield {"event": "node_end", "node": node}
+
+            # Commands (e.g. write_section) carry their state update in .update
+            output = event["data"].get("output")
+            update = output.update if isinstance(output, Command) else output
+            if not isinstance(update, dict):
+                continue
+
+            for key in SECTION_STATE_KEYS:
+                for section in update.get(key) or []:
+                    if isinstance(section, BlogSection) and section.name not in emitted_sections:
+                        emitted_sections.add(section.name)
+                        yield {"event": "section", "node": node, "section": section.model_dump()}
+
+    yield {"event": "result", "blog": blog_post}
@@ -0,0 +1,66 @@
+"""
+aiohttp 응답과 공유 세션을 흉내 내는 테스트용 객체
+
+get_http_session()을 패치하는 테스트에서 함께 사용합니다.
+"""
+import asyncio
+
+
+class FakeResponse:
+    """aiohttp 응답을 흉내 내는 테스트용 객체
+
+    async with로 사용하며, latency가 있으면 응답을 받기 전에 그만큼 기다립니다.
+    """
+
+    def __init__(self, status=200, payload=None, headers=None, latency=0):
+        self.status = status
+        self.payload = payload or {}
+        self.headers = headers or {}
+        self.latency = latency
+
+    async def json(self, content_type=None):
+        return dict(self.payload)
+
+    async def text(self):
+        return str(self.payload)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            error = Exception("Too Many Requests" if self.status == 429 else f"HTTP {self.status}")
+            error.status = self.status
+            raise error
+
+    async def __aenter__(self):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """요청을 기록하고 준비된 응답을 순서대로 반환하는 세션
+
+    준비된 응답이 떨어지면 respond(요청 파라미터 또는 본문)로 응답을 만들고,
+    respond가 없으면 빈 200 응답을 반환합니다.
+    """
+
+    def __init__(self, responses=None, respond=None):
+        self.responses = list(responses or [])
+        self.respond = respond
+        self.requests = []
+
+    def get(self, url, headers=None, params=None):
+        return self._next(params)
+
+    def post(self, url, headers=None, json=None):
+        return self._next(json)
+
+    def _next(self, request):
+        self.requests.append(request)
+        if self.responses:
+            return self.responses.pop(0)
+        if self.respond is not None:
+            return self.respond(request)
+        return FakeResponse()
@@ -0,0 +1,117 @@
+"""
+채팅 모델 팩토리 테스트
+"""
+import os
+import sys
+import asyncio
+import unittest
+from unittest import mock
+
+from pydantic import BaseModel
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common.config import providers
+
+
+class Answer(BaseModel):
+    text: str
+
+
+class TestChatModelFactory(unittest.TestCase):
+    """get_chat_model 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        providers.clear_chat_model_cache()
+        for key in providers._MODEL_CACHE_STATS:
+            providers._MODEL_CACHE_STATS[key] = 0
+
+        patcher = mock.patch("langchain.chat_models.init_chat_model", side_effect=lambda **kwargs: mock.MagicMock())
+        self.init_chat_model = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(providers.clear_chat_model_cache)
+
+    def test_same_options_reuse_model(self):
+        """같은 제공자, 모델, 온도, 옵션이면 같은 인스턴스를 재사용해야 함"""
+        first = providers.get_chat_model("anthropic", "claude", temperature=0,
+                                         thinking={"type": "enabled", "budget_tokens": 16_000})
+        second = providers.get_chat_model("anthropic", "claude", temperature=0,
+                                          thinking={"type": "enabled", "budget_tokens": 16_000})
+
+        self.assertIs(first, second)
+        self.assertEqual(self.init_chat_model.call_count, 1)
+        stats = providers.get_chat_model_pool_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_temperature_and_schema_are_part_of_the_key(self):
+        """온도나 구조화 출력 스키마가 다르면 별도 모델을 생성해야 함"""
+        plain = providers.get_chat_model("anthropic", "claude", temperature=0)
+        warm = providers.get_chat_model("anthropic", "claude", temperature=0.7)
+        structured = providers.get_chat_model("anthropic", "claude", temperature=0, structured_output=Answer)
+
+        self.assertIsNot(plain, warm)
+        self.assertIsNot(plain, structured)
+        self.assertEqual(self.init_chat_model.call_count, 3)
+        self.assertIs(providers.get_chat_model("anthropic", "claude", temperature=0, structured_output=Answer), structured)
+
+    def test_openai_models_share_http_pool(self):
+        """OpenAI 모델은 모델이 달라도 같은 HTTP 클라이언트를 공유해야 함"""
+        providers.get_chat_model("openai", "gpt-4o", temperature=0)
+        providers.get_chat_model("openai", "gpt-4o-mini", temperature=0)
+
+        first_kwargs = self.init_chat_model.call_args_list[0].kwargs
+        second_kwargs = self.init_chat_model.call_args_list[1].kwargs
+        self.assertIs(first_kwargs["http_client"], second_kwargs["http_client"])
+        self.assertIs(first_kwargs["http_async_client"], second_kwargs["http_async_client"])
+        self.assertIn("openai", providers.get_chat_model_pool_stats()["http_pools"])
+
+    def test_clear_closes_sync_and_async_clients(self):
+        """캐시를 비우면 동기와 비동기 HTTP 클라이언트를 모두 닫아야 함 (이벤트 루프 안팎)"""
+        providers.get_chat_model("openai", "gpt-4o", temperature=0)
+        http_client, http_async_client = providers._HTTP_CLIENTS["openai"]
+        providers.clear_chat_model_cache()
+
+        self.assertTrue(http_client.is_closed)
+        self.assertTrue(http_async_client.is_closed)
+
+        async def clear_in_loop():
+            providers.get_chat_model("openai", "gpt-4o", temperature=0)
+            clients = providers._HTTP_CLIENTS["openai"]
+            providers.clear_chat_model_cache()
+            await asyncio.gather(*providers._CLOSE_TASKS)
+            return clients
+
+        http_client, http_async_client = asyncio.run(clear_in_loop())
+        self.assertTrue(http_client.is_closed)
+        self.assertTrue(http_async_client.is_closed)
+
+    def test_async_client_uses_one_pool_per_event_loop(self):
+        """공유 비동기 클라이언트는 이벤트 루프마다 별도 연결 풀을 사용해야 함"""
+        providers.get_chat_model("openai", "gpt-4o", temperature=0)
+        http_async_client = self.init_chat_model.call_args.kwargs["http_async_client"]
+
+        async def loop_clients():
+            return http_async_client._client_for_loop(), http_async_client._client_for_loop()
+
+        def run_in_new_loop():
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(loop_clients())
+            finally:
+                loop.close()
+
+        first, same = run_in_new_loop()
+        second, _ = run_in_new_loop()
+
+        self.assertIs(first, same)
+        self.assertIsNot(first, second)
+        # 종료된 루프의 클라이언트는 더 이상 사용하지 않음
+        self.assertEqual(http_async_client.loop_clients(), [second])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+본문 추출 실행기 테스트
+"""
+import os
+import sys
+import signal
+import asyncio
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.search.utils.extraction import ExtractionExecutor, _ping, decode_html, extract_content, sniff_charset
+from src.core.search.manager.content_fetcher import ContentFetcher
+
+FIXTURE_DIR = os.path.join(project_root, 'tests', 'fixtures', 'html')
+
+
+def load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+        return f.read()
+
+
+class TestExtractContent(unittest.TestCase):
+    """extract_content 테스트 클래스"""
+
+    def test_decode_falls_back_to_cp949(self):
+        """charset이 없고 UTF-8이 아니면 CP949로 디코딩해야 함"""
+        raw = "<p>한국어</p>".encode('euc-kr')
+        self.assertEqual(decode_html(raw), "<p>한국어</p>")
+        self.assertEqual(decode_html(raw, 'euc-kr'), "<p>한국어</p>")
+        self.assertEqual(decode_html("<p>한국어</p>".encode('utf-8'), 'unknown-charset'), "<p>한국어</p>")
+
+    def test_truncated_utf8_is_not_decoded_as_cp949(self):
+        """최대 바이트 수에서 멀티바이트 문자 중간이 잘린 UTF-8 문서는 UTF-8로 디코딩해야 함"""
+        raw = "<p>한국어 본문</p>".encode('utf-8')
+        self.assertEqual(decode_html(raw[:8]), "<p>한")
+
+    def test_charset_sniffing_order(self):
+        """BOM, Content-Type 헤더, meta 태그 순서로 인코딩을 확인해야 함"""
+        meta = '<meta http-equiv="Content-Type" content="text/html; charset=EUC-KR">'.encode('ascii')
+
+        self.assertEqual(sniff_charset(meta), 'cp949')
+        self.assertEqual(sniff_charset(meta, 'utf-8'), 'utf-8')
+        self.assertEqual(sniff_charset(b'\xef\xbb\xbf' + meta, 'euc-kr'), 'utf-8-sig')
+        self.assertIsNone(sniff_charset(b'<p>plain</p>'))
+        self.assertEqual(decode_html(meta + "<p>똠방각하</p>".encode('cp949')), meta.decode() + "<p>똠방각하</p>")
+
+    def test_article_source(self):
+        """기사 추출은 정리된 본문과 발행일/언론사를 반환해야 함"""
+        result = extract_content(load_fixture('news_article.html'), 'article')
+
+        self.assertEqual(set(result), {'text', 'date', 'press'})
+        self.assertTrue(result['text'])
+        self.assertNotIn('\n', result['text'])
+
+    def test_naver_kin_source(self):
+        """지식iN 추출은 질문과 답변을 조합해야 함"""
+        html = (
+            "<div class='c-heading__title'>질문 제목</div>"
+            "<div class='c-heading__content'>질문 본문</div>"
+            "<div class='answer-content__item'>첫 답변</div>"
+        ).encode('utf-8')
+        result = extract_content(html, 'kin')
+
+        self.assertEqual(result['answers'], ['첫 답변'])
+        self.assertEqual(result['text'], "질문: 질문 제목\n\n질문 내용: 질문 본문\n\n답변 1: 첫 답변")
+
+    def test_fetcher_source_types(self):
+        """ContentFetcher는 URL 유형에 맞는 추출기를 사용해야 함"""
+        self.assertEqual(ContentFetcher._source_type('https://blog.naver.com/a/1'), 'naver_blog')
+        self.assertEqual(ContentFetcher._source_type('https://example.com'), 'web')
+
+        result = extract_content(load_fixture('naver_blog.html'), 'naver_blog')
+        self.assertTrue(result['content'])
+
+    def test_unknown_source_type(self):
+        """알 수 없는 소스 유형은 ValueError를 발생시켜야 함"""
+        with self.assertRaises(ValueError):
+            extract_content(b"<p>x</p>", 'unknown')
+
+
+class TestExtractionExecutor(unittest.TestCase):
+    """ExtractionExecutor 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.loop.close()
+
+    def test_inline_executor(self):
+        """workers가 0이면 프로세스 풀 없이 추출해야 함"""
+        executor = ExtractionExecutor(workers=0)
+        result = self.loop.run_until_complete(executor.extract(load_fixture('generic_page.html'), 'web'))
+
+        self.assertTrue(result['content'])
+        self.assertEqual(executor.stats()['started'], False)
+        self.assertEqual(executor.stats()['tasks'], 1)
+
+    def test_process_pool_matches_inline(self):
+        """워커 프로세스의 추출 결과는 직접 추출한 결과와 같아야 함"""
+        executor = ExtractionExecutor(workers=1)
+        self.addCleanup(executor.shutdown)
+        executor.warm_up()
+
+        raw = load_fixture('news_article.html')
+        result = self.loop.run_until_complete(executor.extract(raw, 'article', 'utf-8'))
+
+        self.assertEqual(result, extract_content(raw, 'article', 'utf-8'))
+        self.assertTrue(executor.stats()['started'])
+
+    def test_pool_is_rebuilt_after_worker_dies(self):
+        """워커가 죽어 풀이 깨지면 해당 요청만 실패하고 다음 요청은 새 풀에서 처리되어야 함"""
+        executor = ExtractionExecutor(workers=1)
+        self.addCleanup(executor.shutdown)
+        executor.warm_up()
+
+        broken_pool = executor._pool
+        pid = broken_pool.submit(_ping).result()
+        os.kill(pid, signal.SIGKILL)
+
+        raw = load_fixture('generic_page.html')
+        with self.assertRaises(BrokenProcessPool):
+            self.loop.run_until_complete(executor.extract(raw, 'web'))
+        self.assertIsNone(executor._pool)
+
+        result = self.loop.run_until_complete(executor.extract(raw, 'web'))
+        self.assertEqual(result, extract_content(raw, 'web'))
+        self.assertIsNot(executor._pool, broken_pool)
+        self.assertEqual(executor.stats()['pool_restarts'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+GoogleNews 단계별 수집(HTTP 우선, Selenium 대체) 테스트
+"""
+import os
+import sys
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.search.engines.google import DomainTierMemory, GoogleNews, _needs_javascript, decode_google_news_url
+
+ARTICLE_URL = "https://www.yna.co.kr/view/AKR1"
+GOOGLE_URL = "https://news.google.com/rss/articles/CBMi"
+# ARTICLE_URL이 인코딩된 기사 ID
+ENCODED_GOOGLE_URL = "https://news.google.com/rss/articles/CBMiH2h0dHBzOi8vd3d3LnluYS5jby5rci92aWV3L0FLUjHSAQA?oc=5"
+
+
+class TestDomainTierMemory(unittest.TestCase):
+    """DomainTierMemory 테스트 클래스"""
+
+    def test_switches_to_selenium_after_consecutive_failures(self):
+        """HTTP 수집이 연속으로 실패한 도메인은 Selenium을 먼저 사용해야 함"""
+        memory = DomainTierMemory(max_failures=2)
+        memory.record("a.com", "http", False)
+        self.assertEqual(memory.preferred_tier("a.com"), "http")
+        memory.record("a.com", "http", False)
+        self.assertEqual(memory.preferred_tier("a.com"), "selenium")
+        self.assertEqual(memory.preferred_tier("b.com"), "http")
+
+    def test_success_resets_and_retry_interval_expires(self):
+        """HTTP 성공은 실패 횟수를 초기화하고, retry_interval이 지나면 HTTP를 다시 시도해야 함"""
+        memory = DomainTierMemory(max_failures=1, retry_interval=0)
+        memory.record("a.com", "http", False)
+        self.assertEqual(memory.preferred_tier("a.com"), "http")
+
+        memory = DomainTierMemory(max_failures=2)
+        memory.record("a.com", "http", False)
+        memory.record("a.com", "http", True)
+        memory.record("a.com", "http", False)
+        self.assertEqual(memory.preferred_tier("a.com"), "http")
+        self.assertEqual(memory.stats()["a.com"]["http_successes"], 1)
+
+    def test_keeps_only_recent_domains(self):
+        """max_domains를 넘으면 가장 오래 기록하지 않은 도메인부터 제거해야 함"""
+        memory = DomainTierMemory(max_failures=1, max_domains=2)
+        memory.record("a.com", "http", False)
+        memory.record("b.com", "http", True)
+        memory.record("a.com", "http", False)
+        memory.record("c.com", "http", True)
+
+        self.assertEqual(sorted(memory.stats()), ["a.com", "c.com"])
+        self.assertEqual(memory.preferred_tier("a.com"), "selenium")
+
+
+class TestGoogleNewsFetch(unittest.TestCase):
+    """GoogleNews.fetch_content 단계 선택 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.loop = asyncio.new_event_loop()
+        self.news = GoogleNews(tier_memory=DomainTierMemory(max_failures=1))
+        self.news._resolve_url = AsyncMock(return_value=ARTICLE_URL)
+        self.selenium = patch.object(self.news, "_fetch_with_selenium",
+                                     return_value=("", "셀레니움 본문", {"title": "t"})).start()
+        self.addCleanup(patch.stopall)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.loop.close()
+
+    def fetch(self, url=GOOGLE_URL):
+        return self.loop.run_until_complete(self.news.fetch_content(url))
+
+    def test_http_tier_skips_browser(self):
+        """HTTP 수집에 성공하면 Selenium을 사용하지 않아야 함"""
+        self.news._fetch_with_http = AsyncMock(return_value=("", "HTTP 본문", {"title": "t"}))
+        _, text, metadata = self.fetch()
+
+        self.assertEqual((text, metadata["fetch_tier"]), ("HTTP 본문", "http"))
+        self.news._fetch_with_http.assert_awaited_once()
+        self.assertEqual(self.news._fetch_with_http.await_args.args[0], ARTICLE_URL)
+        self.selenium.assert_not_called()
+
+    def test_escalates_and_remembers_failing_domain(self):
+        """HTTP 수집이 실패하면 Selenium으로 재시도하고, 이후에는 HTTP 단계를 건너뛰어야 함"""
+        self.news._fetch_with_http = AsyncMock(return_value=None)
+        _, text, metadata = self.fetch()
+        self.assertEqual((text, metadata["fetch_tier"]), ("셀레니움 본문", "selenium"))
+
+        self.fetch()
+        self.news._fetch_with_http.assert_awaited_once()
+        self.assertEqual(self.selenium.call_count, 2)
+        self.assertEqual(self.selenium.call_args.args[0], ARTICLE_URL)
+
+    def test_decodes_publisher_url_without_redirect(self):
+        """기사 ID에 원문 URL이 있으면 리디렉션 확인 없이 언론사 도메인으로 기록해야 함"""
+        self.assertEqual(decode_google_news_url(ENCODED_GOOGLE_URL), ARTICLE_URL)
+        self.assertIsNone(decode_google_news_url(GOOGLE_URL))
+        self.assertIsNone(decode_google_news_url(ARTICLE_URL))
+
+        self.news._fetch_with_http = AsyncMock(return_value=None)
+        self.fetch(ENCODED_GOOGLE_URL)
+
+        self.news._resolve_url.assert_not_awaited()
+        self.assertEqual(self.news._fetch_with_http.await_args.args[0], ARTICLE_URL)
+        self.assertEqual(set(self.news.tier_memory.stats()), {"www.yna.co.kr"})
+
+    def test_selenium_final_url_is_recorded_for_publisher(self):
+        """원문 URL을 얻지 못하면 HTTP 단계 없이 Selenium을 사용하고, 최종 URL의 언론사 도메인에 기록해야 함"""
+        self.news._resolve_url = AsyncMock(return_value=GOOGLE_URL)
+        self.news._fetch_with_http = AsyncMock(return_value=None)
+        self.selenium.return_value = ("", "셀레니움 본문", {"title": "t", "final_url": ARTICLE_URL})
+
+        _, _, metadata = self.loop.run_until_complete(
+            self.news.fetch_content(GOOGLE_URL, publisher_url="https://www.yna.co.kr")
+        )
+
+        self.assertEqual(metadata["fetch_tier"], "selenium")
+        self.news._fetch_with_http.assert_not_awaited()
+        stats = self.news.tier_memory.stats()
+        self.assertNotIn("news.google.com", stats)
+        self.assertEqual(stats["www.yna.co.kr"]["selenium_successes"], 1)
+
+    def test_extract_and_js_detection(self):
+        """사이트별 셀렉터로 본문을 추출하고, 리디렉션되지 않은 Google 페이지는 JS 필요로 판단해야 함"""
+        html = "<html><title>제목</title><body><nav>메뉴</nav><div class='article'>" + "본문 " * 80 + "</div></body></html>"
+        text, metadata = self.news._extract_from_html(html, ARTICLE_URL)
+
+        self.assertEqual(metadata["title"], "제목")
+        self.assertTrue(text.startswith("본문"))
+        self.assertNotIn("메뉴", text)
+        self.assertTrue(_needs_javascript(html, GOOGLE_URL))
+        self.assertTrue(_needs_javascript("<noscript>Please enable JavaScript</noscript>", ARTICLE_URL))
+        self.assertFalse(_needs_javascript(html, ARTICLE_URL))
+
+
+if __name__ == "__main__":
+    unittest.main()
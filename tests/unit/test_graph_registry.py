@@ -0,0 +1,92 @@
+"""
+컴파일된 그래프 레지스트리 테스트
+"""
+import os
+import sys
+import threading
+import unittest
+from typing import TypedDict
+
+from langgraph.graph import END, StateGraph
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.workflows.graphs.registry import GraphRegistry
+
+
+class CounterState(TypedDict):
+    value: int
+
+
+class TestGraphRegistry(unittest.TestCase):
+    """GraphRegistry 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.build_count = 0
+
+        def build(step: int = 1):
+            self.build_count += 1
+            workflow = StateGraph(CounterState)
+            workflow.add_node("increment", lambda state: {"value": state["value"] + step})
+            workflow.set_entry_point("increment")
+            workflow.add_edge("increment", END)
+            return workflow.compile()
+
+        self.registry = GraphRegistry(builders={})
+        self.registry.register("counter", build)
+
+    def test_graph_is_compiled_once_and_reused(self):
+        """같은 이름과 옵션으로 요청하면 같은 그래프 인스턴스를 재사용해야 함"""
+        first = self.registry.get("counter")
+        second = self.registry.get("counter")
+
+        self.assertIs(first, second)
+        self.assertEqual(self.build_count, 1)
+        self.assertEqual(first.invoke({"value": 1})["value"], 2)
+        self.assertEqual(self.registry.stats()["hits"], 1)
+
+    def test_options_are_part_of_the_key(self):
+        """빌더 옵션이 다르면 별도로 컴파일해야 함"""
+        default = self.registry.get("counter")
+        step_ten = self.registry.get("counter", step=10)
+
+        self.assertIsNot(default, step_ten)
+        self.assertEqual(step_ten.invoke({"value": 1})["value"], 11)
+        self.assertIs(self.registry.get("counter", step=10), step_ten)
+        self.assertEqual(self.build_count, 2)
+
+    def test_concurrent_requests_build_once(self):
+        """여러 스레드가 동시에 요청해도 한 번만 컴파일해야 함"""
+        barrier = threading.Barrier(8)
+        graphs = []
+
+        def request():
+            barrier.wait()
+            graphs.append(self.registry.get("counter"))
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.build_count, 1)
+        self.assertTrue(all(graph is graphs[0] for graph in graphs))
+
+    def test_clear_and_unknown_graph(self):
+        """clear 후에는 다시 컴파일하고, 등록되지 않은 이름은 KeyError를 발생시켜야 함"""
+        self.registry.get("counter")
+        self.registry.clear("counter")
+        self.registry.get("counter")
+        self.assertEqual(self.build_count, 2)
+
+        with self.assertRaises(KeyError):
+            self.registry.get("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+요청 헤징 테스트
+"""
+import os
+import sys
+import asyncio
+import unittest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common.hedging import RequestHedger
+
+
+class TestRequestHedger(unittest.TestCase):
+    """RequestHedger 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.loop.close()
+
+    def make_request(self, delays):
+        """호출 순서대로 지정된 시간 뒤에 응답하는 요청 함수를 만듭니다."""
+        calls = []
+
+        async def request():
+            index = len(calls)
+            calls.append(index)
+            await asyncio.sleep(delays[index])
+            return index
+
+        return request, calls
+
+    def test_fast_request_is_not_hedged(self):
+        """헤지 지연 시간 안에 끝나면 중복 요청을 보내지 않아야 함"""
+        hedger = RequestHedger(budget=1.0, initial_delay=0.1)
+        request, calls = self.make_request([0.01])
+
+        self.assertEqual(self.loop.run_until_complete(hedger.run(request)), 0)
+        self.assertEqual(calls, [0])
+        self.assertEqual(hedger.stats()["hedged"], 0)
+
+    def test_slow_request_is_hedged_and_hedge_wins(self):
+        """느린 요청은 헤지하고 먼저 끝난 헤지 응답을 사용해야 함"""
+        hedger = RequestHedger(budget=1.0, initial_delay=0.05)
+        request, calls = self.make_request([1.0, 0.01])
+
+        self.assertEqual(self.loop.run_until_complete(hedger.run(request)), 1)
+        stats = hedger.stats()
+        self.assertEqual((stats["hedged"], stats["hedge_wins"]), (1, 1))
+        self.assertEqual(stats["win_rate"], 1.0)
+
+    def test_budget_limits_hedges(self):
+        """헤지 요청 비율은 예산을 넘지 않아야 함"""
+        hedger = RequestHedger(budget=0.25, initial_delay=0.01)
+
+        async def slow():
+            await asyncio.sleep(0.03)
+            return "ok"
+
+        for _ in range(8):
+            self.loop.run_until_complete(hedger.run(slow))
+
+        stats = hedger.stats()
+        self.assertEqual(stats["requests"], 8)
+        self.assertLessEqual(stats["hedge_rate"], 0.25)
+        self.assertGreater(stats["budget_denied"], 0)
+
+    def test_hedge_delay_tracks_percentile(self):
+        """표본이 충분하면 p90 지연 시간을 헤지 지연 시간으로 사용해야 함"""
+        hedger = RequestHedger(min_samples=10, initial_delay=5.0)
+        self.assertEqual(hedger.hedge_delay(), 5.0)
+
+        for latency in range(1, 11):
+            hedger.record(latency / 10)
+        self.assertAlmostEqual(hedger.hedge_delay(), 1.0)
+
+    def test_first_failure_falls_back_to_other_request(self):
+        """한 요청이 실패하면 다른 요청의 응답을 사용해야 함"""
+        hedger = RequestHedger(budget=1.0, initial_delay=0.02)
+        calls = []
+
+        async def request():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                await asyncio.sleep(0.05)
+                raise RuntimeError("실패")
+            await asyncio.sleep(0.1)
+            return "hedge"
+
+        self.assertEqual(self.loop.run_until_complete(hedger.run(request)), "hedge")
+
+    def test_cancelled_loser_is_recorded_as_lower_bound(self):
+        """헤지 요청에 져서 취소된 요청도 취소 시점까지의 지연 시간으로 기록되어야 함"""
+        hedger = RequestHedger(budget=1.0, initial_delay=0.05)
+        request, _ = self.make_request([1.0, 0.05])
+
+        self.loop.run_until_complete(hedger.run(request))
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        stats = hedger.stats()
+        self.assertEqual((stats["samples"], stats["cancelled"]), (2, 1))
+        # 취소된 1차 요청의 하한값(약 0.1초)이 가장 큰 표본이어야 함
+        self.assertGreaterEqual(max(hedger._latencies), 0.09)
+        self.assertLess(max(hedger._latencies), 1.0)
+
+    def test_failures_are_not_latency_samples(self):
+        """예외로 끝난 요청은 지연 시간 표본이 아닌 실패로 기록되어야 함"""
+        hedger = RequestHedger(budget=0.0, initial_delay=1.0)
+
+        async def failing():
+            raise RuntimeError("실패")
+
+        with self.assertRaises(RuntimeError):
+            self.loop.run_until_complete(hedger.run(failing))
+
+        stats = hedger.stats()
+        self.assertEqual((stats["samples"], stats["failures"]), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
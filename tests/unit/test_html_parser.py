@@ -0,0 +1,74 @@
+"""
+HTML 파서 백엔드 테스트
+"""
+import os
+import re
+import sys
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.search.utils.html_parser import (
+    available_backends, extract_article, get_parser_backend, make_soup, normalize_whitespace
+)
+
+FIXTURE_DIR = os.path.join(project_root, 'tests', 'fixtures', 'html')
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class TestParserBackend(unittest.TestCase):
+    """파서 백엔드 선택 테스트 클래스"""
+
+    def test_html_parser_is_always_available(self):
+        """html.parser는 항상 마지막 대체 백엔드로 사용 가능해야 함"""
+        self.assertEqual(available_backends()[-1], "html.parser")
+        self.assertIn(get_parser_backend(), available_backends())
+
+    def test_unavailable_backend_falls_back(self):
+        """설치되지 않은 백엔드를 요청하면 사용 가능한 가장 빠른 백엔드를 사용해야 함"""
+        with patch.dict(os.environ, {"HTML_PARSER": "not-installed"}):
+            self.assertEqual(get_parser_backend(), available_backends()[0])
+        self.assertEqual(get_parser_backend("html.parser"), "html.parser")
+        self.assertIsNotNone(make_soup("<p>x</p>", "selectolax").p)
+
+
+class TestExtractArticle(unittest.TestCase):
+    """extract_article 테스트 클래스"""
+
+    def test_news_fixture_with_every_backend(self):
+        """모든 백엔드에서 본문과 메타데이터를 같게 추출하고 스크립트는 제외해야 함"""
+        html = load_fixture('news_article.html')
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                text, metadata = extract_article(
+                    html, ['article', '.article-body'],
+                    {'date': ['.t11', '.date'], 'press': ['.press'], 'author': ['.byline']},
+                    backend=backend
+                )
+                self.assertIn("고대역폭 메모리", text)
+                self.assertNotIn("많이 본 뉴스", text)
+                self.assertNotIn("dataLayer", text)
+                self.assertEqual(metadata, {'date': '2025-03-16 10:24', 'press': '테스트경제', 'author': None})
+
+    def test_falls_back_to_whole_document(self):
+        """본문 선택자가 일치하지 않으면 문서 전체 텍스트를 사용해야 함"""
+        text, _ = extract_article(load_fixture('generic_page.html'), ['article'], backend='html.parser')
+        self.assertIn("Python asyncio guide", text)
+
+    def test_normalize_whitespace(self):
+        """줄 단위 공백 제거와 연속 공백 압축 결과가 기존 정제 방식과 같아야 함"""
+        text = "  첫 줄\n\n\t둘째   줄 \r\n  \n셋째　줄  "
+        legacy = re.sub(r'\s+', ' ', '\n'.join(line.strip() for line in text.split('\n') if line.strip()))
+        self.assertEqual(normalize_whitespace(text), legacy)
+
+
+if __name__ == "__main__":
+    unittest.main()
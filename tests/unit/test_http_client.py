@@ -0,0 +1,129 @@
+"""
+공유 HTTP 클라이언트 관리자 테스트
+"""
+import os
+import sys
+import asyncio
+import unittest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common.config import HTTPConfiguration
+from src.common.exceptions import UnsupportedContentTypeError
+from src.common.http_client import HTTPSessionManager, read_html_body
+
+
+class FakeStream:
+    """aiohttp StreamReader 대용 객체 (읽은 청크 수 기록)"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.chunks_read = 0
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self.body), size):
+            self.chunks_read += 1
+            yield self.body[start:start + size]
+
+
+class FakeResponse:
+    """aiohttp 응답 대용 객체"""
+
+    def __init__(self, body: bytes, content_type: str = "text/html; charset=utf-8"):
+        self.headers = {"Content-Type": content_type} if content_type else {}
+        self.content_type = content_type.split(";")[0] if content_type else "application/octet-stream"
+        self.content = FakeStream(body)
+        self.url = "https://example.com"
+
+
+class TestHTTPSessionManager(unittest.TestCase):
+    """HTTPSessionManager 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.manager = HTTPSessionManager(HTTPConfiguration(http_limit=20, http_limit_per_host=4, http_dns_ttl=120))
+
+    def test_session_is_shared_within_loop(self):
+        """같은 이벤트 루프에서는 같은 세션과 커넥터 설정을 재사용해야 함"""
+        async def run():
+            first = self.manager.get_session()
+            second = self.manager.get_session()
+            connector = first.connector
+            stats = self.manager.stats()
+            await self.manager.close()
+            return first, second, connector, stats
+
+        first, second, connector, stats = asyncio.run(run())
+        self.assertIs(first, second)
+        self.assertTrue(first.closed)
+        self.assertEqual(connector.limit, 20)
+        self.assertEqual(connector.limit_per_host, 4)
+        self.assertEqual(stats["sessions"], 1)
+
+    def test_new_loop_gets_new_session(self):
+        """이벤트 루프가 바뀌면 새 세션을 만들고, 종료된 루프의 세션은 정리해야 함"""
+        async def get_session():
+            return self.manager.get_session()
+
+        # nest_asyncio가 적용된 경우 asyncio.run이 루프를 재사용하므로 루프를 직접 생성
+        first_loop = asyncio.new_event_loop()
+        first = first_loop.run_until_complete(get_session())
+        first_loop.run_until_complete(first.close())
+        first_loop.close()
+
+        async def run_second():
+            session = self.manager.get_session()
+            count = len(self.manager._sessions)
+            await self.manager.close()
+            return session, count
+
+        second_loop = asyncio.new_event_loop()
+        second, count = second_loop.run_until_complete(run_second())
+        second_loop.close()
+        self.assertIsNot(first, second)
+        self.assertEqual(count, 1)
+        self.assertEqual(self.manager.stats()["sessions"], 0)
+
+    def test_config_values_are_cast_from_env_strings(self):
+        """환경 변수 문자열 값은 숫자로 변환되어야 함"""
+        config = HTTPConfiguration(http_limit="50", http_keepalive_timeout="15")
+        self.assertEqual(config.http_limit, 50)
+        self.assertEqual(config.http_keepalive_timeout, 15.0)
+
+
+class TestReadHTMLBody(unittest.TestCase):
+    """read_html_body 테스트 클래스"""
+
+    def read(self, response, max_bytes):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(read_html_body(response, max_bytes, chunk_size=4))
+        finally:
+            loop.close()
+
+    def test_stops_reading_at_byte_cap(self):
+        """최대 바이트 수를 넘으면 나머지 청크를 읽지 않고 잘라야 함"""
+        response = FakeResponse(b"0123456789" * 10)
+        body, truncated = self.read(response, 10)
+
+        self.assertEqual(body, b"0123456789")
+        self.assertTrue(truncated)
+        self.assertEqual(response.content.chunks_read, 3)
+
+    def test_reads_whole_small_body(self):
+        """최대 바이트 수 이하의 본문은 그대로 반환해야 함 (Content-Type이 없으면 HTML로 간주)"""
+        self.assertEqual(self.read(FakeResponse(b"<p>ok</p>", content_type=""), 100), (b"<p>ok</p>", False))
+
+    def test_rejects_non_html_before_reading(self):
+        """HTML이 아닌 콘텐츠 유형은 본문을 읽기 전에 거부해야 함"""
+        response = FakeResponse(b"%PDF-1.7", content_type="application/pdf")
+        with self.assertRaises(UnsupportedContentTypeError):
+            self.read(response, 100)
+        self.assertEqual(response.content.chunks_read, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+블로그 생성 작업 큐 테스트
+"""
+import os
+import sys
+import asyncio
+import tempfile
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common.exceptions import JobQueueFullError, JobQueueUnavailableError
+from src.jobs import BlogJobQueue, JobEventBroker, MemoryJobStore, SQLiteJobStore
+
+
+class TestJobStores(unittest.TestCase):
+    """작업 저장소 테스트 클래스"""
+
+    def test_memory_store_evicts_finished_jobs_over_capacity(self):
+        """메모리 저장소는 용량 초과 시 완료된 작업만 LRU 순서로 제거해야 함"""
+        store = MemoryJobStore(max_jobs=2, ttl_seconds=3600)
+        store.create({"job_id": "a", "status": "pending"})
+        store.create({"job_id": "b", "status": "pending"})
+        store.update("a", status="completed")
+        store.create({"job_id": "c", "status": "pending"})
+
+        self.assertIsNone(store.get("a"))
+        self.assertIsNotNone(store.get("b"))
+        self.assertIsNotNone(store.get("c"))
+
+    def test_memory_store_ttl_eviction(self):
+        """TTL이 지난 완료 작업은 evict_expired로 제거되어야 함"""
+        store = MemoryJobStore(max_jobs=10, ttl_seconds=0)
+        store.create({"job_id": "a", "status": "pending"})
+        store.create({"job_id": "b", "status": "pending"})
+        store.update("a", status="failed")
+
+        self.assertEqual(store.evict_expired(), 1)
+        self.assertIsNone(store.get("a"))
+        self.assertEqual([job["job_id"] for job in store.list_unfinished()], ["b"])
+
+    def test_sqlite_store_persists_jobs(self):
+        """SQLite 저장소는 다시 열어도 작업을 유지해야 함"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "jobs.sqlite3")
+            store = SQLiteJobStore(path=path, ttl_seconds=3600)
+            store.create({"job_id": "a", "status": "pending", "topic": "골밀도"})
+            store.update("a", status="running")
+            store.close()
+
+            reopened = SQLiteJobStore(path=path, ttl_seconds=0)
+            self.assertEqual(reopened.get("a")["topic"], "골밀도")
+            self.assertEqual(len(reopened.list_unfinished()), 1)
+
+            reopened.update("a", status="completed", blog="본문")
+            self.assertEqual(reopened.evict_expired(), 1)
+            self.assertIsNone(reopened.get("a"))
+            reopened.close()
+
+
+class TestBlogJobQueue(unittest.TestCase):
+    """BlogJobQueue 테스트 클래스"""
+
+    def test_submit_before_start_is_rejected(self):
+        """시작 전 작업 제출은 JobQueueUnavailableError를 발생시켜야 함"""
+        job_queue = BlogJobQueue(mock.AsyncMock(return_value="blog"), MemoryJobStore())
+        with self.assertRaises(JobQueueUnavailableError):
+            job_queue.submit("주제")
+
+    def test_admission_control_and_completion(self):
+        """큐가 가득 차면 거절하고, 접수된 작업은 완료되어야 함"""
+        async def run():
+            release = asyncio.Event()
+
+            async def handler(topic, config):
+                await release.wait()
+                return f"{topic} 블로그"
+
+            job_queue = BlogJobQueue(handler, MemoryJobStore(), workers=1, queue_size=1)
+            await job_queue.start()
+
+            first = job_queue.submit("첫 번째")
+            await asyncio.sleep(0)  # 워커가 첫 작업을 가져가도록 양보
+            second = job_queue.submit("두 번째")
+            with self.assertRaises(JobQueueFullError):
+                job_queue.submit("세 번째")
+
+            release.set()
+            await job_queue._queue.join()
+            results = [job_queue.get(first["job_id"]), job_queue.get(second["job_id"])]
+            await job_queue.stop()
+            return results
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first["status"], "completed")
+        self.assertEqual(first["blog"], "첫 번째 블로그")
+        self.assertEqual(second["status"], "completed")
+
+    def test_failed_job_is_recorded(self):
+        """처리 중 예외가 발생하면 작업이 failed 상태가 되어야 함"""
+        async def run():
+            job_queue = BlogJobQueue(mock.AsyncMock(side_effect=RuntimeError("boom")), MemoryJobStore())
+            await job_queue.start()
+            job = job_queue.submit("주제")
+            await job_queue._queue.join()
+            result = job_queue.get(job["job_id"])
+            await job_queue.stop()
+            return result
+
+        result = asyncio.run(run())
+        self.assertEqual(result["status"], "failed")
+        self.assertIn("boom", result["message"])
+
+    def test_secret_config_is_not_persisted(self):
+        """비밀 키는 저장소 파일에 기록하지 않고 handler에는 원래 구성을 전달해야 함"""
+        config = {"searcher_api_key": "tvly-secret", "number_of_queries": 2,
+                  "search_api_config": {"api_key": "exa-secret", "max_results": 3}}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "jobs.sqlite3")
+
+            async def run():
+                handler = mock.AsyncMock(return_value="blog")
+                job_queue = BlogJobQueue(handler, SQLiteJobStore(path=path))
+                await job_queue.start()
+                job = job_queue.submit("주제", config)
+                await job_queue._queue.join()
+                stored = job_queue.get(job["job_id"])
+                await job_queue.stop()
+                return handler, job, stored
+
+            handler, job, stored = asyncio.run(run())
+            with open(path, "rb") as f:
+                raw = f.read()
+
+        handler.assert_awaited_once_with("주제", config)
+        expected = {"number_of_queries": 2, "search_api_config": {"max_results": 3}}
+        self.assertEqual(job["config"], expected)
+        self.assertEqual(stored["config"], expected)
+        self.assertNotIn(b"secret", raw)
+
+    def test_unfinished_jobs_are_recovered_on_start(self):
+        """SQLite 저장소에 남은 미완료 작업은 시작 시 다시 실행되어야 함"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "jobs.sqlite3")
+            store = SQLiteJobStore(path=path)
+            store.create({"job_id": "left-over", "status": "running", "topic": "재시작", "config": {}})
+            store.close()
+
+            async def run():
+                job_queue = BlogJobQueue(mock.AsyncMock(return_value="blog"), SQLiteJobStore(path=path))
+                await job_queue.start()
+                await job_queue._queue.join()
+                result = job_queue.get("left-over")
+                await job_queue.stop()
+                return result
+
+            self.assertEqual(asyncio.run(run())["status"], "completed")
+
+    def test_restart_after_stop_reopens_store(self):
+        """stop() 후 다시 start()하면 닫힌 SQLite 저장소를 다시 열어 작업을 처리해야 함"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            job_queue = BlogJobQueue(mock.AsyncMock(return_value="blog"),
+                                     SQLiteJobStore(path=os.path.join(tmp_dir, "jobs.sqlite3")))
+
+            async def run_once():
+                await job_queue.start()
+                job = job_queue.submit("주제")
+                await job_queue._queue.join()
+                result = job_queue.get(job["job_id"])
+                await job_queue.stop()
+                return result
+
+            self.assertEqual(asyncio.run(run_once())["status"], "completed")
+            self.assertEqual(asyncio.run(run_once())["status"], "completed")
+
+    def test_progress_events_are_streamed(self):
+        """이벤트 브로커 구독자는 상태, 진행, 완료 이벤트를 순서대로 받아야 함"""
+        async def run():
+            async def handler(topic, config, on_event):
+                on_event({"event": "node_start", "node": "plan_sections"})
+                on_event({"event": "token", "node": "combine_blog_sections", "content": "본문"})
+                return "본문"
+
+            broker = JobEventBroker(retention_seconds=0)
+            job_queue = BlogJobQueue(handler, MemoryJobStore(), events=broker)
+            await job_queue.start()
+            job = job_queue.submit("주제")
+            events = [event async for event in broker.subscribe(job["job_id"])]
+            await job_queue.stop()
+            return events
+
+        events = asyncio.run(run())
+        self.assertEqual(
+            [event["event"] for event in events],
+            ["status", "status", "node_start", "token", "done"]
+        )
+        self.assertEqual(events[-1]["blog"], "본문")
+
+
+    def test_token_events_are_not_replayed(self):
+        """늦게 연결한 구독자는 토큰 이벤트가 많아도 처음 상태 이벤트부터 받아야 함"""
+        async def run():
+            broker = JobEventBroker(max_history=10, retention_seconds=0)
+            broker.publish("job", {"event": "status", "status": "running"})
+            broker.publish("job", {"event": "node_start", "node": "combine_blog_sections"})
+            for index in range(100):
+                broker.publish("job", {"event": "token", "node": "combine_blog_sections", "content": str(index)})
+            broker.publish("job", {"event": "done", "blog": "본문"})
+            return [event async for event in broker.subscribe("job")]
+
+        events = asyncio.run(run())
+        self.assertEqual([event["event"] for event in events], ["status", "node_start", "done"])
+
+
+if __name__ == "__main__":
+    unittest.main()
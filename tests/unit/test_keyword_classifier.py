@@ -28,7 +28,8 @@ class TestKeywordClassifier(unittest.TestCase):
         # 테스트용 분류기 설정
         config = KeywordClassifierConfig(
             llm_model="gpt-4o-mini",
-            llm_temperature=0
+            llm_temperature=0,
+            search_cache_path=""
         )
         self.classifier = KeywordClassifier(config=config)
     
@@ -0,0 +1,232 @@
+"""
+키워드 일괄 분류 및 속도 제한 테스트
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import asyncio
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common.rate_limit import AsyncRateLimiter
+from src.core.classifier import KeywordClassifier, KeywordClassifierConfig, KeywordType
+from src.core.search.engines.naver import naver_search_async
+from src.core.search.manager.search_cache import SearchResultCache, get_search_cache
+
+from http_fakes import FakeResponse, FakeSession
+
+
+class TestAsyncRateLimiter(unittest.TestCase):
+    """AsyncRateLimiter 테스트 클래스"""
+
+    def test_rate_is_enforced_after_burst(self):
+        """버스트 이후 요청은 rate에 맞춰 지연되어야 함"""
+        async def run():
+            limiter = AsyncRateLimiter(rate=50, burst=1)
+            started = time.monotonic()
+            await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+            return time.monotonic() - started
+
+        # 첫 요청은 즉시, 나머지 5개는 0.02초 간격
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+    def test_zero_rate_disables_limit(self):
+        """rate가 0이면 기다리지 않아야 함"""
+        limiter = AsyncRateLimiter(rate=0)
+        self.assertEqual(asyncio.run(limiter.acquire()), 0.0)
+
+
+class TestClassifyMany(unittest.TestCase):
+    """KeywordClassifier.classify_many 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.classifier = KeywordClassifier(client_id="test_client_id", client_secret="test_client_secret", use_cache=False)
+
+    def test_classify_many_keeps_order_and_limits_concurrency(self):
+        """결과는 입력 순서를 유지하고, 동시 실행 수는 concurrency 이하여야 함"""
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_search(keyword, search_type, **kwargs):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            if search_type == "blog" and keyword.startswith("정보"):
+                return {"items": [{"title": "방법", "description": "설명"}]}
+            if search_type == "shop" and keyword.startswith("상품"):
+                return {"items": [{"title": "상품", "category1": "생활"}]}
+            return {"items": []}
+
+        keywords = ["정보1", "상품1", "정보2", "상품2", "정보3", "상품3"]
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=fake_search):
+            results = self.classifier.classify_many(keywords, concurrency=2, qps=0)
+
+        self.assertEqual([result["keyword"] for result in results], keywords)
+        self.assertEqual(results[0]["type"], KeywordType.INFORMATION)
+        self.assertEqual(results[1]["type"], KeywordType.PRODUCT)
+        # 키워드 2개 x (블로그, 쇼핑) 검색
+        self.assertLessEqual(in_flight["max"], 4)
+
+    def test_search_error_marks_keyword_failed(self):
+        """검색 오류가 발생하면 결과 없음으로 분류하지 않고 오류를 붙여 실패로 표시해야 함"""
+        async def failing_search(keyword, search_type, **kwargs):
+            raise RuntimeError("boom")
+
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=failing_search):
+            results = self.classifier.classify_many(["키워드"], qps=0)
+
+        self.assertEqual(results[0]["type"], KeywordType.UNKNOWN)
+        self.assertEqual(results[0]["confidence"], 0.0)
+        self.assertIn("boom", results[0]["error"])
+
+    def test_rate_limited_shop_search_is_not_classified(self):
+        """쇼핑 검색만 실패해도 블로그 결과만으로 정보성으로 분류하지 않아야 함"""
+        async def shop_limited(keyword, search_type, **kwargs):
+            if search_type == "shop":
+                return {"items": [], "error": "API 요청 오류: 429"}
+            return {"items": [{"title": "방법", "description": "설명"}]}
+
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=shop_limited):
+            results = self.classifier.classify_many(["키워드"], qps=0)
+
+        self.assertEqual(results[0]["type"], KeywordType.UNKNOWN)
+        self.assertEqual(results[0]["error"], "shop: API 요청 오류: 429")
+
+    def test_sync_call_closes_sessions_inside_running_loop(self):
+        """이벤트 루프 안에서도 동작하고, 호출마다 연 공유 세션을 닫아야 함"""
+        async def fake_search(keyword, search_type, **kwargs):
+            return {"items": []}
+
+        async def call_from_loop():
+            return self.classifier.classify_many(["키워드"], qps=0)
+
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=fake_search), \
+                patch("src.core.classifier.keyword_classifier.close_http_sessions") as close_sessions:
+            self.classifier.classify_many(["키워드"], qps=0)
+            results = asyncio.run(call_from_loop())
+
+        self.assertEqual(results[0]["keyword"], "키워드")
+        self.assertEqual(close_sessions.await_count, 2)
+
+
+class TestNaverSearchAsync(unittest.TestCase):
+    """naver_search_async 재시도 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        os.environ["NAVER_CLIENT_ID"] = "test_client_id"
+        os.environ["NAVER_CLIENT_SECRET"] = "test_client_secret"
+        self.limiter = AsyncRateLimiter(1000)
+
+    def search(self, session, **kwargs):
+        with patch("src.core.search.engines.naver.get_http_session", return_value=session):
+            return asyncio.run(naver_search_async("골밀도", "shop", limiter=self.limiter, backoff=0, **kwargs))
+
+    def test_retries_after_rate_limit(self):
+        """429 응답은 속도 제한기를 낮춘 뒤 재시도해야 함"""
+        session = FakeSession([FakeResponse(429, headers={"Retry-After": "0"}), FakeResponse(200, {"items": [{"title": "A"}]})])
+        result = self.search(session)
+
+        self.assertEqual(result["items"], [{"title": "A"}])
+        self.assertEqual(len(session.requests), 2)
+        self.assertLess(self.limiter.rate, 1000)
+
+    def test_returns_error_after_retries(self):
+        """재시도 후에도 429이면 오류를 반환해야 함"""
+        session = FakeSession([FakeResponse(429, headers={"Retry-After": "0"}) for _ in range(3)])
+        result = self.search(session, max_retries=2)
+
+        self.assertEqual(result["error"], "API 요청 오류: 429")
+        self.assertEqual(len(session.requests), 3)
+
+
+class TestClassifyBatch(unittest.TestCase):
+    """KeywordClassifier.classify_batch 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.results_path = os.path.join(self.tmpdir.name, "classifications.jsonl")
+        self.classifier = KeywordClassifier(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            save_results=True,
+            config=KeywordClassifierConfig(results_path=self.results_path),
+            cache=SearchResultCache(path=None)
+        )
+        self.calls = []
+
+    async def fake_search(self, keyword, search_type, **kwargs):
+        self.calls.append((keyword, search_type))
+        if search_type == "blog":
+            return {"items": [{"title": "방법", "description": "설명"}]}
+        return {"items": []}
+
+    def test_duplicates_share_one_classification(self):
+        """중복 키워드는 한 번만 검색하고 같은 결과를 반환해야 함"""
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=self.fake_search):
+            results = self.classifier.classify_batch(["골밀도", "견과류", "골밀도 "], qps=0)
+
+        self.assertEqual([result["keyword"] for result in results], ["골밀도", "견과류", "골밀도"])
+        self.assertIs(results[0], results[2])
+        self.assertEqual(len(self.calls), 4)
+
+    def test_overlapping_batches_hit_cache(self):
+        """이미 검색한 키워드는 캐시된 원본 응답으로 다시 분류해야 함"""
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=self.fake_search):
+            self.classifier.classify_batch(["골밀도", "견과류"], qps=0)
+            results = self.classifier.classify_batch(["견과류", "유팡"], qps=0)
+
+        self.assertEqual(results[0]["type"], KeywordType.INFORMATION)
+        self.assertEqual(self.calls[4:], [("유팡", "blog"), ("유팡", "shop")])
+
+    def test_default_cache_is_on_disk_and_separate(self):
+        """기본 캐시는 설정한 SQLite 파일에 저장되어 새 분류기에서도 적중하고, 전역 검색 캐시와 분리되어야 함"""
+        config = KeywordClassifierConfig(search_cache_path=os.path.join(self.tmpdir.name, "naver.sqlite3"))
+        first = KeywordClassifier(client_id="test_client_id", client_secret="test_client_secret", config=config)
+        second = KeywordClassifier(client_id="test_client_id", client_secret="test_client_secret", config=config)
+
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=self.fake_search):
+            first.classify_batch(["골밀도"], qps=0)
+            results = second.classify_batch(["골밀도"], qps=0)
+
+        self.assertEqual(results[0]["type"], KeywordType.INFORMATION)
+        self.assertEqual(len(self.calls), 2)
+        self.assertIsNot(first.cache, get_search_cache())
+
+    def test_errors_are_not_cached(self):
+        """오류 응답은 캐시하지 않고 다음 분류에서 다시 검색해야 함"""
+        async def failing_search(keyword, search_type, **kwargs):
+            self.calls.append((keyword, search_type))
+            return {"items": [], "error": "API 요청 오류: 500"}
+
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=failing_search):
+            self.classifier.classify_batch(["골밀도"], qps=0)
+            self.classifier.classify_batch(["골밀도"], qps=0)
+
+        self.assertEqual(len(self.calls), 4)
+
+    def test_results_are_appended_to_one_jsonl_file(self):
+        """분류 결과는 검색마다 파일을 만들지 않고 하나의 JSONL 파일에 추가되어야 함"""
+        with patch("src.core.classifier.keyword_classifier.naver_search_async", side_effect=self.fake_search):
+            self.classifier.classify_batch(["골밀도", "견과류"], qps=0)
+            self.classifier.classify_batch(["유팡"], qps=0)
+
+        with open(self.results_path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row["keyword"] for row in rows], ["골밀도", "견과류", "유팡"])
+        self.assertEqual(rows[0]["type"], "information")
+        self.assertEqual(os.listdir(self.tmpdir.name), ["classifications.jsonl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
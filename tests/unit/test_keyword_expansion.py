@@ -0,0 +1,86 @@
+"""
+연관 키워드 동시 조회(aget_relkeywords, RelatedKeywordExpander) 테스트
+"""
+import os
+import sys
+import asyncio
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common.rate_limit import AsyncRateLimiter
+from src.core.search.utils.naver_api_utils import RelatedKeywordExpander, aget_relkeywords
+
+from http_fakes import FakeResponse, FakeSession
+
+
+def keyword_session(responses=None):
+    """준비된 응답 뒤에는 시드 키워드를 그대로 연관 키워드로 돌려주는 세션"""
+    def respond(params):
+        hints = params["hintKeywords"].split(",")
+        return FakeResponse(200, {"keywordList": [{"relKeyword": hint} for hint in hints]})
+    return FakeSession(responses, respond)
+
+
+class TestRelatedKeywordExpansion(unittest.TestCase):
+    """연관 키워드 동시 조회 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.loop = asyncio.new_event_loop()
+        self.limiter = AsyncRateLimiter(1000)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.loop.close()
+
+    def run_with_session(self, session, coro_factory):
+        with patch("src.core.search.utils.naver_api_utils.get_http_session", return_value=session):
+            return self.loop.run_until_complete(coro_factory())
+
+    def test_retries_after_rate_limit(self):
+        """429 응답은 속도 제한기를 낮춘 뒤 재시도해야 함"""
+        session = keyword_session([FakeResponse(429, headers={"Retry-After": "0"})])
+        result = self.run_with_session(session, lambda: aget_relkeywords(["캠핑"], self.limiter, backoff=0))
+
+        self.assertEqual(result, {"keywordList": [{"relKeyword": "캠핑"}]})
+        self.assertEqual(len(session.requests), 2)
+        self.assertLess(self.limiter.rate, 1000)
+
+    def test_client_error_is_not_retried(self):
+        """429가 아닌 4xx 응답은 재시도하지 않고 오류를 반환해야 함"""
+        session = keyword_session([FakeResponse(400, {"title": "bad request"})])
+        result = self.run_with_session(session, lambda: aget_relkeywords(["캠핑"], self.limiter, backoff=0))
+
+        self.assertEqual(result["error"], "API 오류: 400")
+        self.assertEqual(len(session.requests), 1)
+
+    def test_batches_hint_keywords(self):
+        """시드 키워드를 batch_size개씩 묶어 조회하고 진행 상황을 알려야 함"""
+        expander = RelatedKeywordExpander(batch_size=5, concurrency=2)
+        expander.limiter = self.limiter
+        session = keyword_session()
+        progress = []
+        seeds = [f"키워드{i}" for i in range(12)] + ["키워드0", " "]
+
+        results = self.run_with_session(
+            session, lambda: expander.expand(seeds, on_progress=lambda done, total: progress.append((done, total)))
+        )
+
+        self.assertEqual([len(params["hintKeywords"].split(",")) for params in session.requests], [5, 5, 2])
+        self.assertEqual([result["hints"] for result in results][2], ["키워드10", "키워드11"])
+        self.assertEqual(sum(len(result["keywordList"]) for result in results), 12)
+        self.assertEqual(progress, [(1, 3), (2, 3), (3, 3)])
+
+    def test_batch_size_is_capped(self):
+        """batch_size는 API 제한(5개)을 넘지 않아야 함"""
+        self.assertEqual(RelatedKeywordExpander(batch_size=20).batch_size, 5)
+        self.assertEqual(RelatedKeywordExpander(batch_size=0).batch_size, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
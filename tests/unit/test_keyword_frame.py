@@ -0,0 +1,91 @@
+"""
+연관 키워드 DataFrame 후처리(normalize_keyword_frame)와 Parquet 저장 테스트
+"""
+import os
+import sys
+import tempfile
+import unittest
+import importlib.util
+
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.search.engines.naver_keywords import (
+    NaverKeywordCollector,
+    load_keyword_frame,
+    normalize_keyword_frame
+)
+
+HAS_PARQUET_ENGINE = any(importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet"))
+
+
+def api_row(keyword, pc, mobile, comp="중간", ctr=1.5):
+    return {
+        "relKeyword": keyword,
+        "monthlyPcQcCnt": pc,
+        "monthlyMobileQcCnt": mobile,
+        "monthlyAvePcClkCnt": 3.2,
+        "monthlyAveMobileClkCnt": 10,
+        "monthlyAvePcCtr": ctr,
+        "monthlyAveMobileCtr": 2.1,
+        "compIdx": comp,
+        "plAvgDepth": 15,
+    }
+
+
+class TestNormalizeKeywordFrame(unittest.TestCase):
+    """normalize_keyword_frame 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.raw = NaverKeywordCollector._keyword_rows_to_df([
+            api_row("캠핑", 12000, "< 10"),
+            api_row("캠핑", 12000, "< 10"),
+            api_row("캠핑의자", "< 10", 350, comp="높음"),
+            api_row("캠핑카", 80, 90, comp="알수없음", ctr=None),
+        ])
+
+    def test_fixed_dtypes(self):
+        """검색수는 int32, 클릭수/클릭률은 float32, 경쟁정도는 순서형 범주여야 함"""
+        df = normalize_keyword_frame(self.raw)
+
+        self.assertEqual(list(df.index), ["캠핑", "캠핑의자", "캠핑카"])
+        self.assertEqual(str(df["월간검색수_PC"].dtype), "int32")
+        self.assertEqual(str(df["월평균클릭률_PC"].dtype), "float32")
+        self.assertTrue(df["경쟁정도"].cat.ordered)
+        self.assertEqual(df.loc["캠핑", "월간검색수_모바일"], 10)
+        self.assertEqual(df.loc["캠핑의자", "월간검색수_PC"], 10)
+        self.assertEqual(list(df["경쟁정도"].cat.codes), [1, 2, -1])
+
+    def test_dropna_removes_incomplete_rows(self):
+        """dropna=True면 값이 없거나 알 수 없는 경쟁정도인 행을 제거해야 함"""
+        df = normalize_keyword_frame(self.raw, dropna=True)
+        self.assertEqual(list(df.index), ["캠핑", "캠핑의자"])
+
+    def test_empty_frame(self):
+        """빈 DataFrame은 그대로 반환해야 함"""
+        self.assertTrue(normalize_keyword_frame(pd.DataFrame()).empty)
+
+    @unittest.skipUnless(HAS_PARQUET_ENGINE, "pyarrow 또는 fastparquet 필요")
+    def test_parquet_round_trip(self):
+        """Parquet 파일은 dtype을 보존해야 함"""
+        df = normalize_keyword_frame(self.raw)
+        collector = NaverKeywordCollector(store=None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                filename = collector.save_to_parquet(df, "테스트")
+                loaded = load_keyword_frame(filename)
+            finally:
+                os.chdir(cwd)
+
+        pd.testing.assert_frame_equal(loaded, df)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+키워드 규칙 매처(KeywordMatcher)와 규칙 기반 분류 테스트
+"""
+import os
+import sys
+import random
+import unittest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.classifier import KeywordClassifier, KeywordMatcher
+from src.core.classifier.keyword_matcher import INFO_CONTENT_WORDS, PRODUCT_KEYWORD_WORDS
+
+
+def reference_is_informational(blog_results):
+    """단어마다 반복하던 기존 구현"""
+    items = blog_results.get("items", [])
+    if not items:
+        return False
+    count = 0
+    for item in items:
+        title = item.get("title", "").replace("<b>", "").replace("</b>", "")
+        description = item.get("description", "").replace("<b>", "").replace("</b>", "")
+        if any(word in title or word in description for word in INFO_CONTENT_WORDS):
+            count += 1
+    return count / len(items) >= 0.5
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """KeywordMatcher 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.matcher = KeywordMatcher(["방법", "사용법", "팁", "a.b"])
+
+    def test_single_pass_counts(self):
+        """긴 단어를 우선하여 겹치지 않게 세어야 함"""
+        self.assertEqual(self.matcher.matches("사용법과 방법, 팁"), ["사용법", "방법", "팁"])
+        self.assertEqual(self.matcher.count("사용법과 방법, 팁"), 3)
+        self.assertTrue(self.matcher.search("a.b"))
+        self.assertFalse(self.matcher.search("axb"))
+
+    def test_vectorized_matches_scalar(self):
+        """배열 연산 결과는 텍스트별 결과와 같아야 함"""
+        texts = ["방법 팁 팁", "없음", None, "사용법"]
+        self.assertEqual(self.matcher.contains_many(texts).tolist(), [True, False, False, True])
+        self.assertEqual(self.matcher.count_many(texts).tolist(), [3, 0, 0, 1])
+
+    def test_empty_word_list_never_matches(self):
+        """단어가 없으면 어떤 텍스트와도 일치하지 않아야 함"""
+        matcher = KeywordMatcher([])
+        self.assertFalse(matcher.search("방법"))
+        self.assertEqual(matcher.count_many(["방법"]).tolist(), [0])
+
+
+class TestRuleBasedClassification(unittest.TestCase):
+    """KeywordClassifier 규칙 기반 분류 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.classifier = KeywordClassifier(client_id="test_client_id", client_secret="test_client_secret",
+                                            use_cache=False)
+        rng = random.Random(7)
+        vocabulary = list(INFO_CONTENT_WORDS) + ["캠핑", "<b>", "</b>", "여행", "방", "법", "후기"]
+        self.results = [
+            {"items": [
+                {"title": "".join(rng.choices(vocabulary, k=3)), "description": "".join(rng.choices(vocabulary, k=2))}
+                for _ in range(rng.randint(0, 6))
+            ]}
+            for _ in range(200)
+        ]
+
+    def test_informational_content_matches_reference(self):
+        """컴파일된 매처는 기존 단어별 반복 구현과 같은 결과를 내야 함"""
+        for blog_results in self.results:
+            self.assertEqual(self.classifier._is_informational_content(blog_results),
+                             reference_is_informational(blog_results))
+
+    def test_batch_ratios_match_single_results(self):
+        """배치 비율 계산은 결과별 판단과 일치해야 함"""
+        ratios = self.classifier.informational_ratios(self.results)
+        self.assertEqual([bool(ratio >= 0.5) for ratio in ratios],
+                         [self.classifier._is_informational_content(results) for results in self.results])
+        self.assertEqual(self.classifier.informational_ratios([{"items": []}]).tolist(), [0.0])
+
+    def test_product_or_info(self):
+        """상품성 단어가 있으면 상품, 없으면 정보성이어야 함"""
+        keywords = ["의자 추천", "다이어트 방법", "캠핑", f"{PRODUCT_KEYWORD_WORDS[0]} 후기"]
+        expected = ["상품", "정보성", "정보성", "상품"]
+
+        self.assertEqual([self.classifier.llm_classify_product_or_info(keyword) for keyword in keywords], expected)
+        self.assertEqual(self.classifier.classify_product_or_info_many(keywords), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
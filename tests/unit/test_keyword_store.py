@@ -0,0 +1,141 @@
+"""
+연관 키워드 저장소(KeywordStore)와 수집 재개 테스트
+"""
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.search.engines.naver_keywords import NaverKeywordCollector, RELKEYWORD_COLUMNS
+from src.core.search.utils.keyword_store import KeywordStore
+
+from http_fakes import FakeResponse, FakeSession
+
+
+def keyword_row(keyword):
+    return {**{field: "10" for field in RELKEYWORD_COLUMNS}, "relKeyword": keyword, "compIdx": "낮음"}
+
+
+class FlakySession(FakeSession):
+    """failing에 포함된 시드 키워드 요청은 500으로 응답하는 세션"""
+
+    def __init__(self, failing=()):
+        super().__init__(respond=self.respond_to)
+        self.failing = set(failing)
+        self.hints = []
+
+    def respond_to(self, params):
+        hints = params["hintKeywords"].split(",")
+        self.hints.extend(hints)
+        if self.failing.intersection(hints):
+            return FakeResponse(500)
+        return FakeResponse(200, {"keywordList": [keyword_row(f"{hint} 추천") for hint in hints]})
+
+
+class TestKeywordStore(unittest.TestCase):
+    """KeywordStore 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = KeywordStore(os.path.join(self.tmpdir.name, "keywords.sqlite3"))
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def test_run_progress_and_resume(self):
+        """완료한 시드 키워드는 이어서 진행할 때 제외되어야 함"""
+        run_id = self.store.start_run(["a", "b", "c"], kind="info", label="url")
+        self.store.save_results(run_id, ["a"], [keyword_row("a1"), keyword_row("a2")])
+        self.store.mark_failed(run_id, ["b"])
+
+        self.assertEqual(self.store.finish_run(run_id), "partial")
+        self.assertEqual(self.store.start_run(["a", "d"], run_id), run_id)
+        self.assertEqual(self.store.run_seeds(run_id), ["a", "b", "c", "d"])
+        self.assertEqual(self.store.pending_seeds(run_id), ["b", "c", "d"])
+        self.assertEqual([row["relKeyword"] for row in self.store.run_keywords(run_id)], ["a1", "a2"])
+        self.assertEqual(self.store.get_run(run_id)["seeds"], {"pending": 2, "done": 1, "failed": 1})
+
+    def test_fresh_seeds_are_reused_across_runs(self):
+        """freshness 기간 안에 조회한 시드 키워드는 다른 실행에서도 다시 조회하지 않아야 함"""
+        first = self.store.start_run(["a"])
+        self.store.save_results(first, ["a"], [keyword_row("a1")])
+
+        second = self.store.start_run(["a", "b"])
+        self.assertEqual(self.store.pending_seeds(second), ["b"])
+        self.assertEqual([row["relKeyword"] for row in self.store.run_keywords(second)], ["a1"])
+
+        self.store.freshness_seconds = 0
+        third = self.store.start_run(["a"])
+        self.assertEqual(self.store.pending_seeds(third), ["a"])
+
+
+class TestResumableCollection(unittest.TestCase):
+    """NaverKeywordCollector 수집 재개 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = KeywordStore(os.path.join(self.tmpdir.name, "keywords.sqlite3"))
+        self.collector = NaverKeywordCollector(qps=1000, store=self.store)
+        self.collector.expander.max_retries = 0
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def expand(self, session, keywords, run_id=None):
+        with patch("src.core.search.utils.naver_api_utils.get_http_session", return_value=session):
+            return self.collector.expand_related_keywords(keywords, run_id=run_id)
+
+    def test_resume_only_fetches_remaining_seeds(self):
+        """실패 후 같은 run_id로 다시 실행하면 남은 시드 키워드만 조회해야 함"""
+        df = self.expand(FlakySession(failing={"b"}), ["a", "b [말머리]", "c"])
+        run_id = self.collector.last_run_id
+
+        self.assertEqual(sorted(df["연관키워드"]), ["a 추천", "c 추천"])
+        self.assertEqual(self.store.get_run(run_id)["status"], "partial")
+
+        session = FlakySession()
+        df = self.expand(session, ["a", "b", "c"], run_id=run_id)
+
+        self.assertEqual(session.hints, ["b"])
+        self.assertEqual(sorted(df["연관키워드"]), ["a 추천", "b 추천", "c 추천"])
+        self.assertEqual(self.store.get_run(run_id)["status"], "completed")
+
+    def test_resumed_category_run_skips_scraping(self):
+        """저장된 실행을 재개하면 카테고리 페이지를 다시 수집하지 않아야 함"""
+        run_id = self.store.start_run(["a", "b"], kind="info", label="https://kin.naver.com/qna/list.naver?dirId=7")
+
+        with patch.object(self.collector, "collect_category_keywords") as scrape:
+            with patch("src.core.search.utils.naver_api_utils.get_http_session", return_value=FlakySession()):
+                df = self.collector.collect_info_keywords_from_category("https://kin.naver.com/qna/list.naver?dirId=7",
+                                                                        run_id=run_id)
+
+        scrape.assert_not_called()
+        self.assertEqual(sorted(df.index), ["a 추천", "b 추천"])
+
+    def test_explicit_none_disables_store(self):
+        """store=None이면 기본 저장소 파일을 만들지 않고 저장소 없이 수집해야 함"""
+        with patch("src.core.search.engines.naver_keywords.create_keyword_store") as create_store:
+            collector = NaverKeywordCollector(qps=1000, store=None)
+            collector.expander.max_retries = 0
+            with patch("src.core.search.utils.naver_api_utils.get_http_session", return_value=FlakySession()):
+                df = collector.expand_related_keywords(["a"])
+
+        create_store.assert_not_called()
+        self.assertIsNone(collector.store)
+        self.assertEqual(list(df["연관키워드"]), ["a 추천"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+LLM 응답 캐시 테스트
+"""
+import os
+import sys
+import tempfile
+import unittest
+from typing import List
+from unittest import mock
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common import llm_cache
+from src.common.config import Configuration
+from src.common.llm_cache import LLMResponseCache, invoke_chat_model, make_cache_key
+from src.workflows.states.blog_state import BlogSection
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """LLMResponseCache 테스트 클래스"""
+
+    def test_disk_tier_survives_new_instance(self):
+        """SQLite 계층에 저장된 항목은 새 인스턴스에서도 조회되어야 함"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "llm.sqlite3")
+            cache = LLMResponseCache(path=path)
+            cache.set("key", "value")
+            cache.close()
+
+            reopened = LLMResponseCache(path=path)
+            self.assertEqual(reopened.get("key"), "value")
+            self.assertEqual(reopened.stats()["disk_hits"], 1)
+            self.assertEqual(reopened.get("key"), "value")
+            self.assertEqual(reopened.stats()["hits"], 1)
+            reopened.close()
+
+    def test_expired_and_evicted_entries(self):
+        """TTL이 지난 항목과 LRU에서 밀려난 항목은 조회되지 않아야 함"""
+        cache = LLMResponseCache(max_entries=1, ttl_seconds=3600)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), "2")
+
+        cache.ttl_seconds = -1
+        self.assertIsNone(cache.get("b"))
+
+    def test_cache_key_covers_model_and_messages(self):
+        """모델, 온도, 메시지가 다르면 키가 달라야 함"""
+        messages = [SystemMessage(content="지시"), HumanMessage(content="질문")]
+        key = make_cache_key("openai", "gpt-4o", 0, messages)
+
+        self.assertEqual(key, make_cache_key("openai", "gpt-4o", 0, list(messages)))
+        self.assertNotEqual(key, make_cache_key("openai", "gpt-4o-mini", 0, messages))
+        self.assertNotEqual(key, make_cache_key("openai", "gpt-4o", 0.7, messages))
+        self.assertNotEqual(key, make_cache_key("openai", "gpt-4o", 0, messages[:1]))
+        self.assertNotEqual(key, make_cache_key("openai", "gpt-4o", 0, messages, List[BlogSection]))
+
+
+class TestInvokeChatModel(unittest.TestCase):
+    """invoke_chat_model 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        cache_patcher = mock.patch.object(llm_cache, "get_llm_cache", return_value=LLMResponseCache())
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        self.model = mock.MagicMock()
+        patcher = mock.patch.object(llm_cache, "get_chat_model", return_value=self.model)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.messages = [HumanMessage(content="골밀도에 대해 써주세요")]
+
+    def test_disabled_cache_always_calls_model(self):
+        """llm_cache가 꺼져 있으면 매번 모델을 호출해야 함"""
+        self.model.invoke.return_value = AIMessage(content="본문")
+        configurable = Configuration()
+
+        invoke_chat_model(configurable, "openai", "gpt-4o", self.messages, temperature=0)
+        invoke_chat_model(configurable, "openai", "gpt-4o", self.messages, temperature=0)
+        self.assertEqual(self.model.invoke.call_count, 2)
+
+    def test_repeated_call_is_served_from_cache(self):
+        """같은 호출을 반복하면 캐시된 응답을 반환하고, bypass 시 새로 호출해야 함"""
+        self.model.invoke.return_value = AIMessage(content="본문")
+        configurable = Configuration(llm_cache=True)
+
+        first = invoke_chat_model(configurable, "openai", "gpt-4o", self.messages, temperature=0)
+        second = invoke_chat_model(configurable, "openai", "gpt-4o", self.messages, temperature=0)
+        self.assertEqual(self.model.invoke.call_count, 1)
+        self.assertEqual(second.content, first.content)
+
+        bypass = Configuration(llm_cache=True, llm_cache_bypass=True)
+        invoke_chat_model(bypass, "openai", "gpt-4o", self.messages, temperature=0)
+        self.assertEqual(self.model.invoke.call_count, 2)
+
+    def test_structured_output_round_trip(self):
+        """구조화 출력은 스키마 타입으로 복원되어야 함"""
+        sections = [BlogSection(name="서론", description="개요")]
+        self.model.invoke.return_value = sections
+        configurable = Configuration(llm_cache=True)
+
+        invoke_chat_model(configurable, "openai", "gpt-4o", self.messages, structured_output=List[BlogSection])
+        cached = invoke_chat_model(configurable, "openai", "gpt-4o", self.messages, structured_output=List[BlogSection])
+
+        self.assertEqual(self.model.invoke.call_count, 1)
+        self.assertIsInstance(cached[0], BlogSection)
+        self.assertEqual(cached[0].name, "서론")
+
+
+class TestLLMCacheConfiguration(unittest.TestCase):
+    """LLM 캐시 서버 설정 테스트 클래스"""
+
+    def test_request_cannot_choose_cache_storage(self):
+        """요청 구성으로는 캐시 경로, 크기, 유효 시간을 바꿀 수 없어야 함"""
+        configurable = Configuration.from_runnable_config({"configurable": {
+            "llm_cache": True, "llm_cache_path": "/tmp/other.sqlite3", "llm_cache_ttl": 1
+        }})
+
+        self.assertTrue(configurable.llm_cache)
+        self.assertFalse(hasattr(configurable, "llm_cache_path"))
+        self.assertFalse(hasattr(configurable, "llm_cache_ttl"))
+
+    def test_server_settings_come_from_environment(self):
+        """캐시 설정은 환경 변수에서 읽고 전역 캐시는 하나만 생성되어야 함"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "llm.sqlite3")
+            env = {"LLM_CACHE_PATH": path, "LLM_CACHE_TTL": "60", "LLM_CACHE_MAX_ENTRIES": "5"}
+            with mock.patch.dict(os.environ, env):
+                llm_cache.close_llm_cache()
+                try:
+                    cache = llm_cache.get_llm_cache()
+                    self.assertIs(llm_cache.get_llm_cache(), cache)
+                    self.assertEqual((cache.path, cache.ttl_seconds, cache.max_entries), (path, 60, 5))
+                finally:
+                    llm_cache.close_llm_cache()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+다중 검색 엔진 동시 검색 테스트
+"""
+import os
+import sys
+import time
+import asyncio
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.search.formatters.source_formatter import SourceFormatter
+from src.core.search.manager import SearchOrchestrator
+
+
+class FakeSearcher:
+    """지연 시간과 점수 척도를 지정할 수 있는 검색 엔진 대용 객체"""
+
+    def __init__(self, name, delay, scores):
+        self.name = name
+        self.delay = delay
+        self.scores = scores
+
+    async def search_all(self, queries):
+        await asyncio.sleep(self.delay)
+        return [{
+            'query': query,
+            'results': [
+                {'title': f"{self.name} {i}", 'url': f"https://{self.name}.com/{query}/{i}", 'score': score,
+                 'content': '', 'source_type': self.name}
+                for i, score in enumerate(self.scores)
+            ]
+        } for query in queries]
+
+
+class TestNormalizeScores(unittest.TestCase):
+    """SourceFormatter.normalize_scores 테스트 클래스"""
+
+    def test_scores_are_scaled_per_engine(self):
+        """점수는 0~1로 조정하고 원래 점수는 보존해야 함"""
+        results = SourceFormatter.normalize_scores([{'score': 10}, {'score': 30}, {'score': 20}])
+
+        self.assertEqual([result['score'] for result in results], [0.0, 1.0, 0.5])
+        self.assertEqual(results[1]['engine_score'], 30)
+        self.assertEqual(SourceFormatter.normalize_scores([{'score': 0.3}])[0]['score'], 1.0)
+
+
+class TestMultiEngineSearch(unittest.TestCase):
+    """SearchOrchestrator.select_and_execute_multi_search 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.loop = asyncio.new_event_loop()
+        self.searchers = {
+            "tavily": FakeSearcher("tavily", 0.01, [0.9, 0.5]),
+            "exa": FakeSearcher("exa", 0.02, [40, 10]),
+            "arxiv": FakeSearcher("arxiv", 3.0, [1.0]),
+        }
+        patcher = patch.object(SearchOrchestrator, "_create_searcher",
+                               side_effect=lambda search_api, params: self.searchers[search_api])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.orchestrator = SearchOrchestrator(use_cache=False)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.loop.close()
+
+    def test_deadline_returns_partial_results(self):
+        """제한 시간이 지나면 느린 엔진을 기다리지 않고 도착한 결과만 반환해야 함"""
+        started = time.monotonic()
+        results = self.loop.run_until_complete(self.orchestrator.select_and_execute_multi_search(
+            ["tavily", "exa", "arxiv"], ["q1", "q2"], deadline=0.3, format_results=False
+        ))
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual([item['query'] for item in results], ["q1", "q2"])
+        engines = {result['source_type'] for result in results[0]['results']}
+        self.assertEqual(engines, {"tavily", "exa"})
+
+    def test_results_are_normalized_and_ranked(self):
+        """엔진별로 정규화된 점수 순으로 정렬되어야 함"""
+        results = self.loop.run_until_complete(self.orchestrator.select_and_execute_multi_search(
+            ["tavily", "exa"], ["q1"], deadline=None, format_results=False
+        ))
+
+        scores = [result['score'] for result in results[0]['results']]
+        self.assertEqual(len(scores), 4)
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertTrue(all(0.0 <= score <= 1.0 for score in scores))
+        self.assertIn(results[0]['results'][0]['engine_score'], (0.9, 40))
+
+    def test_unsupported_engine_raises(self):
+        """지원되지 않는 엔진은 ValueError를 발생시켜야 함"""
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(self.orchestrator.select_and_execute_multi_search(["bing"], ["q"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+연구 섹션 병렬 실행(Send fan-out) 테스트
+"""
+import os
+import sys
+import asyncio
+import unittest
+
+from langgraph.graph import END, StateGraph
+from langgraph.types import Send
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.workflows.graphs.section_research import (
+    collect_research_sections,
+    create_research_section_node,
+    route_research_sections
+)
+from src.workflows.states.blog_state import BlogSection, BlogState, SectionState
+
+RESEARCH_ROUTES = ["set_up_section_state", "research_section", "get_remaining_non_research_sections"]
+
+
+def build_stub_search(delays, skipped=()):
+    """섹션별로 지연한 뒤 섹션을 완료하는 검색 워크플로우 대역을 만듭니다.
+
+    skipped에 포함된 섹션은 완료된 섹션 없이 반환합니다.
+    """
+    calls = {"active": 0, "max_active": 0, "order": []}
+
+    async def search(state: SectionState):
+        section = state["section"]
+        calls["active"] += 1
+        calls["max_active"] = max(calls["max_active"], calls["active"])
+        try:
+            await asyncio.sleep(delays.get(section.name, 0))
+        finally:
+            calls["active"] -= 1
+        calls["order"].append(section.name)
+        if section.name in skipped:
+            return {"completed_sections": []}
+        return {"completed_sections": [section.model_copy(update={"content": f"{section.name} 본문"})]}
+
+    workflow = StateGraph(SectionState)
+    workflow.add_node("search", search)
+    workflow.set_entry_point("search")
+    workflow.add_edge("search", END)
+    return workflow.compile(), calls
+
+
+def build_research_graph(search_workflow):
+    """blog_workflow의 병렬 연구 루프만 떼어 낸 그래프를 만듭니다."""
+    workflow = StateGraph(BlogState)
+    workflow.add_node("plan_sections", lambda state: {})
+    workflow.add_node("set_up_section_state", lambda state: {})
+    workflow.add_node("research_section", create_research_section_node(search_workflow))
+    workflow.add_node("collect_research_sections", collect_research_sections)
+    workflow.add_node("get_remaining_non_research_sections", lambda state: {})
+    workflow.set_entry_point("plan_sections")
+    workflow.add_conditional_edges("plan_sections", route_research_sections, RESEARCH_ROUTES)
+    workflow.add_edge("research_section", "collect_research_sections")
+    workflow.add_conditional_edges("collect_research_sections", route_research_sections, RESEARCH_ROUTES)
+    workflow.add_edge("set_up_section_state", END)
+    workflow.add_edge("get_remaining_non_research_sections", END)
+    return workflow.compile()
+
+
+def initial_state(sections):
+    return {
+        "topic": "캠핑",
+        "sections": sections,
+        "research_needed_sections": list(sections),
+        "completed_sections": [],
+        "research_results": [],
+        "blog_post": "",
+    }
+
+
+class TestRouteResearchSections(unittest.TestCase):
+    """route_research_sections 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.sections = [BlogSection(name=f"섹션{i}", description="설명") for i in range(3)]
+
+    def test_serial_mode_and_empty_queue(self):
+        """병렬 모드가 꺼져 있으면 순차 루프로, 남은 섹션이 없으면 비연구 섹션 처리로 보내야 함"""
+        state = initial_state(self.sections)
+        self.assertEqual(route_research_sections(state, {}), "set_up_section_state")
+
+        state["research_needed_sections"] = []
+        config = {"configurable": {"parallel_sections": True}}
+        self.assertEqual(route_research_sections(state, config), "get_remaining_non_research_sections")
+
+    def test_wave_is_bounded_by_max_parallel_sections(self):
+        """병렬 모드에서는 max_parallel_sections개까지만 Send로 보내야 함"""
+        config = {"configurable": {"parallel_sections": True, "max_parallel_sections": 2}}
+        sends = route_research_sections(initial_state(self.sections), config)
+
+        self.assertEqual(len(sends), 2)
+        self.assertTrue(all(isinstance(send, Send) and send.node == "research_section" for send in sends))
+        self.assertEqual([send.arg["section"].name for send in sends], ["섹션0", "섹션1"])
+        self.assertEqual(sends[0].arg["topic"], "캠핑")
+        self.assertEqual(sends[0].arg["search_iterations"], 0)
+
+
+class TestResearchSectionNode(unittest.TestCase):
+    """create_research_section_node 테스트 클래스"""
+
+    def test_completed_sections_and_fallback(self):
+        """완료된 섹션을 research_results로 반환하고, 없으면 원래 섹션으로 대신해야 함"""
+        search_workflow, _ = build_stub_search({}, skipped={"빈 섹션"})
+        node = create_research_section_node(search_workflow)
+        done = BlogSection(name="완료 섹션", description="설명")
+        empty = BlogSection(name="빈 섹션", description="설명")
+
+        async def run():
+            return (await node({"topic": "캠핑", "section": done}, {}),
+                    await node({"topic": "캠핑", "section": empty}, {}))
+
+        done_result, empty_result = asyncio.run(run())
+        self.assertEqual(done_result["research_results"][0].content, "완료 섹션 본문")
+        self.assertEqual(empty_result["research_results"], [empty])
+
+
+class TestParallelResearchGraph(unittest.TestCase):
+    """병렬 연구 루프 통합 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.sections = [BlogSection(name=f"섹션{i}", description="설명") for i in range(5)]
+        # 뒤쪽 섹션이 먼저 끝나도록 지연 시간을 역순으로 설정
+        delays = {section.name: 0.05 * (5 - index) for index, section in enumerate(self.sections)}
+        self.search_workflow, self.calls = build_stub_search(delays, skipped={"섹션3"})
+        self.graph = build_research_graph(self.search_workflow)
+
+    def run_graph(self, max_parallel_sections):
+        config = {"configurable": {"parallel_sections": True, "max_parallel_sections": max_parallel_sections},
+                  "recursion_limit": 20}
+        return asyncio.run(self.graph.ainvoke(initial_state(self.sections), config=config))
+
+    def test_waves_accumulate_results_in_plan_order(self):
+        """웨이브마다 최대 동시 실행 수를 지키고, 결과는 누적되어 계획 순서대로 병합되어야 함"""
+        result = self.run_graph(max_parallel_sections=2)
+
+        self.assertEqual(self.calls["max_active"], 2)
+        self.assertEqual(self.calls["order"][:2], ["섹션1", "섹션0"])
+        self.assertEqual(len(result["research_results"]), 5)
+        self.assertEqual([section.name for section in result["completed_sections"]],
+                         [section.name for section in self.sections])
+        self.assertEqual(result["research_needed_sections"], [])
+
+    def test_section_without_result_does_not_stall_the_loop(self):
+        """검색 워크플로우가 완료 섹션을 내지 않아도 해당 섹션을 완료로 처리해야 함"""
+        result = self.run_graph(max_parallel_sections=5)
+
+        self.assertEqual(self.calls["max_active"], 5)
+        completed = {section.name: section for section in result["completed_sections"]}
+        self.assertEqual(completed["섹션3"].content, "")
+        self.assertEqual(completed["섹션4"].content, "섹션4 본문")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+공유 속도 제한기 테스트
+"""
+import os
+import sys
+import time
+import asyncio
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common import rate_limit
+from src.common.rate_limit import (
+    AsyncRateLimiter, gather_rate_limited, get_rate_limiter, get_retry_after, is_rate_limit_error
+)
+
+
+class HTTPError(Exception):
+    """상태 코드와 헤더를 갖는 테스트용 예외"""
+
+    def __init__(self, status: int, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+
+class TestRateLimiterRegistry(unittest.TestCase):
+    """get_rate_limiter 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self._saved = dict(rate_limit._LIMITERS)
+        self._saved_hosts = dict(rate_limit._HOST_LIMITERS)
+        rate_limit._LIMITERS.clear()
+        rate_limit._HOST_LIMITERS.clear()
+
+    def tearDown(self):
+        """테스트 정리"""
+        rate_limit._LIMITERS.clear()
+        rate_limit._LIMITERS.update(self._saved)
+        rate_limit._HOST_LIMITERS.clear()
+        rate_limit._HOST_LIMITERS.update(self._saved_hosts)
+
+    def test_limiter_is_shared_by_name(self):
+        """같은 이름은 같은 제한기를 반환하고 기본값을 사용해야 함"""
+        limiter = get_rate_limiter("exa")
+
+        self.assertIs(get_rate_limiter("exa"), limiter)
+        self.assertEqual(limiter.rate, rate_limit.DEFAULT_RATE_LIMITS["exa"][0])
+        self.assertIsNot(get_rate_limiter("host:a.com"), get_rate_limiter("host:b.com"))
+
+    def test_environment_overrides_defaults(self):
+        """RATE_LIMIT_<이름>_QPS / _BURST 환경 변수가 기본값보다 우선해야 함"""
+        with patch.dict(os.environ, {"RATE_LIMIT_HOST_QPS": "7", "RATE_LIMIT_HOST_BURST": "3"}):
+            limiter = get_rate_limiter("host:example.com", rate=1.0)
+
+        self.assertEqual(limiter.rate, 7.0)
+        self.assertEqual(limiter.burst, 3)
+
+    def test_host_limiters_are_bounded_and_aggregated(self):
+        """호스트별 제한기는 최근에 사용한 것만 보관하고, 상태는 하나로 합산해야 함"""
+        with patch.object(rate_limit, "MAX_HOST_LIMITERS", 2):
+            first = get_rate_limiter("host:a.com")
+            get_rate_limiter("host:b.com")
+            self.assertIs(get_rate_limiter("host:a.com"), first)
+            get_rate_limiter("host:c.com")
+            stats = rate_limit.get_rate_limiter_stats()
+
+        self.assertEqual(list(rate_limit._HOST_LIMITERS), ["host:a.com", "host:c.com"])
+        self.assertEqual(stats["host"]["limiters"], 2)
+        self.assertFalse(any(name.startswith("host:") for name in stats))
+
+
+class TestAdaptiveRate(unittest.TestCase):
+    """penalize / reward 테스트 클래스"""
+
+    def test_penalize_halves_rate_and_reward_recovers(self):
+        """429 후에는 속도가 절반으로, 성공 후에는 원래 속도까지 회복되어야 함"""
+        limiter = AsyncRateLimiter(rate=8, burst=1)
+
+        limiter.penalize(retry_after=0)
+        self.assertEqual(limiter.rate, 4)
+        for _ in range(3):
+            limiter.penalize(retry_after=0)
+        self.assertEqual(limiter.rate, limiter.min_rate)
+
+        for _ in range(20):
+            limiter.reward()
+        self.assertEqual(limiter.rate, 8)
+        self.assertEqual(limiter.stats()["throttled"], 4)
+
+    def test_penalize_pauses_acquire(self):
+        """Retry-After 동안 acquire가 대기해야 함"""
+        limiter = AsyncRateLimiter(rate=1000, burst=10)
+        limiter.penalize(retry_after=0.1)
+
+        started = time.monotonic()
+        asyncio.new_event_loop().run_until_complete(limiter.acquire())
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_rate_limit_error_detection(self):
+        """상태 코드, 메시지, Retry-After 헤더를 인식해야 함"""
+        self.assertTrue(is_rate_limit_error(HTTPError(429)))
+        self.assertTrue(is_rate_limit_error(Exception("429 Too Many Requests")))
+        self.assertFalse(is_rate_limit_error(HTTPError(500)))
+        self.assertFalse(is_rate_limit_error(Exception("Timeout after 4290 ms")))
+        self.assertEqual(get_retry_after(HTTPError(429, {"Retry-After": "2"})), 2.0)
+        self.assertIsNone(get_retry_after(HTTPError(429)))
+
+
+class TestGatherRateLimited(unittest.TestCase):
+    """gather_rate_limited 테스트 클래스"""
+
+    def test_results_keep_input_order_and_exceptions(self):
+        """결과는 입력 순서를 유지하고 실패는 예외 객체로 반환해야 함"""
+        running = 0
+        peak = 0
+
+        async def work(item: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * (5 - item))
+            running -= 1
+            if item == 3:
+                raise ValueError("실패")
+            return item * 10
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(
+                gather_rate_limited([1, 2, 3, 4], work, AsyncRateLimiter(rate=0), concurrency=2)
+            )
+        finally:
+            loop.close()
+
+        self.assertEqual(results[:2], [10, 20])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(results[3], 40)
+        self.assertLessEqual(peak, 2)
+
+    def test_throughput_respects_rate(self):
+        """버스트 이후에는 초당 rate개를 넘지 않아야 함"""
+        limiter = AsyncRateLimiter(rate=50, burst=1)
+
+        async def work(item: int) -> int:
+            return item
+
+        loop = asyncio.new_event_loop()
+        try:
+            started = time.monotonic()
+            loop.run_until_complete(gather_rate_limited(list(range(6)), work, limiter, concurrency=6))
+            elapsed = time.monotonic() - started
+        finally:
+            loop.close()
+
+        # 첫 요청은 즉시, 나머지 5개는 20ms 간격
+        self.assertGreaterEqual(elapsed, 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
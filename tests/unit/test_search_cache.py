@@ -0,0 +1,142 @@
+"""
+검색 결과 캐시 테스트
+"""
+import os
+import sys
+import asyncio
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.search.manager import SearchOrchestrator, SearchResultCache
+from src.common.config import SearchCacheConfiguration
+from src.core.search.manager.search_cache import get_search_cache, make_search_cache_key
+
+
+class FakeSearcher:
+    """호출 횟수를 기록하는 검색 엔진 대용 객체"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def search_all(self, queries):
+        self.calls.append(list(queries))
+        return [{'query': query, 'results': [{'title': f"{query} #{len(self.calls)}", 'url': f"https://example.com/{query}"}]}
+                for query in queries]
+
+
+class TestSearchResultCache(unittest.TestCase):
+    """SearchResultCache 테스트 클래스"""
+
+    def test_key_normalizes_query_and_includes_params(self):
+        """공백/대소문자만 다른 쿼리는 같은 키, 매개변수가 다르면 다른 키여야 함"""
+        self.assertEqual(make_search_cache_key("tavily", "  Python   Async "),
+                         make_search_cache_key("tavily", "python async"))
+        self.assertNotEqual(make_search_cache_key("tavily", "python", {"topic": "news"}),
+                            make_search_cache_key("tavily", "python"))
+        self.assertNotEqual(make_search_cache_key("exa", "python"), make_search_cache_key("tavily", "python"))
+
+    def test_ttl_depends_on_engine(self):
+        """뉴스는 짧게, 학술 검색은 길게 유지해야 함"""
+        cache = SearchResultCache(default_ttl=100, news_ttl=10, academic_ttl=1000)
+
+        self.assertEqual(cache.ttl_for("tavily"), 100)
+        self.assertEqual(cache.ttl_for("tavily", {"topic": "news"}), 10)
+        self.assertEqual(cache.ttl_for("arxiv"), 1000)
+
+    def test_fresh_stale_and_expired(self):
+        """유효 시간 안에는 적중, stale_ttl 안에는 만료 적중, 그 이후에는 미스여야 함"""
+        cache = SearchResultCache(stale_ttl=50)
+        cache.set("key", {"results": [1]})
+
+        with patch("src.core.search.manager.search_cache.time.time") as now:
+            created_at = cache._memory["key"][0]
+            now.return_value = created_at + 5
+            self.assertEqual(cache.get("key", ttl=10), ({"results": [1]}, False))
+            now.return_value = created_at + 30
+            self.assertEqual(cache.get("key", ttl=10), ({"results": [1]}, True))
+            now.return_value = created_at + 100
+            self.assertIsNone(cache.get("key", ttl=10))
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["stale_hits"], stats["misses"]), (1, 1, 1))
+
+    def test_disk_tier_survives_restart(self):
+        """SQLite에 저장된 결과는 새 캐시 인스턴스에서도 조회되어야 함"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "search_cache.sqlite3")
+            first = SearchResultCache(path=path)
+            first.set("key", {"results": ["a"]}, engine="exa")
+            first.close()
+
+            second = SearchResultCache(path=path)
+            self.assertEqual(second.get("key", ttl=60), ({"results": ["a"]}, False))
+            self.assertEqual(second.stats()["disk_hits"], 1)
+            second.close()
+
+    def test_default_cache_is_memory_only(self):
+        """기본 설정의 캐시는 파일을 만들지 않아야 함"""
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("SEARCH_CACHE_PATH", None)
+            cache = get_search_cache(SearchCacheConfiguration.from_runnable_config())
+
+        self.assertIsNone(cache.path)
+
+
+class TestOrchestratorCache(unittest.TestCase):
+    """SearchOrchestrator 캐시 연동 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.loop = asyncio.new_event_loop()
+        self.searcher = FakeSearcher()
+        self.cache = SearchResultCache(default_ttl=60, stale_ttl=60)
+        self.orchestrator = SearchOrchestrator(cache=self.cache)
+        patcher = patch.object(SearchOrchestrator, "_create_searcher", return_value=self.searcher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.loop.close()
+
+    def search(self, queries):
+        return self.loop.run_until_complete(
+            self.orchestrator.select_and_execute_search("tavily", queries, format_results=False)
+        )
+
+    def test_only_missing_queries_are_searched(self):
+        """캐시에 있는 쿼리는 검색 엔진을 다시 호출하지 않아야 함"""
+        self.search(["a", "b"])
+        results = self.search(["B", "c"])
+
+        self.assertEqual(self.searcher.calls, [["a", "b"], ["c"]])
+        self.assertEqual([item["query"] for item in results], ["B", "c"])
+        self.assertEqual(results[0]["results"][0]["title"], "b #1")
+
+    def test_stale_results_are_revalidated_in_background(self):
+        """만료된 결과는 바로 반환하고 백그라운드에서 한 번만 갱신해야 함"""
+        self.search(["a"])
+        self.cache.default_ttl = 0
+
+        with patch("src.core.search.manager.search_cache.time.time", return_value=self.cache._memory[
+                make_search_cache_key("tavily", "a", {})][0] + 1):
+            stale = self.search(["a"])
+            self.search(["a"])
+            self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.assertEqual(stale[0]["results"][0]["title"], "a #1")
+        self.assertEqual(self.searcher.calls, [["a"], ["a"]])
+        self.assertEqual(self.cache.stats()["refreshes"], 1)
+
+        self.cache.default_ttl = 60
+        self.assertEqual(self.search(["a"])[0]["results"][0]["title"], "a #2")
+
+
+if __name__ == "__main__":
+    unittest.main()
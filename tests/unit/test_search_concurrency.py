@@ -0,0 +1,151 @@
+"""
+검색 엔진 비차단 실행 테스트
+
+검색이 진행되는 동안에도 이벤트 루프가 다른 작업을 처리할 수 있는지 확인합니다.
+"""
+import os
+import sys
+import time
+import asyncio
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.search.engines import web_engines
+from src.core.search.engines.web_engines import ExaSearcher, PerplexitySearcher, RATE_LIMIT_RETRIES
+from src.common.rate_limit import AsyncRateLimiter
+from src.core.search.manager import SearchOrchestrator
+
+from http_fakes import FakeResponse, FakeSession
+
+# 검색 한 건의 지연 시간과 허용하는 최대 루프 지연 시간(초)
+SEARCH_LATENCY = 0.2
+MAX_LOOP_LAG = 0.1
+
+
+PERPLEXITY_PAYLOAD = {
+    "choices": [{"message": {"content": "답변"}}],
+    "citations": ["https://example.com/1", "https://example.com/2"],
+}
+
+
+def perplexity_session(rate_limited=0):
+    """처음 rate_limited번의 요청은 429로, 나머지는 SEARCH_LATENCY 후 답변으로 응답하는 세션"""
+    return FakeSession([FakeResponse(429, latency=SEARCH_LATENCY) for _ in range(rate_limited)],
+                       lambda body: FakeResponse(200, PERPLEXITY_PAYLOAD, latency=SEARCH_LATENCY))
+
+
+def blocking_exa_search(query, **kwargs):
+    """동기 Exa SDK 호출 대용 함수"""
+    time.sleep(SEARCH_LATENCY)
+    return {"results": [{"title": query, "url": f"https://example.com/{query}", "text": "본문", "score": 0.9}]}
+
+
+async def measure_loop_lag(coro):
+    """코루틴을 실행하는 동안 이벤트 루프의 최대 지연 시간을 측정합니다.
+
+    Returns:
+        Tuple[Any, float]: 코루틴 결과와 최대 지연 시간(초)
+    """
+    lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal lag
+        while not done:
+            started = time.monotonic()
+            await asyncio.sleep(0.01)
+            lag = max(lag, time.monotonic() - started - 0.01)
+
+    ticker_task = asyncio.ensure_future(ticker())
+    try:
+        result = await coro
+    finally:
+        done = True
+        await ticker_task
+    return result, lag
+
+
+class TestSearchDoesNotBlockLoop(unittest.TestCase):
+    """검색 중 이벤트 루프 지연 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.loop = asyncio.new_event_loop()
+        patcher = patch.object(web_engines.get_rate_limiter("perplexity"), "rate", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(web_engines.get_rate_limiter("exa"), "rate", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.loop.close()
+
+    def test_perplexity_uses_async_session(self):
+        """Perplexity 검색은 루프를 막지 않고 쿼리를 동시에 처리해야 함"""
+        session = perplexity_session()
+        searcher = PerplexitySearcher(api_key="test-key", max_concurrency=3)
+
+        with patch.object(web_engines, "get_http_session", return_value=session):
+            started = time.monotonic()
+            results, lag = self.loop.run_until_complete(measure_loop_lag(searcher.search_all(["a", "b", "c"])))
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(len(session.requests), 3)
+        self.assertEqual([len(item["results"]) for item in results], [2, 2, 2])
+        self.assertLess(lag, MAX_LOOP_LAG)
+        self.assertLess(elapsed, SEARCH_LATENCY * 2)
+
+    def test_rate_limited_query_is_retried(self):
+        """429 응답을 받으면 제한기 속도를 낮추고 같은 쿼리를 다시 보내 결과를 반환해야 함"""
+        searcher = PerplexitySearcher(api_key="test-key")
+        searcher.rate_limiter = AsyncRateLimiter(100, 10, name="test")
+
+        with patch.object(web_engines, "get_http_session", return_value=perplexity_session(rate_limited=1)), \
+                patch.object(web_engines.random, "uniform", return_value=0):
+            results = self.loop.run_until_complete(searcher.search("a"))
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(searcher.rate_limiter.stats()["throttled"], 1)
+
+        # 재시도 횟수를 넘으면 빈 결과를 반환해야 함
+        session = perplexity_session(rate_limited=RATE_LIMIT_RETRIES + 1)
+        with patch.object(web_engines, "get_http_session", return_value=session), \
+                patch.object(web_engines.random, "uniform", return_value=0):
+            self.assertEqual(self.loop.run_until_complete(searcher.search("a")), [])
+        self.assertEqual(len(session.requests), RATE_LIMIT_RETRIES + 1)
+
+    def test_exa_runs_in_executor(self):
+        """Exa SDK 호출은 스레드 풀에서 실행되어 루프를 막지 않아야 함"""
+        searcher = ExaSearcher(api_key="test-key")
+
+        with patch.object(searcher.exa, "search_and_contents", side_effect=blocking_exa_search):
+            results, lag = self.loop.run_until_complete(measure_loop_lag(searcher.search_all(["a", "b"])))
+
+        self.assertEqual([item["results"][0]["title"] for item in results], ["a", "b"])
+        self.assertLess(lag, MAX_LOOP_LAG)
+
+    def test_orchestrator_awaits_perplexity(self):
+        """오케스트레이터는 Perplexity 검색도 await하여 결과 목록을 반환해야 함"""
+        session = perplexity_session()
+        orchestrator = SearchOrchestrator(use_cache=False)
+
+        with patch.object(web_engines, "get_http_session", return_value=session), \
+                patch.dict(os.environ, {"PERPLEXITY_API_KEY": "test-key"}):
+            results, lag = self.loop.run_until_complete(measure_loop_lag(
+                orchestrator.select_and_execute_search("perplexity", ["a", "b"], format_results=False)
+            ))
+
+        self.assertIsInstance(results, list)
+        self.assertEqual([item["query"] for item in results], ["a", "b"])
+        self.assertLess(lag, MAX_LOOP_LAG)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+토크나이저, SourceFormatter 형식화, 토큰 예산 기반 소스 컨텍스트 빌더(SourceContextBuilder) 테스트
+"""
+import os
+import sys
+import unittest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.common.tokens import (
+    EstimateTokenizer,
+    Tokenizer,
+    count_tokens,
+    get_tokenizer,
+    set_tokenizer,
+    truncate_to_tokens
+)
+from src.core.search.formatters import SourceContextBuilder, SourceFormatter
+from src.core.search.formatters.context_builder import normalize_url
+from src.workflows.nodes.processors.source_combiner import combine_search_results
+
+
+def result(url, content, score, title="제목"):
+    return {"title": title, "url": url, "content": content, "score": score, "source_type": "tavily"}
+
+
+class TestTokens(unittest.TestCase):
+    """토큰 계산 함수 테스트 클래스"""
+
+    def test_truncate_respects_limit(self):
+        """잘린 텍스트는 최대 토큰 수를 넘지 않아야 함"""
+        text = "캠핑 의자를 고르는 방법 " * 50
+        clipped = truncate_to_tokens(text, 20)
+
+        self.assertLessEqual(count_tokens(clipped), 20)
+        self.assertTrue(text.startswith(clipped))
+        self.assertEqual(truncate_to_tokens("짧은 글", 100), "짧은 글")
+        self.assertEqual(count_tokens(""), 0)
+
+    def test_estimate_tokenizer_round_trip(self):
+        """추정 토크나이저는 ASCII 4자 또는 한글 1자를 1토큰으로 나누고 그대로 복원해야 함"""
+        tokenizer = EstimateTokenizer()
+        tokens = tokenizer.encode("abcdefg 캠핑")
+
+        self.assertEqual(tokens, ("abcd", "efg ", "캠", "핑"))
+        self.assertEqual(tokenizer.decode(tokens), "abcdefg 캠핑")
+        self.assertEqual(tokenizer.truncate("abcdefg 캠핑", 3), "abcdefg 캠")
+
+    def test_only_short_counts_are_cached(self):
+        """짧은 텍스트의 토큰 수만 캐시하고 긴 문서는 캐시하지 않아야 함"""
+        tokenizer = EstimateTokenizer(cache_size=8)
+        tokenizer.count("캠핑 의자")
+        tokenizer.count("캠핑 의자")
+        tokenizer.count("긴 문서 " * 1000)
+
+        self.assertEqual(tokenizer.cache_info().hits, 1)
+        self.assertEqual(tokenizer.cache_info().currsize, 1)
+
+    def test_pluggable_default_tokenizer(self):
+        """set_tokenizer로 바꾼 토크나이저가 기본값으로 사용되어야 함"""
+        class CharTokenizer(Tokenizer):
+            def encode(self, text):
+                return tuple(text)
+
+            def decode(self, tokens):
+                return "".join(tokens)
+
+        previous = get_tokenizer()
+        set_tokenizer(CharTokenizer())
+        try:
+            self.assertEqual(count_tokens("abcdef"), 6)
+            self.assertEqual(truncate_to_tokens("abcdef", 2), "ab")
+        finally:
+            set_tokenizer(previous)
+
+
+class TestSourceFormatter(unittest.TestCase):
+    """SourceFormatter.format_sources 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.tokenizer = EstimateTokenizer()
+        self.response = [
+            {"query": "q1", "results": [
+                {**result("https://a.com", "요약", 0.9, title="A"), "raw_content": "캠핑 의자 고르는 법 " * 100},
+                {**result("https://b.com", "요약", 0.5, title="B"), "raw_content": None},
+            ]},
+            {"query": "q2", "results": [{**result("https://a.com", "요약", 0.8, title="A"), "raw_content": "짧은 본문"}]},
+        ]
+
+    def test_raw_content_is_cut_on_token_boundary(self):
+        """raw_content는 토큰 수 기준으로 잘리고 최종 토큰 수가 보고되어야 함"""
+        formatted = SourceFormatter.format_sources(self.response[:1], max_tokens_per_source=30, tokenizer=self.tokenizer)
+        clipped = self.tokenizer.truncate("캠핑 의자 고르는 법 " * 100, 30)
+
+        self.assertIn(f"30 토큰으로 제한된 전체 소스 내용: {clipped}... [잘림]", formatted.text)
+        self.assertEqual(formatted.tokens, self.tokenizer.count(formatted.text))
+        self.assertEqual((formatted.sources, formatted.truncated), (2, 1))
+
+    def test_matches_legacy_layout(self):
+        """문자열 형식은 기존 deduplicate_and_format_sources와 같아야 함"""
+        text = SourceFormatter.deduplicate_and_format_sources(self.response, include_raw_content=False)
+        expected = "소스 콘텐츠:\n" + "".join(
+            f"{'=' * 80}\n소스: {title}\n{'-' * 80}\nURL: {url}\n===\n소스의 가장 관련성 높은 내용: 요약\n===\n{'=' * 80}\n\n"
+            for title, url in (("A", "https://a.com"), ("B", "https://b.com"))
+        )
+
+        self.assertEqual(text, expected.strip())
+
+
+class TestSourceContextBuilder(unittest.TestCase):
+    """SourceContextBuilder 테스트 클래스"""
+
+    def test_normalize_url(self):
+        """추적 파라미터, 프래그먼트, www, 끝 슬래시 차이는 같은 URL로 봐야 함"""
+        self.assertEqual(normalize_url("HTTPS://www.Example.com/a/?utm_source=x&b=2&a=1#top"),
+                         normalize_url("https://example.com/a?a=1&b=2"))
+        self.assertNotEqual(normalize_url("https://example.com/a?id=1"), normalize_url("https://example.com/a?id=2"))
+
+    def test_deduplicates_by_url_and_content_keeping_best_score(self):
+        """URL이나 내용이 같으면 점수가 가장 높은 결과만 남고 점수 순으로 정렬되어야 함"""
+        results = [
+            result("https://a.com/1", "첫 번째 내용", 0.2),
+            result("https://www.a.com/1/?utm_medium=feed", "첫 번째 내용 (다른 쿼리)", 0.9),
+            result("https://b.com/copy", "  첫 번째 내용 ", 0.5),
+            result("https://c.com", "세 번째 내용", 0.7),
+        ]
+        unique = SourceContextBuilder().deduplicate(results)
+
+        self.assertEqual([item["url"] for item in unique],
+                         ["https://www.a.com/1/?utm_medium=feed", "https://c.com", "https://b.com/copy"])
+
+        context = SourceContextBuilder().build(results + [result("https://c.com/", "세 번째 내용", 0.1)])
+        self.assertEqual(context.duplicates, 2)
+        self.assertEqual(len(context.sources), 3)
+
+    def test_packs_into_token_budget(self):
+        """컨텍스트는 토큰 예산을 넘지 않고, 높은 점수의 소스부터 담겨야 함"""
+        results = [result(f"https://site{i}.com", f"{i}번 소스의 긴 본문입니다. " * 80, score=i / 10) for i in range(10)]
+        builder = SourceContextBuilder(token_budget=800, max_tokens_per_source=300)
+        context = builder.build(results)
+
+        self.assertLessEqual(context.tokens, 800)
+        self.assertEqual(context.tokens, count_tokens(context.text))
+        self.assertEqual(context.sources[0]["url"], "https://site9.com")
+        self.assertGreater(context.truncated, 0)
+        self.assertEqual(len(context.sources) + context.dropped, 10)
+        self.assertTrue(context.text.startswith("[1] 제목\nURL: https://site9.com\n"))
+
+    def test_long_body_is_encoded_once(self):
+        """긴 본문은 한 번만 토큰화하여 길이 비교와 자르기에 사용해야 함"""
+        body = "아주 긴 원본 본문입니다. " * 2000
+        tokenizer = EstimateTokenizer()
+        encoded = []
+        original_encode = tokenizer.encode
+        tokenizer.encode = lambda text: encoded.append(text) or original_encode(text)
+
+        context = SourceContextBuilder(token_budget=500, max_tokens_per_source=200,
+                                       tokenizer=tokenizer).build([result("https://a.com", body, 1.0)])
+
+        self.assertEqual(context.truncated, 1)
+        self.assertEqual(encoded.count(body.strip()), 1)
+
+    def test_combine_node_uses_configured_budget(self):
+        """노드는 구성의 토큰 예산으로 컨텍스트를 만들어야 함"""
+        state = {
+            "search_results": [result(f"https://site{i}.com", "본문 " * 500, score=1 - i / 10) for i in range(5)],
+            "search_iterations": 0
+        }
+        output = combine_search_results(state, {"configurable": {"source_token_budget": 400}})
+
+        self.assertEqual(output["search_iterations"], 1)
+        self.assertLessEqual(count_tokens(output["source_str"]), 400)
+        self.assertIn("https://site0.com", output["source_str"])
+
+        output = combine_search_results({"search_results": [], "search_iterations": 1}, {})
+        self.assertEqual(output, {"source_str": "검색 결과가 없습니다.", "search_iterations": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
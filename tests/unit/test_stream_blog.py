@@ -0,0 +1,122 @@
+"""
+블로그 생성 진행 이벤트 스트리밍(stream_blog) 테스트
+"""
+import os
+import sys
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, StateGraph
+from langgraph.types import Command
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.workflows import workflow as workflow_module
+from src.workflows.states.blog_state import BlogSection, BlogState
+
+BLOG_POST = "캠핑 의자 고르는 법"
+SECTION = BlogSection(name="도입", description="설명", content="본문")
+
+
+def build_fake_blog_graph():
+    """blog 워크플로우 대역 그래프를 만듭니다.
+
+    - plan_sections: 채팅 모델을 스트리밍하지만 토큰 스트리밍 노드가 아님
+    - research_section: 하위 그래프를 실행하여 중간 blog_post 값을 만듦 (최종 상태가 아님)
+    - write_section: Command로 완료 섹션을 반환
+    - collect_research_sections: 같은 섹션을 research_results로 한 번 더 반환 (중복)
+    - combine_blog_sections: 최종 본문을 토큰 단위로 스트리밍
+    """
+    sub_workflow = StateGraph(BlogState)
+    sub_workflow.add_node("draft", lambda state: {"blog_post": "중간 값"})
+    sub_workflow.set_entry_point("draft")
+    sub_workflow.add_edge("draft", END)
+    subgraph = sub_workflow.compile()
+
+    async def plan_sections(state: BlogState):
+        model = GenericFakeChatModel(messages=iter([AIMessage(content="계획 토큰")]))
+        async for _ in model.astream("계획"):
+            pass
+        return {"sections": [SECTION]}
+
+    async def research_section(state: BlogState):
+        await subgraph.ainvoke(state)
+        return {}
+
+    def write_section(state: BlogState):
+        return Command(update={"completed_sections": [SECTION]}, goto="collect_research_sections")
+
+    def collect_research_sections(state: BlogState):
+        return {"research_results": [SECTION]}
+
+    async def combine_blog_sections(state: BlogState):
+        model = GenericFakeChatModel(messages=iter([AIMessage(content=BLOG_POST)]))
+        text = ""
+        async for chunk in model.astream("결합"):
+            text += chunk.content
+        return {"blog_post": text}
+
+    graph = StateGraph(BlogState)
+    graph.add_node("plan_sections", plan_sections)
+    graph.add_node("research_section", research_section)
+    graph.add_node("write_section", write_section)
+    graph.add_node("collect_research_sections", collect_research_sections)
+    graph.add_node("combine_blog_sections", combine_blog_sections)
+    graph.set_entry_point("plan_sections")
+    graph.add_edge("plan_sections", "research_section")
+    graph.add_edge("research_section", "write_section")
+    graph.add_edge("collect_research_sections", "combine_blog_sections")
+    graph.add_edge("combine_blog_sections", END)
+    return graph.compile()
+
+
+class TestStreamBlog(unittest.TestCase):
+    """stream_blog 이벤트 변환 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        patcher = patch.object(workflow_module, "get_compiled_graph", return_value=build_fake_blog_graph())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def collect(self):
+        async def run():
+            return [event async for event in workflow_module.stream_blog("캠핑")]
+
+        return asyncio.run(run())
+
+    def test_node_events_and_final_result(self):
+        """하위 그래프를 포함한 노드 전환 이벤트를 순서대로 보내고, 최상위 그래프의 최종 상태로 result를 보내야 함"""
+        events = self.collect()
+
+        starts = [event["node"] for event in events if event["event"] == "node_start"]
+        self.assertEqual(starts, ["plan_sections", "research_section", "draft", "write_section",
+                                  "collect_research_sections", "combine_blog_sections"])
+        self.assertEqual(events[-1], {"event": "result", "blog": BLOG_POST})
+        self.assertEqual(sum(event["event"] == "result" for event in events), 1)
+
+    def test_sections_are_unwrapped_and_deduplicated(self):
+        """Command 갱신의 섹션을 꺼내 보내고, 같은 섹션은 한 번만 보내야 함"""
+        sections = [event for event in self.collect() if event["event"] == "section"]
+
+        self.assertEqual(len(sections), 1)
+        self.assertEqual(sections[0]["node"], "write_section")
+        self.assertEqual(sections[0]["section"], SECTION.model_dump())
+
+    def test_tokens_come_only_from_token_stream_nodes(self):
+        """토큰 이벤트는 TOKEN_STREAM_NODES의 채팅 모델 스트림에서만 나와야 함"""
+        tokens = [event for event in self.collect() if event["event"] == "token"]
+
+        self.assertGreater(len(tokens), 1)
+        self.assertTrue(all(event["node"] in workflow_module.TOKEN_STREAM_NODES for event in tokens))
+        self.assertEqual("".join(event["content"] for event in tokens), BLOG_POST)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+WebDriver 풀 테스트
+"""
+import os
+import sys
+import threading
+import unittest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from selenium.common.exceptions import WebDriverException
+
+from src.common.utils.selenium_utils import WebDriverPool, wait_for_page_ready
+
+
+class FakeDriver:
+    """Chrome 없이 사용하는 WebDriver 대용 객체"""
+
+    def __init__(self):
+        self.healthy = True
+        self.quit_called = False
+        self.ready_state = "complete"
+        self.current_url = "about:blank"
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise WebDriverException("no such window")
+        if script == "return document.readyState":
+            return self.ready_state
+        return 1
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.current_url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestWebDriverPool(unittest.TestCase):
+    """WebDriverPool 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.created = []
+
+        def factory():
+            driver = FakeDriver()
+            self.created.append(driver)
+            return driver
+
+        self.factory = factory
+
+    def test_driver_is_reused(self):
+        """반납한 드라이버는 다음 요청에 재사용되어야 함"""
+        pool = WebDriverPool(self.factory, size=2)
+        with pool.driver() as first:
+            pass
+        with pool.driver() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(pool.stats()["reused"], 1)
+
+    def test_recycle_after_max_pages(self):
+        """max_pages개 페이지를 로드한 드라이버는 종료하고 새로 만들어야 함"""
+        pool = WebDriverPool(self.factory, size=1, max_pages=2)
+        for _ in range(3):
+            with pool.driver():
+                pass
+
+        self.assertEqual(len(self.created), 2)
+        self.assertTrue(self.created[0].quit_called)
+        self.assertEqual(pool.stats()["recycled"], 1)
+
+    def test_unhealthy_or_failed_drivers_are_replaced(self):
+        """응답하지 않거나 오류가 발생한 드라이버는 재사용하지 않아야 함"""
+        pool = WebDriverPool(self.factory, size=1)
+        with pool.driver() as driver:
+            pass
+        driver.healthy = False
+        with pool.driver() as replacement:
+            pass
+        self.assertIsNot(replacement, driver)
+
+        with self.assertRaises(WebDriverException):
+            with pool.driver():
+                raise WebDriverException("crashed")
+        self.assertTrue(replacement.quit_called)
+        self.assertEqual(pool.stats()["unhealthy"], 1)
+
+    def test_pool_bounds_concurrent_drivers(self):
+        """동시에 꺼낼 수 있는 드라이버 수는 size개로 제한되어야 함"""
+        pool = WebDriverPool(self.factory, size=2, checkout_timeout=0.05)
+        first, _ = pool.checkout(), pool.checkout()
+        with self.assertRaises(TimeoutError):
+            pool.checkout()
+
+        released = threading.Timer(0.01, pool.checkin, args=(first,))
+        released.start()
+        pool.checkout_timeout = 1
+        self.assertIs(pool.checkout(), first)
+        released.join()
+        self.assertEqual(len(self.created), 2)
+
+    def test_close_quits_idle_drivers(self):
+        """풀을 닫으면 대기 중인 드라이버와 이후 반납되는 드라이버를 종료해야 함"""
+        pool = WebDriverPool(self.factory, size=2)
+        idle, busy = pool.checkout(), pool.checkout()
+        pool.checkin(idle)
+        pool.close()
+        pool.checkin(busy)
+
+        self.assertTrue(idle.quit_called)
+        self.assertTrue(busy.quit_called)
+        self.assertEqual(pool.stats()["alive"], 0)
+
+    def test_wait_for_page_ready(self):
+        """readyState와 추가 조건을 모두 만족해야 준비된 것으로 판단해야 함"""
+        driver = FakeDriver()
+        driver.current_url = "https://news.google.com/rss/articles/x"
+
+        self.assertTrue(wait_for_page_ready(driver, timeout=0.5))
+        self.assertFalse(wait_for_page_ready(
+            driver, timeout=0.3, condition=lambda current: "news.google.com" not in current.current_url
+        ))
+
+
+if __name__ == "__main__":
+    unittest.main()